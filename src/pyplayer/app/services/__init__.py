@@ -1,5 +1,34 @@
 """Application services package."""
 
+from .fingerprint_service import FingerprintService
+from .library_index import LibraryHit, LibraryIndex
+from .metadata_prober import MetadataProber
+from .playback_clock import PlaybackClock, PlaybackTick
+from .playback_diagnostics import FrameStatistics, PlaybackDiagnostics
+from .playback_loader import LoadState, PlaybackLoader
 from .playlist_manager import PlaylistManager
+from .playlist_registry import PlaylistHeader
+from .read_ahead import ReadAheadPrefetcher
+from .relink_engine import RelinkEngine, RelinkIndex, RelinkMatch, RelinkReport
+from .seek_scheduler import SeekScheduler
 
-__all__ = ["PlaylistManager"]
+__all__ = [
+    "FingerprintService",
+    "FrameStatistics",
+    "LibraryHit",
+    "LibraryIndex",
+    "LoadState",
+    "MetadataProber",
+    "PlaybackClock",
+    "PlaybackDiagnostics",
+    "PlaybackLoader",
+    "PlaybackTick",
+    "PlaylistHeader",
+    "PlaylistManager",
+    "ReadAheadPrefetcher",
+    "RelinkEngine",
+    "RelinkIndex",
+    "RelinkMatch",
+    "RelinkReport",
+    "SeekScheduler",
+]
@@ -0,0 +1,140 @@
+"""FingerprintService — recognises moved files and duplicates from partial-content fingerprints."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from src.pyplayer.domain.media import MEDIA_EXTENSIONS, Video
+from src.pyplayer.domain.media.fingerprint import compute_fingerprint
+from src.pyplayer.domain.media.video import make_media_key
+from src.pyplayer.infrastructure.cache.metadata_cache import MediaMetadataCache
+from src.pyplayer.infrastructure.filesystem.parallel_scan import ScannedFile, scan_files
+
+logger = logging.getLogger(__name__)
+
+
+class FingerprintService:
+    """
+    Retrouve les fichiers deplaces et les doublons sans tout relire.
+
+    Fingerprints are cached in the metadata cache under the content key
+    (path, size, mtime), so a file is read at most once while unchanged.
+    Both searches bucket files by size first: a file whose size matches no
+    other candidate is never opened, which leaves only a handful of reads
+    even on large trees. Reads run on a thread pool; every call blocks
+    until done, so callers run it off the UI thread when the roots are big.
+    """
+
+    MAX_WORKERS = 4
+
+    def __init__(self, cache: MediaMetadataCache, max_workers: int = MAX_WORKERS) -> None:
+        self._cache = cache
+        self._max_workers = max(1, max_workers)
+
+    def has_fingerprint(self, video: Video) -> bool:
+        return video.size > 0 and self._cache.get_fingerprint(video.content_key) is not None
+
+    def fingerprint_files(self, files: Iterable[ScannedFile]) -> Dict[str, str]:
+        """Return path -> fingerprint, reading only files missing from the cache."""
+        result: Dict[str, str] = {}
+        todo: List[tuple] = []
+        for entry in files:
+            key = make_media_key(Path(entry.path), entry.size, entry.mtime)
+            cached = self._cache.get_fingerprint(key)
+            if cached is not None:
+                result[entry.path] = cached
+            else:
+                todo.append((entry, key))
+        if not todo:
+            return result
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="fingerprint") as pool:
+            computed = pool.map(lambda item: compute_fingerprint(Path(item[0].path), item[0].size), todo)
+            for (entry, key), fingerprint in zip(todo, computed):
+                if fingerprint is not None:
+                    self._cache.put_fingerprint(key, fingerprint)
+                    result[entry.path] = fingerprint
+        return result
+
+    def find_relinks(
+        self,
+        videos: Iterable[Video],
+        search_roots: Sequence[Path],
+        extensions: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Path]:
+        """Locate missing videos under ``search_roots``; return video id -> new path."""
+        missing = [video for video in videos if video.size > 0 and not video.file_path.exists()]
+        if not any(self.has_fingerprint(video) for video in missing):
+            return {}
+        scanned = scan_files(search_roots, MEDIA_EXTENSIONS if extensions is None else extensions)
+        return self.match_scanned(missing, scanned)
+
+    def match_scanned(self, missing: Iterable[Video], scanned: Sequence[ScannedFile]) -> Dict[str, Path]:
+        """
+        Match missing videos against already scanned files; return video id -> new path.
+
+        Only videos whose fingerprint was recorded while the file still
+        existed can be matched. Among several identical copies, one with the
+        original file name is preferred.
+        """
+        started = time.perf_counter()
+        wanted: Dict[int, List[tuple]] = defaultdict(list)
+        for video in missing:
+            if self.has_fingerprint(video):
+                fingerprint = self._cache.get_fingerprint(video.content_key)
+                wanted[video.size].append((video, fingerprint))
+        if not wanted:
+            return {}
+
+        candidates = [entry for entry in scanned if entry.size in wanted]
+        fingerprints = self.fingerprint_files(candidates)
+        by_fingerprint: Dict[str, List[ScannedFile]] = defaultdict(list)
+        for entry in candidates:
+            fingerprint = fingerprints.get(entry.path)
+            if fingerprint is not None:
+                by_fingerprint[fingerprint].append(entry)
+
+        relinks: Dict[str, Path] = {}
+        for entries in wanted.values():
+            for video, fingerprint in entries:
+                matches = by_fingerprint.get(fingerprint)
+                if matches:
+                    best = min(matches, key=lambda entry: (entry.name != video.name, entry.path))
+                    relinks[video.id] = Path(best.path)
+        logger.info(
+            "Recherche par empreinte: %s/%s videos retrouvees, %s fichiers parcourus, %s lus en %.0f ms",
+            len(relinks),
+            sum(len(entries) for entries in wanted.values()),
+            len(scanned),
+            len(candidates),
+            (time.perf_counter() - started) * 1000,
+        )
+        return relinks
+
+    def find_duplicates(self, files: Iterable[ScannedFile]) -> List[List[str]]:
+        """Group files with identical content; sizes seen once are never read."""
+        by_size: Dict[int, List[ScannedFile]] = defaultdict(list)
+        seen = set()
+        for entry in files:
+            if entry.size > 0 and entry.path not in seen:
+                seen.add(entry.path)
+                by_size[entry.size].append(entry)
+        candidates = [entry for bucket in by_size.values() if len(bucket) > 1 for entry in bucket]
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for path, fingerprint in self.fingerprint_files(candidates).items():
+            groups[fingerprint].append(path)
+        return sorted(sorted(paths) for paths in groups.values() if len(paths) > 1)
+
+    def find_library_duplicates(self, videos: Iterable[Video]) -> List[List[str]]:
+        """Run ``find_duplicates`` over known videos, using their recorded size and mtime."""
+        return self.find_duplicates(
+            ScannedFile(os.fspath(video.file_path), video.size, video.mtime) for video in videos
+        )
+
+
+__all__ = ["FingerprintService"]
@@ -0,0 +1,377 @@
+"""Library-wide full-text index over every video of every playlist."""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.pyplayer.app.services.playlist_registry import PlaylistRegistry
+from src.pyplayer.domain.media.video import Video
+from src.pyplayer.domain.playlist import Playlist
+from src.pyplayer.infrastructure.persistence.io_utils import write_json_atomic
+from src.pyplayer.shared.text import fold_text, tokenize, trigrams
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+# Per-term weights used to rank hits.
+SCORE_EXACT_TOKEN = 4.0
+SCORE_PREFIX_TOKEN = 2.5
+SCORE_SUBSTRING = 1.5
+SCORE_PATH_TOKEN = 0.5
+
+
+@dataclass
+class LibraryHit:
+    """A ranked search result pointing at a video inside a playlist."""
+
+    playlist: Playlist
+    video: Video
+    score: float
+
+
+class _Entry:
+    """Indexed (playlist, video) pair."""
+
+    __slots__ = ("playlist_id", "path", "folded_name", "name_tokens", "path_tokens", "video")
+
+    def __init__(
+        self,
+        playlist_id: str,
+        path: str,
+        folded_name: str,
+        name_tokens: Tuple[str, ...],
+        path_tokens: Tuple[str, ...],
+        video: Optional[Video] = None,
+    ) -> None:
+        self.playlist_id = playlist_id
+        self.path = path
+        self.folded_name = folded_name
+        self.name_tokens = name_tokens
+        self.path_tokens = path_tokens
+        self.video = video
+
+
+class LibraryIndex:
+    """
+    Index inverse (tokens + trigrammes) de toutes les videos du registre.
+
+    L'index est maintenu incrementalement : chaque playlist expose un compteur
+    de revision, et seules les playlists modifiees depuis la derniere
+    synchronisation sont rediffusees (diff par chemin, pas de reconstruction).
+    """
+
+    def __init__(self, registry: PlaylistRegistry, index_file: Optional[Path] = None) -> None:
+        self._registry = registry
+        self.index_file = Path(index_file) if index_file else None
+
+        self._entries: Dict[int, _Entry] = {}
+        self._entry_ids: Dict[Tuple[str, str], int] = {}
+        self._by_playlist: Dict[str, Set[int]] = {}
+        self._tokens: Dict[str, Set[int]] = {}
+        self._path_tokens: Dict[str, Set[int]] = {}
+        self._trigrams: Dict[str, Set[int]] = {}
+        self._revisions: Dict[str, int] = {}
+        self._sorted_vocabulary: Optional[List[str]] = None
+        self._next_id = 0
+        self._dirty = False
+
+    # --- maintenance ---
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+    def refresh(self) -> int:
+        """Bring the index in line with the registry. Returns the number of changed entries."""
+        changed = 0
+        live_ids = set()
+        for playlist_id, playlist in self._registry.iterate_items():
+            live_ids.add(playlist_id)
+            revision = getattr(playlist, "revision", None)
+            if revision is not None and self._revisions.get(playlist_id) == revision:
+                continue
+            changed += self.sync_playlist(playlist)
+
+        for stale_id in [pid for pid in self._by_playlist if pid not in live_ids]:
+            changed += self.remove_playlist(stale_id)
+        return changed
+
+    def sync_playlist(self, playlist: Playlist) -> int:
+        """Diff ``playlist`` against its indexed entries and apply only the differences."""
+        playlist_id = playlist.id
+        indexed = self._by_playlist.setdefault(playlist_id, set())
+        current: Dict[str, Video] = {str(video.file_path): video for video in playlist.videos}
+
+        changed = 0
+        for entry_id in list(indexed):
+            entry = self._entries[entry_id]
+            video = current.pop(entry.path, None)
+            if video is None:
+                self._remove_entry(entry_id)
+                changed += 1
+            else:
+                entry.video = video
+
+        for path, video in current.items():
+            self._add_entry(playlist_id, path, video.name, video)
+            changed += 1
+
+        self._revisions[playlist_id] = getattr(playlist, "revision", 0)
+        if changed:
+            self._dirty = True
+        return changed
+
+    def remove_playlist(self, playlist_id: str) -> int:
+        """Drop every entry belonging to ``playlist_id``."""
+        entry_ids = self._by_playlist.pop(playlist_id, set())
+        for entry_id in list(entry_ids):
+            self._remove_entry(entry_id)
+        self._revisions.pop(playlist_id, None)
+        if entry_ids:
+            self._dirty = True
+        return len(entry_ids)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._entry_ids.clear()
+        self._by_playlist.clear()
+        self._tokens.clear()
+        self._path_tokens.clear()
+        self._trigrams.clear()
+        self._revisions.clear()
+        self._sorted_vocabulary = None
+        self._next_id = 0
+        self._dirty = True
+
+    def _add_entry(self, playlist_id: str, path: str, name: str, video: Optional[Video]) -> int:
+        folded_name = fold_text(name)
+        name_tokens = tuple(dict.fromkeys(tokenize(name)))
+        parent = str(Path(path).parent)
+        path_tokens = tuple(token for token in dict.fromkeys(tokenize(parent)) if token not in name_tokens)
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._insert(entry_id, _Entry(playlist_id, path, folded_name, name_tokens, path_tokens, video))
+        return entry_id
+
+    def _insert(self, entry_id: int, entry: _Entry) -> None:
+        self._entries[entry_id] = entry
+        self._entry_ids[(entry.playlist_id, entry.path)] = entry_id
+        self._by_playlist.setdefault(entry.playlist_id, set()).add(entry_id)
+        for token in entry.name_tokens:
+            bucket = self._tokens.get(token)
+            if bucket is None:
+                self._tokens[token] = bucket = set()
+                self._sorted_vocabulary = None
+            bucket.add(entry_id)
+        for token in entry.path_tokens:
+            self._path_tokens.setdefault(token, set()).add(entry_id)
+        for gram in trigrams(entry.folded_name):
+            self._trigrams.setdefault(gram, set()).add(entry_id)
+
+    def _remove_entry(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        self._entry_ids.pop((entry.playlist_id, entry.path), None)
+        self._by_playlist.get(entry.playlist_id, set()).discard(entry_id)
+        if self._discard_postings(self._tokens, entry.name_tokens, entry_id):
+            self._sorted_vocabulary = None
+        self._discard_postings(self._path_tokens, entry.path_tokens, entry_id)
+        self._discard_postings(self._trigrams, trigrams(entry.folded_name), entry_id)
+
+    @staticmethod
+    def _discard_postings(postings: Dict[str, Set[int]], keys: Iterable[str], entry_id: int) -> bool:
+        """Remove ``entry_id`` from each posting list. Returns True if a key disappeared."""
+        emptied = False
+        for key in keys:
+            bucket = postings.get(key)
+            if bucket is None:
+                continue
+            bucket.discard(entry_id)
+            if not bucket:
+                del postings[key]
+                emptied = True
+        return emptied
+
+    # --- search ---
+    def search(self, query: str, limit: int = 50) -> List[LibraryHit]:
+        """Return ranked hits for every query term (AND semantics)."""
+        self.refresh()
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        scores: Optional[Dict[int, float]] = None
+        for term in terms:
+            term_scores = self._score_term(term)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    entry_id: score + term_scores[entry_id]
+                    for entry_id, score in scores.items()
+                    if entry_id in term_scores
+                }
+            if not scores:
+                return []
+
+        hits: List[LibraryHit] = []
+        for score in sorted(set(scores.values()), reverse=True):
+            tier = [entry_id for entry_id, value in scores.items() if value == score]
+            # Ties keep insertion order (playlist order) to stay cheap on large tiers.
+            for entry_id in heapq.nsmallest(limit - len(hits), tier):
+                hit = self._resolve(entry_id, score)
+                if hit is not None:
+                    hits.append(hit)
+            if len(hits) >= limit:
+                break
+        return hits
+
+    def _score_term(self, term: str) -> Dict[int, float]:
+        exact = self._tokens.get(term, set())
+        prefixed: Set[int] = set()
+        for token in self._vocabulary_with_prefix(term):
+            if token != term:
+                prefixed |= self._tokens[token]
+        prefixed -= exact
+
+        substring = self._substring_candidates(term) - exact - prefixed
+        if len(term) > 3:
+            # Trigram intersection is a superset: verify the (small) remainder.
+            substring = {entry_id for entry_id in substring if term in self._entries[entry_id].folded_name}
+
+        scores = dict.fromkeys(substring, SCORE_SUBSTRING)
+        scores.update(dict.fromkeys(prefixed, SCORE_PREFIX_TOKEN))
+        scores.update(dict.fromkeys(exact, SCORE_EXACT_TOKEN))
+        for entry_id in self._path_tokens.get(term, ()):
+            scores[entry_id] = scores.get(entry_id, 0.0) + SCORE_PATH_TOKEN
+        return scores
+
+    def _vocabulary_with_prefix(self, prefix: str) -> List[str]:
+        if self._sorted_vocabulary is None:
+            self._sorted_vocabulary = sorted(self._tokens)
+        vocabulary = self._sorted_vocabulary
+        start = bisect.bisect_left(vocabulary, prefix)
+        end = bisect.bisect_left(vocabulary, prefix + "\U0010ffff", start)
+        return vocabulary[start:end]
+
+    def _substring_candidates(self, term: str) -> Set[int]:
+        grams = trigrams(term)
+        if not grams:
+            # Too short for trigrams: fall back to the token vocabulary.
+            candidates: Set[int] = set()
+            for token, entry_ids in self._tokens.items():
+                if term in token:
+                    candidates |= entry_ids
+            return candidates
+
+        postings = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+        if not postings[0]:
+            return set()
+        return postings[0].intersection(*postings[1:])
+
+    def _resolve(self, entry_id: int, score: float) -> Optional[LibraryHit]:
+        entry = self._entries[entry_id]
+        playlist = self._registry.get(entry.playlist_id)
+        if playlist is None:
+            return None
+        if entry.video is None:
+            self.sync_playlist(playlist)
+            entry = self._entries.get(entry_id)
+            if entry is None or entry.video is None:
+                return None
+        return LibraryHit(playlist=playlist, video=entry.video, score=score)
+
+    # --- persistence ---
+    def save(self, index_file: Optional[Path] = None) -> bool:
+        """Persist entries and postings so the next boot skips tokenization."""
+        target = Path(index_file) if index_file else self.index_file
+        if target is None:
+            return False
+
+        entries = []
+        remap: Dict[int, int] = {}
+        for position, (entry_id, entry) in enumerate(self._entries.items()):
+            remap[entry_id] = position
+            entries.append([entry.playlist_id, entry.path, entry.folded_name])
+
+        def dump_postings(postings: Dict[str, Set[int]]) -> Dict[str, List[int]]:
+            return {key: sorted(remap[entry_id] for entry_id in ids) for key, ids in postings.items()}
+
+        data = {
+            "version": INDEX_FORMAT_VERSION,
+            "entries": entries,
+            "name_tokens": dump_postings(self._tokens),
+            "path_tokens": dump_postings(self._path_tokens),
+            "trigrams": dump_postings(self._trigrams),
+            "revisions": self._revisions,
+        }
+        try:
+            write_json_atomic(target, data, indent=None, ensure_ascii=False)
+            self._dirty = False
+            logger.info("Index bibliotheque sauvegarde: %s (%s entrees)", target, len(entries))
+            return True
+        except Exception as error:
+            logger.error("Erreur sauvegarde index bibliotheque: %s", error)
+            return False
+
+    def load(self, index_file: Optional[Path] = None) -> bool:
+        """Load a persisted index. Entries are re-attached to live videos lazily."""
+        source = Path(index_file) if index_file else self.index_file
+        if source is None or not source.exists():
+            return False
+
+        try:
+            with open(source, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if data.get("version") != INDEX_FORMAT_VERSION:
+                logger.info("Format d'index obsolete, reconstruction: %s", source)
+                return False
+
+            self.clear()
+            entry_tokens: Dict[int, List[str]] = {}
+            entry_path_tokens: Dict[int, List[str]] = {}
+            for token, ids in data.get("name_tokens", {}).items():
+                self._tokens[token] = set(ids)
+                for entry_id in ids:
+                    entry_tokens.setdefault(entry_id, []).append(token)
+            for token, ids in data.get("path_tokens", {}).items():
+                self._path_tokens[token] = set(ids)
+                for entry_id in ids:
+                    entry_path_tokens.setdefault(entry_id, []).append(token)
+            self._trigrams = {gram: set(ids) for gram, ids in data.get("trigrams", {}).items()}
+
+            for entry_id, (playlist_id, path, folded_name) in enumerate(data.get("entries", [])):
+                entry = _Entry(
+                    playlist_id,
+                    path,
+                    folded_name,
+                    tuple(entry_tokens.get(entry_id, ())),
+                    tuple(entry_path_tokens.get(entry_id, ())),
+                )
+                self._entries[entry_id] = entry
+                self._entry_ids[(playlist_id, path)] = entry_id
+                self._by_playlist.setdefault(playlist_id, set()).add(entry_id)
+            self._next_id = len(self._entries)
+            # Revisions are per-process counters: force a cheap diff on first refresh.
+            self._revisions.clear()
+            self._dirty = False
+            logger.info("Index bibliotheque charge: %s (%s entrees)", source, len(self._entries))
+            return True
+        except Exception as error:
+            logger.error("Erreur chargement index bibliotheque %s: %s", source, error)
+            self.clear()
+            return False
+
+
+__all__ = ["LibraryHit", "LibraryIndex"]
@@ -0,0 +1,220 @@
+"""MetadataProber — fills video duration and size from container headers in the background."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PySide6 import QtCore
+
+from src.pyplayer.domain.media import MediaMetadata, Video, read_media_metadata
+from src.pyplayer.domain.media.fingerprint import compute_fingerprint
+from src.pyplayer.infrastructure.cache.metadata_cache import MediaMetadataCache
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataProber(QtCore.QObject):
+    """
+    Sonde les en-tetes des videos sans bloquer l'interface.
+
+    Cached results (keyed by path, size and mtime) are applied as soon as
+    videos are enqueued. The rest goes to a priority queue shared by a small
+    thread pool: visible rows first, then the active playlist, then every
+    other playlist. Re-enqueueing a video with a better priority moves it up.
+    Worker threads only read headers; results are applied to the videos on
+    the UI thread and announced in batches through ``probed``.
+
+    While a file is open the worker also records its partial-content
+    fingerprint (unless disabled), so the file can still be recognised once
+    it has been moved or renamed.
+    """
+
+    PRIORITY_VISIBLE = 0
+    PRIORITY_PLAYLIST = 1
+    PRIORITY_BACKGROUND = 2
+
+    MAX_WORKERS = 4
+    BATCH_INTERVAL_MS = 100
+
+    probed = QtCore.Signal(object)  # list[Video] updated since the previous batch
+
+    def __init__(
+        self,
+        cache: MediaMetadataCache,
+        max_workers: int = MAX_WORKERS,
+        fingerprints: bool = True,
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+        self._cache = cache
+        self._max_workers = max(1, max_workers)
+        self._fingerprints = fingerprints
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[int, int, str]] = []
+        self._sequence = itertools.count()
+        self._priorities: Dict[str, int] = {}  # media key -> best queued priority
+        self._videos: Dict[str, Video] = {}  # media key -> video waiting for its result
+        self._active_workers = 0
+        self._results: "queue.SimpleQueue[Tuple[str, Optional[MediaMetadata], Optional[str]]]" = queue.SimpleQueue()
+        self._applied: List[Video] = []
+        self._started_at = 0.0
+        self._probed_count = 0
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setInterval(self.BATCH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._priorities)
+
+    @property
+    def is_idle(self) -> bool:
+        with self._lock:
+            return not self._priorities and self._active_workers == 0
+
+    @staticmethod
+    def needs_probe(video: Video) -> bool:
+        # Audio items never get a size: the duration is all they wait for
+        return video.duration <= 0 or (video.width <= 0 and not video.is_audio)
+
+    def enqueue(self, videos: Iterable[Video], priority: int = PRIORITY_PLAYLIST) -> int:
+        """Apply cached metadata and queue the remaining videos; return how many were queued."""
+        queued = 0
+        with self._lock:
+            for video in videos:
+                key = video.content_key
+                done = not self._fingerprints or self._cache.get_fingerprint(key) is not None
+                if self.needs_probe(video):
+                    cached = self._cache.get(key)
+                    if cached is not None:
+                        if self._apply(video, cached):
+                            self._applied.append(video)
+                    else:
+                        done = False
+                if done:
+                    continue
+                best = self._priorities.get(key)
+                if key in self._videos and (best is None or best <= priority):
+                    continue  # already being probed, or queued at least as urgently
+                self._priorities[key] = priority
+                self._videos[key] = video
+                heapq.heappush(self._heap, (priority, next(self._sequence), key))
+                queued += 1
+            start_workers = min(self._max_workers, len(self._priorities)) - self._active_workers
+            self._active_workers += max(0, start_workers)
+        if queued and not self._started_at:
+            self._started_at = time.perf_counter()
+        for _ in range(max(0, start_workers)):
+            self._pool().submit(self._work)
+        if self._applied and not queued:
+            # Cached results only: deliver them on the next event-loop turn
+            QtCore.QTimer.singleShot(0, self._flush)
+        if queued or self._active_workers:
+            self._flush_timer.start()
+        return queued
+
+    def cancel(self, priority: Optional[int] = None) -> None:
+        """Drop queued work (only at ``priority`` when given); probes already running finish."""
+        with self._lock:
+            if priority is None:
+                dropped = set(self._priorities)
+            else:
+                dropped = {key for key, value in self._priorities.items() if value == priority}
+            for key in dropped:
+                self._priorities.pop(key, None)
+                self._videos.pop(key, None)
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._flush_timer.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._flush()
+        self._cache.save()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="metadata-probe")
+        return self._executor
+
+    def _next_job(self) -> Optional[Tuple[str, Video]]:
+        with self._lock:
+            while self._heap:
+                priority, _, key = heapq.heappop(self._heap)
+                if self._priorities.get(key) != priority:
+                    continue  # superseded by a better priority, or cancelled
+                del self._priorities[key]
+                video = self._videos.get(key)
+                if video is not None:
+                    return key, video
+            self._active_workers -= 1
+            return None
+
+    def _work(self) -> None:
+        # Runs on a pool thread: header reads only, no Qt and no model updates
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            key, video = job
+            metadata = read_media_metadata(video.file_path)
+            fingerprint = compute_fingerprint(video.file_path) if self._fingerprints else None
+            self._results.put((key, metadata, fingerprint))
+
+    def _flush(self) -> None:
+        while True:
+            try:
+                key, metadata, fingerprint = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._cache.put(key, metadata)
+            if fingerprint is not None:
+                self._cache.put_fingerprint(key, fingerprint)
+            self._probed_count += 1
+            with self._lock:
+                video = self._videos.pop(key, None)
+            if video is not None and metadata is not None and self._apply(video, metadata):
+                self._applied.append(video)
+        if self._applied:
+            batch, self._applied = self._applied, []
+            self.probed.emit(batch)
+        if self.is_idle and self._results.empty():
+            self._flush_timer.stop()
+            self._on_idle()
+
+    def _on_idle(self) -> None:
+        if self._started_at:
+            logger.info(
+                "Sondage des metadonnees termine: %s fichiers en %.0f ms",
+                self._probed_count,
+                (time.perf_counter() - self._started_at) * 1000,
+            )
+            self._started_at = 0.0
+            self._probed_count = 0
+        self._cache.save()
+
+    @staticmethod
+    def _apply(video: Video, metadata: MediaMetadata) -> bool:
+        before = (video.duration, video.width, video.height, video.title)
+        video.update_metadata(
+            width=metadata.width,
+            height=metadata.height,
+            duration=metadata.duration_ms,
+            title=metadata.title,
+            artist=metadata.artist,
+            album=metadata.album,
+        )
+        return (video.duration, video.width, video.height, video.title) != before
+
+
+__all__ = ["MetadataProber"]
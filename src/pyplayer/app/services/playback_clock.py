@@ -0,0 +1,175 @@
+"""PlaybackClock — single sampling point for the playback position."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from PySide6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+
+def format_hms(ms: int) -> str:
+    """Format a position in milliseconds as ``HH:MM:SS``."""
+    seconds = max(ms, 0) // 1000
+    return f"{seconds // 3600:02d}:{(seconds % 3600) // 60:02d}:{seconds % 60:02d}"
+
+
+@dataclass(frozen=True)
+class PlaybackTick:
+    """
+    One coalesced position update.
+
+    ``position_text``/``duration_text`` are only reformatted when the
+    displayed second changes; ``second_changed`` tells consumers that only
+    care about the text (time label) whether there is anything to redraw.
+    """
+
+    position: int
+    duration: int
+    position_text: str
+    duration_text: str
+    second_changed: bool
+
+
+TickCallback = Callable[[PlaybackTick], None]
+
+
+class PlaybackClock(QtCore.QObject):
+    """
+    Horloge de lecture : echantillonne la position a cadence fixe et la diffuse.
+
+    Instead of every widget reacting to each ``positionChanged`` of the
+    player, the clock samples ``player.position()`` on its own timer while
+    playback runs (``ACTIVE_HZ``, lowered to ``BACKGROUND_HZ`` while the
+    window is hidden or minimized) and publishes one ``PlaybackTick`` to
+    every subscriber. Position changes outside playback (seek while paused)
+    go through ``request_sample()``, coalesced to one tick per event-loop
+    turn.
+    """
+
+    ACTIVE_HZ = 30
+    BACKGROUND_HZ = 2
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None, active_hz: int = ACTIVE_HZ, background_hz: int = BACKGROUND_HZ):
+        super().__init__(parent)
+        self._player: Any = None
+        self._subscribers: List[TickCallback] = []
+        self._active_hz = max(1, active_hz)
+        self._background_hz = max(1, background_hz)
+        self._background = False
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.sample)
+        self._sample_pending = False
+        self._last_position = -1
+        self._last_duration = -1
+        self._position_second = -1
+        self._duration_second = -1
+        self._position_text = format_hms(0)
+        self._duration_text = format_hms(0)
+        self._apply_interval()
+
+    # --- configuration ---
+    @property
+    def interval(self) -> int:
+        """Intervalle courant du timer, en millisecondes."""
+        return self._timer.interval()
+
+    @property
+    def is_running(self) -> bool:
+        return self._timer.isActive()
+
+    @property
+    def is_background(self) -> bool:
+        return self._background
+
+    def set_rates(self, active_hz: int, background_hz: Optional[int] = None) -> None:
+        self._active_hz = max(1, active_hz)
+        if background_hz is not None:
+            self._background_hz = max(1, background_hz)
+        self._apply_interval()
+
+    def set_background(self, background: bool) -> None:
+        """Bascule la cadence reduite (fenetre cachee ou minimisee)."""
+        if background == self._background:
+            return
+        self._background = background
+        self._apply_interval()
+        logger.debug("Horloge de lecture: %s Hz", self._background_hz if background else self._active_hz)
+
+    def _apply_interval(self) -> None:
+        hz = self._background_hz if self._background else self._active_hz
+        self._timer.setInterval(max(1, round(1000 / hz)))
+
+    # --- source ---
+    def set_player(self, player: Any) -> None:
+        """Attach the object sampled by the clock (anything with ``position()``/``duration()``)."""
+        self._player = player
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the last published values so the next sample is published in full."""
+        self._last_position = self._last_duration = -1
+        self._position_second = self._duration_second = -1
+
+    def start(self) -> None:
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self) -> None:
+        """Stop periodic sampling after publishing the final position."""
+        self._timer.stop()
+        self.sample()
+
+    # --- consumers ---
+    def subscribe(self, callback: TickCallback) -> None:
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: TickCallback) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    # --- sampling ---
+    def request_sample(self, *args) -> None:
+        """Ask for a sample on the next event-loop turn; no-op while the timer already runs."""
+        if self._timer.isActive() or self._sample_pending:
+            return
+        self._sample_pending = True
+        QtCore.QTimer.singleShot(0, self.sample)
+
+    def sample(self) -> Optional[PlaybackTick]:
+        """Read the player once and publish a tick if anything changed."""
+        self._sample_pending = False
+        player = self._player
+        if player is None:
+            return None
+        position = max(player.position(), 0)
+        duration = max(player.duration(), 0)
+        if position == self._last_position and duration == self._last_duration:
+            return None
+        self._last_position, self._last_duration = position, duration
+
+        second_changed = False
+        if position // 1000 != self._position_second:
+            self._position_second = position // 1000
+            self._position_text = format_hms(position)
+            second_changed = True
+        if duration // 1000 != self._duration_second:
+            self._duration_second = duration // 1000
+            self._duration_text = format_hms(duration)
+            second_changed = True
+
+        tick = PlaybackTick(position, duration, self._position_text, self._duration_text, second_changed)
+        for callback in list(self._subscribers):
+            try:
+                callback(tick)
+            except Exception as error:
+                logger.error("Erreur abonne horloge de lecture: %s", error)
+        return tick
+
+
+__all__ = ["PlaybackClock", "PlaybackTick", "format_hms"]
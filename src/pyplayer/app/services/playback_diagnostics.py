@@ -0,0 +1,325 @@
+"""PlaybackDiagnostics — frame delivery, dropped frames and UI stalls measured during playback."""
+
+from __future__ import annotations
+
+import bisect
+import copy
+import json
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from PySide6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the jitter histogram buckets; one more bucket holds anything slower
+JITTER_BUCKETS_MS = (2, 4, 8, 16, 33, 66)
+# A frame arriving later than its presentation interval plus this margin is late
+LATE_MARGIN_MS = 8.0
+# A timestamp jump this big, or backwards, is a seek or a new item, not dropped frames
+DISCONTINUITY_US = 1_000_000
+# An event-loop turn delayed by more than this is a UI stall
+STALL_MS = 50.0
+
+
+def jitter_bucket(jitter_ms: float) -> int:
+    return bisect.bisect_left(JITTER_BUCKETS_MS, jitter_ms)
+
+
+def jitter_labels() -> List[str]:
+    return [f"<{bound}" for bound in JITTER_BUCKETS_MS] + [f">{JITTER_BUCKETS_MS[-1]}"]
+
+
+class _FrameClock:
+    """Intervals between successive frames seen at one observation point."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.pts: Optional[int] = None
+        self.at = 0.0
+
+    def step(self, pts_us: int, at: float) -> Optional[Tuple[float, float]]:
+        """Return (expected ms, actual ms) since the previous frame, None at a discontinuity."""
+        previous, previous_at = self.pts, self.at
+        self.pts, self.at = pts_us, at
+        if previous is None:
+            return None
+        delta = pts_us - previous
+        if delta <= 0 or delta > DISCONTINUITY_US:
+            return None
+        return delta / 1000, (at - previous_at) * 1000
+
+
+class FrameStatistics:
+    """
+    Compteurs de livraison des images, par fenetre et pour toute la session.
+
+    Each frame is recorded twice: when the backend delivers it
+    (``record_delivery``, any thread) and when the UI thread handles it
+    (``record_display``). Comparing each interval with the presentation
+    timestamps tells where time was lost:
+
+    * gaps in the timestamps are frames dropped before delivery;
+    * late deliveries point at decoding;
+    * on-time deliveries handled late point at the UI thread, and are
+      counted as ``late_in_stall`` when a recorded event-loop stall
+      overlaps them.
+    """
+
+    NOMINAL_HISTORY = 120
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._delivery = _FrameClock()
+        self._display = _FrameClock()
+        self._intervals: Deque[float] = deque(maxlen=self.NOMINAL_HISTORY)
+        self._stalls: Deque[Tuple[float, float]] = deque(maxlen=256)
+        self._late_spans: List[Tuple[float, float]] = []
+        self.totals = self._empty()
+        self._window = self._empty()
+        self._window_started: Optional[float] = None
+
+    @staticmethod
+    def _empty() -> Dict[str, Any]:
+        return {
+            "frames": 0,
+            "dropped": 0,
+            "late_delivery": 0,
+            "late_display": 0,
+            "late_in_stall": 0,
+            "stalls": 0,
+            "stall_max_ms": 0.0,
+            "jitter_delivery": [0] * (len(JITTER_BUCKETS_MS) + 1),
+            "jitter_display": [0] * (len(JITTER_BUCKETS_MS) + 1),
+        }
+
+    def _add(self, key: str, value: int = 1) -> None:
+        self.totals[key] += value
+        self._window[key] += value
+
+    def _add_jitter(self, key: str, jitter_ms: float) -> None:
+        bucket = jitter_bucket(jitter_ms)
+        self.totals[key][bucket] += 1
+        self._window[key][bucket] += 1
+
+    @property
+    def nominal_interval_ms(self) -> float:
+        return statistics.median(self._intervals) if self._intervals else 0.0
+
+    def reset_clocks(self) -> None:
+        """Forget the previous frame (seek, new item) so the jump is not counted as drops."""
+        with self._lock:
+            self._delivery.reset()
+            self._display.reset()
+            self._intervals.clear()
+
+    def record_delivery(self, pts_us: Optional[int], at: float) -> None:
+        with self._lock:
+            if self._window_started is None:
+                self._window_started = at
+            self._add("frames")
+            if pts_us is None or pts_us < 0:
+                return
+            step = self._delivery.step(pts_us, at)
+            if step is None:
+                return
+            expected, actual = step
+            self._intervals.append(expected)
+            nominal = self.nominal_interval_ms
+            if nominal > 0:
+                self._add("dropped", max(0, round(expected / nominal) - 1))
+            self._add_jitter("jitter_delivery", abs(actual - expected))
+            if actual > expected + LATE_MARGIN_MS:
+                self._add("late_delivery")
+
+    def record_display(self, pts_us: Optional[int], at: float) -> None:
+        with self._lock:
+            if pts_us is None or pts_us < 0:
+                return
+            step = self._display.step(pts_us, at)
+            if step is None:
+                return
+            expected, actual = step
+            self._add_jitter("jitter_display", abs(actual - expected))
+            if actual > expected + LATE_MARGIN_MS:
+                self._add("late_display")
+                self._late_spans.append((at - actual / 1000, at))
+
+    def record_stall(self, started: float, duration_ms: float) -> None:
+        with self._lock:
+            self._stalls.append((started, started + duration_ms / 1000))
+            self._add("stalls")
+            for counters in (self.totals, self._window):
+                counters["stall_max_ms"] = max(counters["stall_max_ms"], round(duration_ms, 1))
+
+    def take_window(self, now: float) -> Dict[str, Any]:
+        """Return the counters since the previous call, with the delivered frame rate."""
+        with self._lock:
+            self._match_stalls(now)
+            window = self._window
+            started = self._window_started if self._window_started is not None else now
+            elapsed = max(now - started, 1e-6)
+            window["seconds"] = round(elapsed, 3)
+            window["fps"] = round(window["frames"] / elapsed, 2) if window["frames"] else 0.0
+            window["interval_ms"] = round(self.nominal_interval_ms, 2)
+            self._window = self._empty()
+            self._window_started = now
+            return window
+
+    def _match_stalls(self, now: float) -> None:
+        # A stall is only recorded once it is over: late spans that just ended wait for the next window
+        pending = []
+        for start, end in self._late_spans:
+            if end > now - STALL_MS / 1000:
+                pending.append((start, end))
+            elif any(stall_start < end and stall_end > start for stall_start, stall_end in self._stalls):
+                self._add("late_in_stall")
+        self._late_spans = pending
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            summary = copy.deepcopy(self.totals)
+            summary["interval_ms"] = round(self.nominal_interval_ms, 2)
+            return summary
+
+
+class PlaybackDiagnostics(QtCore.QObject):
+    """
+    Mode diagnostic de lecture : statistiques par seconde, journal JSONL.
+
+    ``tap(sink)`` listens to a ``QVideoSink``: a direct connection stamps
+    each frame on the thread that delivers it, a second (queued) one when
+    the UI thread gets to it. A precise 10 ms timer measures event-loop
+    stalls. Every second the window counters are emitted (``report``,
+    for the overlay) and appended to ``playback-<date>.jsonl`` in
+    ``log_dir``, followed by the session totals on ``stop()``.
+    """
+
+    REPORT_INTERVAL_MS = 1000
+    MONITOR_INTERVAL_MS = 10
+
+    report = QtCore.Signal(object)  # dict des compteurs de la derniere seconde
+
+    def __init__(self, log_dir: Optional[Path] = None, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.stats = FrameStatistics()
+        self._log_dir = Path(log_dir) if log_dir else None
+        self._log_file = None
+        self.log_path: Optional[Path] = None
+        self._sinks: List[Any] = []
+        self._position: Optional[Callable[[], int]] = None
+        self._source = ""
+        self._last_tick = 0.0
+        self._monitor = QtCore.QTimer(self)
+        self._monitor.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._monitor.setInterval(self.MONITOR_INTERVAL_MS)
+        self._monitor.timeout.connect(self._on_monitor)
+        self._reporter = QtCore.QTimer(self)
+        self._reporter.setInterval(self.REPORT_INTERVAL_MS)
+        self._reporter.timeout.connect(self._on_report)
+
+    @property
+    def active(self) -> bool:
+        return self._reporter.isActive()
+
+    # --- configuration ---
+    def tap(self, sink: Any) -> None:
+        """Listen to ``sink.videoFrameChanged`` (a QVideoSink)."""
+        if sink in self._sinks:
+            return
+        sink.videoFrameChanged.connect(self._on_frame_delivered, QtCore.Qt.ConnectionType.DirectConnection)
+        sink.videoFrameChanged.connect(self._on_frame_displayed, QtCore.Qt.ConnectionType.QueuedConnection)
+        self._sinks.append(sink)
+
+    def untap(self) -> None:
+        for sink in self._sinks:
+            sink.videoFrameChanged.disconnect(self._on_frame_delivered)
+            sink.videoFrameChanged.disconnect(self._on_frame_displayed)
+        self._sinks = []
+
+    def set_position_source(self, position: Optional[Callable[[], int]]) -> None:
+        self._position = position
+
+    def set_source(self, source: str) -> None:
+        """New item: its first frame is not compared with the previous item's last one."""
+        self._source = source
+        self.stats.reset_clocks()
+        if self.active:
+            self._write({"event": "source", "source": source})
+
+    # --- session ---
+    def start(self) -> None:
+        if self.active:
+            return
+        self._last_tick = time.perf_counter()
+        self._monitor.start()
+        self._reporter.start()
+        logger.info("Diagnostic de lecture actif")
+
+    def stop(self) -> None:
+        if not self.active:
+            return
+        self._monitor.stop()
+        self._reporter.stop()
+        self._on_report()
+        if self._log_file is not None:
+            self._write({"event": "summary", **self.stats.summary()})
+            self._log_file.close()
+            self._log_file = None
+            logger.info("Diagnostic de lecture ecrit dans %s", self.log_path)
+
+    # --- frames ---
+    def _on_frame_delivered(self, frame: Any) -> None:
+        # Backend thread: only stamp the frame, no Qt object is touched here
+        if frame.isValid():
+            self.stats.record_delivery(frame.startTime(), time.perf_counter())
+
+    def _on_frame_displayed(self, frame: Any) -> None:
+        if frame.isValid():
+            self.stats.record_display(frame.startTime(), time.perf_counter())
+
+    # --- event loop ---
+    def _on_monitor(self) -> None:
+        now = time.perf_counter()
+        lag_ms = (now - self._last_tick) * 1000 - self.MONITOR_INTERVAL_MS
+        if lag_ms > STALL_MS:
+            self.stats.record_stall(self._last_tick, lag_ms)
+        self._last_tick = now
+
+    def _on_report(self) -> None:
+        window = self.stats.take_window(time.perf_counter())
+        if not window["frames"] and not window["stalls"]:
+            return  # paused or stopped: nothing worth logging
+        if self._position is not None:
+            window["position_ms"] = self._position()
+        self._write({"event": "window", **window})
+        self.report.emit(window)
+
+    # --- JSONL log ---
+    def _write(self, record: Dict[str, Any]) -> None:
+        if self._log_dir is None:
+            return
+        if self._log_file is None:
+            try:
+                self._log_dir.mkdir(parents=True, exist_ok=True)
+                self.log_path = self._log_dir / f"playback-{time.strftime('%Y%m%d-%H%M%S')}.jsonl"
+                self._log_file = open(self.log_path, "a", encoding="utf-8")
+            except OSError as exc:
+                logger.warning("Journal de diagnostic impossible a ouvrir: %s", exc)
+                self._log_dir = None
+                return
+            header = {"event": "session", "jitter_buckets_ms": jitter_labels(), "source": self._source}
+            self._log_file.write(json.dumps(header, separators=(",", ":")) + "\n")
+        record = {"t": round(time.time(), 3), **record}
+        self._log_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._log_file.flush()
+
+
+__all__ = ["FrameStatistics", "PlaybackDiagnostics", "jitter_bucket", "jitter_labels"]
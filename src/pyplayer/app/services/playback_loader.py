@@ -0,0 +1,158 @@
+"""PlaybackLoader — opens an item, seeks to its resume point and only then starts playback."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from PySide6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+
+class LoadState(Enum):
+    IDLE = "idle"
+    LOADING = "loading"  # source set, waiting for LoadedMedia
+    SEEKING = "seeking"  # resume position sent, playback started, waiting for its first frame
+    STARTING = "starting"  # no resume point, waiting for the first frame
+    PLAYING = "playing"
+
+
+class PlaybackLoader(QtCore.QObject):
+    """
+    Chargement d'un element : source -> media charge -> reprise -> lecture.
+
+    ``play()`` used to be called right after ``setSource`` and the resume
+    seek only once the media was loaded, so the start of the file was
+    decoded and shown before the jump. Here ``play()`` waits for
+    ``media_loaded()`` and comes after ``setPosition(resume)``: the decoder
+    starts at the resume point and the first frame shown is the right one.
+
+    The player is driven by the caller forwarding its status changes
+    (``media_loaded`` / ``media_failed``) and first output (``notify_frame``
+    for video, ``notify_position`` for audio only). The time from the
+    request (usually the click) to that first output is recorded.
+    """
+
+    FIRST_FRAME_TIMEOUT_MS = 5000
+    LATENCY_HISTORY = 200
+
+    state_changed = QtCore.Signal(object)  # LoadState
+    first_frame = QtCore.Signal(float)  # ms depuis la demande
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._player: Any = None
+        self._state = LoadState.IDLE
+        self._frame_driven = True
+        self._resume_ms = 0
+        self._requested_at = 0.0
+        # (latence ms, reprise ms) des premieres images, les plus recentes a la fin
+        self.latencies: Deque[Tuple[float, int]] = deque(maxlen=self.LATENCY_HISTORY)
+        self.timeouts = 0
+        self._timeout = QtCore.QTimer(self)
+        self._timeout.setSingleShot(True)
+        self._timeout.setInterval(self.FIRST_FRAME_TIMEOUT_MS)
+        self._timeout.timeout.connect(self._on_timeout)
+
+    # --- configuration ---
+    def set_player(self, player: Any) -> None:
+        """Attach the player (anything with ``setSource()``, ``setPosition()`` and ``play()``)."""
+        self._player = player
+        self.cancel()
+
+    @property
+    def state(self) -> LoadState:
+        return self._state
+
+    @property
+    def busy(self) -> bool:
+        return self._state not in (LoadState.IDLE, LoadState.PLAYING)
+
+    # --- requests ---
+    def load(self, source: Any, resume_ms: int = 0, requested_at: Optional[float] = None, loaded: bool = False) -> None:
+        """
+        Open ``source`` and play it from ``resume_ms``.
+
+        ``loaded`` tells the source is already open in the player (same
+        source, which ``setSource`` would ignore): the seek and play are
+        then issued at once.
+        """
+        if self._player is None:
+            return
+        self._timeout.stop()
+        self._resume_ms = max(0, int(resume_ms))
+        self._requested_at = time.perf_counter() if requested_at is None else requested_at
+        if loaded:
+            self._set_state(LoadState.LOADING)
+            self.media_loaded()
+            return
+        # State first: some backends report LoadedMedia from inside setSource
+        self._set_state(LoadState.LOADING)
+        self._player.setSource(source)
+
+    def cancel(self) -> None:
+        self._timeout.stop()
+        self._set_state(LoadState.IDLE)
+
+    # --- player feedback ---
+    def media_loaded(self, has_video: bool = True) -> None:
+        if self._state is not LoadState.LOADING:
+            return
+        self._frame_driven = bool(has_video)
+        if self._resume_ms > 0:
+            self._set_state(LoadState.SEEKING)
+            self._player.setPosition(self._resume_ms)
+        else:
+            self._set_state(LoadState.STARTING)
+        self._timeout.start()
+        self._player.play()
+
+    def media_failed(self) -> None:
+        if self._state is LoadState.IDLE:
+            return
+        logger.warning("Chargement du media impossible")
+        self.cancel()
+
+    def notify_frame(self, *args) -> None:
+        if self._frame_driven:
+            self._first_output()
+
+    def notify_position(self, *args) -> None:
+        if not self._frame_driven:
+            self._first_output()
+
+    def _first_output(self) -> None:
+        if self._state not in (LoadState.SEEKING, LoadState.STARTING):
+            return
+        self._timeout.stop()
+        latency = (time.perf_counter() - self._requested_at) * 1000
+        self.latencies.append((latency, self._resume_ms))
+        logger.info("Premiere image en %.1f ms (reprise a %d ms)", latency, self._resume_ms)
+        self._set_state(LoadState.PLAYING)
+        self.first_frame.emit(latency)
+
+    def _on_timeout(self) -> None:
+        if self._state in (LoadState.SEEKING, LoadState.STARTING):
+            self.timeouts += 1
+            logger.debug("Aucune image %d ms apres le lancement", self.FIRST_FRAME_TIMEOUT_MS)
+            self._set_state(LoadState.PLAYING)
+
+    def _set_state(self, state: LoadState) -> None:
+        if state is not self._state:
+            self._state = state
+            self.state_changed.emit(state)
+
+    # --- instrumentation ---
+    def latency_summary(self) -> Dict[str, float]:
+        """Count, mean and max of request->first frame latency (ms) over the recent history."""
+        values = [latency for latency, _ in self.latencies]
+        if not values:
+            return {"count": 0, "mean": 0.0, "max": 0.0}
+        return {"count": len(values), "mean": sum(values) / len(values), "max": max(values)}
+
+
+__all__ = ["LoadState", "PlaybackLoader"]
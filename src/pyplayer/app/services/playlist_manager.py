@@ -5,14 +5,21 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from PySide6 import QtCore
 
-from src.pyplayer.app.services.playlist_registry import PlaylistRegistry
+from src.pyplayer.app.services.fingerprint_service import FingerprintService
+from src.pyplayer.app.services.library_index import LibraryHit, LibraryIndex
+from src.pyplayer.app.services.playlist_registry import PlaylistHeader, PlaylistRegistry
+from src.pyplayer.app.services.relink_engine import RelinkEngine
+from src.pyplayer.domain.media.media_library import MediaLibrary
+from src.pyplayer.domain.media.video import Video
 from src.pyplayer.domain.playlist import Playlist
 from src.pyplayer.infrastructure.backup.backup_cleaner import BackupCleaner
+from src.pyplayer.infrastructure.cache.metadata_cache import MediaMetadataCache
 from src.pyplayer.infrastructure.config.settings import CONFIG
+from src.pyplayer.infrastructure.filesystem.directory_listing import DirectoryListingCache
 from src.pyplayer.infrastructure.persistence.manager_config_store import ManagerConfigStore
 from src.pyplayer.infrastructure.persistence.playlist_repository import PlaylistRepository
 from src.pyplayer.infrastructure.persistence.last_played_store import LastPlayedStore
@@ -34,6 +41,9 @@ class PlaylistManager:
         config_store: Optional[ManagerConfigStore] = None,
         last_played_store: Optional[LastPlayedStore] = None,
         backup_cleaner: Optional[BackupCleaner] = None,
+        library_index: Optional[LibraryIndex] = None,
+        media_library: Optional[MediaLibrary] = None,
+        metadata_cache: Optional[MediaMetadataCache] = None,
         synchronous: bool = False,
     ):
         if data_dir:
@@ -47,11 +57,32 @@ class PlaylistManager:
         self._last_played_file = self.data_dir / "last_played.json"
 
         # Inject dependencies or create defaults
+        self._media_library = (
+            media_library
+            if media_library is not None
+            else MediaLibrary(self.data_dir / "media_library.json")
+        )
+        self._media_library.load()
         self._registry = registry if registry is not None else PlaylistRegistry()
-        self._repository = repository if repository is not None else PlaylistRepository(self.data_dir)
+        self._repository = (
+            repository
+            if repository is not None
+            else PlaylistRepository(self.data_dir, library=self._media_library)
+        )
         self._config_store = config_store if config_store is not None else ManagerConfigStore(self._config_file)
         self._last_played_store = last_played_store if last_played_store is not None else LastPlayedStore(self._last_played_file)
         self._backup_cleaner = backup_cleaner if backup_cleaner is not None else BackupCleaner(self.data_dir)
+        self._library_index = (
+            library_index
+            if library_index is not None
+            else LibraryIndex(self._registry, self.data_dir / "cache" / "library_index.json")
+        )
+        self._metadata_cache = (
+            metadata_cache
+            if metadata_cache is not None
+            else MediaMetadataCache(self.data_dir / "cache" / "media_metadata.json")
+        )
+        self._metadata_cache.load()
 
         self._volume: float = 0.45
         self._last_played_id: Optional[str] = None
@@ -64,6 +95,7 @@ class PlaylistManager:
         self._synchronous = synchronous
 
         self._load_config()
+        self._library_index.load()
 
         if synchronous:
             # Legacy behavior: load synchronously
@@ -125,13 +157,38 @@ class PlaylistManager:
     def playlist_names(self) -> Dict[str, str]:
         return self._registry.names_map()
 
+    def playlist_headers(self) -> List[PlaylistHeader]:
+        """Resumes legers de toutes les playlists, dans l'ordre du registre."""
+        return self._registry.headers()
+
+    @property
+    def media_library(self) -> MediaLibrary:
+        return self._media_library
+
+    @property
+    def metadata_cache(self) -> MediaMetadataCache:
+        return self._metadata_cache
+
+    @property
+    def library_index(self) -> LibraryIndex:
+        return self._library_index
+
+    def search_library(self, query: str, limit: int = 50) -> List[LibraryHit]:
+        """Recherche plein texte dans toutes les playlists."""
+        return self._library_index.search(query, limit=limit)
+
+    def save_library_index(self) -> bool:
+        if not self._library_index.is_dirty:
+            return True
+        return self._library_index.save()
+
     def create_playlist(
         self,
         source_path: Optional[Path] = None,
         name: Optional[str] = None,
     ) -> Playlist:
         try:
-            playlist = Playlist(source_path)
+            playlist = Playlist(source_path, library=self._media_library)
             if name:
                 playlist.name = name
 
@@ -181,12 +238,15 @@ class PlaylistManager:
 
     def save_all_playlists(self) -> bool:
         success = True
-        for playlist in self._registry.iterate_items():
+        for _, playlist in self._registry.iterate_items():
             if hasattr(playlist, "save_file_path") and playlist.save_file_path:
                 if not playlist.save_to_file(playlist.save_file_path):
                     success = False
                     logger.error("Echec sauvegarde: %s", playlist.name)
 
+        if self._media_library.is_dirty and not self._media_library.save():
+            success = False
+
         if success:
             logger.info("Toutes les playlists sauvegardees")
 
@@ -305,30 +365,82 @@ class PlaylistManager:
             "is_last_played": playlist_id == self._last_played_id,
         }
 
+    def notify_metadata_changed(self, videos: Iterable[Video]) -> List[Playlist]:
+        """
+        Announce probed metadata to every playlist holding one of ``videos``.
+
+        Videos are shared through the media library, so a background probe
+        started for one playlist also fills entries of the others; each of
+        them refreshes its total duration and emits its row changes.
+        Returns the playlists that contained at least one of the videos.
+        """
+        videos = list(videos)
+        return [
+            playlist
+            for _, playlist in self._registry.iterate_items()
+            if playlist.notify_metadata_changed(videos)
+        ]
+
     def cleanup(self) -> Dict[str, int]:
+        """
+        Remove missing files from every playlist.
+
+        Every folder referenced by any playlist is listed once, concurrently,
+        into a shared listing cache; each playlist is then compacted in a
+        single pass on the calling thread (change listeners are not thread
+        safe) and only the playlists that changed are saved.
+        """
         removed = 0
         cleaned = 0
-
-        for playlist in list(self._registry.iterate_items()):
-            if hasattr(playlist, "remove_missing_files"):
-                removed_videos = playlist.remove_missing_files()
-                if removed_videos:
-                    removed += len(removed_videos)
-                    cleaned += 1
-                    logger.info(
-                        "Playlist nettoyee: %s (%s videos supprimees)",
-                        playlist.name,
-                        len(removed_videos),
-                    )
+        playlists = [playlist for _, playlist in self._registry.iterate_items()]
+        listings = DirectoryListingCache()
+        listings.prefetch(video.file_path for playlist in playlists for video in playlist.videos)
+
+        for playlist in playlists:
+            # Saved once below, not also by the playlist's own auto-save
+            removed_videos = playlist.remove_missing_files(exists=listings.exists, auto_save=False)
+            if removed_videos:
+                removed += len(removed_videos)
+                cleaned += 1
+                logger.info(
+                    "Playlist nettoyee: %s (%s videos supprimees)",
+                    playlist.name,
+                    len(removed_videos),
+                )
+                if playlist.save_file_path and not playlist.save_to_file(playlist.save_file_path):
+                    logger.error("Echec sauvegarde: %s", playlist.name)
 
         if removed > 0:
-            self.save_all_playlists()
+            self._prune_media_library()
+            self._sync_library_index()
 
         return {
             "playlists_cleaned": cleaned,
             "videos_removed": removed,
         }
 
+    def relink_missing(self, search_roots: Optional[List[Path]] = None) -> Dict[str, int]:
+        """Relink moved or renamed videos of every playlist: by name first, then by content."""
+        roots = CONFIG.search_roots() if search_roots is None else list(search_roots)
+        playlists = [playlist for _, playlist in self._registry.iterate_items()]
+        engine = RelinkEngine(FingerprintService(self._metadata_cache))
+        report = engine.resolve(playlists, roots)
+        self._metadata_cache.save()
+
+        result = engine.apply(playlists, report)
+        if result["videos_relinked"]:
+            self._prune_media_library()
+            self._sync_library_index()
+        result["videos_missing"] = report.missing_count
+        result["videos_ambiguous"] = len(report.ambiguous)
+        return result
+
+    def find_duplicates(self) -> List[List[str]]:
+        """Return groups of library files with identical content."""
+        duplicates = FingerprintService(self._metadata_cache).find_library_duplicates(self._media_library)
+        self._metadata_cache.save()
+        return duplicates
+
     def cleanup_backups(
         self,
         max_backups_per_playlist: int = 5,
@@ -377,6 +489,29 @@ class PlaylistManager:
             self._registry.add(playlist)
         self._playlists_loaded = True
         self._loading_state = "loaded"
+        self._prune_media_library()
+        self._sync_library_index()
+
+    def _prune_media_library(self) -> None:
+        """Drop library records that no playlist references anymore."""
+        try:
+            referenced = [
+                video
+                for _, playlist in self._registry.iterate_items()
+                for video in playlist.videos
+            ]
+            if self._media_library.prune(referenced) or self._media_library.is_dirty:
+                self._media_library.save()
+        except Exception as error:
+            logger.error("Erreur nettoyage bibliotheque media: %s", error)
+
+    def _sync_library_index(self) -> None:
+        """Bring the library index up to date and persist it if it changed."""
+        try:
+            self._library_index.refresh()
+            self.save_library_index()
+        except Exception as error:
+            logger.error("Erreur synchronisation index bibliotheque: %s", error)
 
     def _ensure_default_playlist(self) -> None:
         """Ensure at least one playlist exists."""
@@ -406,7 +541,9 @@ class PlaylistManager:
             self._loading_state = "loaded"
 
             # Schedule deferred operations
+            QtCore.QTimer.singleShot(50, self._prune_media_library)
             QtCore.QTimer.singleShot(100, self._cleanup_backups_async)
+            QtCore.QTimer.singleShot(200, self._sync_library_index)
 
             # Notify callback if set
             if self._loading_callback:
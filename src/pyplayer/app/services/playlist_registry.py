@@ -3,13 +3,81 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from src.pyplayer.domain.playlist import Playlist
 
 logger = __import__("logging").getLogger(__name__)
 
 
+class PlaylistHeader:
+    """
+    Lightweight summary of a registered playlist, for list views.
+
+    Identity and video count are read directly from the playlist. Total
+    duration and progress need a pass over the videos, so they are computed
+    on first access and cached until ``invalidate()``.
+    """
+
+    __slots__ = ("_playlist", "_stats")
+
+    def __init__(self, playlist: Playlist) -> None:
+        self._playlist = playlist
+        self._stats: Optional[Tuple[int, float]] = None
+
+    @property
+    def playlist(self) -> Playlist:
+        return self._playlist
+
+    @property
+    def playlist_id(self) -> str:
+        return self._playlist.id
+
+    @property
+    def name(self) -> str:
+        return self._playlist.name
+
+    @property
+    def video_count(self) -> int:
+        return len(self._playlist)
+
+    @property
+    def total_duration(self) -> int:
+        """Duree totale connue, en millisecondes."""
+        return self._compute_stats()[0]
+
+    @property
+    def progress(self) -> float:
+        """Part visionnee de la playlist, entre 0 et 1."""
+        return self._compute_stats()[1]
+
+    def invalidate(self) -> None:
+        self._stats = None
+
+    def _compute_stats(self) -> Tuple[int, float]:
+        if self._stats is None:
+            total = watched = 0
+            progress_sum = 0.0
+            videos = self._playlist.videos
+            for video in videos:
+                state = video.state
+                duration = state.duration
+                if duration > 0:
+                    total += duration
+                    watched += min(state.position, duration)
+                progress_sum += state.progress
+            # Durations are only known for videos played at least once: fall back to the mean.
+            if total > 0:
+                progress = watched / total
+            else:
+                progress = progress_sum / len(videos) if videos else 0.0
+            self._stats = (total, min(max(progress, 0.0), 1.0))
+        return self._stats
+
+    def __repr__(self) -> str:
+        return f"PlaylistHeader(name='{self.name}', videos={self.video_count})"
+
+
 class PlaylistRegistry:
     """In-memory registry of Playlist instances."""
 
@@ -43,6 +111,9 @@ class PlaylistRegistry:
     def names_map(self) -> Dict[str, str]:
         return {pid: p.name for pid, p in self._playlists.items()}
 
+    def headers(self) -> List[PlaylistHeader]:
+        return [PlaylistHeader(playlist) for playlist in self._playlists.values()]
+
     def __len__(self) -> int:
         return len(self._playlists)
 
@@ -0,0 +1,163 @@
+"""ReadAheadPrefetcher — warms the OS page cache with the start of upcoming playlist items."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from src.pyplayer.domain.media import find_index_range
+
+logger = logging.getLogger(__name__)
+
+HEAD_BYTES = 8 * 1024 * 1024
+TAIL_BYTES = 2 * 1024 * 1024
+INDEX_MAX_BYTES = 16 * 1024 * 1024
+CHUNK_BYTES = 1024 * 1024
+DEFAULT_BANDWIDTH = 16 * 1024 * 1024  # bytes per second
+
+
+def read_ahead_ranges(file_path: Path, size: int) -> List[Tuple[int, int]]:
+    """Byte ranges a player touches first: the head, then the sample index (or the tail)."""
+    head = min(size, HEAD_BYTES)
+    ranges = [(0, head)] if head else []
+    index = find_index_range(file_path)
+    if index is not None:
+        offset, length = index
+        end = min(offset + min(length, INDEX_MAX_BYTES), size)
+        start = max(offset, head)
+        if end > start:
+            ranges.append((start, end - start))
+    elif size > head:
+        # Matroska cues and AVI idx1 are usually written last
+        start = max(head, size - TAIL_BYTES)
+        ranges.append((start, size - start))
+    return ranges
+
+
+class ReadAheadPrefetcher:
+    """
+    Precharge dans le cache du systeme le debut des prochains elements.
+
+    On network or spinning storage the first frame waits for cold reads of
+    the container head and its index. A single worker thread asks the
+    kernel to read those ranges ahead with ``posix_fadvise(WILLNEED)``
+    (a throttled plain read where it is unavailable), one chunk at a time,
+    never faster than ``bandwidth`` bytes per second so playback of the
+    current item keeps priority. ``prefetch()`` replaces the targets: work
+    for items that are no longer upcoming stops at the next chunk. Files
+    warmed recently (same size and mtime) are skipped.
+    """
+
+    RECENT_FILES = 32
+
+    def __init__(self, bandwidth: int = DEFAULT_BANDWIDTH, use_fadvise: Optional[bool] = None) -> None:
+        self._bandwidth = max(1, int(bandwidth))
+        self._use_fadvise = hasattr(os, "posix_fadvise") if use_fadvise is None else use_fadvise
+        self._condition = threading.Condition()
+        self._queue: List[Path] = []
+        self._targets: Tuple[str, ...] = ()
+        self._generation = 0
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._recent: "OrderedDict[Tuple[str, int, int], None]" = OrderedDict()
+        self.bytes_prefetched = 0
+
+    @property
+    def is_idle(self) -> bool:
+        with self._condition:
+            return not self._queue and not self._busy
+
+    def prefetch(self, paths: Sequence[Path]) -> None:
+        """Warm ``paths`` in order, cancelling whatever is no longer among them."""
+        targets = tuple(os.fspath(path) for path in paths)
+        with self._condition:
+            if self._closed or targets == self._targets:
+                return
+            self._targets = targets
+            self._generation += 1
+            self._queue = [Path(target) for target in targets]
+            self._condition.notify_all()
+            if self._thread is None and targets:
+                self._thread = threading.Thread(target=self._run, name="read-ahead", daemon=True)
+                self._thread.start()
+
+    def cancel(self) -> None:
+        self.prefetch(())
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._generation += 1
+            self._queue = []
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=1.0)
+
+    def _cancelled(self, generation: int) -> bool:
+        return self._closed or generation != self._generation
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._busy = False
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                path = self._queue.pop(0)
+                generation = self._generation
+                self._busy = True
+            self._warm(path, generation)
+
+    def _warm(self, path: Path, generation: int) -> None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        key = (os.fspath(path), stat.st_size, stat.st_mtime_ns)
+        if key in self._recent:
+            return
+        started = time.monotonic()
+        sent = 0
+        try:
+            with open(path, "rb", buffering=0) as handle:
+                for offset, length in read_ahead_ranges(path, stat.st_size):
+                    end = offset + length
+                    while offset < end:
+                        if self._cancelled(generation):
+                            return
+                        chunk = min(CHUNK_BYTES, end - offset)
+                        if self._use_fadvise:
+                            os.posix_fadvise(handle.fileno(), offset, chunk, os.POSIX_FADV_WILLNEED)
+                        else:
+                            handle.seek(offset)
+                            handle.read(chunk)
+                        offset += chunk
+                        sent += chunk
+                        self.bytes_prefetched += chunk
+                        self._throttle(sent / self._bandwidth - (time.monotonic() - started), generation)
+        except OSError as exc:
+            logger.debug("Prechargement impossible pour %s: %s", path, exc)
+            return
+        self._recent[key] = None
+        while len(self._recent) > self.RECENT_FILES:
+            self._recent.popitem(last=False)
+        logger.debug("Prechargement de %s: %s Ko en %.0f ms", path.name, sent // 1024, (time.monotonic() - started) * 1000)
+
+    def _throttle(self, delay: float, generation: int) -> None:
+        if delay <= 0:
+            return
+        with self._condition:
+            # prefetch()/shutdown() wake the wait, so a cancelled item stops at once
+            if not self._cancelled(generation):
+                self._condition.wait(delay)
+
+
+__all__ = ["ReadAheadPrefetcher", "read_ahead_ranges"]
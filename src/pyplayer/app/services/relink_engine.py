@@ -0,0 +1,236 @@
+"""RelinkEngine — resolves every missing video of every playlist against one scan of the search roots."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.pyplayer.app.services.fingerprint_service import FingerprintService
+from src.pyplayer.domain.media import MEDIA_EXTENSIONS, Video
+from src.pyplayer.domain.playlist import Playlist
+from src.pyplayer.infrastructure.filesystem.parallel_scan import ScannedFile, scan_files, stat_files
+
+logger = logging.getLogger(__name__)
+
+# Candidate scoring: a same-size file is the strongest hint, then an intact mtime
+# (copies and moves usually keep it), then each trailing parent folder in common.
+SCORE_SIZE = 4.0
+SCORE_MTIME = 2.0
+SCORE_PARENT = 1.0
+MAX_PARENT_DEPTH = 3
+MTIME_TOLERANCE_S = 2.0
+
+
+@dataclass(frozen=True)
+class RelinkMatch:
+    """Best candidate found for a missing video."""
+
+    video_id: str
+    old_path: Path
+    new_path: Path
+    score: float
+    by_fingerprint: bool = False
+
+
+@dataclass
+class RelinkReport:
+    """Outcome of one relink pass, with the time spent in each phase (ms)."""
+
+    matches: List[RelinkMatch] = field(default_factory=list)
+    ambiguous: List[str] = field(default_factory=list)  # video ids with several equally good candidates
+    unresolved: List[str] = field(default_factory=list)
+    missing_count: int = 0
+    scanned_count: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def relinks(self) -> Dict[str, Path]:
+        return {match.video_id: match.new_path for match in self.matches}
+
+
+class RelinkIndex:
+    """
+    Index nom de fichier -> fichiers trouves, construit par un seul scan des racines.
+
+    The scan skips the per-file stat; only the candidates actually looked
+    up are stat'd, once. ``sized_files()`` stats the whole tree, for the
+    fingerprint fallback that needs every size.
+    """
+
+    def __init__(self, files: Sequence[ScannedFile]) -> None:
+        self._files = list(files)
+        self._sized = all(entry.has_stat for entry in self._files)
+        self._by_name: Dict[str, List[ScannedFile]] = defaultdict(list)
+        for entry in self._files:
+            self._by_name[entry.name.casefold()].append(entry)
+
+    @classmethod
+    def scan(cls, roots: Iterable[Path], extensions: Optional[Iterable[str]] = None) -> "RelinkIndex":
+        return cls(scan_files(roots, MEDIA_EXTENSIONS if extensions is None else extensions, with_stat=False))
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def candidates(self, name: str) -> List[ScannedFile]:
+        key = name.casefold()
+        entries = self._by_name.get(key)
+        if not entries:
+            return []
+        if not all(entry.has_stat for entry in entries):
+            entries = self._by_name[key] = stat_files(entries)
+        return entries
+
+    def sized_files(self) -> List[ScannedFile]:
+        if not self._sized:
+            self._files = stat_files(self._files)
+            self._sized = True
+        return self._files
+
+
+def _parent_parts(path: str) -> List[str]:
+    parts = os.path.dirname(path).replace("\\", "/").casefold().split("/")
+    return [part for part in parts if part][-MAX_PARENT_DEPTH:]
+
+
+def score_candidate(video: Video, entry: ScannedFile) -> float:
+    """Score how likely ``entry`` is the file ``video`` pointed to before it moved."""
+    score = 0.0
+    if video.size > 0 and entry.size == video.size:
+        score += SCORE_SIZE
+    if video.mtime and abs(entry.mtime - video.mtime) <= MTIME_TOLERANCE_S:
+        score += SCORE_MTIME
+    old_parents = _parent_parts(os.fspath(video.file_path))
+    new_parents = _parent_parts(entry.path)
+    for old, new in zip(reversed(old_parents), reversed(new_parents)):
+        if old != new:
+            break
+        score += SCORE_PARENT
+    return score
+
+
+class RelinkEngine:
+    """
+    Relocalise en une passe les videos manquantes de toutes les playlists.
+
+    The search roots are scanned once (parallel scanner) into a name index.
+    Every missing video, deduplicated across playlists, is then looked up by
+    file name and the candidates are scored by size, mtime and common parent
+    folders. A candidate whose size differs from a known size is never
+    accepted, and ties are reported as ambiguous instead of guessed. Videos
+    left unresolved (renamed files) fall back to content fingerprints over
+    the same scan when a fingerprint service is given.
+    """
+
+    def __init__(self, fingerprints: Optional[FingerprintService] = None) -> None:
+        self._fingerprints = fingerprints
+
+    @staticmethod
+    def find_missing(playlists: Iterable[Playlist]) -> List[Video]:
+        """Return each missing video once, even when several playlists share it."""
+        missing: Dict[str, Video] = {}
+        checked = set()
+        for playlist in playlists:
+            for video in playlist.videos:
+                if video.id in checked:
+                    continue
+                checked.add(video.id)
+                if not os.path.exists(video.file_path):
+                    missing[video.id] = video
+        return list(missing.values())
+
+    def resolve(
+        self,
+        playlists: Sequence[Playlist],
+        search_roots: Sequence[Path],
+        index: Optional[RelinkIndex] = None,
+    ) -> RelinkReport:
+        report = RelinkReport()
+        started = time.perf_counter()
+        missing = self.find_missing(playlists)
+        report.missing_count = len(missing)
+        report.timings["missing"] = (time.perf_counter() - started) * 1000
+        if not missing:
+            return report
+
+        step = time.perf_counter()
+        if index is None:
+            index = RelinkIndex.scan(search_roots)
+        report.scanned_count = len(index)
+        report.timings["scan"] = (time.perf_counter() - step) * 1000
+
+        step = time.perf_counter()
+        unresolved: List[Video] = []
+        for video in missing:
+            match, ambiguous = self._best_by_name(video, index)
+            if match is not None:
+                report.matches.append(match)
+            elif ambiguous:
+                report.ambiguous.append(video.id)
+            else:
+                unresolved.append(video)
+        report.timings["match"] = (time.perf_counter() - step) * 1000
+
+        step = time.perf_counter()
+        if self._fingerprints is not None and any(self._fingerprints.has_fingerprint(v) for v in unresolved):
+            # Renamed files: the whole tree has to be sized, so only when it can pay off
+            found = self._fingerprints.match_scanned(unresolved, index.sized_files())
+            for video in unresolved:
+                new_path = found.get(video.id)
+                if new_path is not None:
+                    report.matches.append(RelinkMatch(video.id, video.file_path, new_path, SCORE_SIZE, True))
+                else:
+                    report.unresolved.append(video.id)
+        else:
+            report.unresolved.extend(video.id for video in unresolved)
+        report.timings["fingerprint"] = (time.perf_counter() - step) * 1000
+        report.timings["total"] = (time.perf_counter() - started) * 1000
+
+        logger.info(
+            "Relocalisation: %s/%s videos retrouvees (%s ambigues) parmi %s fichiers en %.0f ms",
+            len(report.matches),
+            report.missing_count,
+            len(report.ambiguous),
+            report.scanned_count,
+            report.timings["total"],
+        )
+        return report
+
+    @staticmethod
+    def _best_by_name(video: Video, index: RelinkIndex) -> Tuple[Optional[RelinkMatch], bool]:
+        scored = []
+        for entry in index.candidates(video.name):
+            if video.size > 0 and entry.size != video.size:
+                continue
+            scored.append((score_candidate(video, entry), entry))
+        if not scored:
+            return None, False
+        scored.sort(key=lambda item: (-item[0], item[1].path))
+        best_score, best = scored[0]
+        if len(scored) > 1 and scored[1][0] == best_score:
+            return None, True
+        return RelinkMatch(video.id, video.file_path, Path(best.path), best_score), False
+
+    @staticmethod
+    def apply(playlists: Iterable[Playlist], report: RelinkReport) -> Dict[str, int]:
+        """Apply every match in bulk: one relink call (and one save) per affected playlist."""
+        relinks = report.relinks
+        relinked = 0
+        playlists_relinked = 0
+        if relinks:
+            for playlist in playlists:
+                count = playlist.relink_videos(relinks)
+                if count:
+                    relinked += count
+                    playlists_relinked += 1
+        return {
+            "playlists_relinked": playlists_relinked,
+            "videos_relinked": relinked,
+        }
+
+
+__all__ = ["RelinkEngine", "RelinkIndex", "RelinkMatch", "RelinkReport", "score_candidate"]
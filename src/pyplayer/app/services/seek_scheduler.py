@@ -0,0 +1,148 @@
+"""SeekScheduler — coalesces seek requests so the decoder handles one at a time."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from PySide6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+
+class SeekScheduler(QtCore.QObject):
+    """
+    Planificateur de recherches : une seule recherche en cours, la derniere demande gagne.
+
+    A seek is "in flight" from ``setPosition`` until the next decoded frame
+    (``notify_frame``), or the next position report for media without video
+    (``notify_position``), or ``SEEK_TIMEOUT_MS``. Requests made meanwhile
+    replace each other, so only the latest target is sent when the decoder
+    is free again.
+
+    QtMultimedia has no keyframe-only seek, so approximate seeks (slider
+    drag) snap the target to ``APPROXIMATE_GRID_MS``. Successive drag
+    positions then collapse onto the same target and are skipped. Precise
+    seeks (release, click, shortcuts) use the exact position.
+    """
+
+    APPROXIMATE_GRID_MS = 500
+    SEEK_TIMEOUT_MS = 400
+    LATENCY_HISTORY = 200
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._player: Any = None
+        self._frame_driven = True
+        self._in_flight: Optional[Tuple[int, bool, float]] = None
+        self._queued: Optional[Tuple[int, bool]] = None
+        self._last_target = -1
+        # (latence ms, precise) des recherches abouties, les plus recentes a la fin
+        self.latencies: Deque[Tuple[float, bool]] = deque(maxlen=self.LATENCY_HISTORY)
+        self.requested = 0
+        self.dispatched = 0
+        self.timeouts = 0
+        self._timeout = QtCore.QTimer(self)
+        self._timeout.setSingleShot(True)
+        self._timeout.setInterval(self.SEEK_TIMEOUT_MS)
+        self._timeout.timeout.connect(self._on_timeout)
+
+    # --- configuration ---
+    def set_player(self, player: Any) -> None:
+        """Attach the player to seek (anything with ``setPosition()``); drops pending seeks."""
+        self._player = player
+        self._timeout.stop()
+        self._in_flight = None
+        self._queued = None
+        self._last_target = -1
+
+    def set_frame_driven(self, has_video: bool) -> None:
+        """Complete seeks on decoded frames (video) or on position reports (audio only)."""
+        self._frame_driven = bool(has_video)
+
+    @property
+    def in_flight(self) -> bool:
+        return self._in_flight is not None
+
+    @property
+    def pending_target(self) -> Optional[int]:
+        """Latest requested position not yet reached, or None when idle."""
+        if self._queued is not None:
+            return self._queued[0]
+        if self._in_flight is not None:
+            return self._in_flight[0]
+        return None
+
+    # --- requests ---
+    def request(self, target: int, precise: bool = True) -> None:
+        self.requested += 1
+        target = max(0, int(target))
+        if not precise:
+            target = round(target / self.APPROXIMATE_GRID_MS) * self.APPROXIMATE_GRID_MS
+        if self._in_flight is not None:
+            self._queued = (target, precise)
+            return
+        self._dispatch(target, precise)
+
+    def _dispatch(self, target: int, precise: bool) -> None:
+        if self._player is None:
+            return
+        if target == self._last_target and not precise:
+            # Same snapped target as the previous seek: nothing new to decode
+            return
+        self._last_target = target
+        self._in_flight = (target, precise, time.perf_counter())
+        self.dispatched += 1
+        self._timeout.start()
+        self._player.setPosition(target)
+
+    # --- completion ---
+    def notify_frame(self, *args) -> None:
+        if self._frame_driven:
+            self._complete()
+
+    def notify_position(self, *args) -> None:
+        if not self._frame_driven:
+            self._complete()
+
+    def _complete(self) -> None:
+        if self._in_flight is None:
+            return
+        target, precise, started = self._in_flight
+        latency = (time.perf_counter() - started) * 1000
+        self.latencies.append((latency, precise))
+        logger.debug("Recherche %d ms (%s) en %.1f ms", target, "precise" if precise else "approx", latency)
+        self._next()
+
+    def _on_timeout(self) -> None:
+        if self._in_flight is not None:
+            self.timeouts += 1
+            logger.debug("Recherche %d ms sans image apres %d ms", self._in_flight[0], self.SEEK_TIMEOUT_MS)
+        self._next()
+
+    def _next(self) -> None:
+        self._timeout.stop()
+        self._in_flight = None
+        if self._queued is not None:
+            target, precise = self._queued
+            self._queued = None
+            self._dispatch(target, precise)
+
+    # --- instrumentation ---
+    def latency_summary(self) -> Dict[str, float]:
+        """Count, mean, p95 and max of request->frame latency (ms) over the recent history."""
+        values = sorted(latency for latency, _ in self.latencies)
+        if not values:
+            return {"count": 0, "mean": 0.0, "p95": 0.0, "max": 0.0}
+        p95 = values[min(len(values) - 1, int(round(0.95 * (len(values) - 1))))]
+        return {
+            "count": len(values),
+            "mean": sum(values) / len(values),
+            "p95": p95,
+            "max": values[-1],
+        }
+
+
+__all__ = ["SeekScheduler"]
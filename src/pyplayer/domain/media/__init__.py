@@ -1,6 +1,21 @@
 """Media domain objects and shared format declarations."""
 
-from .media_formats import SUPPORTED_AUDIO_FORMATS, VIDEO_EXTENSIONS
+from .fingerprint import compute_fingerprint
+from .media_formats import MEDIA_EXTENSIONS, SUPPORTED_AUDIO_FORMATS, VIDEO_EXTENSIONS, is_audio_path
+from .media_library import MediaLibrary
+from .media_metadata import MediaMetadata, find_index_range, read_media_metadata
 from .video import Video, VideoState
 
-__all__ = ["SUPPORTED_AUDIO_FORMATS", "VIDEO_EXTENSIONS", "Video", "VideoState"]
+__all__ = [
+    "MEDIA_EXTENSIONS",
+    "SUPPORTED_AUDIO_FORMATS",
+    "VIDEO_EXTENSIONS",
+    "MediaLibrary",
+    "MediaMetadata",
+    "Video",
+    "VideoState",
+    "compute_fingerprint",
+    "find_index_range",
+    "is_audio_path",
+    "read_media_metadata",
+]
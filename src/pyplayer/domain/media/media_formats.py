@@ -1,8 +1,18 @@
 """Shared media format declarations."""
 
+from pathlib import Path
+
 VIDEO_EXTENSIONS = {
     ".mp4", ".avi", ".mkv", ".mov", ".webm",
     ".wmv", ".flv", ".mpeg", ".mpg", ".m4v",
 }
 
 SUPPORTED_AUDIO_FORMATS = {".mp3", ".wav", ".flac", ".aac", ".ogg", ".m4a"}
+
+# Everything a playlist accepts
+MEDIA_EXTENSIONS = VIDEO_EXTENSIONS | SUPPORTED_AUDIO_FORMATS
+
+
+def is_audio_path(file_path: Path) -> bool:
+    """True for files played without a video pipeline."""
+    return file_path.suffix.lower() in SUPPORTED_AUDIO_FORMATS
@@ -0,0 +1,176 @@
+"""Shared media library — one Video instance per file across all playlists."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from src.pyplayer.domain.media.video import Video
+from src.pyplayer.infrastructure.persistence.io_utils import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+LIBRARY_FORMAT_VERSION = 1
+
+
+class MediaLibrary:
+    """
+    Bibliotheque centrale des medias.
+
+    Each file is represented by a single flyweight ``Video`` keyed by its
+    media key, so metadata and resume positions discovered in one playlist
+    are visible from every playlist referencing the same file.
+
+    The library file holds every record, so it is only rewritten when
+    something changed (``mark_dirty``), and throttled saves
+    (``save_if_needed``) happen at most once per ``SAVE_COOLDOWN``.
+    """
+
+    SAVE_COOLDOWN: float = 30.0  # seconds between throttled saves
+
+    def __init__(self, library_file: Optional[Path] = None) -> None:
+        self.library_file = Path(library_file) if library_file else None
+        self._by_key: Dict[str, Video] = {}
+        self._by_path: Dict[str, Video] = {}
+        self._dirty = False
+        self._last_save: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def __contains__(self, media_key: str) -> bool:
+        return media_key in self._by_key
+
+    def __iter__(self) -> Iterator[Video]:
+        return iter(list(self._by_key.values()))
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def get(self, media_key: Optional[str]) -> Optional[Video]:
+        if not media_key:
+            return None
+        return self._by_key.get(media_key)
+
+    def get_by_path(self, file_path: Path) -> Optional[Video]:
+        return self._by_path.get(str(file_path))
+
+    def acquire(self, file_path: Path) -> Video:
+        """Return the shared video for ``file_path``, creating it on first use."""
+        video = self._by_path.get(str(file_path))
+        if video is None:
+            video = self._register(Video(file_path))
+        return video
+
+    def adopt(self, video: Video) -> Video:
+        """Register ``video`` unless the same file is already known; return the shared instance."""
+        existing = self._by_key.get(video.media_key) or self._by_path.get(str(video.file_path))
+        if existing is None:
+            return self._register(video)
+        if existing is not video:
+            existing.update_metadata(width=video.width, height=video.height, duration=video.duration)
+        return existing
+
+    def resolve(self, data: Dict[str, Any]) -> Video:
+        """Return the shared video for a serialized playlist entry (reference or full record)."""
+        video = self._by_key.get(data.get("media_key") or "")
+        if video is None:
+            video = self._by_path.get(str(data.get("file_path", "")))
+        if video is None:
+            video = self.adopt(Video.from_dict(data))
+        return video
+
+    def _register(self, video: Video) -> Video:
+        self._by_key[video.media_key] = video
+        self._by_path[str(video.file_path)] = video
+        self._dirty = True
+        return video
+
+    def discard(self, media_key: str) -> bool:
+        video = self._by_key.pop(media_key, None)
+        if video is None:
+            return False
+        self._by_path.pop(str(video.file_path), None)
+        self._dirty = True
+        return True
+
+    def prune(self, referenced: Iterable[Video]) -> int:
+        """Drop entries no longer referenced by any playlist."""
+        keep = {video.media_key for video in referenced}
+        stale = [key for key in self._by_key if key not in keep]
+        for key in stale:
+            self.discard(key)
+        if stale:
+            logger.info("Bibliotheque media: %s entrees orphelines supprimees", len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        self._by_key.clear()
+        self._by_path.clear()
+        self._dirty = True
+
+    # --- persistence ---
+    def save_if_needed(self, force: bool = False) -> bool:
+        """Save pending changes; unless ``force``, skip when the last save is recent."""
+        if not self._dirty or self.library_file is None:
+            return False
+        if not force and self._last_save is not None and time.monotonic() - self._last_save < self.SAVE_COOLDOWN:
+            return False
+        return self.save()
+
+    def save(self, library_file: Optional[Path] = None) -> bool:
+        """Persist every shared video record."""
+        target = Path(library_file) if library_file else self.library_file
+        if target is None:
+            return False
+
+        data = {
+            "version": LIBRARY_FORMAT_VERSION,
+            "videos": [video.to_dict() for video in self._by_key.values()],
+        }
+        try:
+            write_json_atomic(target, data, indent=None, ensure_ascii=False)
+            self._dirty = False
+            self._last_save = time.monotonic()
+            logger.debug("Bibliotheque media sauvegardee: %s (%s entrees)", target, len(self._by_key))
+            return True
+        except Exception as error:
+            logger.error("Erreur sauvegarde bibliotheque media: %s", error)
+            return False
+
+    def load(self, library_file: Optional[Path] = None) -> bool:
+        """Load persisted records; playlists loaded afterwards resolve against them."""
+        source = Path(library_file) if library_file else self.library_file
+        if source is None or not source.exists():
+            return False
+
+        try:
+            with open(source, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if data.get("version") != LIBRARY_FORMAT_VERSION:
+                logger.warning("Format de bibliotheque media non supporte: %s", source)
+                return False
+
+            self._by_key.clear()
+            self._by_path.clear()
+            for record in data.get("videos", []):
+                try:
+                    self._register(Video.from_dict(record))
+                except Exception as error:
+                    logger.error("Entree bibliotheque invalide: %s", error)
+            self._dirty = False
+            logger.info("Bibliotheque media chargee: %s (%s entrees)", source, len(self._by_key))
+            return True
+        except Exception as error:
+            logger.error("Erreur chargement bibliotheque media %s: %s", source, error)
+            return False
+
+
+__all__ = ["LIBRARY_FORMAT_VERSION", "MediaLibrary"]
@@ -0,0 +1,814 @@
+"""Lecture des en-tetes de conteneurs — duree et dimensions sans decodage.
+
+Each parser seeks to the few header structures it needs and reads a
+handful of kilobytes; the media payload (``mdat``, clusters, ``movi``) is
+skipped, never read. Supported containers:
+
+* MP4 / MOV / M4V: ``moov/mvhd`` (duration) and ``moov/trak/tkhd`` (size)
+* Matroska / WebM: EBML ``Segment/Info`` and ``Segment/Tracks``
+* AVI: RIFF ``hdrl/avih`` (and ``odml/dmlh`` for OpenDML files)
+* FLV: the AMF0 ``onMetaData`` script tag
+* MP3: ID3v2/ID3v1 tags, Xing/Info/VBRI frame count (bitrate estimate for CBR)
+* FLAC: ``STREAMINFO`` and ``VORBIS_COMMENT`` blocks
+* WAV: RIFF ``fmt``/``data`` sizes and ``LIST/INFO`` tags
+* Ogg Vorbis / Opus: identification and comment packets, last page granule
+* AAC (ADTS): estimated from the first frames
+* M4A: the MP4 parser above, plus ``udta/meta/ilst`` tags
+
+Parsers return None for anything they do not understand instead of raising.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Header elements bigger than this are not header data; the file is malformed
+MAX_HEADER_READ = 4 * 1024 * 1024
+# Tag values are truncated to this; cover art and lyrics are never read
+MAX_TAG_BYTES = 1024
+
+
+@dataclass(frozen=True)
+class MediaMetadata:
+    """Metadonnees lues dans l'en-tete du conteneur."""
+
+    container: str
+    duration_ms: int = 0
+    width: int = 0
+    height: int = 0
+    title: str = ""
+    artist: str = ""
+    album: str = ""
+
+    @property
+    def has_video(self) -> bool:
+        return self.width > 0 and self.height > 0
+
+
+def _read_exact(handle: BinaryIO, size: int) -> Optional[bytes]:
+    if size < 0 or size > MAX_HEADER_READ:
+        return None
+    data = handle.read(size)
+    return data if len(data) == size else None
+
+
+def _clean_tag(value: str) -> str:
+    return value.split("\x00", 1)[0].strip()[:MAX_TAG_BYTES]
+
+
+# --- MP4 / MOV ---
+
+_MP4_CONTAINERS = {b"moov", b"trak", b"udta", b"ilst"}
+_MP4_TAGS = {b"\xa9nam": "title", b"\xa9ART": "artist", b"\xa9alb": "album"}
+
+
+def _mp4_boxes(handle: BinaryIO, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Yield (type, payload offset, payload size) for the boxes in [start, end)."""
+    offset = start
+    while offset + 8 <= end:
+        handle.seek(offset)
+        header = handle.read(8)
+        if len(header) < 8:
+            return
+        size, box_type = struct.unpack(">I4s", header)
+        header_size = 8
+        if size == 1:
+            large = handle.read(8)
+            if len(large) < 8:
+                return
+            size = struct.unpack(">Q", large)[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size:
+            return
+        yield box_type, offset + header_size, size - header_size
+        offset += size
+
+
+def _parse_mp4(handle: BinaryIO, file_size: int) -> Optional[MediaMetadata]:
+    duration_ms = width = height = 0
+    found_moov = False
+    tags: Dict[str, str] = {}
+
+    def walk(start: int, end: int) -> None:
+        nonlocal duration_ms, width, height, found_moov
+        for box_type, offset, size in _mp4_boxes(handle, start, end):
+            if box_type in _MP4_CONTAINERS:
+                found_moov = found_moov or box_type == b"moov"
+                walk(offset, offset + size)
+            elif box_type == b"meta":
+                # Full box: version and flags come before the children
+                walk(offset + 4, offset + size)
+            elif box_type in _MP4_TAGS:
+                for child_type, child_offset, child_size in _mp4_boxes(handle, offset, offset + size):
+                    if child_type == b"data" and child_size > 8:
+                        handle.seek(child_offset + 8)
+                        data = _read_exact(handle, min(child_size - 8, MAX_TAG_BYTES))
+                        if data is not None:
+                            tags.setdefault(_MP4_TAGS[box_type], _clean_tag(data.decode("utf-8", "replace")))
+            elif box_type == b"mvhd":
+                handle.seek(offset)
+                data = _read_exact(handle, min(size, 32))
+                if data is None:
+                    continue
+                if data[0] == 1:
+                    timescale, duration = struct.unpack_from(">IQ", data, 20)
+                else:
+                    timescale, duration = struct.unpack_from(">II", data, 12)
+                if timescale and duration not in (0, 0xFFFFFFFF, 0xFFFFFFFFFFFFFFFF):
+                    duration_ms = duration * 1000 // timescale
+            elif box_type == b"tkhd" and size >= 84:
+                # Width and height are the last two 16.16 fixed-point fields
+                handle.seek(offset + size - 8)
+                data = _read_exact(handle, 8)
+                if data is None:
+                    continue
+                track_width, track_height = (value >> 16 for value in struct.unpack(">II", data))
+                if track_width * track_height > width * height:
+                    width, height = track_width, track_height
+
+    walk(0, file_size)
+    if not found_moov:
+        return None
+    return MediaMetadata("mp4", duration_ms, width, height, **tags)
+
+
+# --- Matroska / WebM ---
+
+_EBML_HEADER = 0x1A45DFA3
+_MKV_SEGMENT = 0x18538067
+_MKV_SEEK_HEAD = 0x114D9B74
+_MKV_SEEK = 0x4DBB
+_MKV_SEEK_ID = 0x53AB
+_MKV_SEEK_POSITION = 0x53AC
+_MKV_INFO = 0x1549A966
+_MKV_TIMECODE_SCALE = 0x2AD7B1
+_MKV_DURATION = 0x4489
+_MKV_TRACKS = 0x1654AE6B
+_MKV_TRACK_ENTRY = 0xAE
+_MKV_TRACK_TYPE = 0x83
+_MKV_VIDEO = 0xE0
+_MKV_PIXEL_WIDTH = 0xB0
+_MKV_PIXEL_HEIGHT = 0xBA
+_MKV_CLUSTER = 0x1F43B675
+_MKV_DOC_TYPE = 0x4282
+_MKV_UNKNOWN_SIZE = -1
+
+
+def _ebml_vint(data: bytes, offset: int, keep_marker: bool) -> Optional[Tuple[int, int]]:
+    """Decode an EBML variable-length integer; return (value, next offset)."""
+    if offset >= len(data):
+        return None
+    first = data[offset]
+    if first == 0:
+        return None
+    length = 8 - first.bit_length() + 1
+    if offset + length > len(data):
+        return None
+    value = first if keep_marker else first & (0xFF >> length)
+    all_ones = value == (0xFF >> length)
+    for byte in data[offset + 1 : offset + length]:
+        value = (value << 8) | byte
+        all_ones = all_ones and byte == 0xFF
+    if not keep_marker and all_ones:
+        value = _MKV_UNKNOWN_SIZE
+    return value, offset + length
+
+
+def _ebml_elements(data: bytes, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+    """Yield (id, payload offset, payload size) for the elements in an in-memory block."""
+    end = len(data) if end is None else end
+    offset = start
+    while offset < end:
+        element_id = _ebml_vint(data, offset, keep_marker=True)
+        if element_id is None:
+            return
+        size = _ebml_vint(data, element_id[1], keep_marker=False)
+        if size is None:
+            return
+        payload, length = size[1], size[0]
+        if length == _MKV_UNKNOWN_SIZE:
+            length = end - payload
+        yield element_id[0], payload, length
+        offset = payload + length
+
+
+def _ebml_uint(data: bytes, offset: int, size: int) -> int:
+    return int.from_bytes(data[offset : offset + size], "big")
+
+
+def _read_element_header(handle: BinaryIO) -> Optional[Tuple[int, int, int]]:
+    """Read one element header at the current position; return (id, payload offset, size)."""
+    start = handle.tell()
+    data = handle.read(12)
+    element_id = _ebml_vint(data, 0, keep_marker=True)
+    if element_id is None:
+        return None
+    size = _ebml_vint(data, element_id[1], keep_marker=False)
+    if size is None:
+        return None
+    return element_id[0], start + size[1], size[0]
+
+
+def _parse_matroska(handle: BinaryIO, file_size: int) -> Optional[MediaMetadata]:
+    handle.seek(0)
+    header = _read_element_header(handle)
+    if header is None or header[0] != _EBML_HEADER:
+        return None
+    handle.seek(header[1])
+    ebml = _read_exact(handle, header[2]) or b""
+    container = "mkv"
+    for element_id, offset, size in _ebml_elements(ebml):
+        if element_id == _MKV_DOC_TYPE and ebml[offset : offset + size] == b"webm":
+            container = "webm"
+
+    handle.seek(header[1] + header[2])
+    segment = _read_element_header(handle)
+    if segment is None or segment[0] != _MKV_SEGMENT:
+        return None
+    segment_start = segment[1]
+    segment_end = file_size if segment[2] == _MKV_UNKNOWN_SIZE else min(file_size, segment_start + segment[2])
+
+    blocks: Dict[int, bytes] = {}
+    seek_positions: Dict[int, int] = {}
+
+    def load(position: int) -> Optional[Tuple[int, int, int]]:
+        handle.seek(position)
+        element = _read_element_header(handle)
+        if element is None:
+            return None
+        element_id, payload, size = element
+        if element_id in (_MKV_INFO, _MKV_TRACKS, _MKV_SEEK_HEAD) and element_id not in blocks:
+            handle.seek(payload)
+            data = _read_exact(handle, size)
+            if data is not None:
+                blocks[element_id] = data
+        return element
+
+    # Top-level children up to the first cluster; Info and Tracks nearly always come first
+    position = segment_start
+    while position < segment_end and not (_MKV_INFO in blocks and _MKV_TRACKS in blocks):
+        element = load(position)
+        if element is None or element[0] == _MKV_CLUSTER or element[2] == _MKV_UNKNOWN_SIZE:
+            break
+        position = element[1] + element[2]
+
+    # Otherwise follow the SeekHead index
+    for element_id, offset, size in _ebml_elements(blocks.get(_MKV_SEEK_HEAD, b"")):
+        if element_id != _MKV_SEEK:
+            continue
+        target_id = target_position = None
+        for child_id, child_offset, child_size in _ebml_elements(blocks[_MKV_SEEK_HEAD], offset, offset + size):
+            if child_id == _MKV_SEEK_ID:
+                target_id = _ebml_uint(blocks[_MKV_SEEK_HEAD], child_offset, child_size)
+            elif child_id == _MKV_SEEK_POSITION:
+                target_position = _ebml_uint(blocks[_MKV_SEEK_HEAD], child_offset, child_size)
+        if target_id is not None and target_position is not None:
+            seek_positions[target_id] = segment_start + target_position
+    for element_id in (_MKV_INFO, _MKV_TRACKS):
+        if element_id not in blocks and element_id in seek_positions:
+            load(seek_positions[element_id])
+
+    if _MKV_INFO not in blocks and _MKV_TRACKS not in blocks:
+        return None
+
+    duration_ms = 0
+    info = blocks.get(_MKV_INFO, b"")
+    timecode_scale = 1_000_000
+    raw_duration = None
+    for element_id, offset, size in _ebml_elements(info):
+        if element_id == _MKV_TIMECODE_SCALE:
+            timecode_scale = _ebml_uint(info, offset, size) or timecode_scale
+        elif element_id == _MKV_DURATION and size in (4, 8):
+            raw_duration = struct.unpack(">f" if size == 4 else ">d", info[offset : offset + size])[0]
+    if raw_duration and raw_duration > 0:
+        duration_ms = int(raw_duration * timecode_scale / 1_000_000)
+
+    width = height = 0
+    tracks = blocks.get(_MKV_TRACKS, b"")
+    for element_id, offset, size in _ebml_elements(tracks):
+        if element_id != _MKV_TRACK_ENTRY:
+            continue
+        track_type = 0
+        track_size = (0, 0)
+        for child_id, child_offset, child_size in _ebml_elements(tracks, offset, offset + size):
+            if child_id == _MKV_TRACK_TYPE:
+                track_type = _ebml_uint(tracks, child_offset, child_size)
+            elif child_id == _MKV_VIDEO:
+                pixel_width = pixel_height = 0
+                for video_id, video_offset, video_size in _ebml_elements(
+                    tracks, child_offset, child_offset + child_size
+                ):
+                    if video_id == _MKV_PIXEL_WIDTH:
+                        pixel_width = _ebml_uint(tracks, video_offset, video_size)
+                    elif video_id == _MKV_PIXEL_HEIGHT:
+                        pixel_height = _ebml_uint(tracks, video_offset, video_size)
+                track_size = (pixel_width, pixel_height)
+        if track_type == 1 and track_size[0] * track_size[1] > width * height:
+            width, height = track_size
+
+    return MediaMetadata(container, duration_ms, width, height)
+
+
+# --- AVI ---
+
+
+def _riff_chunks(data: bytes, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    offset = start
+    while offset + 8 <= end:
+        chunk_id, size = struct.unpack_from("<4sI", data, offset)
+        yield chunk_id, offset + 8, min(size, end - offset - 8)
+        offset += 8 + size + (size & 1)
+
+
+def _parse_avi(handle: BinaryIO, file_size: int) -> Optional[MediaMetadata]:
+    handle.seek(0)
+    header = handle.read(24)
+    if len(header) < 24 or header[:4] != b"RIFF" or header[8:12] != b"AVI ":
+        return None
+    list_id, list_size, list_type = struct.unpack_from("<4sI4s", header, 12)
+    if list_id != b"LIST" or list_type != b"hdrl":
+        return None
+    hdrl = _read_exact(handle, list_size - 4)
+    if hdrl is None:
+        return None
+
+    us_per_frame = total_frames = width = height = 0
+    odml_frames = 0
+    for chunk_id, offset, size in _riff_chunks(hdrl, 0, len(hdrl)):
+        if chunk_id == b"avih" and size >= 40:
+            us_per_frame, = struct.unpack_from("<I", hdrl, offset)
+            total_frames, = struct.unpack_from("<I", hdrl, offset + 16)
+            width, height = struct.unpack_from("<II", hdrl, offset + 32)
+        elif chunk_id == b"LIST" and hdrl[offset : offset + 4] == b"odml":
+            # OpenDML (> 1 GB): avih only counts the frames of the first RIFF chunk
+            for sub_id, sub_offset, sub_size in _riff_chunks(hdrl, offset + 4, offset + size):
+                if sub_id == b"dmlh" and sub_size >= 4:
+                    odml_frames, = struct.unpack_from("<I", hdrl, sub_offset)
+    frames = max(total_frames, odml_frames)
+    duration_ms = frames * us_per_frame // 1000
+    return MediaMetadata("avi", duration_ms, width, height)
+
+
+# --- FLV ---
+
+_AMF_NUMBER = 0
+_AMF_BOOLEAN = 1
+_AMF_STRING = 2
+_AMF_OBJECT = 3
+_AMF_NULL = 5
+_AMF_UNDEFINED = 6
+_AMF_REFERENCE = 7
+_AMF_ECMA_ARRAY = 8
+_AMF_OBJECT_END = 9
+_AMF_STRICT_ARRAY = 10
+_AMF_DATE = 11
+_AMF_LONG_STRING = 12
+
+
+def _amf_string(data: bytes, offset: int) -> Tuple[str, int]:
+    length, = struct.unpack_from(">H", data, offset)
+    end = offset + 2 + length
+    return data[offset + 2 : end].decode("utf-8", "replace"), end
+
+
+def _amf_properties(data: bytes, offset: int, count: Optional[int]) -> Tuple[dict, int]:
+    values = {}
+    while count is None or len(values) < count:
+        if data[offset : offset + 3] == b"\x00\x00\x09":
+            return values, offset + 3
+        key, offset = _amf_string(data, offset)
+        values[key], offset = _amf_value(data, offset)
+    if data[offset : offset + 3] == b"\x00\x00\x09":
+        offset += 3
+    return values, offset
+
+
+def _amf_value(data: bytes, offset: int) -> Tuple[object, int]:
+    marker = data[offset]
+    offset += 1
+    if marker == _AMF_NUMBER:
+        return struct.unpack_from(">d", data, offset)[0], offset + 8
+    if marker == _AMF_BOOLEAN:
+        return bool(data[offset]), offset + 1
+    if marker == _AMF_STRING:
+        return _amf_string(data, offset)
+    if marker == _AMF_LONG_STRING:
+        length, = struct.unpack_from(">I", data, offset)
+        return data[offset + 4 : offset + 4 + length].decode("utf-8", "replace"), offset + 4 + length
+    if marker in (_AMF_NULL, _AMF_UNDEFINED):
+        return None, offset
+    if marker == _AMF_REFERENCE:
+        return None, offset + 2
+    if marker == _AMF_OBJECT:
+        return _amf_properties(data, offset, None)
+    if marker == _AMF_ECMA_ARRAY:
+        count, = struct.unpack_from(">I", data, offset)
+        return _amf_properties(data, offset + 4, count)
+    if marker == _AMF_STRICT_ARRAY:
+        count, = struct.unpack_from(">I", data, offset)
+        offset += 4
+        items = []
+        for _ in range(count):
+            item, offset = _amf_value(data, offset)
+            items.append(item)
+        return items, offset
+    if marker == _AMF_DATE:
+        return struct.unpack_from(">d", data, offset)[0], offset + 10
+    raise ValueError(f"AMF0 marker {marker}")
+
+
+def _parse_flv(handle: BinaryIO, file_size: int) -> Optional[MediaMetadata]:
+    handle.seek(0)
+    header = handle.read(9)
+    if len(header) < 9 or header[:3] != b"FLV":
+        return None
+    data_offset, = struct.unpack_from(">I", header, 5)
+    # PreviousTagSize0, then the first tag: onMetaData is the first script tag
+    handle.seek(data_offset + 4)
+    tag = handle.read(11)
+    if len(tag) < 11 or tag[0] & 0x1F != 18:
+        return None
+    size = int.from_bytes(tag[1:4], "big")
+    body = _read_exact(handle, size)
+    if body is None:
+        return None
+    name, offset = _amf_value(body, 0)
+    if name != "onMetaData":
+        return None
+    metadata, _ = _amf_value(body, offset)
+    if not isinstance(metadata, dict):
+        return None
+
+    def number(key: str) -> float:
+        value = metadata.get(key)
+        return value if isinstance(value, float) and value > 0 else 0.0
+
+    return MediaMetadata("flv", int(number("duration") * 1000), int(number("width")), int(number("height")))
+
+
+# --- MP3 ---
+
+_ID3_TEXT_FRAMES = {
+    b"TIT2": "title", b"TPE1": "artist", b"TALB": "album",
+    b"TT2": "title", b"TP1": "artist", b"TAL": "album",
+}
+_ID3_ENCODINGS = {0: "latin-1", 1: "utf-16", 2: "utf-16-be", 3: "utf-8"}
+# kbit/s by bitrate index, layer III: MPEG-1, then MPEG-2/2.5
+_MP3_BITRATES = (
+    (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+)
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _synchsafe(data: bytes) -> int:
+    value = 0
+    for byte in data:
+        value = (value << 7) | (byte & 0x7F)
+    return value
+
+
+def _id3v2_tags(data: bytes, major: int, flags: int) -> Dict[str, str]:
+    tags: Dict[str, str] = {}
+    offset = 0
+    if flags & 0x40 and major >= 3:
+        # Extended header: its size excludes itself in v2.3, includes itself in v2.4
+        size = _synchsafe(data[:4]) if major == 4 else int.from_bytes(data[:4], "big") + 4
+        offset = size
+    id_size, header_size = (3, 6) if major == 2 else (4, 10)
+    while offset + header_size <= len(data):
+        frame_id = data[offset : offset + id_size]
+        if not frame_id.strip(b"\x00"):
+            break  # padding
+        raw_size = data[offset + id_size : offset + header_size - (0 if major == 2 else 2)]
+        size = _synchsafe(raw_size) if major == 4 else int.from_bytes(raw_size, "big")
+        body = data[offset + header_size : offset + header_size + size]
+        key = _ID3_TEXT_FRAMES.get(frame_id)
+        if key and body and body[0] in _ID3_ENCODINGS:
+            tags.setdefault(key, _clean_tag(body[1:MAX_TAG_BYTES].decode(_ID3_ENCODINGS[body[0]], "replace")))
+        offset += header_size + size
+    return tags
+
+
+def _id3v1_tags(handle: BinaryIO, file_size: int) -> Dict[str, str]:
+    if file_size < 128:
+        return {}
+    handle.seek(file_size - 128)
+    data = handle.read(128)
+    if data[:3] != b"TAG":
+        return {}
+    fields = {"title": data[3:33], "artist": data[33:63], "album": data[63:93]}
+    tags = {key: _clean_tag(value.decode("latin-1")) for key, value in fields.items()}
+    return {key: value for key, value in tags.items() if value}
+
+
+def _parse_mp3(handle: BinaryIO, file_size: int) -> Optional[MediaMetadata]:
+    handle.seek(0)
+    header = handle.read(10)
+    tags: Dict[str, str] = {}
+    audio_start = 0
+    if header[:3] == b"ID3" and len(header) == 10:
+        size = _synchsafe(header[6:10])
+        audio_start = 10 + size + (10 if header[5] & 0x10 else 0)
+        data = _read_exact(handle, size)
+        if data is not None:
+            tags = _id3v2_tags(data, header[3], header[5])
+
+    # First frame: some encoders leave padding between the tag and the audio
+    handle.seek(audio_start)
+    data = handle.read(64 * 1024)
+    frame = -1
+    for offset in range(len(data) - 4):
+        if data[offset] == 0xFF and data[offset + 1] & 0xE6 == 0xE2 and data[offset + 2] & 0xF0 not in (0, 0xF0):
+            if (data[offset + 2] >> 2) & 3 != 3 and (data[offset + 1] >> 3) & 3 != 1:
+                frame = offset
+                break
+    if frame < 0:
+        return None
+    b1, b2, b3 = data[frame + 1], data[frame + 2], data[frame + 3]
+    version = (b1 >> 3) & 3
+    mpeg1 = version == 3
+    sample_rate = _MP3_SAMPLE_RATES[version][(b2 >> 2) & 3]
+    bitrate = _MP3_BITRATES[0 if mpeg1 else 1][b2 >> 4]
+    samples_per_frame = 1152 if mpeg1 else 576
+    mono = b3 >> 6 == 3
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+
+    frames = 0
+    xing = frame + 4 + side_info
+    if data[xing : xing + 4] in (b"Xing", b"Info") and len(data) >= xing + 12:
+        if struct.unpack_from(">I", data, xing + 4)[0] & 1:
+            frames = struct.unpack_from(">I", data, xing + 8)[0]
+    elif data[frame + 36 : frame + 40] == b"VBRI" and len(data) >= frame + 54:
+        frames = struct.unpack_from(">I", data, frame + 50)[0]
+
+    if frames:
+        duration_ms = frames * samples_per_frame * 1000 // sample_rate
+    else:
+        # Constant bitrate: the audio size gives the duration
+        audio_bytes = file_size - audio_start - frame
+        duration_ms = audio_bytes * 8 // bitrate if bitrate else 0
+    if not tags:
+        tags = _id3v1_tags(handle, file_size)
+    return MediaMetadata("mp3", duration_ms, **tags)
+
+
+# --- AAC (ADTS) ---
+
+_ADTS_SAMPLE_RATES = (96000, 88200, 64000, 48000, 44100, 32000, 24000, 22050, 16000, 12000, 11025, 8000, 7350)
+_ADTS_SAMPLE_FRAMES = 64
+
+
+def _parse_adts(handle: BinaryIO, file_size: int) -> Optional[MediaMetadata]:
+    # ADTS has no global header: average the first frames and extrapolate
+    offset = 0
+    lengths = []
+    sample_rate = 0
+    while len(lengths) < _ADTS_SAMPLE_FRAMES and offset + 7 <= file_size:
+        handle.seek(offset)
+        header = handle.read(7)
+        if len(header) < 7 or header[0] != 0xFF or header[1] & 0xF6 != 0xF0:
+            break
+        rate_index = (header[2] >> 2) & 0x0F
+        if rate_index >= len(_ADTS_SAMPLE_RATES):
+            break
+        sample_rate = _ADTS_SAMPLE_RATES[rate_index]
+        length = ((header[3] & 0x03) << 11) | (header[4] << 3) | (header[5] >> 5)
+        if length < 7:
+            break
+        lengths.append(length)
+        offset += length
+    if not lengths:
+        return None
+    frames = file_size * len(lengths) / sum(lengths)
+    return MediaMetadata("aac", int(frames * 1024 * 1000 / sample_rate))
+
+
+# --- FLAC / Vorbis comments ---
+
+_VORBIS_TAGS = {"TITLE": "title", "ARTIST": "artist", "ALBUM": "album"}
+
+
+def _vorbis_comments(data: bytes, offset: int = 0) -> Dict[str, str]:
+    tags: Dict[str, str] = {}
+    vendor_size, = struct.unpack_from("<I", data, offset)
+    offset += 4 + vendor_size
+    count, = struct.unpack_from("<I", data, offset)
+    offset += 4
+    for _ in range(count):
+        if offset + 4 > len(data):
+            break
+        size, = struct.unpack_from("<I", data, offset)
+        comment = data[offset + 4 : offset + 4 + size].decode("utf-8", "replace")
+        offset += 4 + size
+        key, _, value = comment.partition("=")
+        tag = _VORBIS_TAGS.get(key.upper())
+        if tag:
+            tags.setdefault(tag, _clean_tag(value))
+    return tags
+
+
+def _parse_flac(handle: BinaryIO, file_size: int) -> Optional[MediaMetadata]:
+    handle.seek(4)
+    duration_ms = 0
+    tags: Dict[str, str] = {}
+    found = False
+    last = False
+    while not last:
+        header = handle.read(4)
+        if len(header) < 4:
+            break
+        last = bool(header[0] & 0x80)
+        block_type = header[0] & 0x7F
+        size = int.from_bytes(header[1:4], "big")
+        if block_type in (0, 4):
+            data = _read_exact(handle, size)
+            if data is None:
+                break
+            if block_type == 0 and size >= 18:
+                found = True
+                sample_rate = int.from_bytes(data[10:13], "big") >> 4
+                total_samples = int.from_bytes(data[13:18], "big") & 0xFFFFFFFFF
+                if sample_rate:
+                    duration_ms = total_samples * 1000 // sample_rate
+            elif block_type == 4:
+                tags = _vorbis_comments(data)
+        else:
+            # Pictures, seek tables, padding: skipped, never read
+            handle.seek(size, 1)
+    return MediaMetadata("flac", duration_ms, **tags) if found else None
+
+
+# --- WAV ---
+
+_WAV_INFO_TAGS = {b"INAM": "title", b"IART": "artist", b"IPRD": "album"}
+
+
+def _parse_wav(handle: BinaryIO, file_size: int) -> Optional[MediaMetadata]:
+    byte_rate = data_size = 0
+    tags: Dict[str, str] = {}
+    offset = 12
+    # Walk the top-level chunks; the sample data itself is skipped
+    for _ in range(64):
+        if offset + 8 > file_size:
+            break
+        handle.seek(offset)
+        chunk_id, size = struct.unpack("<4sI", handle.read(8))
+        if chunk_id == b"fmt " and size >= 12:
+            data = _read_exact(handle, 12)
+            if data is not None:
+                byte_rate, = struct.unpack_from("<I", data, 8)
+        elif chunk_id == b"data":
+            data_size = min(size, file_size - offset - 8)
+        elif chunk_id == b"LIST" and size >= 4:
+            data = _read_exact(handle, size)
+            if data is not None and data[:4] == b"INFO":
+                for sub_id, sub_offset, sub_size in _riff_chunks(data, 4, len(data)):
+                    if sub_id in _WAV_INFO_TAGS:
+                        value = data[sub_offset : sub_offset + sub_size].decode("latin-1")
+                        tags.setdefault(_WAV_INFO_TAGS[sub_id], _clean_tag(value))
+        offset += 8 + size + (size & 1)
+    if not byte_rate:
+        return None
+    return MediaMetadata("wav", data_size * 1000 // byte_rate, **tags)
+
+
+# --- Ogg Vorbis / Opus ---
+
+_OGG_SCAN_BYTES = 64 * 1024
+
+
+def _ogg_packets(data: bytes, serial: Optional[int] = None, limit: int = 2) -> Tuple[list, Optional[int]]:
+    """Reassemble the first ``limit`` packets of one logical stream from in-memory pages."""
+    packets = []
+    current = b""
+    offset = 0
+    while offset + 27 <= len(data) and len(packets) < limit and data[offset : offset + 4] == b"OggS":
+        page_serial, = struct.unpack_from("<I", data, offset + 14)
+        segment_count = data[offset + 26]
+        segments = data[offset + 27 : offset + 27 + segment_count]
+        body = offset + 27 + segment_count
+        if serial is None:
+            serial = page_serial
+        for lacing in segments:
+            if page_serial == serial:
+                current += data[body : body + lacing]
+                if lacing < 255:
+                    packets.append(current)
+                    current = b""
+            body += lacing
+        offset = body
+    return packets[:limit], serial
+
+
+def _parse_ogg(handle: BinaryIO, file_size: int) -> Optional[MediaMetadata]:
+    handle.seek(0)
+    packets, serial = _ogg_packets(handle.read(_OGG_SCAN_BYTES))
+    if not packets:
+        return None
+    identification = packets[0]
+    tags: Dict[str, str] = {}
+    if identification[:7] == b"\x01vorbis" and len(identification) >= 16:
+        container = "ogg"
+        sample_rate, = struct.unpack_from("<I", identification, 12)
+        pre_skip = 0
+        if len(packets) > 1 and packets[1][:7] == b"\x03vorbis":
+            tags = _vorbis_comments(packets[1], 7)
+    elif identification[:8] == b"OpusHead" and len(identification) >= 12:
+        container = "opus"
+        sample_rate = 48000  # Opus granules always count 48 kHz samples
+        pre_skip, = struct.unpack_from("<H", identification, 10)
+        if len(packets) > 1 and packets[1][:8] == b"OpusTags":
+            tags = _vorbis_comments(packets[1], 8)
+    else:
+        return None
+
+    # The last page of the stream carries its total sample count
+    start = max(0, file_size - _OGG_SCAN_BYTES)
+    handle.seek(start)
+    tail = handle.read(file_size - start)
+    granule = 0
+    position = tail.rfind(b"OggS")
+    while position >= 0:
+        if len(tail) >= position + 18 and struct.unpack_from("<I", tail, position + 14)[0] == serial:
+            granule, = struct.unpack_from("<q", tail, position + 6)
+            break
+        position = tail.rfind(b"OggS", 0, position)
+    duration_ms = max(0, granule - pre_skip) * 1000 // sample_rate if sample_rate else 0
+    return MediaMetadata(container, duration_ms, **tags)
+
+
+# --- dispatch ---
+
+
+def _sniff(head: bytes) -> Optional[Callable[[BinaryIO, int], Optional[MediaMetadata]]]:
+    if head[4:8] in (b"ftyp", b"moov", b"mdat", b"free", b"wide", b"skip", b"pnot"):
+        return _parse_mp4
+    if head[:4] == b"\x1a\x45\xdf\xa3":
+        return _parse_matroska
+    if head[:4] == b"RIFF" and head[8:12] == b"AVI ":
+        return _parse_avi
+    if head[:3] == b"FLV":
+        return _parse_flv
+    if head[:4] == b"fLaC":
+        return _parse_flac
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return _parse_wav
+    if head[:4] == b"OggS":
+        return _parse_ogg
+    if head[:3] == b"ID3" or (head[:1] == b"\xff" and head[1] & 0xE6 == 0xE2):
+        return _parse_mp3
+    if head[:1] == b"\xff" and head[1] & 0xF6 == 0xF0:
+        return _parse_adts
+    return None
+
+
+def read_media_metadata(file_path: Path) -> Optional[MediaMetadata]:
+    """Lit duree, dimensions et tags depuis l'en-tete du conteneur, None si inconnu ou illisible.
+
+    The container is detected from the first bytes, not the extension.
+    """
+    try:
+        with open(file_path, "rb") as handle:
+            head = handle.read(12)
+            parser = _sniff(head)
+            if parser is None:
+                return None
+            handle.seek(0, 2)
+            file_size = handle.tell()
+            return parser(handle, file_size)
+    except (OSError, struct.error, ValueError, IndexError, RecursionError) as exc:
+        logger.debug("En-tete illisible pour %s: %s", file_path, exc)
+        return None
+
+
+def find_index_range(file_path: Path) -> Optional[Tuple[int, int]]:
+    """Return (offset, length) of the MP4/MOV ``moov`` payload, None for other containers.
+
+    The sample index is what a player reads right after the header; when it
+    was written at the end of the file, the head alone does not cover it.
+    Matroska cues and AVI ``idx1`` usually trail the file as well.
+    """
+    try:
+        with open(file_path, "rb") as handle:
+            if _sniff(handle.read(12)) is not _parse_mp4:
+                return None
+            handle.seek(0, 2)
+            file_size = handle.tell()
+            for box_type, payload, size in _mp4_boxes(handle, 0, file_size):
+                if box_type == b"moov":
+                    return payload, size
+    except (OSError, struct.error, ValueError) as exc:
+        logger.debug("Index introuvable pour %s: %s", file_path, exc)
+    return None
+
+
+__all__ = ["MediaMetadata", "find_index_range", "read_media_metadata"]
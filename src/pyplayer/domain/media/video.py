@@ -1,7 +1,12 @@
 """Video domain model."""
 
+import hashlib
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from src.pyplayer.domain.media.media_formats import is_audio_path
+from src.pyplayer.domain.media.media_metadata import read_media_metadata
+from src.pyplayer.shared.text import fold_text
 
 
 class VideoState:
@@ -89,6 +94,21 @@ class VideoState:
         return f"{status} {self.position}/{self._duration}ms"
 
 
+def make_media_key(file_path: Path, size: int, mtime: float) -> str:
+    """Return a short stable key identifying a file by path, size and mtime."""
+    raw = f"{file_path}\0{size}\0{int(mtime)}".encode("utf-8", "surrogateescape")
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def stat_media_key(file_path: Path) -> Optional[str]:
+    """Return the media key of ``file_path`` as it is on disk now, None if it cannot be stat'ed."""
+    try:
+        stat = Path(file_path).stat()
+    except OSError:
+        return None
+    return make_media_key(Path(file_path), stat.st_size, stat.st_mtime)
+
+
 class Video:
     """Represents a local video file and its metadata."""
 
@@ -100,26 +120,72 @@ class Video:
 
         self.state = VideoState()
 
-        self.size = self._get_file_size()
+        self.size, self.mtime = self._stat_file()
         self.width = 0
         self.height = 0
-
-    def _get_file_size(self) -> int:
+        # Audio tags, read from the file header
+        self.title = ""
+        self.artist = ""
+        self.album = ""
+        self.media_key = make_media_key(file_path, self.size, self.mtime)
+        self._search_key: Optional[Tuple[str, str]] = None
+
+    def _stat_file(self) -> Tuple[int, float]:
         try:
-            return self.file_path.stat().st_size
+            stat = self.file_path.stat()
+            return stat.st_size, stat.st_mtime
         except Exception:
-            return 0
+            return 0, 0.0
+
+    def _get_file_size(self) -> int:
+        return self._stat_file()[0]
+
+    @property
+    def id(self) -> str:
+        """Stable identifier, unique per file (unlike the display name)."""
+        return self.media_key
+
+    @property
+    def content_key(self) -> str:
+        """
+        Key of the file content as last stat'ed, for the metadata, fingerprint and thumbnail caches.
+
+        ``id`` keeps the key the video was first registered with, so
+        playlists keep pointing at it; this one changes when the file is
+        rewritten in place, so cached results for the old content miss.
+        """
+        return make_media_key(self.file_path, self.size, self.mtime)
+
+    @property
+    def search_key(self) -> str:
+        """Casefolded, accent-free name used to filter lists as the user types."""
+        cached = self._search_key
+        if cached is None or cached[0] != self.name:
+            cached = self._search_key = (self.name, fold_text(self.name))
+        return cached[1]
 
     @property
     def progress(self):
         return self.get_progress_bar(self.state.progress)
 
+    @property
+    def is_audio(self) -> bool:
+        """Audio-only item, played without a video output."""
+        return is_audio_path(self.file_path)
+
+    @property
+    def display_title(self) -> str:
+        """"Artist - Title" from the tags, or the file name."""
+        if self.title:
+            return f"{self.artist} - {self.title}" if self.artist else self.title
+        return self.name
+
     @property
     def resolution(self) -> str:
         """Return formatted resolution."""
         if self.width > 0 and self.height > 0:
             return f"{self.width}x{self.height}"
-        return "Inconnue"
+        return "Audio" if self.is_audio else "Inconnue"
 
     @property
     def duration(self) -> int:
@@ -141,7 +207,15 @@ class Video:
     def is_played(self):
         return self.state.progress > 0.9 and self.state.playing
 
-    def update_metadata(self, width: int = 0, height: int = 0, duration: int = 0) -> None:
+    def update_metadata(
+        self,
+        width: int = 0,
+        height: int = 0,
+        duration: int = 0,
+        title: str = "",
+        artist: str = "",
+        album: str = "",
+    ) -> None:
         """Update video metadata."""
         if width > 0:
             self.width = width
@@ -149,6 +223,12 @@ class Video:
             self.height = height
         if duration > 0:
             self.duration = duration
+        if title:
+            self.title = title
+        if artist:
+            self.artist = artist
+        if album:
+            self.album = album
 
     def update_state(
         self,
@@ -168,6 +248,21 @@ class Video:
         )
         return True
 
+    def load_header_metadata(self) -> bool:
+        """Fill duration, size and tags from the container header; False if it could not be read."""
+        metadata = read_media_metadata(self.file_path)
+        if metadata is None:
+            return False
+        self.update_metadata(
+            width=metadata.width,
+            height=metadata.height,
+            duration=metadata.duration_ms,
+            title=metadata.title,
+            artist=metadata.artist,
+            album=metadata.album,
+        )
+        return True
+
     def get_progress_bar(self, progress: float) -> str:
         """Return a simple unicode progress bar."""
         progress = max(0.0, min(1.0, progress))
@@ -188,32 +283,55 @@ class Video:
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the video into a JSON-ready dictionary."""
-        return {
+        data = {
             "file_path": str(self.file_path),
             "name": self.name,
             "size": self.size,
+            "mtime": self.mtime,
+            "media_key": self.media_key,
             "width": self.width,
             "height": self.height,
             "duration": self.duration,
             "extension": self.extension,
             "state": self.state.to_dict(),
         }
+        tags = {"title": self.title, "artist": self.artist, "album": self.album}
+        tags = {key: value for key, value in tags.items() if value}
+        if tags:
+            data["tags"] = tags
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Video":
         """Build a video from serialized data."""
         video = cls(Path(data["file_path"]))
-        video.size = data.get("size", 0)
-        video.width = data.get("width", 0)
-        video.height = data.get("height", 0)
+        stored_size = data.get("size", 0)
+        stored_mtime = data.get("mtime", video.mtime)
+        if not video.size and not video.mtime:
+            # File missing: keep the recorded identity, fingerprint lookups need it to relink
+            video.size, video.mtime = stored_size, stored_mtime
+        # Rewritten in place since it was recorded: the stored metadata describes the old content
+        changed = "size" in data and (video.size, int(video.mtime)) != (stored_size, int(stored_mtime))
+        video.media_key = data.get("media_key") or video.media_key
 
-        duration = data.get("duration", 0)
         state_data = data.get("state")
         if isinstance(state_data, dict):
             video.state = VideoState.from_dict(state_data)
-            if duration > 0:
-                video.duration = duration
-        elif duration > 0:
+        if changed:
+            video.duration = 0
+            return video
+
+        video.width = data.get("width", 0)
+        video.height = data.get("height", 0)
+        tags = data.get("tags")
+        if isinstance(tags, dict):
+            video.update_metadata(
+                title=str(tags.get("title", "")),
+                artist=str(tags.get("artist", "")),
+                album=str(tags.get("album", "")),
+            )
+        duration = data.get("duration", 0)
+        if duration > 0:
             video.duration = duration
 
         return video
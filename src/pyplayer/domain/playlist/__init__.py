@@ -1,5 +1,15 @@
 """Playlist domain package."""
 
 from .playlist import PlayMode, Playlist, PlaylistState
+from .playlist_events import PlaylistChange, PlaylistChangeKind, PlaylistNotifier
+from .playlist_snapshot import PlaylistSnapshot
 
-__all__ = ["PlayMode", "Playlist", "PlaylistState"]
+__all__ = [
+    "PlayMode",
+    "Playlist",
+    "PlaylistChange",
+    "PlaylistChangeKind",
+    "PlaylistNotifier",
+    "PlaylistSnapshot",
+    "PlaylistState",
+]
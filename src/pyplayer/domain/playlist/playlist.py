@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
+import dataclasses
 import hashlib
 import logging
 import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from src.pyplayer.domain.media.media_formats import VIDEO_EXTENSIONS
-from src.pyplayer.domain.media.video import Video
+from src.pyplayer.domain.media.media_formats import MEDIA_EXTENSIONS
+from src.pyplayer.domain.media.media_library import MediaLibrary
+from src.pyplayer.domain.media.video import Video, VideoState
 from src.pyplayer.domain.playlist.play_mode import PlayMode
+from src.pyplayer.domain.playlist.playlist_events import PlaylistChange, PlaylistChangeKind, PlaylistNotifier
 from src.pyplayer.domain.playlist.playlist_navigation import PlaylistNavigation
 from src.pyplayer.domain.playlist.playlist_serializer import PlaylistSerializer
+from src.pyplayer.domain.playlist.playlist_snapshot import PlaylistSnapshot
 from src.pyplayer.domain.playlist.playlist_state import PlaylistState
 from src.pyplayer.domain.playlist.playlist_file_service import PlaylistFileService
 from src.pyplayer.domain.playlist.playlist_validation import PlaylistValidation
@@ -25,8 +29,9 @@ logger = logging.getLogger(__name__)
 class Playlist:
     """Represente une playlist de videos, chargee depuis un dossier ou vide."""
 
-    def __init__(self, video_path: Optional[Path] = None):
+    def __init__(self, video_path: Optional[Path] = None, library: Optional[MediaLibrary] = None):
         self.path = video_path
+        self._library = library
         self.name = video_path.name if video_path else "Playlist sans titre"
         self.unique_id = self._generate_id()
         self.play_mode = PlayMode.NORMAL
@@ -37,6 +42,11 @@ class Playlist:
         self._shuffle_order: List[int] = []
         self._shuffle_position = -1
         self._shuffle_history: List[int] = []
+        self._revision = 0
+        self._id_index: Dict[str, int] = {}
+        self._id_index_revision = -1
+        self.changes = PlaylistNotifier()
+        self._structure_shared = False
         self.p_state = PlaylistState(
             playlist_id=self.unique_id,
             total_videos=len(self.videos),
@@ -71,10 +81,87 @@ class Playlist:
     def total(self) -> int:
         return len(self.videos)
 
+    @property
+    def library(self) -> Optional[MediaLibrary]:
+        """Shared media library the videos are acquired from, if any."""
+        return self._library
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every structural change of the video list."""
+        return self._revision
+
+    def _bump_revision(self) -> None:
+        self._revision += 1
+
+    def _emit_change(
+        self,
+        kind: PlaylistChangeKind,
+        first: int = -1,
+        last: Optional[int] = None,
+        destination: int = -1,
+        videos: Tuple[Video, ...] = (),
+    ) -> None:
+        """Record a change: bump the revision for structural ones and notify listeners."""
+        if kind.is_structural:
+            self._bump_revision()
+        if self.changes.has_listeners:
+            self.changes.emit(
+                PlaylistChange(kind, first, first if last is None else last, destination, videos)
+            )
+
+    def snapshot(self) -> PlaylistSnapshot:
+        """Return an immutable view sharing the current lists (copied on next mutation)."""
+        self._structure_shared = True
+        return PlaylistSnapshot(
+            unique_id=self.unique_id,
+            name=self.name,
+            description=self.description,
+            path=self.path,
+            play_mode=self.play_mode,
+            current_index=self.current_index,
+            revision=self._revision,
+            videos=self.videos,
+            raw_current_index=self._current_index,
+            shuffle_order=self._shuffle_order,
+            shuffle_position=self._shuffle_position,
+            shuffle_history=self._shuffle_history,
+            p_state=dataclasses.replace(self.p_state, play_history=list(self.p_state.play_history)),
+            library=self._library,
+        )
+
+    def _detach_shared(self) -> None:
+        """Copy-on-write: take private copies of the lists a snapshot still references."""
+        if not self._structure_shared:
+            return
+        self.videos = list(self.videos)
+        self._shuffle_order = list(self._shuffle_order)
+        self._shuffle_history = list(self._shuffle_history)
+        self._structure_shared = False
+
+    def _rows_by_id(self) -> Dict[str, int]:
+        """Video id -> row map, rebuilt lazily after structural changes."""
+        if self._id_index_revision != self._revision:
+            self._id_index = {video.id: row for row, video in enumerate(self.videos)}
+            self._id_index_revision = self._revision
+        return self._id_index
+
+    def index_of_id(self, video_id: str) -> int:
+        return self._rows_by_id().get(video_id, -1)
+
+    def get_video_by_id(self, video_id: str) -> Optional[Video]:
+        row = self._rows_by_id().get(video_id, -1)
+        return self.videos[row] if row >= 0 else None
+
     @property
     def total_duration(self) -> int:
         return sum(video.duration for video in self.videos if video.duration > 0)
 
+    @property
+    def is_audio_only(self) -> bool:
+        """True when every item is audio: the player then never needs a video output."""
+        return bool(self.videos) and all(video.is_audio for video in self.videos)
+
     def _invalidate_duration_cache(self) -> None:
         """Placeholder for future optimization if needed."""
         pass
@@ -128,6 +215,7 @@ class Playlist:
             index=value,
             video_path=self.videos[value].file_path if value >= 0 else None,
         )
+        self._emit_change(PlaylistChangeKind.CURRENT_CHANGED, value)
         self._auto_save_if_needed()
 
     @property
@@ -198,12 +286,19 @@ class Playlist:
         if playing is not None:
             self.p_state.is_playing = playing
 
+        self._mark_library_dirty()
+        self._emit_change(PlaylistChangeKind.PROGRESS_CHANGED, self.current_index)
         self._auto_save_if_needed()
         return True
 
     # Class-level constant for auto-save throttle
     AUTO_SAVE_COOLDOWN: float = 2.0  # seconds
 
+    def _mark_library_dirty(self) -> None:
+        # Video records live in the shared library, not in the playlist file
+        if self._library is not None:
+            self._library.mark_dirty()
+
     def _auto_save_if_needed(self) -> None:
         if self._save_file_path and self._save_file_path.parent.exists():
             # Throttle: skip if saved recently
@@ -212,7 +307,7 @@ class Playlist:
                 return
             self._last_auto_save = now
             try:
-                self.save_to_file(self._save_file_path, create_backup=False)
+                self.save_to_file(self._save_file_path, create_backup=False, flush_library=False)
             except Exception as e:
                 logger.debug(f"Auto-save echoue: {e}")
 
@@ -240,6 +335,7 @@ class Playlist:
         return True
 
     def get_next_video(self) -> Tuple[Optional[Video], int]:
+        self._detach_shared()
         nav = PlaylistNavigation(
             self.videos, self.play_mode, self._current_index,
             self._shuffle_order, self._shuffle_position, self._shuffle_history,
@@ -261,10 +357,28 @@ class Playlist:
         )
         self.p_state.total_videos = self.total
         self.p_state.total_duration = self.total_duration
+        self._emit_change(PlaylistChangeKind.CURRENT_CHANGED, new_idx)
         self._auto_save_if_needed()
         return video, new_idx
 
+    def peek_next_video(self) -> Tuple[Optional[Video], int]:
+        """Video that ``get_next_video`` would select, without advancing (used to preload it)."""
+        nav = PlaylistNavigation(
+            self.videos, self.play_mode, self._current_index,
+            self._shuffle_order, self._shuffle_position, self._shuffle_history,
+        )
+        return nav.peek_next_video()
+
+    def peek_upcoming_videos(self, count: int = 2) -> List[Video]:
+        """Videos expected to play after the current one, in order (used to prefetch them)."""
+        nav = PlaylistNavigation(
+            self.videos, self.play_mode, self._current_index,
+            self._shuffle_order, self._shuffle_position, self._shuffle_history,
+        )
+        return [video for video, _ in nav.peek_upcoming(count)]
+
     def get_previous_video(self) -> Tuple[Optional[Video], int]:
+        self._detach_shared()
         nav = PlaylistNavigation(
             self.videos, self.play_mode, self._current_index,
             self._shuffle_order, self._shuffle_position, self._shuffle_history,
@@ -279,11 +393,13 @@ class Playlist:
             self._shuffle_position = nav._shuffle_position
 
         self.p_state.update_state(index=new_idx, video_path=video.file_path if video else None)
+        self._emit_change(PlaylistChangeKind.CURRENT_CHANGED, new_idx)
         self._auto_save_if_needed()
         return video, new_idx
 
     def set_play_mode(self, mode: PlayMode) -> None:
         try:
+            self._detach_shared()
             if mode == self.play_mode:
                 return
 
@@ -338,7 +454,7 @@ class Playlist:
 
         try:
             for file_path in dir_path.rglob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in VIDEO_EXTENSIONS:
+                if file_path.is_file() and file_path.suffix.lower() in MEDIA_EXTENSIONS:
                     video = self.add_video(file_path)
                     if video:
                         added_videos.append(video)
@@ -355,14 +471,18 @@ class Playlist:
                 return None
 
             suffix = file_path.suffix.lower()
-            if suffix not in VIDEO_EXTENSIONS:
+            if suffix not in MEDIA_EXTENSIONS:
                 return None
 
             if any(v.file_path == file_path for v in self.videos):
                 return None
 
-            video = Video(file_path)
+            self._detach_shared()
+
+            video = self._library.acquire(file_path) if self._library is not None else Video(file_path)
             self.videos.append(video)
+            row = len(self.videos) - 1
+            self._emit_change(PlaylistChangeKind.ROWS_INSERTED, row, videos=(video,))
             self._invalidate_duration_cache()
             self.p_state.total_videos = self.total
             self.p_state.total_duration = self.total_duration
@@ -374,6 +494,7 @@ class Playlist:
 
     def remove_video(self, identifier: Union[Video, Path, int]) -> bool:
         try:
+            self._detach_shared()
             if isinstance(identifier, int):
                 if 0 <= identifier < len(self.videos):
                     if identifier == self._current_index:
@@ -392,6 +513,7 @@ class Playlist:
                                 self._shuffle_position = -1
 
                     del self.videos[identifier]
+                    self._emit_change(PlaylistChangeKind.ROWS_REMOVED, identifier)
                     self._invalidate_duration_cache()
                     self.p_state.total_videos = self.total
                     self.p_state.total_duration = self.total_duration
@@ -399,6 +521,11 @@ class Playlist:
                     return True
                 return False
 
+            if isinstance(identifier, Video):
+                row = self.index_of_id(identifier.id)
+                if row >= 0 and self.videos[row].file_path == identifier.file_path:
+                    return self.remove_video(row)
+
             target_path = identifier.file_path if isinstance(identifier, Video) else identifier
             for i, video in enumerate(self.videos):
                 if video.file_path == target_path:
@@ -415,6 +542,7 @@ class Playlist:
                                 self._shuffle_position = -1
 
                     del self.videos[i]
+                    self._emit_change(PlaylistChangeKind.ROWS_REMOVED, i)
                     self._invalidate_duration_cache()
                     self.p_state.total_videos = self.total
                     self.p_state.total_duration = self.total_duration
@@ -425,6 +553,140 @@ class Playlist:
             logger.error(f"Erreur remove_video: {e}")
             return False
 
+    def remove_videos(self, video_ids: Iterable[str]) -> int:
+        """
+        Supprime plusieurs videos en une seule passe.
+
+        The index remapping (current index, shuffle order and history) is
+        computed once, each contiguous run of removed rows is reported as one
+        ROWS_REMOVED range, and the playlist is saved once. Returns the number
+        of videos removed; unknown ids are ignored.
+        """
+        try:
+            rows_by_id = self._rows_by_id()
+            return self._remove_rows({rows_by_id[video_id] for video_id in video_ids if video_id in rows_by_id})
+        except Exception as e:
+            logger.error(f"Erreur remove_videos: {e}")
+            return 0
+
+    def _remove_rows(self, rows: Iterable[int], auto_save: bool = True) -> int:
+        """
+        Compact the list in one pass, with a single remap table for every index kept on the side.
+
+        ``auto_save=False`` leaves saving to a caller that saves explicitly afterwards.
+        """
+        rows = sorted(row for row in set(rows) if 0 <= row < len(self.videos))
+        if not rows:
+            return 0
+
+        self._detach_shared()
+        removed = set(rows)
+        remap: List[int] = []
+        kept: List[Video] = []
+        for row, video in enumerate(self.videos):
+            if row in removed:
+                remap.append(-1)
+            else:
+                remap.append(len(kept))
+                kept.append(video)
+
+        if 0 <= self._current_index < len(remap):
+            if remap[self._current_index] < 0:
+                self._current_index = -1
+                self.p_state.update_state(index=-1, video_path=None)
+            else:
+                self._current_index = remap[self._current_index]
+
+        if self._shuffle_order:
+            position = self._shuffle_position
+            if position >= 0:
+                # Keep pointing at the last surviving entry already played.
+                position = sum(1 for idx in self._shuffle_order[: position + 1] if remap[idx] >= 0) - 1
+            self._shuffle_order = [remap[idx] for idx in self._shuffle_order if remap[idx] >= 0]
+            self._shuffle_position = position if position < len(self._shuffle_order) else -1
+        self._shuffle_history = [
+            remap[idx] for idx in self._shuffle_history if 0 <= idx < len(remap) and remap[idx] >= 0
+        ]
+
+        self.videos = kept
+        # Bottom-up, so every range is expressed in rows of the list as it was when emitted.
+        start = end = rows[-1]
+        for row in reversed(rows[:-1]):
+            if row != start - 1:
+                self._emit_change(PlaylistChangeKind.ROWS_REMOVED, start, end)
+                end = row
+            start = row
+        self._emit_change(PlaylistChangeKind.ROWS_REMOVED, start, end)
+        self._invalidate_duration_cache()
+        self.p_state.total_videos = self.total
+        self.p_state.total_duration = self.total_duration
+        if auto_save:
+            self._auto_save_if_needed()
+        logger.info(f"{len(rows)} videos supprimees de la playlist {self.name}")
+        return len(rows)
+
+    def relink_videos(self, relinks: Dict[str, Path]) -> int:
+        """
+        Remplace des videos deplacees par leur nouvel emplacement.
+
+        ``relinks`` maps a video id to the path where the file now lives. Each
+        entry keeps its row, playback state and known metadata; rows, current
+        index and shuffle order are untouched. Every contiguous run of rows is
+        reported as a ROWS_REMOVED/ROWS_INSERTED pair (the ids change), and
+        the playlist is saved once. Returns the number of videos relinked.
+        """
+        try:
+            rows_by_id = self._rows_by_id()
+            targets = sorted(
+                (rows_by_id[video_id], Path(new_path))
+                for video_id, new_path in relinks.items()
+                if video_id in rows_by_id
+            )
+            if not targets:
+                return 0
+
+            self._detach_shared()
+            replaced: Dict[int, Video] = {}
+            for row, new_path in targets:
+                old = self.videos[row]
+                if new_path == old.file_path:
+                    continue
+                video = self._library.acquire(new_path) if self._library is not None else Video(new_path)
+                video.update_metadata(width=old.width, height=old.height, duration=old.duration)
+                if video.state.position <= 0 < old.state.position:
+                    video.state = VideoState.from_dict(old.state.to_dict())
+                replaced[row] = video
+            if not replaced:
+                return 0
+
+            rows = sorted(replaced)
+            for row in rows:
+                self.videos[row] = replaced[row]
+            start = previous = rows[0]
+            for row in rows[1:] + [-1]:
+                if row != previous + 1:
+                    self._emit_change(PlaylistChangeKind.ROWS_REMOVED, start, previous)
+                    self._emit_change(
+                        PlaylistChangeKind.ROWS_INSERTED,
+                        start,
+                        previous,
+                        videos=tuple(self.videos[start : previous + 1]),
+                    )
+                    start = row
+                previous = row
+
+            if self._current_index in replaced:
+                self.p_state.update_state(video_path=replaced[self._current_index].file_path)
+            self._invalidate_duration_cache()
+            self.p_state.total_duration = self.total_duration
+            self._mark_library_dirty()
+            self._auto_save_if_needed()
+            logger.info(f"{len(rows)} videos relocalisees dans la playlist {self.name}")
+            return len(rows)
+        except Exception as e:
+            logger.error(f"Erreur relink_videos: {e}")
+            return 0
+
     def move_video(self, from_index: int, to_index: int) -> bool:
         try:
             if not 0 <= from_index < len(self.videos) or not 0 <= to_index <= len(self.videos):
@@ -432,8 +694,14 @@ class Playlist:
             if from_index == to_index:
                 return True
 
+            self._detach_shared()
             video = self.videos.pop(from_index)
             self.videos.insert(to_index, video)
+            self._emit_change(
+                PlaylistChangeKind.ROW_MOVED,
+                from_index,
+                destination=min(to_index, len(self.videos) - 1),
+            )
             self._invalidate_duration_cache()  # Duration unchanged but state updated
 
             if self._current_index == from_index:
@@ -473,7 +741,13 @@ class Playlist:
             if idx1 == idx2:
                 return True
 
+            self._detach_shared()
             self.videos[idx1], self.videos[idx2] = self.videos[idx2], self.videos[idx1]
+            low, high = min(idx1, idx2), max(idx1, idx2)
+            # A swap is two moves: the high row up to the low slot, then the pushed-down row back to the high slot.
+            self._emit_change(PlaylistChangeKind.ROW_MOVED, high, destination=low)
+            if high - low > 1:
+                self._emit_change(PlaylistChangeKind.ROW_MOVED, low + 1, destination=high)
 
             if self._current_index == idx1:
                 self._current_index = idx2
@@ -515,6 +789,7 @@ class Playlist:
         if description is not None:
             self.description = description
 
+        self._emit_change(PlaylistChangeKind.METADATA_CHANGED)
         self._auto_save_if_needed()
         logger.info(f"Metadonnees mises a jour: name={self.name}, description={self.description}")
 
@@ -523,7 +798,7 @@ class Playlist:
             return None
 
         if isinstance(identifier, Video):
-            return identifier if identifier in self.videos else None
+            return identifier if self.get_video_index(identifier) >= 0 else None
 
         if isinstance(identifier, int):
             if 0 <= identifier < len(self.videos):
@@ -542,6 +817,10 @@ class Playlist:
             return None
 
         if isinstance(identifier, str):
+            video = self.get_video_by_id(identifier)
+            if video is not None:
+                return video
+
             for video in self.videos:
                 if video.name == identifier:
                     return video
@@ -567,6 +846,9 @@ class Playlist:
             return identifier if 0 <= identifier < len(self.videos) else -1
 
         if isinstance(identifier, Video):
+            row = self.index_of_id(identifier.id)
+            if row >= 0 and self.videos[row] is identifier:
+                return row
             try:
                 return self.videos.index(identifier)
             except ValueError:
@@ -595,6 +877,37 @@ class Playlist:
                     return i
         return -1
 
+    def update_video_metadata(
+        self,
+        identifier: Union[int, str, Video, Path],
+        width: int = 0,
+        height: int = 0,
+        duration: int = 0,
+    ) -> bool:
+        row = self.get_video_index(identifier)
+        if row < 0:
+            return False
+        self.videos[row].update_metadata(width=width, height=height, duration=duration)
+        self.p_state.total_duration = self.total_duration
+        self._mark_library_dirty()
+        self._emit_change(PlaylistChangeKind.METADATA_CHANGED, row)
+        return True
+
+    def notify_metadata_changed(self, videos: Iterable[Video]) -> int:
+        """Announce metadata filled in elsewhere (e.g. a background probe), one change per row run."""
+        rows = sorted({row for row in (self.index_of_id(video.id) for video in videos) if row >= 0})
+        if not rows:
+            return 0
+        self.p_state.total_duration = self.total_duration
+        self._mark_library_dirty()
+        start = previous = rows[0]
+        for row in rows[1:] + [-1]:
+            if row != previous + 1:
+                self._emit_change(PlaylistChangeKind.METADATA_CHANGED, start, previous)
+                start = row
+            previous = row
+        return len(rows)
+
     def jump_to_video_by_name(self, video_name: str, exact_match: bool = True) -> bool:
         idx = self.get_index_by_name(video_name, exact_match)
         if idx >= 0:
@@ -610,6 +923,17 @@ class Playlist:
         logger.warning(f"Video introuvable : '{video_name}'")
         return False
 
+    def jump_to_video_by_id(self, video_id: str) -> bool:
+        idx = self.index_of_id(video_id)
+        if idx < 0:
+            logger.warning(f"Video introuvable : id={video_id}")
+            return False
+        self.current_index = idx
+        if self.play_mode == PlayMode.SHUFFLE and self._shuffle_order and idx not in self._shuffle_order:
+            self._generate_shuffle_order()
+            self._shuffle_position = self._shuffle_order.index(idx) if self._shuffle_order else -1
+        return True
+
     def find_videos_by_name(self, name: str, case_sensitive: bool = False) -> List[Video]:
         if not self.videos:
             return []
@@ -669,7 +993,9 @@ class Playlist:
             current_mode = None
             was_playing = False
 
+        self._detach_shared()
         self.videos.clear()
+        self._emit_change(PlaylistChangeKind.RESET)
         self._invalidate_duration_cache()
         self._current_index = -1
 
@@ -698,6 +1024,7 @@ class Playlist:
         self.clear(reset_state=False)
 
     def _generate_shuffle_order(self) -> None:
+        self._detach_shared()
         if not self.videos:
             self._shuffle_order = []
             self._shuffle_position = -1
@@ -746,19 +1073,26 @@ class Playlist:
             description=self.description,
             unique_id=self.unique_id,
             include_video_states=include_video_states,
+            library=self._library,
         )
 
     @classmethod
-    def from_dict(cls, data: dict, validate_files: bool = True) -> "Playlist":
-        result = PlaylistSerializer.from_dict(data, validate_files=validate_files)
+    def from_dict(
+        cls,
+        data: dict,
+        validate_files: bool = True,
+        library: Optional[MediaLibrary] = None,
+    ) -> "Playlist":
+        result = PlaylistSerializer.from_dict(data, validate_files=validate_files, library=library)
 
-        playlist = cls(video_path=None)
+        playlist = cls(video_path=None, library=library)
         playlist.path = result["path"]
         playlist.name = result["name"]
         playlist.description = result["description"]
         playlist.unique_id = result["unique_id"] or playlist._generate_id()
         playlist.play_mode = result["play_mode"]
         playlist.videos = result["videos"]
+        playlist._bump_revision()
         playlist._current_index = result["current_index"]
         playlist._shuffle_order = result["shuffle_order"]
         playlist._shuffle_position = result["shuffle_position"]
@@ -794,7 +1128,14 @@ class Playlist:
         create_backup: bool = True,
         name: Optional[str] = None,
         description: Optional[str] = None,
+        flush_library: bool = True,
     ) -> bool:
+        """
+        Write the playlist file, then the shared library if it has pending changes.
+
+        Auto-saves pass ``flush_library=False``: the library is then written
+        at most once per ``MediaLibrary.SAVE_COOLDOWN``.
+        """
         original_name = self.name
         original_description = self.description
 
@@ -805,6 +1146,9 @@ class Playlist:
 
         data = self.to_dict()
         result = PlaylistFileService.save_to_file(file_path, data, create_backup=create_backup)
+        if result and self._library is not None and self._library.library_file:
+            # References in the playlist file are only meaningful with the shared records.
+            self._library.save_if_needed(force=flush_library)
 
         if name is not None:
             self.name = original_name
@@ -819,6 +1163,7 @@ class Playlist:
         validate_files: bool = True,
         name: Optional[str] = None,
         description: Optional[str] = None,
+        library: Optional[MediaLibrary] = None,
     ) -> Optional["Playlist"]:
         data = PlaylistFileService.load_from_file(file_path)
         if data is None:
@@ -827,7 +1172,7 @@ class Playlist:
                 return None
             data = backup_data
 
-        playlist = cls.from_dict(data, validate_files=validate_files)
+        playlist = cls.from_dict(data, validate_files=validate_files, library=library)
         if name is not None:
             playlist.name = name
         if description is not None:
@@ -849,18 +1194,27 @@ class Playlist:
             self.videos, name=self.name, description=self.description
         )
 
-    def remove_missing_files(self) -> List[Dict[str, Any]]:
-        report = self.get_validation_report()
-        missing_files = report.get("missing_files", [])
-        removed = []
-
-        for item in sorted(missing_files, key=lambda x: x["index"], reverse=True):
-            idx = item["index"]
-            if 0 <= idx < len(self.videos):
-                removed_video = self.videos[idx]
-                if self.remove_video(idx):
-                    removed.append({"index": idx, "name": removed_video.name, "path": str(removed_video.file_path)})
-                    logger.info(f"Video supprimee (fichier manquant): {removed_video.name}")
+    def missing_rows(self, exists: Optional[Callable[[Path], bool]] = None) -> List[int]:
+        """Rows whose file is gone; ``exists`` lets callers share a directory-listing cache."""
+        exists = exists or Path.exists
+        return [row for row, video in enumerate(self.videos) if not video.file_path or not exists(video.file_path)]
+
+    def remove_missing_files(
+        self, exists: Optional[Callable[[Path], bool]] = None, auto_save: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Drop every entry whose file is gone in one compaction pass (one remap, one save unless ``auto_save=False``)."""
+        rows = self.missing_rows(exists)
+        removed = [
+            {"index": row, "name": self.videos[row].name, "path": str(self.videos[row].file_path)}
+            for row in rows
+        ]
+        if rows:
+            self._remove_rows(rows, auto_save=auto_save)
+            for item in removed:
+                logger.debug(f"Video supprimee (fichier manquant): {item['name']}")
+        # The report computed at load time no longer matches the rows
+        if hasattr(self, "_load_validation"):
+            del self._load_validation
 
         self.update_playlist_state()
         return removed
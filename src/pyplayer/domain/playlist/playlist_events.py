@@ -0,0 +1,158 @@
+"""Playlist change notifications — Qt-free, batched per scheduler tick."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ChangeCallback = Callable[[List["PlaylistChange"]], None]
+Scheduler = Callable[[Callable[[], None]], None]
+
+
+class PlaylistChangeKind(Enum):
+    """Kinds of change a playlist can report."""
+
+    ROWS_INSERTED = "rows_inserted"
+    ROWS_REMOVED = "rows_removed"
+    ROW_MOVED = "row_moved"
+    PROGRESS_CHANGED = "progress_changed"
+    CURRENT_CHANGED = "current_changed"
+    METADATA_CHANGED = "metadata_changed"
+    RESET = "reset"
+
+    @property
+    def is_structural(self) -> bool:
+        return self in _STRUCTURAL_KINDS
+
+
+_STRUCTURAL_KINDS = {
+    PlaylistChangeKind.ROWS_INSERTED,
+    PlaylistChangeKind.ROWS_REMOVED,
+    PlaylistChangeKind.ROW_MOVED,
+    PlaylistChangeKind.RESET,
+}
+
+
+@dataclass(frozen=True)
+class PlaylistChange:
+    """
+    One change, expressed in rows of the list *as it was when the change happened*.
+
+    ``first``/``last`` is an inclusive row range (``-1`` for playlist-level
+    changes). ``destination`` is the target row of a move. Inserted videos
+    are carried along so listeners can replay a batch without reading back
+    a list that may have changed again since.
+    """
+
+    kind: PlaylistChangeKind
+    first: int = -1
+    last: int = -1
+    destination: int = -1
+    videos: Tuple[Any, ...] = ()
+
+    @property
+    def count(self) -> int:
+        return self.last - self.first + 1 if self.first >= 0 else 0
+
+
+class PlaylistNotifier:
+    """
+    Collects changes and delivers them to listeners in batches.
+
+    Without a scheduler every change is delivered immediately as a batch of
+    one. With one (e.g. a zero-delay timer in the UI), changes emitted during
+    the same event-loop tick are coalesced and delivered once.
+    """
+
+    def __init__(self, scheduler: Optional[Scheduler] = None) -> None:
+        self.scheduler = scheduler
+        self._listeners: List[ChangeCallback] = []
+        self._pending: List[PlaylistChange] = []
+        self._flush_scheduled = False
+
+    @property
+    def has_listeners(self) -> bool:
+        return bool(self._listeners)
+
+    def subscribe(self, callback: ChangeCallback) -> None:
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback: ChangeCallback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+        if not self._listeners:
+            self._pending.clear()
+
+    def emit(self, change: PlaylistChange) -> None:
+        if not self._listeners:
+            return
+        self._pending.append(change)
+        if self.scheduler is None:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.scheduler(self.flush)
+
+    def flush(self) -> None:
+        """Deliver every pending change as one coalesced batch."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        batch = coalesce_changes(self._pending)
+        self._pending = []
+        for callback in list(self._listeners):
+            try:
+                callback(batch)
+            except Exception as error:
+                logger.error("Erreur listener playlist: %s", error)
+
+
+def coalesce_changes(changes: List[PlaylistChange]) -> List[PlaylistChange]:
+    """Merge adjacent changes that a listener can apply as a single operation."""
+    merged: List[PlaylistChange] = []
+    for change in changes:
+        if change.kind is PlaylistChangeKind.RESET:
+            # Nothing before a reset matters to a listener.
+            merged = [change]
+            continue
+        if merged:
+            previous = merged[-1]
+            combined = _merge_pair(previous, change)
+            if combined is not None:
+                merged[-1] = combined
+                continue
+        merged.append(change)
+    return merged
+
+
+def _merge_pair(previous: PlaylistChange, change: PlaylistChange) -> Optional[PlaylistChange]:
+    if previous.kind is not change.kind:
+        return None
+    kind = change.kind
+    if kind is PlaylistChangeKind.ROWS_INSERTED and change.first == previous.last + 1:
+        return replace(previous, last=change.last, videos=previous.videos + change.videos)
+    if kind is PlaylistChangeKind.ROWS_REMOVED:
+        if change.first == previous.first:
+            # Repeated removal at the same row: the range grows downwards.
+            return replace(previous, last=previous.last + change.count)
+        if change.last + 1 == previous.first:
+            return replace(previous, first=change.first)
+    if kind is PlaylistChangeKind.CURRENT_CHANGED:
+        return change
+    if kind in (PlaylistChangeKind.PROGRESS_CHANGED, PlaylistChangeKind.METADATA_CHANGED):
+        if (change.first, change.last) == (previous.first, previous.last):
+            return change
+    return None
+
+
+__all__ = [
+    "PlaylistChange",
+    "PlaylistChangeKind",
+    "PlaylistNotifier",
+    "coalesce_changes",
+]
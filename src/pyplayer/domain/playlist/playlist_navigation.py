@@ -44,6 +44,62 @@ class PlaylistNavigation:
 
         return video, new_idx
 
+    def peek_next_video(self) -> Tuple[Optional[Video], int]:
+        """
+        Return what ``get_next_video`` would return, without touching any state.
+
+        In shuffle mode the next entry is only known while the current order
+        is not exhausted; past its end a new order is drawn at random, so
+        nothing is predicted.
+        """
+        if not self._videos:
+            return None, -1
+
+        current_idx = self._current_index
+        if self._play_mode == PlayMode.NORMAL:
+            video, new_idx = self._next_normal(current_idx)
+        elif self._play_mode == PlayMode.LOOP_ONE:
+            video, new_idx = self._next_loop_one(current_idx)
+        elif self._play_mode == PlayMode.LOOP_ALL:
+            video, new_idx = self._next_loop_all(current_idx)
+        elif self._play_mode == PlayMode.SHUFFLE:
+            position = self._shuffle_position + 1
+            if not self._shuffle_order or position >= len(self._shuffle_order):
+                return None, -1
+            new_idx = self._shuffle_order[position]
+            video = self._videos[new_idx] if 0 <= new_idx < len(self._videos) else None
+        else:
+            return None, -1
+
+        if video is None or new_idx < 0 or new_idx >= len(self._videos):
+            return None, -1
+
+        return video, new_idx
+
+    def peek_upcoming(self, count: int) -> List[Tuple[Video, int]]:
+        """
+        Return up to ``count`` entries that would play next, in order, without touching any state.
+
+        Stops at the end of the list (NORMAL), at the end of the current
+        shuffle order, and when an entry would repeat, so LOOP_ONE yields
+        nothing.
+        """
+        upcoming: List[Tuple[Video, int]] = []
+        index, position = self._current_index, self._shuffle_position
+        for _ in range(count):
+            nav = PlaylistNavigation(
+                self._videos, self._play_mode, index,
+                self._shuffle_order, position, self._shuffle_history,
+            )
+            video, new_idx = nav.peek_next_video()
+            # Shuffle orders are permutations; elsewhere LOOP_ONE and LOOP_ALL wrap onto the current row
+            wraps = self._play_mode != PlayMode.SHUFFLE and new_idx == self._current_index
+            if video is None or wraps or any(new_idx == row for _, row in upcoming):
+                break
+            upcoming.append((video, new_idx))
+            index, position = new_idx, position + 1
+        return upcoming
+
     def get_previous_video(self) -> Tuple[Optional[Video], int]:
         """Get previous video based on play mode."""
         if not self._videos:
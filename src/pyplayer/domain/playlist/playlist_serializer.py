@@ -6,6 +6,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from src.pyplayer.domain.media.media_library import MediaLibrary
 from src.pyplayer.domain.media.video import Video
 from src.pyplayer.domain.playlist.play_mode import PlayMode
 from src.pyplayer.domain.playlist.playlist_state import PlaylistState
@@ -28,18 +29,26 @@ class PlaylistSerializer:
         description: Optional[str],
         unique_id: str,
         include_video_states: bool = True,
+        library: Optional[MediaLibrary] = None,
     ) -> Dict[str, Any]:
-        """Serialize playlist to dict."""
+        """Serialize playlist to dict.
+
+        With a shared ``library`` the videos are stored as references
+        (media key + path); their records live in the library file.
+        """
         videos_data = []
         valid_video_count = 0
         missing_video_count = 0
 
         for video in videos:
             file_exists = video.file_path.exists() if video.file_path else False
-            video_dict = video.to_dict()
-            video_dict["file_exists"] = file_exists
-            if not include_video_states:
-                video_dict.pop("state", None)
+            if library is not None:
+                video_dict = {"media_key": video.media_key, "file_path": str(video.file_path)}
+            else:
+                video_dict = video.to_dict()
+                video_dict["file_exists"] = file_exists
+                if not include_video_states:
+                    video_dict.pop("state", None)
             videos_data.append(video_dict)
 
             if file_exists:
@@ -56,7 +65,7 @@ class PlaylistSerializer:
             }
 
         return {
-            "version": "1.0",
+            "version": "1.1" if library is not None else "1.0",
             "created_at": datetime.now().isoformat(),
             "file_validation": {
                 "total_videos": len(videos),
@@ -76,7 +85,12 @@ class PlaylistSerializer:
         }
 
     @classmethod
-    def from_dict(cls, data: dict, validate_files: bool = True) -> Dict[str, Any]:
+    def from_dict(
+        cls,
+        data: dict,
+        validate_files: bool = True,
+        library: Optional[MediaLibrary] = None,
+    ) -> Dict[str, Any]:
         """
         Deserialize playlist from dict.
         Returns a dict with keys: path, name, description, unique_id, play_mode, videos,
@@ -86,7 +100,7 @@ class PlaylistSerializer:
             raise ValueError("Les donnees doivent etre un dictionnaire")
 
         version = data.get("version", "1.0")
-        if version not in ["1.0"]:
+        if version not in ["1.0", "1.1"]:
             import logging
             logger = logging.getLogger(__name__)
             logger.warning(f"Version {version} non supportee, tentative de chargement")
@@ -106,7 +120,7 @@ class PlaylistSerializer:
 
         for i, video_data in enumerate(data.get("videos", [])):
             try:
-                video = Video.from_dict(video_data)
+                video = library.resolve(video_data) if library is not None else Video.from_dict(video_data)
                 if validate_files and video.file_path:
                     if not video.file_path.exists():
                         missing_files.append({"index": i, "path": str(video.file_path), "name": video.name})
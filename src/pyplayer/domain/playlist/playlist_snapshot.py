@@ -0,0 +1,129 @@
+"""Immutable playlist snapshots sharing structure with the live playlist."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Union, overload
+
+from src.pyplayer.domain.media.video import Video
+from src.pyplayer.domain.playlist.play_mode import PlayMode
+from src.pyplayer.domain.playlist.playlist_serializer import PlaylistSerializer
+from src.pyplayer.domain.playlist.playlist_state import PlaylistState
+
+if TYPE_CHECKING:
+    from src.pyplayer.domain.media.media_library import MediaLibrary
+
+
+class PlaylistSnapshot(Sequence[Video]):
+    """
+    Vue figee d'une playlist, lisible depuis un thread de travail.
+
+    The snapshot holds the very list objects of the playlist it was taken
+    from. The playlist copies them before its next in-place mutation
+    (copy-on-write), so taking a snapshot is O(1) and the snapshot never
+    observes later structural changes. Video objects themselves are shared,
+    not copied.
+    """
+
+    __slots__ = (
+        "unique_id",
+        "name",
+        "description",
+        "path",
+        "play_mode",
+        "current_index",
+        "revision",
+        "_videos",
+        "_raw_current_index",
+        "_shuffle_order",
+        "_shuffle_position",
+        "_shuffle_history",
+        "_p_state",
+        "_library",
+    )
+
+    def __init__(
+        self,
+        *,
+        unique_id: str,
+        name: str,
+        description: Optional[str],
+        path: Optional[Path],
+        play_mode: PlayMode,
+        current_index: int,
+        revision: int,
+        videos: List[Video],
+        raw_current_index: int,
+        shuffle_order: List[int],
+        shuffle_position: int,
+        shuffle_history: List[int],
+        p_state: PlaylistState,
+        library: Optional["MediaLibrary"] = None,
+    ) -> None:
+        self.unique_id = unique_id
+        self.name = name
+        self.description = description
+        self.path = path
+        self.play_mode = play_mode
+        self.current_index = current_index
+        self.revision = revision
+        self._videos = videos
+        self._raw_current_index = raw_current_index
+        self._shuffle_order = shuffle_order
+        self._shuffle_position = shuffle_position
+        self._shuffle_history = shuffle_history
+        self._p_state = p_state
+        self._library = library
+
+    @property
+    def id(self) -> str:
+        return self.unique_id
+
+    @property
+    def total(self) -> int:
+        return len(self._videos)
+
+    @property
+    def current_video(self) -> Optional[Video]:
+        if 0 <= self.current_index < len(self._videos):
+            return self._videos[self.current_index]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._videos)
+
+    @overload
+    def __getitem__(self, index: int) -> Video: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Video]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Video, List[Video]]:
+        return self._videos[index]
+
+    def __iter__(self) -> Iterator[Video]:
+        return iter(self._videos)
+
+    def to_dict(self, include_video_states: bool = True) -> Dict[str, Any]:
+        """Serialize exactly like ``Playlist.to_dict`` did at snapshot time."""
+        return PlaylistSerializer.to_dict(
+            videos=self._videos,
+            play_mode=self.play_mode,
+            current_index=self._raw_current_index,
+            shuffle_order=self._shuffle_order,
+            shuffle_position=self._shuffle_position,
+            shuffle_history=self._shuffle_history,
+            p_state=self._p_state,
+            path=self.path,
+            name=self.name,
+            description=self.description,
+            unique_id=self.unique_id,
+            include_video_states=include_video_states,
+            library=self._library,
+        )
+
+    def __repr__(self) -> str:
+        return f"PlaylistSnapshot(name='{self.name}', videos={len(self._videos)}, revision={self.revision})"
+
+
+__all__ = ["PlaylistSnapshot"]
@@ -0,0 +1,7 @@
+"""On-disk caches for derived media data."""
+
+from .metadata_cache import MediaMetadataCache
+from .sprite_sheet_cache import SpriteSheetCache, SpriteSheetInfo
+from .thumbnail_cache import ThumbnailCache
+
+__all__ = ["MediaMetadataCache", "SpriteSheetCache", "SpriteSheetInfo", "ThumbnailCache"]
@@ -0,0 +1,127 @@
+"""Persistent cache of container metadata and content fingerprints, keyed by media key (path, size, mtime)."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.pyplayer.domain.media.media_metadata import MediaMetadata
+from src.pyplayer.infrastructure.persistence.io_utils import write_json_fast
+
+logger = logging.getLogger(__name__)
+
+METADATA_CACHE_VERSION = 1
+
+
+class MediaMetadataCache:
+    """
+    Cache des metadonnees lues dans les en-tetes.
+
+    Entries are keyed by ``Video.content_key``, which hashes the path,
+    size and mtime, so a modified file simply misses. Files that could not
+    be parsed are cached too (empty container), so they are not re-read at
+    every start. Records are stored as compact lists to keep 10k+ entries
+    cheap to load. Partial-content fingerprints live in the same file, in
+    their own map: files found while scanning search roots get one without
+    ever being probed for metadata.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None) -> None:
+        self.cache_file = Path(cache_file) if cache_file else None
+        self._entries: Dict[str, List] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, media_key: str) -> bool:
+        return media_key in self._entries
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+    def get(self, media_key: str) -> Optional[MediaMetadata]:
+        record = self._entries.get(media_key)
+        if record is None:
+            return None
+        container, duration_ms, width, height = record[:4]
+        return MediaMetadata(container, duration_ms, width, height, *record[4:7])
+
+    def put(self, media_key: str, metadata: Optional[MediaMetadata]) -> None:
+        """Store a probe result; None records a file whose header could not be read."""
+        metadata = metadata or MediaMetadata("")
+        record = [metadata.container, metadata.duration_ms, metadata.width, metadata.height]
+        if metadata.title or metadata.artist or metadata.album:
+            # Audio tags only when present: video records keep their four fields
+            record += [metadata.title, metadata.artist, metadata.album]
+        self._entries[media_key] = record
+        self._dirty = True
+
+    def get_fingerprint(self, media_key: str) -> Optional[str]:
+        return self._fingerprints.get(media_key)
+
+    def put_fingerprint(self, media_key: str, fingerprint: str) -> None:
+        if self._fingerprints.get(media_key) != fingerprint:
+            self._fingerprints[media_key] = fingerprint
+            self._dirty = True
+
+    def discard(self, media_key: str) -> bool:
+        removed_entry = self._entries.pop(media_key, None) is not None
+        removed_fingerprint = self._fingerprints.pop(media_key, None) is not None
+        if not (removed_entry or removed_fingerprint):
+            return False
+        self._dirty = True
+        return True
+
+    def load(self) -> bool:
+        if self.cache_file is None or not self.cache_file.exists():
+            return False
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError) as error:
+            logger.warning("Cache de metadonnees illisible %s: %s", self.cache_file, error)
+            return False
+        if data.get("version") != METADATA_CACHE_VERSION or not isinstance(data.get("entries"), dict):
+            logger.warning("Format de cache de metadonnees non supporte: %s", self.cache_file)
+            return False
+        self._entries = {
+            key: record
+            for key, record in data["entries"].items()
+            if isinstance(record, list) and len(record) >= 4
+        }
+        fingerprints = data.get("fingerprints")
+        self._fingerprints = (
+            {key: value for key, value in fingerprints.items() if isinstance(value, str)}
+            if isinstance(fingerprints, dict)
+            else {}
+        )
+        self._dirty = False
+        logger.info(
+            "Cache de metadonnees charge: %s entrees, %s empreintes", len(self._entries), len(self._fingerprints)
+        )
+        return True
+
+    def save(self) -> bool:
+        if self.cache_file is None:
+            return False
+        if not self._dirty:
+            return True
+        try:
+            write_json_fast(
+                self.cache_file,
+                {"version": METADATA_CACHE_VERSION, "entries": self._entries, "fingerprints": self._fingerprints},
+                indent=None,
+            )
+            self._dirty = False
+            return True
+        except OSError as error:
+            logger.error("Erreur sauvegarde cache de metadonnees: %s", error)
+            return False
+
+
+__all__ = ["METADATA_CACHE_VERSION", "MediaMetadataCache"]
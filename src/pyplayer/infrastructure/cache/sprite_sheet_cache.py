@@ -0,0 +1,107 @@
+"""Disk cache for the trickplay sprite sheets shown when hovering the seek slider."""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+from src.pyplayer.infrastructure.persistence.io_utils import write_json_fast
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SpriteSheetInfo:
+    """Geometrie d'une planche : une vignette toutes les ``interval_ms``, rangees par lignes."""
+
+    interval_ms: int
+    count: int
+    columns: int
+    tile_width: int
+    tile_height: int
+
+    @property
+    def rows(self) -> int:
+        return (self.count + self.columns - 1) // self.columns
+
+    @property
+    def sheet_size(self) -> Tuple[int, int]:
+        return self.columns * self.tile_width, self.rows * self.tile_height
+
+    def tile_index(self, position_ms: int) -> int:
+        """Index of the tile nearest to ``position_ms``."""
+        if self.count <= 0 or self.interval_ms <= 0:
+            return 0
+        index = int(round(max(0, position_ms) / self.interval_ms))
+        return min(index, self.count - 1)
+
+    def tile_rect(self, index: int) -> Tuple[int, int, int, int]:
+        """(x, y, width, height) of tile ``index`` inside the sheet."""
+        row, column = divmod(index, self.columns)
+        return column * self.tile_width, row * self.tile_height, self.tile_width, self.tile_height
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["SpriteSheetInfo"]:
+        try:
+            info = cls(**{name: int(data[name]) for name in cls.__dataclass_fields__})
+        except (KeyError, TypeError, ValueError):
+            return None
+        if info.count <= 0 or info.columns <= 0 or info.tile_width <= 0 or info.tile_height <= 0:
+            return None
+        return info
+
+
+class SpriteSheetCache:
+    """
+    Cache disque des planches de vignettes, une image et un fichier JSON par media.
+
+    The image format is left to the caller (the UI encodes it with Qt);
+    this class only owns the file layout and the geometry sidecar. The
+    sidecar is written last, so a sheet is only visible once complete.
+    """
+
+    SHEET_SUFFIX = ".jpg"
+    INFO_SUFFIX = ".json"
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def sheet_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.SHEET_SUFFIX}"
+
+    def info_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.INFO_SUFFIX}"
+
+    def lookup(self, key: str) -> Optional[Tuple[Path, SpriteSheetInfo]]:
+        """Return (sheet path, geometry) for a complete cached sheet, else None."""
+        sheet_path = self.sheet_path(key)
+        try:
+            with open(self.info_path(key), "r", encoding="utf-8") as handle:
+                info = SpriteSheetInfo.from_dict(json.load(handle))
+        except (OSError, ValueError):
+            return None
+        if info is None or not sheet_path.exists():
+            return None
+        return sheet_path, info
+
+    def store_info(self, key: str, info: SpriteSheetInfo) -> bool:
+        """Publish a sheet whose image has already been written to ``sheet_path(key)``."""
+        try:
+            write_json_fast(self.info_path(key), info.to_dict(), indent=0)
+            return True
+        except OSError as exc:
+            logger.warning("Impossible d'enregistrer la planche %s: %s", key, exc)
+            return False
+
+    def discard(self, key: str) -> None:
+        for path in (self.info_path(key), self.sheet_path(key)):
+            path.unlink(missing_ok=True)
+
+
+__all__ = ["SpriteSheetCache", "SpriteSheetInfo"]
@@ -0,0 +1,48 @@
+"""Sharded disk cache for poster thumbnails."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ThumbnailCache:
+    """
+    Cache disque des affiches, un fichier par media.
+
+    Files are named after ``Video.content_key`` (path, size, mtime), so a
+    changed file gets a new thumbnail. They are spread over 256
+    sub-directories by the first two hex digits of the key, which keeps
+    directories small for large libraries. Encoding is left to the caller.
+    """
+
+    SUFFIX = ".jpg"
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{self.SUFFIX}"
+
+    def lookup(self, key: str) -> Optional[Path]:
+        path = self.path_for(key)
+        return path if path.exists() else None
+
+    def prepare(self, key: str) -> Optional[Path]:
+        """Create the shard directory for ``key`` and return the target path."""
+        path = self.path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            logger.warning("Impossible de creer le dossier de vignettes %s: %s", path.parent, exc)
+            return None
+        return path
+
+    def discard(self, key: str) -> None:
+        self.path_for(key).unlink(missing_ok=True)
+
+
+__all__ = ["ThumbnailCache"]
@@ -27,15 +27,28 @@ class PyPlayerConfig:
         self.main_dir = self.assets_dir
         self.resources_dir = self.fonts_dir
 
-        self.default_preferences: dict[str, str | int] = {
+        self.default_preferences: dict[str, str | int | bool | list[str]] = {
             "icon_number": 1,
             "icon_name": "pyplayer",
             "theme": "light",
+            # Multimedia warm-up: skipped in low power mode, started after this much idle time
+            "low_power": False,
+            "warmup_idle_ms": 1500,
+            # Folders searched when relinking videos that were moved or renamed
+            "search_roots": ["~/Videos", "~/Downloads", "~/Desktop"],
+            # Read-ahead of upcoming items into the OS cache (MB/s cap, 0 disables)
+            "prefetch_mb_per_s": 16,
+            # Frame delivery / UI stall statistics, overlay and JSONL log (Ctrl+Shift+D toggles)
+            "playback_diagnostics": False,
         }
         self.valid_themes = {"light", "dark"}
 
         self.runtime_dir = self._ensure_runtime_dir()
         self.log_file_path = self.runtime_dir / "pyplayer-runtime.log"
+        # Derived media data (trickplay sheets, thumbnails), safe to delete
+        self.cache_dir = self.runtime_dir / "cache"
+        # One JSONL file per playback diagnostics session
+        self.diagnostics_dir = self.runtime_dir / "diagnostics"
         self.logger = self._build_logger()
 
         self.preferences = self.load_preferences()
@@ -130,7 +143,73 @@ class PyPlayerConfig:
         )
         return str(self.default_preferences["icon_name"])
 
-    def load_preferences(self) -> dict[str, str | int]:
+    def _normalize_low_power(self, value: object) -> bool:
+        if isinstance(value, bool):
+            return value
+
+        self.logger.warning(
+            "low_power invalide '%s', fallback %s.",
+            value,
+            self.default_preferences["low_power"],
+        )
+        return bool(self.default_preferences["low_power"])
+
+    def _normalize_playback_diagnostics(self, value: object) -> bool:
+        if isinstance(value, bool):
+            return value
+
+        self.logger.warning(
+            "playback_diagnostics invalide '%s', fallback %s.",
+            value,
+            self.default_preferences["playback_diagnostics"],
+        )
+        return bool(self.default_preferences["playback_diagnostics"])
+
+    def _normalize_warmup_idle_ms(self, value: object) -> int:
+        try:
+            normalized = int(value)
+            if normalized >= 0:
+                return normalized
+            raise ValueError("warmup_idle_ms must be >= 0")
+        except (TypeError, ValueError):
+            self.logger.warning(
+                "warmup_idle_ms invalide '%s', fallback %s.",
+                value,
+                self.default_preferences["warmup_idle_ms"],
+            )
+            return int(self.default_preferences["warmup_idle_ms"])
+
+    def _normalize_prefetch_mb_per_s(self, value: object) -> int:
+        try:
+            normalized = int(value)
+            if normalized >= 0:
+                return normalized
+            raise ValueError("prefetch_mb_per_s must be >= 0")
+        except (TypeError, ValueError):
+            self.logger.warning(
+                "prefetch_mb_per_s invalide '%s', fallback %s.",
+                value,
+                self.default_preferences["prefetch_mb_per_s"],
+            )
+            return int(self.default_preferences["prefetch_mb_per_s"])
+
+    def _normalize_search_roots(self, value: object) -> list[str]:
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            return [item.strip() for item in value if item.strip()]
+
+        self.logger.warning(
+            "search_roots invalide '%s', fallback %s.",
+            value,
+            self.default_preferences["search_roots"],
+        )
+        return list(self.default_preferences["search_roots"])
+
+    def search_roots(self) -> list[Path]:
+        """Return the configured relink search folders, with ``~`` expanded."""
+        roots = self.preferences.get("search_roots", self.default_preferences["search_roots"])
+        return [Path(root).expanduser() for root in roots]
+
+    def load_preferences(self) -> dict[str, str | int | bool | list[str]]:
         preferences_path = self.config_dir / "preferences.json"
         if not preferences_path.exists():
             return self.default_preferences.copy()
@@ -151,6 +230,21 @@ class PyPlayerConfig:
                     "theme": self._normalize_theme(
                         loaded.get("theme", self.default_preferences["theme"])
                     ),
+                    "low_power": self._normalize_low_power(
+                        loaded.get("low_power", self.default_preferences["low_power"])
+                    ),
+                    "warmup_idle_ms": self._normalize_warmup_idle_ms(
+                        loaded.get("warmup_idle_ms", self.default_preferences["warmup_idle_ms"])
+                    ),
+                    "search_roots": self._normalize_search_roots(
+                        loaded.get("search_roots", self.default_preferences["search_roots"])
+                    ),
+                    "prefetch_mb_per_s": self._normalize_prefetch_mb_per_s(
+                        loaded.get("prefetch_mb_per_s", self.default_preferences["prefetch_mb_per_s"])
+                    ),
+                    "playback_diagnostics": self._normalize_playback_diagnostics(
+                        loaded.get("playback_diagnostics", self.default_preferences["playback_diagnostics"])
+                    ),
                 }
         except (json.JSONDecodeError, OSError, ValueError, TypeError) as error:
             self.logger.warning("preferences.json invalide (%s), fallback par defaut.", error)
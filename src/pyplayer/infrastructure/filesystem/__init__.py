@@ -1,5 +1,14 @@
 """Filesystem helpers and resource lookup package."""
 
+from .directory_listing import DirectoryListingCache
+from .parallel_scan import ScannedFile, scan_files, stat_files
 from .resource_locator import find_path, reset_find_path_cache
 
-__all__ = ["find_path", "reset_find_path_cache"]
+__all__ = [
+    "DirectoryListingCache",
+    "ScannedFile",
+    "find_path",
+    "reset_find_path_cache",
+    "scan_files",
+    "stat_files",
+]
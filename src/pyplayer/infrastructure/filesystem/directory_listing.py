@@ -0,0 +1,99 @@
+"""Directory listing cache for bulk existence checks."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Default file systems of Windows (NTFS) and macOS (APFS) ignore case
+CASE_INSENSITIVE_PLATFORM = sys.platform == "win32" or sys.platform == "darwin"
+
+
+def fold_name(name: str) -> str:
+    """Key under which a case-insensitive file system considers two names equal."""
+    return unicodedata.normalize("NFC", name).casefold()
+
+
+class DirectoryListingCache:
+    """
+    Repond a ``exists(path)`` en listant chaque dossier une seule fois.
+
+    Playlist entries cluster in a few folders, so one ``os.listdir`` per
+    folder replaces one stat per file. A missing folder lists as empty;
+    one that exists but cannot be listed (permissions, I/O error) falls
+    back to a stat per file, so its entries are never taken for missing.
+    ``prefetch`` lists many folders concurrently, and the cache can then
+    be queried from any thread. Listings are a snapshot: build a new
+    cache for each validation pass.
+
+    On case-insensitive platforms a name that is not listed exactly is
+    looked up again case-folded, as ``Path.exists`` would find it.
+    """
+
+    def __init__(self, case_insensitive: Optional[bool] = None) -> None:
+        # None: the folder exists but could not be listed (permissions, I/O error)
+        self._listings: Dict[str, Optional[FrozenSet[str]]] = {}
+        self._folded: Dict[str, FrozenSet[str]] = {}
+        self.case_insensitive = CASE_INSENSITIVE_PLATFORM if case_insensitive is None else case_insensitive
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def listing(self, directory: PathLike) -> Optional[FrozenSet[str]]:
+        """Names in ``directory``: empty when it is gone, None when it could not be listed."""
+        key = os.fspath(directory)
+        if key in self._listings:
+            return self._listings[key]
+        try:
+            names: Optional[FrozenSet[str]] = frozenset(os.listdir(key))
+        except (FileNotFoundError, NotADirectoryError):
+            names = frozenset()
+        except OSError as exc:
+            logger.warning("Dossier illisible, verification fichier par fichier: %s (%s)", key, exc)
+            names = None
+        # Two threads may list the same folder; both results are equal
+        self._listings[key] = names
+        return names
+
+    def exists(self, path: PathLike) -> bool:
+        path = os.fspath(path)
+        directory, name = os.path.split(path)
+        if not name:
+            return False
+        names = self.listing(directory)
+        if names is None:
+            # A transient listing failure must not make every entry of the folder look missing
+            return os.path.exists(path)
+        if name in names:
+            return True
+        if not self.case_insensitive:
+            return False
+        folded = self._folded.get(directory)
+        if folded is None:
+            folded = frozenset(fold_name(entry) for entry in names)
+            self._folded[directory] = folded
+        return fold_name(name) in folded
+
+    def prefetch(self, paths: Iterable[PathLike], max_workers: int = 8) -> int:
+        """List the parent folders of ``paths`` concurrently; return how many were listed."""
+        directories = {os.path.dirname(os.fspath(path)) for path in paths}
+        directories.difference_update(self._listings)
+        if len(directories) <= 1:
+            for directory in directories:
+                self.listing(directory)
+        else:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="listing") as pool:
+                list(pool.map(self.listing, directories))
+        return len(directories)
+
+
+__all__ = ["DirectoryListingCache"]
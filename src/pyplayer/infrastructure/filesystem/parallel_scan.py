@@ -0,0 +1,112 @@
+"""Parallel directory scanner."""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ScannedFile(NamedTuple):
+    """Fichier trouve par le scan; taille -1 et mtime 0 tant qu'il n'a pas ete stat."""
+
+    path: str
+    size: int
+    mtime: float
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+    @property
+    def has_stat(self) -> bool:
+        return self.size >= 0
+
+
+def _scan_directory(
+    directory: str, extensions: Optional[Set[str]], with_stat: bool
+) -> Tuple[List[ScannedFile], List[str]]:
+    files: List[ScannedFile] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        if extensions is not None and os.path.splitext(entry.name)[1].lower() not in extensions:
+                            continue
+                        if with_stat:
+                            stat = entry.stat(follow_symlinks=False)
+                            files.append(ScannedFile(entry.path, stat.st_size, stat.st_mtime))
+                        else:
+                            files.append(ScannedFile(entry.path, -1, 0.0))
+                except OSError:
+                    continue
+    except OSError as exc:
+        logger.debug("Dossier ignore pendant le scan %s: %s", directory, exc)
+    return files, subdirs
+
+
+def scan_files(
+    roots: Iterable[Path],
+    extensions: Optional[Iterable[str]] = None,
+    max_workers: int = 8,
+    with_stat: bool = True,
+) -> List[ScannedFile]:
+    """List every file under ``roots`` (optionally filtered by extension), one directory per task.
+
+    Directory listings are I/O bound, so a thread pool overlaps them; each
+    finished listing immediately queues its sub-directories. Symlinked
+    directories are not followed, so cycles cannot occur. On large trees the
+    per-file stat costs several times the listing itself: pass
+    ``with_stat=False`` and ``stat_files`` only the entries that matter.
+    """
+    wanted = {ext.lower() for ext in extensions} if extensions is not None else None
+    results: List[ScannedFile] = []
+    seen: Set[str] = set()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="scan") as pool:
+        pending = set()
+        for root in roots:
+            root_str = os.path.abspath(str(root))
+            if root_str not in seen and os.path.isdir(root_str):
+                seen.add(root_str)
+                pending.add(pool.submit(_scan_directory, root_str, wanted, with_stat))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                results.extend(files)
+                for subdir in subdirs:
+                    if subdir not in seen:
+                        seen.add(subdir)
+                        pending.add(pool.submit(_scan_directory, subdir, wanted, with_stat))
+    return results
+
+
+def _stat_entry(entry: ScannedFile) -> Optional[ScannedFile]:
+    if entry.has_stat:
+        return entry
+    try:
+        stat = os.stat(entry.path)
+    except OSError:
+        return None
+    return ScannedFile(entry.path, stat.st_size, stat.st_mtime)
+
+
+def stat_files(files: Iterable[ScannedFile], max_workers: int = 8) -> List[ScannedFile]:
+    """Fill size and mtime of entries scanned without stat; files gone since are dropped."""
+    files = list(files)
+    if len(files) < 64:
+        stated = map(_stat_entry, files)
+        return [entry for entry in stated if entry is not None]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="scan") as pool:
+        return [entry for entry in pool.map(_stat_entry, files) if entry is not None]
+
+
+__all__ = ["ScannedFile", "scan_files", "stat_files"]
@@ -6,6 +6,7 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 
+from src.pyplayer.domain.media.media_library import MediaLibrary
 from src.pyplayer.domain.playlist import Playlist
 
 logger = logging.getLogger(__name__)
@@ -14,15 +15,17 @@ logger = logging.getLogger(__name__)
 class PlaylistRepository:
     """Handles loading and saving Playlist objects to/from disk."""
 
-    def __init__(self, data_dir: Path) -> None:
+    def __init__(self, data_dir: Path, library: Optional[MediaLibrary] = None) -> None:
         self.data_dir = data_dir
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.library = library
 
     def load_all(self) -> List[Playlist]:
         """Load all *.json playlist files from data_dir, skipping config files."""
         config_files = {
             self.data_dir / "manager_config.json",
             self.data_dir / "last_played.json",
+            self.data_dir / "media_library.json",
         }
         playlists: List[Playlist] = []
 
@@ -30,8 +33,8 @@ class PlaylistRepository:
             if file_path in config_files:
                 continue
             try:
-                playlist = Playlist.load_from_file(file_path)
-                if playlist:
+                playlist = Playlist.load_from_file(file_path, library=self.library)
+                if playlist is not None:
                     playlist.set_auto_save(file_path)
                     playlists.append(playlist)
                     logger.debug("Playlist chargee: %s", playlist.name)
@@ -0,0 +1,35 @@
+"""Text normalization helpers shared by search and filtering features."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import List, Set
+
+_TOKEN_SPLIT_RE = re.compile(r"[^\w]+|_+")
+
+
+def fold_text(value: str) -> str:
+    """Return a casefolded, accent-free version of ``value``."""
+    if not value:
+        return ""
+    if value.isascii():
+        return value.casefold()
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return stripped.casefold()
+
+
+def tokenize(value: str) -> List[str]:
+    """Split folded text into non-empty word tokens."""
+    return [token for token in _TOKEN_SPLIT_RE.split(fold_text(value)) if token]
+
+
+def trigrams(folded: str) -> Set[str]:
+    """Return the set of 3-character substrings of already folded text."""
+    if len(folded) < 3:
+        return set()
+    return {folded[i:i + 3] for i in range(len(folded) - 2)}
+
+
+__all__ = ["fold_text", "tokenize", "trigrams"]
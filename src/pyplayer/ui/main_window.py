@@ -1,11 +1,14 @@
 import os
+import time
 from pathlib import Path
 
 from PySide6 import QtCore, QtGui, QtWidgets, QtMultimedia
-from src.pyplayer.app.services import PlaylistManager
-from src.pyplayer.domain.media import VIDEO_EXTENSIONS, Video
-from src.pyplayer.domain.playlist import Playlist
+from src.pyplayer.app.services import MetadataProber, PlaylistManager, ReadAheadPrefetcher
+from src.pyplayer.domain.media import MEDIA_EXTENSIONS, Video, read_media_metadata
+from src.pyplayer.domain.playlist import Playlist, PlaylistChangeKind, PlayMode
+from src.pyplayer.infrastructure.config.settings import CONFIG
 from src.pyplayer.infrastructure.filesystem import find_path
+from src.pyplayer.ui.startup.multimedia_warmup import MultimediaWarmup
 from src.pyplayer.ui.theme import (
     ACCENT_COLOR,
     HOVER_COLOR,
@@ -27,7 +30,7 @@ from src.pyplayer.ui.widgets import (
     PlayerWidget,
     StatusBar,
     ToolBarWidget,
-    VideoListItem,
+    VideoListModel,
 )
 
 
@@ -35,15 +38,33 @@ os.environ["QT_MEDIA_BACKEND"] = "ffmpeg"
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    # Shuffle only knows its next item near the end of the current one
+    PRELOAD_LEAD_MS = 10_000
+    # Items warmed in the page cache ahead of playback
+    PREFETCH_COUNT = 2
 
     def __init__(self):
         super().__init__()
         self.manager = PlaylistManager()
+        # Duree, resolution et empreinte lues hors du thread de l'interface
+        self.metadata_prober = MetadataProber(
+            self.manager.metadata_cache,
+            fingerprints=not CONFIG.preferences.get("low_power", False),
+            parent=self,
+        )
+        # Debut des prochains elements lu a l'avance dans le cache du systeme
+        prefetch_mb = CONFIG.preferences.get("prefetch_mb_per_s", 16)
+        self.read_ahead = (
+            ReadAheadPrefetcher(bandwidth=prefetch_mb * 1024 * 1024)
+            if prefetch_mb > 0 and not CONFIG.preferences.get("low_power", False)
+            else None
+        )
         self.icon_font = None
+        # Playlist active suivie pour libérer l'élément préchargé s'il en sort
+        self._watched_playlist = None
         # Batching timers for position updates
         self._position_save_timer = None
         self._pending_position = None
-        self._position_update_ui_timer = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -53,6 +74,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setup_connections()
         # Defer playlist state initialization to after first paint
         QtCore.QTimer.singleShot(0, self.initialize_playlist_state)
+        # Warm QtMultimedia up once the window is painted and the user is idle
+        self.multimedia_warmup = MultimediaWarmup(
+            self.player_widget,
+            idle_ms=CONFIG.preferences.get("warmup_idle_ms", 1500),
+            low_power=CONFIG.preferences.get("low_power", False),
+            parent=self,
+        )
+        QtCore.QTimer.singleShot(0, self.multimedia_warmup.schedule)
         pass
 
     def icon_font_initialize(self, size=15):
@@ -111,8 +140,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.dock_widget.btn_remove_to_playlist.clicked.connect(self.remove_video_from_playlist)
         self.dock_widget.btn_save_playlist.clicked.connect(self.create_new_playlist)
         self.dock_widget.btn_remove_save.clicked.connect(self.delete_playlist)
-        self.dock_widget.lstw_archive.itemSelectionChanged.connect(self.set_manually_active_playlist)
-        self.dock_widget.lstw.itemDoubleClicked.connect(self.double_click)
+        self.dock_widget.playlist_selected.connect(self.set_manually_active_playlist)
+        self.dock_widget.lstw.doubleClicked.connect(self.double_click)
+        self.dock_widget.visible_videos_changed.connect(self._probe_visible_videos)
+        self.metadata_prober.probed.connect(self._on_metadata_probed)
 
         #Toolbar
         self.toolbar_widget.btn_playlist.clicked.connect(self.playlist_show_or_hide)
@@ -137,19 +168,58 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _setup_player_connections(self):
         """Connect player signals (called via player_initialized signal)."""
-        self.player_widget.video_player.mediaStatusChanged.connect(self.btn_play_pause_update)
-        self.player_widget.video_player.mediaStatusChanged.connect(self.playlist_play_mode_update)
-        self.player_widget.video_player.mediaStatusChanged.connect(self.next_video_if_end)
-        self.player_widget.video_player.mediaStatusChanged.connect(self.current_video_update_metadata)
-        self.player_widget.video_player.playbackStateChanged.connect(self.on_playback_state_changed)
-        self.player_widget.video_player.playbackStateChanged.connect(self.bloc_stop_btn)
-        # Removed redundant btn_play_pause_update connection here (already connected to mediaStatusChanged)
-        # Use throttled version for positionChanged (30-60x/s → 1/2s)
-        self.player_widget.video_player.positionChanged.connect(self._on_position_changed_throttled)
-        self.player_widget.video_player.positionChanged.connect(self.update_time_label)
+        self._connect_player(self.player_widget.video_player)
+        # Gapless hand-over replaces the on-screen player: move the connections along
+        self.player_widget.player_swapped.connect(self._on_player_swapped)
+        # Position updates come from the playback clock (30 Hz, 2 Hz when hidden), not positionChanged
+        self.player_widget.clock.subscribe(self._on_clock_tick)
+
+    def _player_connections(self, player):
+        return [
+            (player.mediaStatusChanged, self.btn_play_pause_update),
+            (player.mediaStatusChanged, self.playlist_play_mode_update),
+            (player.mediaStatusChanged, self.next_video_if_end),
+            (player.mediaStatusChanged, self.current_video_update_metadata),
+            (player.playbackStateChanged, self.on_playback_state_changed),
+            (player.playbackStateChanged, self.bloc_stop_btn),
+        ]
+
+    def _connect_player(self, player):
+        for signal, slot in self._player_connections(player):
+            signal.connect(slot)
+
+    def _on_player_swapped(self, old_player, new_player):
+        for signal, slot in self._player_connections(old_player):
+            signal.disconnect(slot)
+        self._connect_player(new_player)
 
     ##################### END UI ######################
 
+    def changeEvent(self, event):
+        if event.type() == QtCore.QEvent.Type.WindowStateChange:
+            self._update_clock_rate()
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_clock_rate()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._update_clock_rate()
+
+    def closeEvent(self, event):
+        self.metadata_prober.shutdown()
+        if self.read_ahead is not None:
+            self.read_ahead.shutdown()
+        # Écrit le bilan de la session de diagnostic, s'il y en a une
+        self.player_widget.set_diagnostics_enabled(False)
+        super().closeEvent(event)
+
+    def _update_clock_rate(self):
+        # Rien a afficher fenetre cachee ou minimisee : l'horloge ralentit
+        self.player_widget.clock.set_background(self.isMinimized() or not self.isVisible())
+
     @property
     def active_playlist(self) -> Playlist:
         return self.manager.active_playlist
@@ -180,9 +250,11 @@ class MainWindow(QtWidgets.QMainWindow):
         # Ouvrir la boîte de dialogue
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
-            "Sélectionner un fichier vidéo",
+            "Sélectionner un fichier vidéo ou audio",
             start_dir,
-            "Vidéos (*.mp4 *.avi *.mkv *.mov *.webm *.wmv *.flv *.mpeg *.mpg *.m4v);;Tous les fichiers (*.*)"
+            "Médias (*.mp4 *.avi *.mkv *.mov *.webm *.wmv *.flv *.mpeg *.mpg *.m4v *.mp3 *.wav *.flac *.aac *.ogg *.m4a);;"
+            "Vidéos (*.mp4 *.avi *.mkv *.mov *.webm *.wmv *.flv *.mpeg *.mpg *.m4v);;"
+            "Audio (*.mp3 *.wav *.flac *.aac *.ogg *.m4a);;Tous les fichiers (*.*)"
         )
 
         return file_path
@@ -205,9 +277,8 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QFileDialog.Option.ShowDirsOnly or QtWidgets.QFileDialog.Option.DontResolveSymlinks
         )
 
-        video_list = self.active_playlist.add_video_from_dir_path(Path(dir_path))
-        # Batch add with single auto_save at the end
-        self.dock_widget.add_videos_to_playlist_batch(video_list)
+        # The dock follows the playlist change events (one batch per tick)
+        self.active_playlist.add_video_from_dir_path(Path(dir_path))
         self.active_playlist.auto_save()
         return True
 
@@ -412,8 +483,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
                 # VÉRIFIER SI LE DOSSIER CONTIENT DES FICHIERS VIDÉO
                 try:
-                    # Utiliser les extensions vidéo de constant
-                    video_extensions = VIDEO_EXTENSIONS
+                    # Extensions vidéo et audio acceptées par les playlists
+                    video_extensions = MEDIA_EXTENSIONS
 
                     # Compter le nombre de fichiers vidéo dans le dossier
                     video_files = []
@@ -425,7 +496,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     video_files = [f for f in video_files if f.is_file()]
 
                     if not video_files:
-                        error_label.setText("❌ Ce dossier ne contient pas de fichiers vidéo")
+                        error_label.setText("❌ Ce dossier ne contient pas de fichiers vidéo ou audio")
                         error_label.setVisible(True)
                         return False
 
@@ -608,15 +679,17 @@ class MainWindow(QtWidgets.QMainWindow):
 
         return None
 
-    def set_manually_active_playlist(self):
+    def set_manually_active_playlist(self, playlist_id: str):
+        active = self.active_playlist
+        if active is not None and active.id == playlist_id:
+            return
         player = self.player_widget.video_player if self.player_widget.player_ready else None
         position = player.position() if player is not None else 0
-        if position:
+        if position and active is not None:
             self.save_video_on_position_changed(position)
-            self.active_playlist.auto_save()
-        self.manager.set_active_playlist_by_name(self.dock_widget.get_selected_playlist_name())
-        self.initialize_playlist_state()
-        pass
+            active.auto_save()
+        if self.manager.set_active_playlist(playlist_id):
+            self.activate_playlist()
 
     def create_new_playlist(self):
         infos = self.get_playlist_create_info()
@@ -624,8 +697,9 @@ class MainWindow(QtWidgets.QMainWindow):
             name = infos.get('name')
             p_path = Path(infos.get('p_path'))
             playlist = self.manager.create_playlist(source_path=p_path, name=name)
+            self.dock_widget.add_playlist_state(playlist)
             self.manager.set_active_playlist(playlist.id)
-            self.initialize_playlist_state()
+            self.activate_playlist()
         pass
 
     def delete_playlist(self):
@@ -638,7 +712,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 playlist = self.manager.find_playlist(search_term=playlist_name)
                 self.manager.remove_playlist(playlist.id)
                 self.dock_widget.remove_playlist_state(playlist)
-        self.initialize_playlist_state()
+            self.activate_playlist()
         pass
 
     def ui_and_api_update(self):
@@ -810,36 +884,78 @@ class MainWindow(QtWidgets.QMainWindow):
         return []
 
     def initialize_playlist_state(self):
-        # Make a copy to avoid dictionary changed size during iteration
-        playlists = dict(self.manager.all_playlist)
-        for name, item in playlists.items():
-            self.dock_widget.add_playlist_state(item)
-            self.dock_widget.set_active_playlist(self.manager.active_playlist)
-            self.initialize_playlist()
+        # One reset of the archive list from the registry headers, then a single bind of the active playlist.
+        self.dock_widget.set_playlist_headers(self.manager.playlist_headers())
+        self.activate_playlist()
+
+    def activate_playlist(self):
+        # Cached durations are applied here, before the list is bound and painted
+        self._probe_playlists()
+        # Playlist audio : le lecteur ne crée pas de sortie vidéo
+        active = self.active_playlist
+        # L'élément préchargé appartenait à l'ancienne playlist
+        self.player_widget.cancel_preload()
+        self._watch_playlist(active)
+        self.player_widget.set_audio_only(active is not None and active.is_audio_only)
+        self.dock_widget.set_active_playlist(self.active_playlist)
+        self.initialize_playlist()
+        if self.active_playlist is not None:
             self.btn_play_mode_initialize()
-        pass
+
+    def _watch_playlist(self, playlist):
+        if self._watched_playlist is not None:
+            self._watched_playlist.changes.unsubscribe(self._on_active_playlist_changes)
+        self._watched_playlist = playlist
+        if playlist is not None:
+            playlist.changes.subscribe(self._on_active_playlist_changes)
+
+    def _on_active_playlist_changes(self, changes):
+        # Suppression, relocalisation, nettoyage : l'élément préchargé a pu quitter la playlist
+        if not any(change.kind in (PlaylistChangeKind.ROWS_REMOVED, PlaylistChangeKind.RESET) for change in changes):
+            return
+        preloaded = self.player_widget.preloaded_video_id
+        playlist = self.active_playlist
+        if preloaded is not None and (playlist is None or playlist.index_of_id(preloaded) < 0):
+            self.player_widget.cancel_preload()
 
     def initialize_playlist(self):
-        self.dock_widget.lstw.clear()
-        for video in self.active_playlist.all_video:
-            self.dock_widget.add_video_to_playlist(video)
-            pass
+        self.dock_widget.bind_playlist(self.active_playlist)
         pass
 
+    def _probe_playlists(self):
+        active = self.active_playlist
+        if active is not None:
+            self.metadata_prober.enqueue(active.videos, MetadataProber.PRIORITY_PLAYLIST)
+        for playlist in self.manager.all_playlist.values():
+            if playlist is not active:
+                self.metadata_prober.enqueue(playlist.videos, MetadataProber.PRIORITY_BACKGROUND)
+
+    def _probe_visible_videos(self, videos):
+        self.metadata_prober.enqueue(videos, MetadataProber.PRIORITY_VISIBLE)
+
+    def _on_metadata_probed(self, videos):
+        # Les vidéos sont partagées : toutes les playlists qui les contiennent sont mises à jour.
+        changed = self.manager.notify_metadata_changed(videos)
+        self.dock_widget.refresh_playlist_summaries(playlist.id for playlist in changed)
+
     # ============================================
     # MÉTHODES DE GESTION DES VIDEOS
     # ============================================
     def add_video_to_playlist(self):
         v_path = self.choose_file()
         if v_path:
-            video = self.active_playlist.add_video(Path(v_path))
-            self.dock_widget.add_video_to_playlist(video)
+            self.active_playlist.add_video(Path(v_path))
         pass
 
     def remove_video_from_playlist(self):
         """Supprime les vidéos sélectionnées"""
-        # Récupérer les noms sélectionnés
-        video_names = self.dock_widget.get_selected_video_names()
+        # Récupérer les vidéos sélectionnées (par identifiant, pas par nom)
+        videos = [
+            video
+            for video in map(self.active_playlist.get_video_by_id, self.dock_widget.get_selected_video_ids())
+            if video is not None
+        ]
+        video_names = [video.name for video in videos]
 
         if not video_names:
             QtWidgets.QMessageBox.information(
@@ -883,25 +999,18 @@ class MainWindow(QtWidgets.QMainWindow):
         # Vérifier quel bouton a été cliqué
         if msg_box.clickedButton() != yes_button:
             return  # Annuler la suppression
-        # Supprimer chaque vidéo
-        for video_name in video_names:
-            found_videos = self.active_playlist.find_videos_by_name(video_name, case_sensitive=True)
-            if found_videos:
-                video = found_videos[0]
-
-                # Vérifier si la vidéo est en cours de lecture
-                if video.name == self.current_video.name:
-                    QtWidgets.QMessageBox.warning(
-                        self,
-                        "Opération impossible",
-                        "Cette vidéo est en cours de lecture. Impossible de la supprimer."
-                    )
-                    return  # Arrêter l'exécution
+        # Refuser si la vidéo en cours de lecture fait partie de la sélection
+        current_video = self.current_video
+        if current_video is not None and any(video.id == current_video.id for video in videos):
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Opération impossible",
+                "Cette vidéo est en cours de lecture. Impossible de la supprimer."
+            )
+            return
 
-                # Supprimer de la playlist
-                self.active_playlist.remove_video(video)
-                # Supprimer de l'interface
-                self.dock_widget.remove_video_from_playlist(video_name)
+        # Suppression groupée : une seule passe et une seule sauvegarde (le dock suit via les événements)
+        self.active_playlist.remove_videos([video.id for video in videos])
 
         # Message de confirmation finale (optionnel)
         if len(video_names) > 1:
@@ -918,7 +1027,7 @@ class MainWindow(QtWidgets.QMainWindow):
         player = self.player_widget.video_player
         if player is None:
             return
-        self.current_video.update_metadata(duration = player.duration())
+        self.active_playlist.update_video_metadata(self.current_video, duration=player.duration())
         self.init_interface()
         pass
 
@@ -928,19 +1037,27 @@ class MainWindow(QtWidgets.QMainWindow):
             QtCore.QTimer.singleShot(100, self._update_video_resolution)
 
     def _update_video_resolution(self):
-        """Récupère la résolution après que la vidéo ait commencé à jouer."""
+        """Récupère la résolution de la vidéo (et non celle du widget) une fois la lecture lancée."""
         if not self.current_video or not self.player_widget.player_ready:
             return
-        # Maintenant width()/height() devraient être corrects
-        width = self.player_widget.video_output.width()
-        height = self.player_widget.video_output.height()
-        self.current_video.update_metadata(
-            width=width,
-            height=height
-        )
-        item = self.dock_widget.find_video_item_by_name(self.current_video.name)
-        self.statusbar_widget.lbl_title.setText(
-            f"     {item.index} ➤  {self.current_video.name} ▌ Résolution : {self.current_video.resolution}")
+        if self.current_video.width <= 0 and not self.current_video.is_audio:
+            # En-tête du conteneur d'abord, métadonnées du backend sinon
+            metadata = read_media_metadata(self.current_video.file_path)
+            if metadata is not None and metadata.has_video:
+                width, height = metadata.width, metadata.height
+            else:
+                size = self.player_widget.video_player.metaData().value(QtMultimedia.QMediaMetaData.Key.Resolution)
+                width, height = (size.width(), size.height()) if isinstance(size, QtCore.QSize) else (0, 0)
+            self.active_playlist.update_video_metadata(
+                self.current_video,
+                width=width,
+                height=height
+            )
+        row = self.active_playlist.index_of_id(self.current_video.id)
+        video = self.current_video
+        # Piste audio : titre et artiste lus dans les tags plutôt que le nom de fichier
+        title = video.display_title if video.is_audio else video.name
+        self.statusbar_widget.lbl_title.setText(f"     {row + 1} ➤  {title} ▌ Résolution : {video.resolution}")
         pass
 
     def save_video_on_position_changed(self, position):
@@ -986,33 +1103,25 @@ class MainWindow(QtWidgets.QMainWindow):
     def _flush_position_save(self):
         """Sauvegarde effective de la position et mise à jour UI throttlée."""
         if self._pending_position is not None:
+            # La ligne du dock est rafraîchie par l'événement de progression
             self.save_video_on_position_changed(self._pending_position)
-            # Update UI progress throttlé (500ms)
-            self._update_video_progress_throttled(self._pending_position)
             self._pending_position = None
 
-    def _update_video_progress_throttled(self, position):
-        """Mise à jour UI throttlée (toutes les 500ms)."""
-        if self.current_video:
-            if self._position_update_ui_timer is None:
-                self._position_update_ui_timer = QtCore.QTimer(self)
-                self._position_update_ui_timer.setSingleShot(True)
-                self._position_update_ui_timer.timeout.connect(self._do_update_video_progress)
-
-            if not self._position_update_ui_timer.isActive():
-                self._position_update_ui_timer.start(500)  # 500ms
-
-    def _do_update_video_progress(self):
-        """Effectue la mise à jour UI de progression."""
-        if self.current_video:
-            self.dock_widget.update_video_progress(self.current_video.name)
-
     # ============================================
     # MÉTHODES DE GESTION DES LECTURES
     # ============================================
 
     def playlist_play_mode_update(self):
         self.active_playlist.set_play_mode(self.toolbar_widget.player_controls.play_mode)
+        self._prefetch_upcoming()
+
+    def _prefetch_upcoming(self):
+        """Demande la lecture anticipée des prochains éléments selon le mode de lecture."""
+        playlist = self.active_playlist
+        if self.read_ahead is None or playlist is None:
+            return
+        videos = playlist.peek_upcoming_videos(self.PREFETCH_COUNT)
+        self.read_ahead.prefetch([video.file_path for video in videos])
 
     def btn_play_mode_initialize(self):
         self.toolbar_widget.volume_widget.slider.setValue(self.manager.volume * 100)
@@ -1065,6 +1174,8 @@ class MainWindow(QtWidgets.QMainWindow):
     def stop_playing(self):
         if not self.player_widget.player_ready:
             return
+        # Pas d'enchaînement après un arrêt : ne pas garder le fichier suivant ouvert
+        self.player_widget.cancel_preload()
         player = self.player_widget.video_player
         if player is None:
             return
@@ -1077,34 +1188,85 @@ class MainWindow(QtWidgets.QMainWindow):
         pass
 
     def next_video(self):
-        self.active_playlist.get_next_video()
-        if self.current_video:
+        video, _ = self.active_playlist.get_next_video()
+        if video is not None and self.player_widget.swap_to_preloaded(
+            video.id, self._resume_position(), audio_only=video.is_audio
+        ):
+            self._init_preloaded_video()
+        elif self.current_video:
             self.play_video()
 
     def next_video_if_end(self,status):
-        if status == QtMultimedia.QMediaPlayer.MediaStatus.EndOfMedia and self.active_playlist.get_next_video()[0]:
+        if status != QtMultimedia.QMediaPlayer.MediaStatus.EndOfMedia:
+            return
+        playlist = self.active_playlist
+        if playlist.play_mode == PlayMode.LOOP_ONE:
+            # Same item again: rewind the open player instead of reopening the file
+            if playlist.get_next_video()[0]:
+                player = self.player_widget.video_player
+                player.setPosition(0)
+                player.play()
+            return
+        video, _ = playlist.get_next_video()
+        if video is None:
+            return
+        if self.player_widget.swap_to_preloaded(
+            video.id, self._resume_position(), audio_only=video.is_audio
+        ):
+            self._init_preloaded_video()
+        else:
             self.play_video()
-        pass
+
+    def _init_preloaded_video(self):
+        # The swapped-in player went through LoadedMedia while in reserve: do its setup now
+        player = self.player_widget.video_player
+        self.active_playlist.update_video_metadata(self.current_video, duration=player.duration())
+        self.init_interface()
+        self.btn_play_pause_update()
+
+    def _preload_next_video(self, tick):
+        """Ouvre l'élément suivant dans le lecteur de réserve pour un enchaînement sans coupure."""
+        playlist = self.active_playlist
+        if playlist is None or playlist.play_mode == PlayMode.LOOP_ONE:
+            return
+        # NORMAL / LOOP_ALL: next item is known from the start. SHUFFLE: wait for the end of the item
+        if playlist.play_mode == PlayMode.SHUFFLE and (
+            tick.duration <= 0 or tick.duration - tick.position > self.PRELOAD_LEAD_MS
+        ):
+            return
+        video, _ = playlist.peek_next_video()
+        current = playlist.current_video
+        if video is not None and (current is None or video.id != current.id):
+            self.player_widget.preload_next(video.id, video.file_path)
 
     def previous_video(self):
         self.active_playlist.get_previous_video()
         if self.current_video:
             self.play_video()
 
-    def play_video(self):
+    def play_video(self, requested_at=None):
         if not self.current_video:
             return
+        # Début de la mesure clic -> première image, initialisation du lecteur comprise
+        if requested_at is None:
+            requested_at = time.perf_counter()
         if not self.player_widget.player_ready:
-            self.player_widget.ensure_player_ready(self.play_video)
+            self.player_widget.ensure_player_ready(lambda: self.play_video(requested_at))
             return
-        player = self.player_widget.video_player
-        if player is None:
+        if self.player_widget.video_player is None:
             return
-        video_url = QtCore.QUrl.fromLocalFile(str(self.current_video.file_path))
-        player.setSource(video_url)
-        player.play()
+        self.player_widget.open_media(
+            self.current_video.file_path,
+            self._resume_position(),
+            requested_at,
+            audio_only=self.current_video.is_audio,
+        )
         self.init_interface()
 
+    def _resume_position(self) -> int:
+        state = self.current_video.state
+        return state.position if 1000 < state.position < state.duration else 0
+
     def init_interface(self):
         if not self.current_video or not self.player_widget.player_ready:
             return
@@ -1116,15 +1278,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self.toolbar_widget.time_label.set_times(total_time=total_time)
         # init volume widget
         self.toolbar_widget.volume_widget.update_button_icon()
-        if 1000 < self.current_video.state.position < self.current_video.state.duration:
-            player.setPosition(self.current_video.state.position)
-        self.dock_widget.set_current_video(self.current_video.name)
-
-    def double_click(self,item):
-        if isinstance(item, VideoListItem):
-            self.active_playlist.jump_to_video_by_name(item.name)
+        if self.current_video.is_audio:
+            self.player_widget.set_audio_title(self.current_video.display_title)
+        self.dock_widget.set_current_video(self.current_video.id)
+        # Nouvel élément : l'ancienne prédiction ne vaut plus, la suivante part au prochain tic
+        if self.read_ahead is not None:
+            self.read_ahead.cancel()
+
+    def double_click(self, index):
+        video_id = index.data(VideoListModel.VideoIdRole)
+        if video_id:
+            self.active_playlist.jump_to_video_by_id(video_id)
             self.play_video()
-        pass
 
     def btn_play_pause_update(self, state=None):
         """
@@ -1175,10 +1340,15 @@ class MainWindow(QtWidgets.QMainWindow):
         # Mettre à jour le tooltip
         self.toolbar_widget.player_controls.btn_play_pause_tooltip()
 
-    def update_time_label(self,position):
-        current_time = self.player_widget.position_to_hms(position)
-        self.toolbar_widget.time_label.set_times(current_time=current_time)
-        pass
+    def _on_clock_tick(self, tick):
+        if tick.second_changed:
+            self.toolbar_widget.time_label.set_times(
+                current_time=tick.position_text,
+                total_time=tick.duration_text if tick.duration else None,
+            )
+            self._preload_next_video(tick)
+            self._prefetch_upcoming()
+        self._on_position_changed_throttled(tick.position)
 
     def player_mute_if_clicked(self):
         if not self.current_video:
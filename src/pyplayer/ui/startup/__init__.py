@@ -1 +1,5 @@
 """UI startup helpers package."""
+
+from .multimedia_warmup import MultimediaWarmup
+
+__all__ = ["MultimediaWarmup"]
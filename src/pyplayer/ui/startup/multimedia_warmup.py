@@ -0,0 +1,145 @@
+"""Idle-time warm-up of the QtMultimedia backend."""
+
+import logging
+import time
+from typing import Dict, Optional
+
+from PySide6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+
+class MultimediaWarmup(QtCore.QObject):
+    """
+    Prechauffe le lecteur quand l'application est inactive.
+
+    The target (``PlayerWidget``) exposes its lazy QtMultimedia setup as
+    ``run_initialization_step()``. Once no user input has been seen for
+    ``idle_ms``, the warm-up runs those steps one per event-loop turn, so
+    the first play no longer pays for the backend. Any input postpones the
+    next step until the application is idle again. A first play during the
+    warm-up simply runs the remaining steps itself. Nothing runs in low
+    power mode.
+    """
+
+    STATE_PENDING = "pending"
+    STATE_SCHEDULED = "scheduled"
+    STATE_RUNNING = "running"
+    STATE_DONE = "done"
+    STATE_CANCELLED = "cancelled"
+    STATE_SKIPPED = "skipped"
+
+    INPUT_EVENTS = frozenset(
+        {
+            QtCore.QEvent.Type.MouseButtonPress,
+            QtCore.QEvent.Type.MouseButtonDblClick,
+            QtCore.QEvent.Type.KeyPress,
+            QtCore.QEvent.Type.Wheel,
+            QtCore.QEvent.Type.TouchBegin,
+        }
+    )
+
+    finished = QtCore.Signal(object)  # {step: ms}, in execution order
+
+    def __init__(self, target, idle_ms: int = 1500, low_power: bool = False, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._target = target
+        self._low_power = low_power
+        self._state = self.STATE_PENDING
+        self._filter_installed = False
+        self._started_at = 0.0
+        # Duree de chaque etape executee par le prechauffage, en millisecondes
+        self.timings: Dict[str, float] = {}
+        self._idle_timer = QtCore.QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(max(0, idle_ms))
+        self._idle_timer.timeout.connect(self._on_idle)
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.timings.values())
+
+    def schedule(self) -> bool:
+        """Arm the idle timer (call after first paint). Returns False if nothing will run."""
+        if self._state != self.STATE_PENDING:
+            return False
+        if self._low_power:
+            self._state = self.STATE_SKIPPED
+            logger.info("Prechauffage multimedia ignore (mode economie d'energie)")
+            return False
+        if self._target.player_ready:
+            self._state = self.STATE_DONE
+            return False
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.installEventFilter(self)
+            self._filter_installed = True
+        self._state = self.STATE_SCHEDULED
+        self._idle_timer.start()
+        return True
+
+    def cancel(self) -> None:
+        if self._state in (self.STATE_DONE, self.STATE_CANCELLED, self.STATE_SKIPPED):
+            return
+        self._idle_timer.stop()
+        self._remove_filter()
+        self._state = self.STATE_CANCELLED
+        logger.info("Prechauffage multimedia annule apres %d etape(s)", len(self.timings))
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if event.type() in self.INPUT_EVENTS and self._state in (self.STATE_SCHEDULED, self.STATE_RUNNING):
+            # The user is active: wait for the next idle period before the next step
+            self._idle_timer.start()
+        return False
+
+    def _on_idle(self) -> None:
+        if self._state not in (self.STATE_SCHEDULED, self.STATE_RUNNING):
+            return
+        if self._state == self.STATE_SCHEDULED:
+            self._started_at = time.perf_counter()
+        self._state = self.STATE_RUNNING
+        self._run_step()
+
+    def _run_step(self) -> None:
+        if self._state != self.STATE_RUNNING or self._idle_timer.isActive():
+            return
+        if self._target.player_ready:
+            self._finish()
+            return
+        start = time.perf_counter()
+        name = self._target.run_initialization_step()
+        if name is None:
+            self._finish()
+            return
+        self.timings[name] = (time.perf_counter() - start) * 1000
+        if self._target.player_ready:
+            self._finish()
+        else:
+            # One step per event-loop turn: pending input and paints go first
+            QtCore.QTimer.singleShot(0, self._run_step)
+
+    def _finish(self) -> None:
+        self._remove_filter()
+        self._state = self.STATE_DONE
+        steps = ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.timings.items())
+        logger.info(
+            "Prechauffage multimedia termine: %.1f ms de travail en %.1f ms (%s)",
+            self.total_ms,
+            (time.perf_counter() - self._started_at) * 1000,
+            steps or "rien a faire",
+        )
+        self.finished.emit(dict(self.timings))
+
+    def _remove_filter(self) -> None:
+        if self._filter_installed:
+            app = QtCore.QCoreApplication.instance()
+            if app is not None:
+                app.removeEventFilter(self)
+            self._filter_installed = False
+
+
+__all__ = ["MultimediaWarmup"]
@@ -1,8 +1,13 @@
 """Widget namespace compatibility package."""
 
-from .dock_widget import DeletePlaylistDialog, DockWidget, VideoListItem
+from .diagnostics_overlay import DiagnosticsOverlay
+from .dock_widget import DeletePlaylistDialog, DockWidget
+from .media_preloader import MediaPreloader
 from .menu_bar import HelpDialog, MenuBarWidget
 from .player import CustomSlider, PlayerWidget
+from .playlist_list_model import PlaylistItemDelegate, PlaylistListModel
+from .poster_thumbnails import PosterExtractor, PosterProvider
+from .scrub_preview import ScrubPreview, TrickplayGenerator
 from .statusbar_widget import StatusBar
 from .tool_bar import (
     PlayerControlsWidget,
@@ -11,19 +16,30 @@ from .tool_bar import (
     ToolBarWidget,
     VolumeWidget,
 )
+from .video_list_model import VideoItemDelegate, VideoListModel, VideoListView
 
 __all__ = [
     "CustomSlider",
     "DeletePlaylistDialog",
+    "DiagnosticsOverlay",
     "DockWidget",
     "HelpDialog",
+    "MediaPreloader",
     "MenuBarWidget",
     "PlayerControlsWidget",
     "PlayerWidget",
     "PlaylistButtonWidget",
+    "PlaylistItemDelegate",
+    "PlaylistListModel",
+    "PosterExtractor",
+    "PosterProvider",
+    "ScrubPreview",
     "StatusBar",
     "TimeLabelWidget",
     "ToolBarWidget",
-    "VideoListItem",
+    "TrickplayGenerator",
+    "VideoItemDelegate",
+    "VideoListModel",
+    "VideoListView",
     "VolumeWidget",
 ]
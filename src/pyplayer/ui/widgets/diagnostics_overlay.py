@@ -0,0 +1,50 @@
+from typing import Optional
+
+from PySide6 import QtCore, QtWidgets
+
+from src.pyplayer.app.services.playback_diagnostics import jitter_labels
+
+
+class DiagnosticsOverlay(QtWidgets.QLabel):
+    """Statistiques de lecture affichées par-dessus la vidéo.
+
+    A frameless tool-tip window, like the scrub preview popup, so it stays
+    above the native video surface. It follows the top-left corner of the
+    widget it is attached to and ignores the mouse.
+    """
+
+    MARGIN = 16
+
+    def __init__(self, anchor: QtWidgets.QWidget, parent: Optional[QtWidgets.QWidget] = None):
+        super().__init__(parent or anchor, QtCore.Qt.WindowType.ToolTip)
+        self._anchor = anchor
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.setStyleSheet(
+            "background-color: rgba(5, 6, 7, 200); color: #8CF095; padding: 6px;"
+            "font-family: 'Consolas', 'DejaVu Sans Mono', monospace; font-size: 11px;"
+        )
+        self.setText("Diagnostic de lecture : en attente d'images…")
+        self.hide()
+
+    def update_stats(self, stats: dict):
+        histogram = "  ".join(
+            f"{label}:{count}" for label, count in zip(jitter_labels(), stats.get("jitter_delivery", []))
+        )
+        lines = [
+            f"{stats.get('fps', 0.0):5.1f} i/s   intervalle {stats.get('interval_ms', 0.0):.1f} ms",
+            f"perdues {stats.get('dropped', 0)}   en retard : décodage {stats.get('late_delivery', 0)}"
+            f"  affichage {stats.get('late_display', 0)} (blocage UI {stats.get('late_in_stall', 0)})",
+            f"blocages UI {stats.get('stalls', 0)}   max {stats.get('stall_max_ms', 0.0):.0f} ms",
+            f"gigue (ms) {histogram}",
+        ]
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        self.follow_anchor()
+
+    def follow_anchor(self):
+        if self._anchor.isVisible():
+            self.move(self._anchor.mapToGlobal(QtCore.QPoint(self.MARGIN, self.MARGIN)))
+
+
+__all__ = ["DiagnosticsOverlay"]
@@ -1,9 +1,10 @@
-from typing import List
+from typing import Callable, Iterable, List, Optional, Sequence
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from src.pyplayer.app.services.playlist_registry import PlaylistHeader
 from src.pyplayer.domain.media import Video
-from src.pyplayer.domain.playlist import Playlist
+from src.pyplayer.domain.playlist import Playlist, PlaylistChange, PlaylistChangeKind
 from src.pyplayer.ui.theme import (
     ACCENT_COLOR,
     HOVER_COLOR,
@@ -14,161 +15,31 @@ from src.pyplayer.ui.theme import (
     THIRD_COLOR,
     playlist_action_icon,
 )
+from src.pyplayer.infrastructure.config.settings import CONFIG
 from src.pyplayer.infrastructure.filesystem import find_path
+from src.pyplayer.ui.widgets.playlist_list_model import PlaylistItemDelegate, PlaylistListModel
+from src.pyplayer.ui.widgets.poster_thumbnails import PosterProvider
+from src.pyplayer.ui.widgets.video_list_model import VideoItemDelegate, VideoListModel, VideoListView
 
 
-class VideoListItem(QtWidgets.QListWidgetItem):
-    """Item personnalisé pour afficher une vidéo avec progression séparée."""
+def schedule_next_tick(callback: Callable[[], None]) -> None:
+    """Scheduler handed to playlists: deliver their change batch on the next event-loop tick."""
+    QtCore.QTimer.singleShot(0, callback)
 
-    SEPARATOR_ICON = "➤"
 
-    def __init__(self, index: int, video: Video, parent=None):
-        super().__init__(parent)
-
-        self.index = index
-        self.video = video
-        self._name = video.name if hasattr(video, "name") else ""
-        self._is_current = False
-        self._is_read = False
-
-        self.container = QtWidgets.QWidget()
-        self.container.setProperty("class", "video-item-container")
-
-        self.text_label = QtWidgets.QLabel()
-        self.text_label.setProperty("class", "video-item-text")
-
-        self.progress_label = QtWidgets.QLabel()
-        self.progress_label.setProperty("class", "video-item-progress")
-        self.progress_label.setAlignment(
-            QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
-        )
-
-        self.layout = QtWidgets.QHBoxLayout(self.container)
-
-        self.normal_margins = QtCore.QMargins(6, 4, 4, 4)
-        self.selected_margins = QtCore.QMargins(9, 4, 4, 4)
-
-        self.layout.setContentsMargins(self.normal_margins)
-
-        self.layout.addWidget(self.text_label, 1)
-        self.layout.addWidget(self.progress_label, 0, QtCore.Qt.AlignmentFlag.AlignRight)
-
-        self.update_display()
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @name.setter
-    def name(self, value: str):
-        self._name = str(value)
-        self.update_display()
-
-    @property
-    def is_current(self) -> bool:
-        return self._is_current
-
-    @is_current.setter
-    def is_current(self, value: bool):
-        old_value = self._is_current
-        new_value = bool(value)
-
-        if old_value == new_value:
-            return
-
-        self._is_current = new_value
-
-        if old_value and not new_value:
-            self.is_read = True
-
-        self.apply_style()
-
-    @property
-    def is_read(self) -> bool:
-        return self._is_read
-
-    @is_read.setter
-    def is_read(self, value: bool):
-        if self._is_read != value:
-            self._is_read = bool(value)
-            if value and self._is_current:
-                self._is_current = False
-            self.apply_style()
-
-    @property
-    def state(self) -> str:
-        if self._is_current:
-            return "current"
-        if self._is_read:
-            return "read"
-        return "normal"
-
-    def update_display(self):
-        main_text = f"{self.index} {self.SEPARATOR_ICON}  {self.name}"
-        self.text_label.setText(main_text)
-
-        progress_text = f"{self.video.progress}"
-        self.progress_label.setText(progress_text)
-
-        self.apply_style()
-
-    def apply_style(self):
-        self.text_label.setProperty("state", self.state)
-        self.progress_label.setProperty("state", self.state)
-
-        self.text_label.style().unpolish(self.text_label)
-        self.text_label.style().polish(self.text_label)
-        self.progress_label.style().unpolish(self.progress_label)
-        self.progress_label.style().polish(self.progress_label)
-
-    def set_selected(self, selected: bool):
-        if selected:
-            self.layout.setContentsMargins(self.selected_margins)
-        else:
-            self.layout.setContentsMargins(self.normal_margins)
-
-    def set_current(self, is_current: bool):
-        self.is_current = is_current
-
-    def set_read(self, is_read: bool):
-        self.is_read = is_read
-
-    def get_video_name(self) -> str:
-        return self.name
-
-    def set_widget_to_list(self, list_widget: QtWidgets.QListWidget):
-        list_widget.setItemWidget(self, self.container)
-
-    def cleanup(self):
-        try:
-            if hasattr(self, "container"):
-                if hasattr(self, "layout"):
-                    while self.layout.count():
-                        child = self.layout.takeAt(0)
-                        if child and child.widget():
-                            child.widget().setParent(None)
-                    self.layout.deleteLater()
-
-                self.container.deleteLater()
-
-            self.text_label = None
-            self.progress_label = None
-            self.container = None
-            self.layout = None
-
-        except Exception as error:
-            print(f"Erreur lors du nettoyage: {error}")
-
-    def __str__(self) -> str:
-        return f"VideoListItem[{self.index}: {self.name} ({self.state})]"
-
-    def __repr__(self) -> str:
-        return f"VideoListItem(index={self.index}, name='{self.name}', state='{self.state}')"
+class DockWidget(QtWidgets.QDockWidget):
+    FILTER_DEBOUNCE_MS = 150
+    VISIBLE_DEBOUNCE_MS = 50
 
+    # Emis uniquement quand l'utilisateur choisit une playlist dans l'onglet de gestion.
+    playlist_selected = QtCore.Signal(str)
+    # Vidéos à l'écran dans la liste, après un défilement, un redimensionnement ou un changement de liste.
+    visible_videos_changed = QtCore.Signal(object)
 
-class DockWidget(QtWidgets.QDockWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._playlist: Optional[Playlist] = None
+        self._syncing_archive = False
         self.setup_ui()
 
     def setup_ui(self):
@@ -193,12 +64,25 @@ class DockWidget(QtWidgets.QDockWidget):
         self.tab_widget = QtWidgets.QTabWidget()
 
         self.tab_current = QtWidgets.QWidget()
-        self.lstw = QtWidgets.QListWidget()
+        self.video_model = VideoListModel(self)
+        self.video_delegate = VideoItemDelegate(self)
+        self.poster_provider = PosterProvider(
+            CONFIG.cache_dir / "posters",
+            enabled=not CONFIG.preferences.get("low_power", False),
+            parent=self,
+        )
+        self.video_delegate.poster_provider = self.poster_provider
+        self.le_filter = QtWidgets.QLineEdit()
+        self.filter_timer = QtCore.QTimer(self)
+        self.visible_timer = QtCore.QTimer(self)
+        self.lstw = VideoListView()
         self.btn_add_to_playlist = QtWidgets.QPushButton()
         self.btn_remove_to_playlist = QtWidgets.QPushButton()
 
         self.tab_archive = QtWidgets.QWidget()
-        self.lstw_archive = QtWidgets.QListWidget()
+        self.playlist_model = PlaylistListModel(self)
+        self.playlist_delegate = PlaylistItemDelegate(self)
+        self.lstw_archive = QtWidgets.QListView()
         self.btn_save_playlist = QtWidgets.QPushButton()
         self.btn_remove_save = QtWidgets.QPushButton()
 
@@ -239,7 +123,7 @@ class DockWidget(QtWidgets.QDockWidget):
         )
 
         list_style = """
-            QListWidget {
+            QListView {
                 background-color: rgba(24, 26, 29, 0.92);
                 color: #e0e0e0;
                 border: 1px solid rgba(255, 255, 255, 0.06);
@@ -250,7 +134,7 @@ class DockWidget(QtWidgets.QDockWidget):
                 padding: 6px;
             }
 
-            QListWidget::item {
+            QListView::item {
                 height: 46px;
                 padding: 0px;
                 margin: 2px 0;
@@ -259,78 +143,17 @@ class DockWidget(QtWidgets.QDockWidget):
                 background-color: rgba(24, 26, 29, 0.92);
             }
 
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: rgba(76, 175, 80, 0.16);
                 border-left: 3px solid rgba(118, 232, 128, 0.75);
                 padding-left: 0px;
                 border-radius: 8px;
             }
 
-            QListWidget::item:hover:!selected {
+            QListView::item:hover:!selected {
                 background-color: rgba(255, 255, 255, 0.06);
             }
 
-            QListWidget::item .video-item-container {
-                background-color: inherit;
-            }
-
-            QListWidget::item:selected .video-item-container {
-                background-color: rgba(76, 175, 80, 0.15);
-            }
-
-            QListWidget::item:hover:!selected .video-item-container {
-                background-color: rgba(255, 255, 255, 0.07);
-            }
-
-            .video-item-text {
-                background-color: transparent;
-            }
-
-            .video-item-progress {
-                background-color: transparent;
-            }
-
-            .video-item-text[state="normal"] {
-                color: #e8ecef;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 12px;
-            }
-
-            .video-item-progress[state="normal"] {
-                color: #4CAF50;
-                font-size: 12px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-weight: 500;
-            }
-
-            .video-item-text[state="current"] {
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-weight: 600;
-                color: #ffffff;
-                font-size: 13px;
-            }
-
-            .video-item-progress[state="current"] {
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-weight: 600;
-                color: #4CAF50;
-                font-size: 16px;
-            }
-
-            .video-item-text[state="read"] {
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-weight: normal;
-                color: #a5d6a7;
-                font-size: 12px;
-            }
-
-            .video-item-progress[state="read"] {
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-weight: 500;
-                color: #81C784;
-                font-size: 14px;
-            }
-
             QScrollBar:vertical {
                 width: 10px;
                 border-radius: 5px;
@@ -351,6 +174,29 @@ class DockWidget(QtWidgets.QDockWidget):
         self.lstw.setStyleSheet(list_style)
         self.lstw_archive.setStyleSheet(list_style)
 
+        self.le_filter.setPlaceholderText("Filtrer la playlist…")
+        self.le_filter.setClearButtonEnabled(True)
+        self.le_filter.setStyleSheet(
+            """
+            QLineEdit {
+                background-color: rgba(24, 26, 29, 0.92);
+                color: #e8ecef;
+                border: 1px solid rgba(255, 255, 255, 0.06);
+                border-radius: 10px;
+                padding: 7px 10px;
+                font-size: 12px;
+                font-family: 'Segoe UI', Arial, sans-serif;
+            }
+            QLineEdit:focus {
+                border: 1px solid rgba(118, 232, 128, 0.55);
+            }
+        """
+        )
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self.visible_timer.setSingleShot(True)
+        self.visible_timer.setInterval(self.VISIBLE_DEBOUNCE_MS)
+
         button_base_style = """
             QPushButton {
                 background-color: rgba(42, 46, 50, 0.92);
@@ -427,8 +273,13 @@ class DockWidget(QtWidgets.QDockWidget):
         self.btn_save_playlist.setIcon(playlist_action_icon("save_playlist"))
         self.btn_remove_save.setIcon(playlist_action_icon("delete_playlist"))
 
+        self.lstw.setModel(self.video_model)
+        self.lstw.setItemDelegate(self.video_delegate)
         self.lstw.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
         self.lstw.setAlternatingRowColors(False)
+        self.lstw_archive.setModel(self.playlist_model)
+        self.lstw_archive.setItemDelegate(self.playlist_delegate)
+        self.lstw_archive.setUniformItemSizes(True)
         self.lstw_archive.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
 
         self.tab_widget.addTab(self.tab_current, "Playlist Active")
@@ -456,6 +307,7 @@ class DockWidget(QtWidgets.QDockWidget):
     def add_widgets_to_layouts(self):
         self.main_layout.addWidget(self.tab_widget)
 
+        self.tab_current_layout.addWidget(self.le_filter)
         self.tab_current_layout.addWidget(self.lstw, 1)
         current_buttons_vbox = QtWidgets.QVBoxLayout()
         current_buttons_vbox.addLayout(self.current_buttons_layout)
@@ -473,159 +325,146 @@ class DockWidget(QtWidgets.QDockWidget):
         self.setWidget(self.main_widget)
 
     def setup_connections(self):
-        self.lstw.itemSelectionChanged.connect(self.on_selection_changed)
-
-    def on_selection_changed(self):
-        selected_items = self.lstw.selectedItems()
-        for i in range(self.lstw.count()):
-            item = self.lstw.item(i)
-            if isinstance(item, VideoListItem):
-                item.set_selected(item in selected_items)
-
-    def add_playlist_state(self, item: Playlist):
-        if not self.lstw_archive.findItems(item.name, QtCore.Qt.MatchFlag.MatchEndsWith):
-            self.lstw_archive.addItem(item.name)
-            return True
-        return False
-
-    def remove_playlist_state(self, item: Playlist):
-        items = self.lstw_archive.findItems(item.name, QtCore.Qt.MatchFlag.MatchExactly)
-        if items:
-            row = self.lstw_archive.row(items[0])
-            self.lstw_archive.takeItem(row)
-            return True
-        return False
+        self.video_model.currentVideoChanged.connect(self.on_current_video_changed)
+        # Typing restarts the timer: the filter runs once the user pauses.
+        self.le_filter.textChanged.connect(self.filter_timer.start)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        # Scrolling restarts the timer: the visible rows are reported once the list settles.
+        # Sans lambda, la valeur du signal deviendrait l'intervalle du timer (QTimer.start(int)).
+        self.lstw.verticalScrollBar().valueChanged.connect(lambda *_: self.visible_timer.start())
+        self.lstw.verticalScrollBar().rangeChanged.connect(lambda *_: self.visible_timer.start())
+        self.video_model.modelReset.connect(self.visible_timer.start)
+        self.visible_timer.timeout.connect(self.on_visible_rows_settled)
+        self.poster_provider.poster_ready.connect(self.video_model.refresh_video)
+        self.lstw_archive.selectionModel().currentChanged.connect(self.on_archive_current_changed)
+
+    def apply_filter(self):
+        self.filter_timer.stop()
+        self.video_model.set_filter(self.le_filter.text())
+
+    def on_current_video_changed(self, row: int):
+        if row < 0:
+            return
+        index = self.video_model.index(row, 0)
+        self.lstw.selectionModel().setCurrentIndex(
+            index, QtCore.QItemSelectionModel.SelectionFlag.ClearAndSelect
+        )
+        self.lstw.scroll_to_row(row)
 
-    def get_selected_playlist_name(self) -> str:
-        selected_items = self.lstw_archive.selectedItems()
-        if selected_items:
-            return selected_items[0].text()
-        return ""
+    def on_archive_current_changed(self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex):
+        if self._syncing_archive or not current.isValid():
+            return
+        self.playlist_selected.emit(current.data(PlaylistListModel.PlaylistIdRole))
 
-    def set_active_playlist(self, playlist: Playlist):
-        items = self.lstw_archive.findItems(playlist.name, QtCore.Qt.MatchFlag.MatchExactly)
-        if items:
-            self.lstw_archive.setCurrentItem(items[0])
-            index = self.tab_widget.indexOf(self.tab_current)
-            self.tab_widget.setTabText(index, playlist.name)
-            return playlist
+    def _select_archive_row(self, row: int):
+        """Sélectionne une ligne sans la signaler comme un choix de l'utilisateur."""
+        self._syncing_archive = True
+        try:
+            if row < 0:
+                self.lstw_archive.clearSelection()
+            else:
+                self.lstw_archive.setCurrentIndex(self.playlist_model.index(row, 0))
+        finally:
+            self._syncing_archive = False
 
-    def add_video_to_playlist(self, video: Video) -> bool:
-        if not video or not hasattr(video, "name"):
-            return False
+    def set_playlist_headers(self, headers: Sequence[PlaylistHeader]):
+        self.playlist_model.set_headers(headers)
 
-        for i in range(self.lstw.count()):
-            item = self.lstw.item(i)
-            if isinstance(item, VideoListItem) and item.name == video.name:
-                return False
+    def refresh_playlist_summaries(self, playlist_ids: Iterable[str]):
+        self.playlist_model.refresh_playlists(playlist_ids)
 
-        index = self.lstw.count() + 1
-        item = VideoListItem(index, video)
-        self.lstw.addItem(item)
-        self.lstw.setItemWidget(item, item.container)
+    def add_playlist_state(self, item: Playlist):
+        return self.playlist_model.add_playlist(item)
 
-        return True
+    def remove_playlist_state(self, item: Playlist):
+        return self.playlist_model.remove_playlist(item.id)
 
-    def add_videos_to_playlist_batch(self, videos: list) -> int:
-        """Ajoute plusieurs vidéos en une seule opération optimisée."""
-        self.lstw.setUpdatesEnabled(False)
-        self.lstw.blockSignals(True)
+    def get_selected_playlist_id(self) -> str:
+        index = self.lstw_archive.currentIndex()
+        if index.isValid() and self.lstw_archive.selectionModel().isSelected(index):
+            return index.data(PlaylistListModel.PlaylistIdRole)
+        return ""
 
-        try:
-            added = 0
-            existing_names = {
-                self.lstw.item(i).name for i in range(self.lstw.count())
-                if isinstance(self.lstw.item(i), VideoListItem)
-            }
+    def get_selected_playlist_name(self) -> str:
+        index = self.lstw_archive.currentIndex()
+        if index.isValid() and self.lstw_archive.selectionModel().isSelected(index):
+            return index.data()
+        return ""
 
-            for video in videos:
-                if not video or not hasattr(video, "name"):
-                    continue
-                if video.name not in existing_names:
-                    index = self.lstw.count() + 1
-                    item = VideoListItem(index, video)
-                    self.lstw.addItem(item)
-                    self.lstw.setItemWidget(item, item.container)
-                    existing_names.add(video.name)
-                    added += 1
-
-            return added
-        finally:
-            self.lstw.blockSignals(False)
-            self.lstw.setUpdatesEnabled(True)
-
-    def remove_video_from_playlist(self, video_name: str) -> bool:
-        for i in range(self.lstw.count()):
-            item = self.lstw.item(i)
-            if isinstance(item, VideoListItem) and item.name == video_name:
-                item.cleanup()
-                self.lstw.takeItem(i)
-                self.reindex_video_items()
-                return True
-        return False
-
-    def reindex_video_items(self):
-        """Optimisé : met à jour les index sans recalcul de styles inutiles."""
-        self.lstw.setUpdatesEnabled(False)
-        try:
-            for i in range(self.lstw.count()):
-                item = self.lstw.item(i)
-                if isinstance(item, VideoListItem):
-                    item.index = i + 1
-                    # Ne mettre à jour que le texte, pas les styles (apply_style appelé inutilement)
-                    main_text = f"{item.index} {item.SEPARATOR_ICON}  {item.name}"
-                    item.text_label.setText(main_text)
-        finally:
-            self.lstw.setUpdatesEnabled(True)
-
-    def set_current_video(self, video_name: str) -> bool:
-        found_current = False
-
-        for i in range(self.lstw.count()):
-            item = self.lstw.item(i)
-            if isinstance(item, VideoListItem):
-                if item.name == video_name:
-                    item.is_current = True
-                    item.is_read = False
-                    found_current = True
-                    self.lstw.clearSelection()
-                    self.lstw.setCurrentItem(item)
-                elif item.is_current:
-                    item.is_current = False
-
-        return found_current
-
-    def update_video_progress(self, video_name: str):
-        item = self.find_video_item_by_name(video_name)
-        if item:
-            item.update_display()
+    def set_active_playlist(self, playlist: Optional[Playlist]):
+        self.playlist_model.set_active_playlist(playlist)
+        self._select_archive_row(self.playlist_model.row_of(playlist.id) if playlist is not None else -1)
+        index = self.tab_widget.indexOf(self.tab_current)
+        self.tab_widget.setTabText(index, playlist.name if playlist is not None else "Playlist Active")
+        return playlist
+
+    def bind_playlist(self, playlist: Optional[Playlist]):
+        """Affiche la playlist puis suit ses changements de façon incrémentale."""
+        if self._playlist is not None:
+            self._playlist.changes.unsubscribe(self.on_playlist_changes)
+        if playlist is not self._playlist:
+            self.poster_provider.clear()
+            self.filter_timer.stop()
+            self.le_filter.blockSignals(True)
+            self.le_filter.clear()
+            self.le_filter.blockSignals(False)
+        self._playlist = playlist
+        if playlist is not None and playlist.changes.scheduler is None:
+            playlist.changes.scheduler = schedule_next_tick
+        self.video_model.set_playlist(playlist)
+        if playlist is not None:
+            playlist.changes.subscribe(self.on_playlist_changes)
+        current = playlist.current_video if playlist is not None else None
+        if current is not None:
+            self.on_current_video_changed(self.video_model.row_of(current.id, playlist.current_index))
+
+    def on_playlist_changes(self, changes: Sequence[PlaylistChange]):
+        # Rows are handled by the model; only playlist-level metadata concerns the dock itself.
+        for change in changes:
+            if change.kind is PlaylistChangeKind.METADATA_CHANGED and change.first < 0 and self._playlist is not None:
+                self.tab_widget.setTabText(self.tab_widget.indexOf(self.tab_current), self._playlist.name)
+
+    def row_of(self, video_id: str) -> int:
+        return self.video_model.row_of(video_id)
+
+    def visible_rows(self) -> range:
+        """Lignes de la vue actuellement à l'écran (vide si la liste est vide)."""
+        count = self.video_model.rowCount()
+        if count == 0:
+            return range(0)
+        viewport = self.lstw.viewport()
+        top = self.lstw.indexAt(QtCore.QPoint(0, 0))
+        bottom = self.lstw.indexAt(QtCore.QPoint(0, viewport.height() - 1))
+        first = top.row() if top.isValid() else 0
+        last = bottom.row() if bottom.isValid() else count - 1
+        return range(first, last + 1)
+
+    def visible_videos(self) -> List[Video]:
+        return [video for video in map(self.video_model.video_at, self.visible_rows()) if video is not None]
+
+    def on_visible_rows_settled(self):
+        videos = self.visible_videos()
+        # Affiches des seules lignes à l'écran ; celles qui ont défilé hors de vue sont annulées
+        self.poster_provider.request_visible(videos)
+        self.visible_videos_changed.emit(videos)
+
+    def set_current_video(self, video_id: str) -> bool:
+        return self.video_model.set_current_video(video_id)
+
+    def update_video_progress(self, video_id: str):
+        self.video_model.refresh_video(video_id)
+
+    def _selected_rows(self) -> List[int]:
+        return sorted(index.row() for index in self.lstw.selectionModel().selectedRows())
+
+    def get_selected_video_ids(self) -> List[str]:
+        return [self.video_model.video_at(row).id for row in self._selected_rows()]
 
     def get_selected_video_names(self) -> List[str]:
-        selected_items = self.lstw.selectedItems()
-        return [item.name for item in selected_items if isinstance(item, VideoListItem)]
+        return [self.video_model.video_at(row).name for row in self._selected_rows()]
 
     def clear_video_playlist(self):
-        for i in range(self.lstw.count()):
-            item = self.lstw.item(i)
-            if isinstance(item, VideoListItem):
-                item.cleanup()
-
-        self.lstw.clear()
-
-    def find_video_item_by_name(self, video_name: str) -> VideoListItem | None:
-        for i in range(self.lstw.count()):
-            item = self.lstw.item(i)
-            if isinstance(item, VideoListItem) and item.name == video_name:
-                return item
-        return None
-
-    def get_video_items(self) -> List[VideoListItem]:
-        items = []
-        for i in range(self.lstw.count()):
-            item = self.lstw.item(i)
-            if isinstance(item, VideoListItem):
-                items.append(item)
-        return items
+        self.bind_playlist(None)
 
 
 class DeletePlaylistDialog(QtWidgets.QDialog):
@@ -844,4 +683,4 @@ class DeletePlaylistDialog(QtWidgets.QDialog):
             self.confirm_dialog.accept()
 
 
-__all__ = ["DeletePlaylistDialog", "DockWidget", "VideoListItem"]
+__all__ = ["DeletePlaylistDialog", "DockWidget"]
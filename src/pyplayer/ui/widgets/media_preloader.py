@@ -0,0 +1,113 @@
+import time
+from pathlib import Path
+from typing import Optional
+
+from PySide6 import QtCore, QtMultimedia
+
+
+class MediaPreloader(QtCore.QObject):
+    """Lecteur de réserve : ouvre l'élément suivant et décode sa première image.
+
+    The standby QMediaPlayer renders into a private QVideoSink and has no
+    audio output, so preloading is invisible and silent. Once the first
+    frame has been decoded the player is "primed": ``take()`` hands it over
+    to the visible player widget, and the previous player comes back through
+    ``recycle()`` to preload the item after that.
+    """
+
+    primed = QtCore.Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sink = QtMultimedia.QVideoSink(self)
+        self._sink.videoFrameChanged.connect(self._on_frame)
+        self._player: Optional[QtMultimedia.QMediaPlayer] = None
+        self._video_id: Optional[str] = None
+        self._primed = False
+        self._started_at = 0.0
+        # Temps entre setSource et la première image décodée du dernier préchargement
+        self.open_latency_ms: Optional[float] = None
+
+    @property
+    def video_id(self) -> Optional[str]:
+        return self._video_id
+
+    def is_primed_for(self, video_id: str) -> bool:
+        return self._primed and video_id == self._video_id
+
+    def preload(self, video_id: str, file_path: Path) -> bool:
+        """Ouvre ``file_path`` en réserve ; ne fait rien si c'est déjà l'élément préchargé."""
+        if video_id == self._video_id:
+            return False
+        player = self._ensure_player()
+        self._video_id = video_id
+        self._primed = False
+        self.open_latency_ms = None
+        self._started_at = time.perf_counter()
+        player.setSource(QtCore.QUrl.fromLocalFile(str(file_path)))
+        return True
+
+    def cancel(self):
+        if self._player is not None:
+            self._player.stop()
+            self._player.setSource(QtCore.QUrl())
+        self._video_id = None
+        self._primed = False
+
+    def take(self, video_id: str) -> Optional[QtMultimedia.QMediaPlayer]:
+        """Détache et renvoie le lecteur amorcé pour ``video_id``, ou None s'il n'est pas prêt."""
+        if not self.is_primed_for(video_id):
+            return None
+        player = self._player
+        player.mediaStatusChanged.disconnect(self._on_media_status_changed)
+        player.setVideoOutput(None)
+        self._player = None
+        self._video_id = None
+        self._primed = False
+        return player
+
+    def recycle(self, player: QtMultimedia.QMediaPlayer):
+        """Reprend un lecteur qui vient de quitter l'écran pour le prochain préchargement."""
+        player.stop()
+        player.setSource(QtCore.QUrl())
+        player.setAudioOutput(None)
+        if self._player is not None:
+            # Un lecteur de réserve existe déjà : celui-ci n'est plus utile
+            player.deleteLater()
+            return
+        self._adopt(player)
+
+    def _ensure_player(self) -> QtMultimedia.QMediaPlayer:
+        if self._player is None:
+            self._adopt(QtMultimedia.QMediaPlayer(self))
+        return self._player
+
+    def _adopt(self, player: QtMultimedia.QMediaPlayer):
+        player.setVideoOutput(self._sink)
+        player.setAudioOutput(None)
+        player.mediaStatusChanged.connect(self._on_media_status_changed)
+        self._player = player
+
+    def _on_media_status_changed(self, status):
+        if self._video_id is None or self._primed:
+            return
+        if status == QtMultimedia.QMediaPlayer.MediaStatus.LoadedMedia:
+            if self._player.hasVideo():
+                # pause() décode la première image vers le sink sans lancer la lecture
+                self._player.pause()
+            else:
+                self._mark_primed()
+        elif status == QtMultimedia.QMediaPlayer.MediaStatus.InvalidMedia:
+            self.cancel()
+
+    def _on_frame(self, frame):
+        if self._video_id is not None and not self._primed and frame.isValid():
+            self._mark_primed()
+
+    def _mark_primed(self):
+        self._primed = True
+        self.open_latency_ms = (time.perf_counter() - self._started_at) * 1000
+        self.primed.emit(self._video_id)
+
+
+__all__ = ["MediaPreloader"]
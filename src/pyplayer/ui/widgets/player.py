@@ -1,18 +1,31 @@
+import html
 from pathlib import Path
+from typing import Optional
 
 from PySide6 import QtCore, QtGui, QtMultimedia, QtMultimediaWidgets, QtWidgets
 
+from src.pyplayer.app.services.playback_clock import PlaybackClock, PlaybackTick, format_hms
+from src.pyplayer.app.services.playback_diagnostics import PlaybackDiagnostics
+from src.pyplayer.app.services.playback_loader import PlaybackLoader
+from src.pyplayer.app.services.seek_scheduler import SeekScheduler
+from src.pyplayer.ui.widgets.diagnostics_overlay import DiagnosticsOverlay
+from src.pyplayer.ui.widgets.media_preloader import MediaPreloader
+from src.pyplayer.ui.widgets.scrub_preview import ScrubPreview
 from src.pyplayer.ui.theme import PRINCIPAL_COLOR, py_player_icone
+from src.pyplayer.infrastructure.config.settings import CONFIG
 from src.pyplayer.infrastructure.filesystem import find_path
 
 
 class CustomSlider(QtWidgets.QSlider):
-    """Slider personnalise avec click direct sur la position."""
+    """Slider personnalise avec click direct sur la position et survol."""
 
     sliderClicked = QtCore.Signal(int)
+    hovered = QtCore.Signal(int, QtCore.QPoint)  # (valeur sous la souris, point global au-dessus du slider)
+    hoverLeft = QtCore.Signal()
 
     def __init__(self, orientation=QtCore.Qt.Orientation.Horizontal, parent=None):
         super().__init__(orientation, parent)
+        self.setMouseTracking(True)
         self.setup_ui()
 
     def setup_ui(self):
@@ -44,47 +57,81 @@ class CustomSlider(QtWidgets.QSlider):
                    """
         )
 
+    def _value_at(self, pos: float) -> int:
+        value = (self.maximum() - self.minimum()) * pos / self.width() + self.minimum()
+        return max(self.minimum(), min(self.maximum(), int(value)))
+
     def mousePressEvent(self, event: QtGui.QMouseEvent):
         if event.button() == QtCore.Qt.MouseButton.LeftButton:
             pos = event.position().x()
 
             if self.width() > 0:
-                value = (self.maximum() - self.minimum()) * pos / self.width() + self.minimum()
-                value = max(self.minimum(), min(self.maximum(), int(value)))
-                self.sliderClicked.emit(int(value))
-                self.setValue(int(value))
+                value = self._value_at(pos)
+                self.sliderClicked.emit(value)
+                self.setValue(value)
 
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent):
-        if event.buttons() & QtCore.Qt.MouseButton.LeftButton and self.isSliderDown():
+        if self.width() > 0:
             pos = event.position().x()
-            if self.width() > 0:
-                value = (self.maximum() - self.minimum()) * pos / self.width() + self.minimum()
-                value = max(self.minimum(), min(self.maximum(), int(value)))
-
+            value = self._value_at(pos)
+            if event.buttons() & QtCore.Qt.MouseButton.LeftButton and self.isSliderDown():
+                # setValue emits valueChanged only when the value actually changes
                 self.setValue(value)
-                self.valueChanged.emit(value)
+            self.hovered.emit(value, self.mapToGlobal(QtCore.QPoint(int(pos), 0)))
 
         super().mouseMoveEvent(event)
 
+    def leaveEvent(self, event: QtCore.QEvent):
+        self.hoverLeft.emit()
+        super().leaveEvent(event)
+
 
 class PlayerWidget(QtWidgets.QWidget):
     signal_double_click = QtCore.Signal()
     player_initialized = QtCore.Signal()  # Signal emitted when player is ready
+    player_swapped = QtCore.Signal(object, object)  # (old, new) after a gapless hand-over
+
+    # QtMultimedia setup, run in one go on first play or one step per idle slice by the warm-up
+    INIT_STEPS = ("backend", "audio_output", "media_player", "video_output", "finish")
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._seeking = False
         self._player_initialized = False  # Lazy initialization flag
         self._initializing = False  # Prevent concurrent initialization
+        self._init_step = 0  # Next entry of INIT_STEPS
         self._ready_callbacks = []
         self._video_output = None
+        # Playlist audio : l'étape video_output ne crée rien, la sortie vidéo attend le premier élément vidéo
+        self._audio_only = False
+        # Élément courant sans image : la sortie vidéo reste cachée
+        self._audio_mode = False
         self._audio_output = None
         self._video_player = None
+        self.preloader = None
         self._pending_volume = None  # Store volume until audio output is created
         self._pending_mute = None  # Store mute state until audio output is created
+        # Single position sampler shared by the slider, the time label and the resume save
+        self.clock = PlaybackClock(self)
+        self.clock.subscribe(self._on_clock_tick)
+        # Une seule recherche en cours ; les demandes suivantes se remplacent
+        self.seeker = SeekScheduler(self)
+        # Ouverture d'un élément : la reprise est appliquée avant le lancement de la lecture
+        self.loader = PlaybackLoader(self)
+        # Vignettes au survol du slider, générées hors du lecteur principal
+        self.scrub_preview = ScrubPreview(
+            CONFIG.cache_dir / "trickplay",
+            enabled=not CONFIG.preferences.get("low_power", False),
+            parent=self,
+        )
+        # Diagnostic de lecture (optionnel) : créé à la première activation
+        self.diagnostics = None
+        self.diagnostics_overlay = None
         self.setup_ui()
+        if CONFIG.preferences.get("playback_diagnostics", False):
+            self.set_diagnostics_enabled(True)
 
     def setup_ui(self):
         self.customize_self()
@@ -159,10 +206,13 @@ class PlayerWidget(QtWidgets.QWidget):
         self.slider.sliderReleased.connect(self._slider_released)
         self.slider.valueChanged.connect(self._slider_value_changed)
         self.slider.sliderClicked.connect(self._slider_clicked)
+        self.slider.hovered.connect(self._slider_hovered)
+        self.slider.hoverLeft.connect(self.scrub_preview.hide)
 
         # Keyboard shortcuts will trigger lazy init via _seek
         QtGui.QShortcut(QtCore.Qt.Key.Key_Left, self, lambda: self._seek(-10000))
         QtGui.QShortcut(QtCore.Qt.Key.Key_Right, self, lambda: self._seek(10000))
+        QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Shift+D"), self, self.toggle_diagnostics)
 
     def _ensure_player_initialized(self):
         """Lazy initialization of QtMultimedia widgets on first use."""
@@ -202,21 +252,29 @@ class PlayerWidget(QtWidgets.QWidget):
         QtCore.QTimer.singleShot(0, self._do_player_initialization)
 
     def _do_player_initialization(self):
-        """Actual initialization logic, called after timer."""
-        # Create QtMultimedia widgets (this takes ~300-3300ms depending on backend)
-        self._video_output = QtMultimediaWidgets.QVideoWidget()
-        self._audio_output = QtMultimedia.QAudioOutput()
-        self._video_player = QtMultimedia.QMediaPlayer()
+        """Actual initialization logic, called after timer: runs every remaining step."""
+        while self.run_initialization_step() is not None:
+            pass
 
-        # Connect widgets to player
-        self._video_player.setVideoOutput(self._video_output)
-        self._video_player.setAudioOutput(self._audio_output)
+    @property
+    def initialization_steps_left(self) -> int:
+        return len(self.INIT_STEPS) - self._init_step
 
-        # Connect player signals
-        self._video_player.durationChanged.connect(self._on_duration_changed)
-        self._video_player.positionChanged.connect(self._on_position_changed)
-        self._video_player.mediaStatusChanged.connect(self._on_media_status_changed)
+    def run_initialization_step(self):
+        """Exécute la prochaine étape d'initialisation ; renvoie son nom, ou None si le lecteur est prêt."""
+        if self._player_initialized:
+            return None
+        name = self.INIT_STEPS[self._init_step]
+        getattr(self, f"_init_{name}")()
+        self._init_step += 1
+        return name
 
+    def _init_backend(self):
+        # Enumerating devices loads the multimedia backend plugin (the bulk of the first-play cost)
+        QtMultimedia.QMediaDevices.defaultAudioOutput()
+
+    def _init_audio_output(self):
+        self._audio_output = QtMultimedia.QAudioOutput()
         # Apply pending volume/mute state if set
         if self._pending_volume is not None:
             self._audio_output.setVolume(self._pending_volume)
@@ -225,11 +283,41 @@ class PlayerWidget(QtWidgets.QWidget):
             self._audio_output.setMuted(self._pending_mute)
             self._pending_mute = None
 
-        # Add video output to layout (insert after placeholder)
+    def _init_media_player(self):
+        self._video_player = QtMultimedia.QMediaPlayer()
+        self._video_player.setAudioOutput(self._audio_output)
+        # Connect player signals
+        self._connect_player(self._video_player)
+        self.clock.set_player(self._video_player)
+        self.seeker.set_player(self._video_player)
+        self.loader.set_player(self._video_player)
+
+    def _init_video_output(self):
+        if self._audio_only:
+            # QVideoWidget est l'objet le plus coûteux du démarrage : inutile pour de l'audio
+            return
+        self._create_video_output()
+
+    def ensure_video_output(self):
+        """Crée la sortie vidéo à la demande, pour un élément vidéo d'une session démarrée en audio."""
+        if self._video_output is None and self._video_player is not None:
+            self._create_video_output()
+
+    def _create_video_output(self):
+        self._video_output = QtMultimediaWidgets.QVideoWidget()
+        self._video_player.setVideoOutput(self._video_output)
+        self._video_output.videoSink().videoFrameChanged.connect(self.seeker.notify_frame)
+        self._video_output.videoSink().videoFrameChanged.connect(self.loader.notify_frame)
+        # Add video output to layout (insert after placeholder), hidden until media is loaded
         placeholder_index = self.main_layout.indexOf(self.placeholder_label)
         self._video_output.setStyleSheet("background-color: #050607; border-radius: 14px;")
+        self._video_output.setVisible(False)
         self.main_layout.insertWidget(placeholder_index + 1, self._video_output, 1)
+        if self.diagnostics is not None and self.diagnostics.active:
+            self.diagnostics.tap(self._video_output.videoSink())
 
+    def _init_finish(self):
+        self.preloader = MediaPreloader(self)
         self._player_initialized = True
         self._initializing = False
 
@@ -241,6 +329,137 @@ class PlayerWidget(QtWidgets.QWidget):
         for callback in callbacks:
             QtCore.QTimer.singleShot(0, callback)
 
+    def _connect_player(self, player):
+        player.durationChanged.connect(self._on_duration_changed)
+        player.positionChanged.connect(self.clock.request_sample)
+        player.playbackStateChanged.connect(self._on_playback_state_changed)
+        player.mediaStatusChanged.connect(self._on_media_status_changed)
+        player.positionChanged.connect(self.seeker.notify_position)
+        player.hasVideoChanged.connect(self.seeker.set_frame_driven)
+        player.positionChanged.connect(self.loader.notify_position)
+
+    def _disconnect_player(self, player):
+        player.durationChanged.disconnect(self._on_duration_changed)
+        player.positionChanged.disconnect(self.clock.request_sample)
+        player.playbackStateChanged.disconnect(self._on_playback_state_changed)
+        player.mediaStatusChanged.disconnect(self._on_media_status_changed)
+        player.positionChanged.disconnect(self.seeker.notify_position)
+        player.hasVideoChanged.disconnect(self.seeker.set_frame_driven)
+        player.positionChanged.disconnect(self.loader.notify_position)
+
+    def preload_next(self, video_id: str, file_path: Path) -> bool:
+        """Précharge l'élément suivant dans le lecteur de réserve."""
+        if not self.player_ready:
+            return False
+        return self.preloader.preload(video_id, file_path)
+
+    @property
+    def preloaded_video_id(self) -> Optional[str]:
+        return self.preloader.video_id if self.preloader is not None else None
+
+    def cancel_preload(self):
+        """Ferme l'élément en réserve : le fichier n'est plus tenu ouvert (suppression, renommage sous Windows)."""
+        if self.preloader is not None:
+            self.preloader.cancel()
+
+    def set_audio_only(self, audio_only: bool):
+        """Playlist entièrement audio : l'initialisation du lecteur saute la sortie vidéo."""
+        self._audio_only = bool(audio_only)
+
+    def set_audio_title(self, title: str):
+        """Affiche le titre de la piste audio à la place de l'image."""
+        self.placeholder_label.setText(
+            f"""
+            <div style='text-align: center; padding: 36px 24px;'>
+                <div style='font-size: 42px; color: #66d46f; margin-bottom: 10px;'>♪</div>
+                <h3 style='margin: 0; color: #f5f7fa; font-size: 24px; font-weight: 700;'>{html.escape(title)}</h3>
+            </div>
+            """
+        )
+
+    def open_media(self, file_path: Path, resume_ms: int = 0, requested_at=None, audio_only: bool = False):
+        """Ouvre ``file_path`` et le lit à partir de ``resume_ms``, sans décoder le début au préalable."""
+        self._audio_mode = audio_only
+        if not audio_only:
+            self.ensure_video_output()
+        player = self._video_player
+        url = QtCore.QUrl.fromLocalFile(str(file_path))
+        # setSource ignore une source identique : le média est déjà ouvert
+        loaded = player.source() == url and player.mediaStatus() in (
+            QtMultimedia.QMediaPlayer.MediaStatus.LoadedMedia,
+            QtMultimedia.QMediaPlayer.MediaStatus.BufferingMedia,
+            QtMultimedia.QMediaPlayer.MediaStatus.BufferedMedia,
+            QtMultimedia.QMediaPlayer.MediaStatus.EndOfMedia,
+        )
+        if self.diagnostics is not None:
+            self.diagnostics.set_source(str(file_path))
+        self.loader.load(url, resume_ms, requested_at, loaded=loaded)
+
+    def swap_to_preloaded(self, video_id: str, resume_ms: int = 0, audio_only: bool = False) -> bool:
+        """Met à l'écran le lecteur de réserve s'il est amorcé pour ``video_id`` et lance la lecture.
+
+        Returns False when nothing usable was preloaded; the caller then
+        falls back to ``setSource`` on the current player.
+        """
+        if not self.player_ready:
+            return False
+        new_player = self.preloader.take(video_id)
+        if new_player is None:
+            return False
+        self._audio_mode = audio_only
+        if not audio_only:
+            self.ensure_video_output()
+        old_player = self._video_player
+        self._disconnect_player(old_player)
+        old_player.setVideoOutput(None)
+        old_player.setAudioOutput(None)
+
+        new_player.setAudioOutput(self._audio_output)
+        new_player.setVideoOutput(self._video_output)
+        self._video_player = new_player
+        self._connect_player(new_player)
+        self.clock.set_player(new_player)
+        self.seeker.set_player(new_player)
+        self.seeker.set_frame_driven(new_player.hasVideo())
+        self.loader.set_player(new_player)
+        self._on_duration_changed(new_player.duration())
+        self._show_playing_mode()
+        self.slider.setEnabled(new_player.duration() > 0)
+        self._update_scrub_preview()
+        if self.diagnostics is not None:
+            self.diagnostics.set_source(new_player.source().toLocalFile())
+        # Le lecteur de réserve est déjà chargé : reprise puis lecture
+        if resume_ms > 0:
+            new_player.setPosition(resume_ms)
+        new_player.play()
+
+        self.preloader.recycle(old_player)
+        self.player_swapped.emit(old_player, new_player)
+        return True
+
+    def set_diagnostics_enabled(self, enabled: bool):
+        """Active le diagnostic de lecture : statistiques à l'écran et journal JSONL de la session."""
+        if enabled:
+            if self.diagnostics is None:
+                self.diagnostics = PlaybackDiagnostics(CONFIG.diagnostics_dir, self)
+                self.diagnostics.set_position_source(
+                    lambda: self._video_player.position() if self._video_player is not None else 0
+                )
+                self.diagnostics_overlay = DiagnosticsOverlay(self)
+                self.diagnostics.report.connect(self.diagnostics_overlay.update_stats)
+            if self._video_output is not None:
+                self.diagnostics.tap(self._video_output.videoSink())
+            self.diagnostics.start()
+            self.diagnostics_overlay.show()
+            self.diagnostics_overlay.follow_anchor()
+        elif self.diagnostics is not None:
+            self.diagnostics.stop()
+            self.diagnostics.untap()
+            self.diagnostics_overlay.hide()
+
+    def toggle_diagnostics(self):
+        self.set_diagnostics_enabled(self.diagnostics is None or not self.diagnostics.active)
+
     @property
     def player_ready(self) -> bool:
         return self._player_initialized and self._video_player is not None
@@ -290,12 +509,18 @@ class PlayerWidget(QtWidgets.QWidget):
     def _on_duration_changed(self, duration):
         self.slider.setRange(0, duration if duration > 0 else 0)
 
-    def _on_position_changed(self, position):
+    def _on_clock_tick(self, tick: PlaybackTick):
         if not self._seeking:
             self.slider.blockSignals(True)
-            self.slider.setValue(position)
+            self.slider.setValue(tick.position)
             self.slider.blockSignals(False)
 
+    def _on_playback_state_changed(self, state):
+        if state == QtMultimedia.QMediaPlayer.PlaybackState.PlayingState:
+            self.clock.start()
+        else:
+            self.clock.stop()
+
     def _on_media_status_changed(self, status):
         if (
             status == QtMultimedia.QMediaPlayer.MediaStatus.NoMedia
@@ -304,10 +529,25 @@ class PlayerWidget(QtWidgets.QWidget):
             self._show_placeholder_mode()
             self.slider.setEnabled(False)
             self.slider.setValue(0)
+            self.scrub_preview.hide()
         else:
             self._show_playing_mode()
             if self.video_player.duration() > 0:
                 self.slider.setEnabled(True)
+            if status == QtMultimedia.QMediaPlayer.MediaStatus.LoadedMedia:
+                self._update_scrub_preview()
+                self.loader.media_loaded(self.video_player.hasVideo())
+            elif status == QtMultimedia.QMediaPlayer.MediaStatus.InvalidMedia:
+                self.loader.media_failed()
+
+    def _update_scrub_preview(self):
+        source = self.video_player.source()
+        has_frames = source.isLocalFile() and not self._audio_mode
+        self.scrub_preview.set_media(Path(source.toLocalFile()) if has_frames else None)
+
+    def _slider_hovered(self, value, global_pos):
+        if self.slider.isEnabled():
+            self.scrub_preview.show_at(value, global_pos)
 
     def _slider_pressed(self):
         self._seeking = True
@@ -315,24 +555,32 @@ class PlayerWidget(QtWidgets.QWidget):
     def _slider_released(self):
         self._seeking = False
         if self.video_player is not None:
-            self.video_player.setPosition(self.slider.value())
+            # Precise seek on release, whatever approximate seek is still in flight
+            self.seeker.request(self.slider.value(), precise=True)
 
     def _slider_value_changed(self, value):
         if self._seeking and self.video_player is not None:
-            self.video_player.setPosition(value)
+            self.seeker.request(value, precise=False)
 
     def _slider_clicked(self, value):
         if self.video_player is not None:
-            self.video_player.setPosition(value)
+            self.seeker.request(value, precise=True)
 
     def _seek(self, delta_ms):
         if not self.ensure_player_ready():
             return
-        target = self.video_player.position() + delta_ms
-        target = max(0, min(target, self.video_player.duration()))
-        self.video_player.setPosition(target)
+        # Repeated shortcuts stack on the latest requested target, not on the stale position
+        base = self.seeker.pending_target
+        if base is None:
+            base = self.video_player.position()
+        target = max(0, min(base + delta_ms, self.video_player.duration()))
+        self.seeker.request(target, precise=True)
 
     def _show_playing_mode(self):
+        if self._audio_mode:
+            # Audio : le visuel d'attente reste affiché, aucune sortie vidéo
+            self._show_placeholder_mode()
+            return
         self.placeholder_label.setVisible(False)
         if self._video_output:
             self._video_output.setVisible(True)
@@ -343,11 +591,7 @@ class PlayerWidget(QtWidgets.QWidget):
             self._video_output.setVisible(False)
 
     def position_to_hms(self, ms):
-        seconds = ms // 1000
-        h = seconds // 3600
-        m = (seconds % 3600) // 60
-        s = seconds % 60
-        return f"{h:02d}:{m:02d}:{s:02d}"
+        return format_hms(ms)
 
     def mouseDoubleClickEvent(self, event):
         self.signal_double_click.emit()
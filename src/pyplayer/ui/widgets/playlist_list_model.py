@@ -0,0 +1,207 @@
+from typing import Iterable, List, Optional, Sequence
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from src.pyplayer.app.services.playlist_registry import PlaylistHeader
+from src.pyplayer.domain.playlist import Playlist, PlaylistChange
+
+
+def format_playlist_duration(ms: int) -> str:
+    """Durée compacte pour le résumé d'une playlist (« 1 h 05 », « 12 min »)."""
+    minutes = ms // 60000
+    if minutes <= 0:
+        return "—"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours} h {minutes:02d}" if hours else f"{minutes} min"
+
+
+class PlaylistListModel(QtCore.QAbstractListModel):
+    """Modèle de la liste des playlists, rempli une fois à partir des en-têtes du registre.
+
+    Count, duration and progress are only computed when a row is painted.
+    The active playlist is followed through its change events, so its
+    summary is recomputed once per batch of changes instead of on every
+    mutation.
+    """
+
+    HeaderRole = QtCore.Qt.ItemDataRole.UserRole + 1
+    PlaylistIdRole = QtCore.Qt.ItemDataRole.UserRole + 2
+    SummaryRole = QtCore.Qt.ItemDataRole.UserRole + 3
+    ActiveRole = QtCore.Qt.ItemDataRole.UserRole + 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers: List[PlaylistHeader] = []
+        self._active_id: Optional[str] = None
+        self._watched: Optional[Playlist] = None
+
+    # --- Qt model interface ---
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._headers)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if not index.isValid() or not 0 <= row < len(self._headers):
+            return None
+        header = self._headers[row]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return header.name
+        if role == self.PlaylistIdRole:
+            return header.playlist_id
+        if role == self.ActiveRole:
+            return header.playlist_id == self._active_id
+        if role == self.SummaryRole:
+            return self.summary_of(header)
+        if role == self.HeaderRole:
+            return header
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            path = header.playlist.path
+            return str(path) if path else header.name
+        return None
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
+
+    @staticmethod
+    def summary_of(header: PlaylistHeader) -> str:
+        count = header.video_count
+        if count == 0:
+            return "Aucune vidéo"
+        videos = f"{count} vidéo" + ("s" if count > 1 else "")
+        return f"{videos}  ·  {format_playlist_duration(header.total_duration)}  ·  {round(header.progress * 100)} %"
+
+    # --- content ---
+    def set_headers(self, headers: Sequence[PlaylistHeader]):
+        self.beginResetModel()
+        self._headers = list(headers)
+        self.endResetModel()
+
+    def header_at(self, row: int) -> Optional[PlaylistHeader]:
+        if 0 <= row < len(self._headers):
+            return self._headers[row]
+        return None
+
+    def row_of(self, playlist_id: Optional[str]) -> int:
+        for row, header in enumerate(self._headers):
+            if header.playlist_id == playlist_id:
+                return row
+        return -1
+
+    def add_playlist(self, playlist: Playlist) -> bool:
+        if self.row_of(playlist.id) >= 0:
+            return False
+        row = len(self._headers)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._headers.append(PlaylistHeader(playlist))
+        self.endInsertRows()
+        return True
+
+    def remove_playlist(self, playlist_id: str) -> bool:
+        row = self.row_of(playlist_id)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._headers[row]
+        self.endRemoveRows()
+        if playlist_id == self._active_id:
+            self.set_active_playlist(None)
+        return True
+
+    def refresh_playlists(self, playlist_ids: Iterable[str]):
+        """Recalcule le résumé de ces playlists (métadonnées sondées en arrière-plan)."""
+        for playlist_id in set(playlist_ids):
+            row = self.row_of(playlist_id)
+            header = self.header_at(row)
+            if header is not None:
+                header.invalidate()
+                self._emit_row_changed(row)
+
+    # --- active playlist ---
+    def set_active_playlist(self, playlist: Optional[Playlist]):
+        if self._watched is not None:
+            self._watched.changes.unsubscribe(self._on_active_changes)
+        previous = self._active_id
+        self._active_id = playlist.id if playlist is not None else None
+        self._watched = playlist
+        if playlist is not None:
+            playlist.changes.subscribe(self._on_active_changes)
+        for playlist_id in {previous, self._active_id}:
+            self._emit_row_changed(self.row_of(playlist_id))
+
+    def _on_active_changes(self, changes: Sequence[PlaylistChange]):
+        row = self.row_of(self._active_id)
+        header = self.header_at(row)
+        if header is not None:
+            header.invalidate()
+            self._emit_row_changed(row)
+
+    def _emit_row_changed(self, row: int):
+        if 0 <= row < len(self._headers):
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [])
+
+
+class PlaylistItemDelegate(QtWidgets.QStyledItemDelegate):
+    """Peint une playlist : nom sur la première ligne, résumé (vidéos, durée, progression) dessous."""
+
+    ROW_HEIGHT = 50
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._name_font = self._make_font(13, QtGui.QFont.Weight.Normal)
+        self._active_name_font = self._make_font(13, QtGui.QFont.Weight.DemiBold)
+        self._summary_font = self._make_font(11, QtGui.QFont.Weight.Normal)
+        self._name_metrics = QtGui.QFontMetrics(self._active_name_font)
+        self._name_color = QtGui.QColor("#e8ecef")
+        self._active_name_color = QtGui.QColor("#ffffff")
+        self._summary_color = QtGui.QColor("#9aa3ab")
+        self._active_summary_color = QtGui.QColor("#4CAF50")
+
+    @staticmethod
+    def _make_font(pixel_size: int, weight: QtGui.QFont.Weight) -> QtGui.QFont:
+        font = QtGui.QFont()
+        font.setFamilies(["Segoe UI", "Arial", "sans-serif"])
+        font.setPixelSize(pixel_size)
+        font.setWeight(weight)
+        return font
+
+    def sizeHint(self, option, index) -> QtCore.QSize:
+        return QtCore.QSize(0, self.ROW_HEIGHT)
+
+    def paint(self, painter: QtGui.QPainter, option, index: QtCore.QModelIndex):
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        widget = opt.widget
+        style = widget.style() if widget is not None else QtWidgets.QApplication.style()
+        style.drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, widget)
+
+        active = bool(index.data(PlaylistListModel.ActiveRole))
+        rect = option.rect.adjusted(10, 5, -8, -5)
+        name_rect = QtCore.QRect(rect.left(), rect.top(), rect.width(), rect.height() // 2)
+        summary_rect = QtCore.QRect(rect.left(), name_rect.bottom(), rect.width(), rect.height() - name_rect.height())
+
+        painter.save()
+        painter.setFont(self._active_name_font if active else self._name_font)
+        painter.setPen(self._active_name_color if active else self._name_color)
+        name = index.data(QtCore.Qt.ItemDataRole.DisplayRole) or ""
+        painter.drawText(
+            name_rect,
+            QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter,
+            self._name_metrics.elidedText(name, QtCore.Qt.TextElideMode.ElideRight, name_rect.width()),
+        )
+        painter.setFont(self._summary_font)
+        painter.setPen(self._active_summary_color if active else self._summary_color)
+        painter.drawText(
+            summary_rect,
+            QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter,
+            index.data(PlaylistListModel.SummaryRole) or "",
+        )
+        painter.restore()
+
+
+__all__ = ["PlaylistItemDelegate", "PlaylistListModel", "format_playlist_duration"]
@@ -0,0 +1,235 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from PySide6 import QtCore, QtGui, QtMultimedia
+
+from src.pyplayer.domain.media import Video
+from src.pyplayer.infrastructure.cache import ThumbnailCache
+
+
+class PosterExtractor(QtCore.QObject):
+    """Extrait une affiche par vidéo avec un lecteur sans affichage.
+
+    One hidden QMediaPlayer (private QVideoSink, no audio output) handles
+    one file at a time: open, seek to ``POSITION_RATIO`` of the duration
+    while paused, keep the first frame decoded there. Decoding happens in
+    the backend threads; only the small scaled image is handled here.
+    Queued requests can be cancelled at any time, including the one being
+    extracted.
+    """
+
+    POSITION_RATIO = 0.10
+    FRAME_TIMEOUT_MS = 3000
+    WIDTH = 64
+    HEIGHT = 36
+    JPEG_QUALITY = 85
+
+    extracted = QtCore.Signal(str, QtGui.QImage)  # (clé, affiche)
+    failed = QtCore.Signal(str)
+
+    def __init__(self, cache: ThumbnailCache, parent=None):
+        super().__init__(parent)
+        self._cache = cache
+        self._queue: "OrderedDict[str, Path]" = OrderedDict()
+        self._sink = QtMultimedia.QVideoSink(self)
+        self._sink.videoFrameChanged.connect(self._on_frame)
+        self._player: Optional[QtMultimedia.QMediaPlayer] = None
+        self._timeout = QtCore.QTimer(self)
+        self._timeout.setSingleShot(True)
+        self._timeout.setInterval(self.FRAME_TIMEOUT_MS)
+        self._timeout.timeout.connect(self._on_timeout)
+        self._key: Optional[str] = None
+        self._target_ms = -1
+
+    @property
+    def current_key(self) -> Optional[str]:
+        return self._key
+
+    def is_pending(self, key: str) -> bool:
+        return key == self._key or key in self._queue
+
+    def request(self, key: str, file_path: Path):
+        if self.is_pending(key):
+            return
+        self._queue[key] = file_path
+        if self._key is None:
+            QtCore.QTimer.singleShot(0, self._next)
+
+    def cancel(self, key: str):
+        self._queue.pop(key, None)
+        if key == self._key:
+            self._abort()
+            QtCore.QTimer.singleShot(0, self._next)
+
+    def cancel_all(self):
+        self._queue.clear()
+        if self._key is not None:
+            self._abort()
+
+    def _next(self):
+        if self._key is not None or not self._queue:
+            return
+        key, file_path = self._queue.popitem(last=False)
+        if self._player is None:
+            self._player = QtMultimedia.QMediaPlayer(self)
+            self._player.setVideoOutput(self._sink)
+            self._player.mediaStatusChanged.connect(self._on_media_status_changed)
+        self._key = key
+        self._target_ms = -1
+        self._timeout.start()
+        self._player.setSource(QtCore.QUrl.fromLocalFile(str(file_path)))
+
+    def _abort(self):
+        self._timeout.stop()
+        self._key = None
+        self._target_ms = -1
+        if self._player is not None:
+            self._player.stop()
+            self._player.setSource(QtCore.QUrl())
+
+    def _finish(self, image: Optional[QtGui.QImage]):
+        key = self._key
+        self._abort()
+        if image is None:
+            self.failed.emit(key)
+        else:
+            path = self._cache.prepare(key)
+            if path is not None:
+                image.save(str(path), "JPG", self.JPEG_QUALITY)
+            self.extracted.emit(key, image)
+        QtCore.QTimer.singleShot(0, self._next)
+
+    def _on_media_status_changed(self, status):
+        if self._key is None or self._target_ms >= 0:
+            return
+        if status == QtMultimedia.QMediaPlayer.MediaStatus.LoadedMedia:
+            if not self._player.hasVideo():
+                self._finish(None)
+                return
+            self._target_ms = int(self._player.duration() * self.POSITION_RATIO)
+            self._player.pause()
+            self._player.setPosition(self._target_ms)
+        elif status == QtMultimedia.QMediaPlayer.MediaStatus.InvalidMedia:
+            self._finish(None)
+
+    def _on_frame(self, frame: QtMultimedia.QVideoFrame):
+        if self._key is None or self._target_ms < 0 or not frame.isValid():
+            return
+        # La première image décodée après setSource précède la recherche
+        if frame.startTime() >= 0 and frame.startTime() < (self._target_ms - 1000) * 1000:
+            return
+        image = frame.toImage()
+        if image.isNull():
+            return
+        self._finish(
+            image.scaled(
+                self.WIDTH,
+                self.HEIGHT,
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                QtCore.Qt.TransformationMode.SmoothTransformation,
+            )
+        )
+
+    def _on_timeout(self):
+        if self._key is not None:
+            self._finish(None)
+
+
+class PosterProvider(QtCore.QObject):
+    """Fournit les affiches des lignes visibles : mémoire, puis disque, puis extraction.
+
+    ``pixmap()`` only answers from the in-memory LRU, so painting never
+    touches the disk or the decoder. ``request_visible()`` is called with the
+    rows on screen: disk hits are loaded right away, misses are queued for
+    extraction, and queued rows that scrolled away are cancelled.
+    ``poster_ready`` tells the view which row to repaint.
+    """
+
+    PIXMAP_CACHE_SIZE = 512
+
+    poster_ready = QtCore.Signal(str)  # identifiant de la vidéo
+
+    def __init__(self, cache_dir: Path, enabled: bool = True, parent=None):
+        super().__init__(parent)
+        self._cache = ThumbnailCache(cache_dir)
+        self._enabled = enabled
+        self._pixmaps: "OrderedDict[str, QtGui.QPixmap]" = OrderedDict()
+        self._failed: set = set()
+        self._wanted: Dict[str, Path] = {}
+        # Les affiches suivent le contenu du fichier (Video.content_key), la vue parle en identifiants
+        self._content_keys: Dict[str, str] = {}
+        self._video_ids: Dict[str, str] = {}
+        self._extractor: Optional[PosterExtractor] = None
+
+    def pixmap(self, video_id: str) -> Optional[QtGui.QPixmap]:
+        key = self._content_keys.get(video_id)
+        pixmap = self._pixmaps.get(key) if key is not None else None
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def request_visible(self, videos: Iterable[Video]):
+        wanted: Dict[str, Path] = {}
+        for video in videos:
+            if video.is_audio:
+                continue  # pas d'image à extraire
+            key = video.content_key
+            previous = self._content_keys.get(video.id)
+            if previous != key:
+                self._video_ids.pop(previous, None)
+                self._content_keys[video.id] = key
+                self._video_ids[key] = video.id
+            if key in self._pixmaps:
+                self._pixmaps.move_to_end(key)
+            elif key not in self._failed and not self._load(key):
+                wanted[key] = video.file_path
+        if self._extractor is not None:
+            for key in set(self._wanted) - set(wanted):
+                self._extractor.cancel(key)
+        self._wanted = wanted
+        if wanted and self._enabled:
+            extractor = self._ensure_extractor()
+            for key, file_path in wanted.items():
+                extractor.request(key, file_path)
+
+    def clear(self):
+        if self._extractor is not None:
+            self._extractor.cancel_all()
+        self._wanted = {}
+
+    def _load(self, key: str) -> bool:
+        path = self._cache.lookup(key)
+        if path is None:
+            return False
+        pixmap = QtGui.QPixmap(str(path))
+        if pixmap.isNull():
+            self._cache.discard(key)
+            return False
+        self._store(key, pixmap)
+        return True
+
+    def _store(self, key: str, pixmap: QtGui.QPixmap):
+        self._pixmaps[key] = pixmap
+        while len(self._pixmaps) > self.PIXMAP_CACHE_SIZE:
+            self._pixmaps.popitem(last=False)
+        self.poster_ready.emit(self._video_ids.get(key, key))
+
+    def _ensure_extractor(self) -> PosterExtractor:
+        if self._extractor is None:
+            self._extractor = PosterExtractor(self._cache, self)
+            self._extractor.extracted.connect(self._on_extracted)
+            self._extractor.failed.connect(self._on_failed)
+        return self._extractor
+
+    def _on_extracted(self, key: str, image: QtGui.QImage):
+        self._wanted.pop(key, None)
+        self._store(key, QtGui.QPixmap.fromImage(image))
+
+    def _on_failed(self, key: str):
+        # Audio, fichier illisible : pas de nouvelle tentative pendant la session
+        self._wanted.pop(key, None)
+        self._failed.add(key)
+
+
+__all__ = ["PosterExtractor", "PosterProvider"]
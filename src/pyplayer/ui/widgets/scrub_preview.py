@@ -0,0 +1,261 @@
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PySide6 import QtCore, QtGui, QtMultimedia, QtWidgets
+
+from src.pyplayer.domain.media.video import stat_media_key
+from src.pyplayer.infrastructure.cache import SpriteSheetCache, SpriteSheetInfo
+
+
+class TrickplayGenerator(QtCore.QObject):
+    """Génère la planche de vignettes d'une vidéo avec un lecteur d'arrière-plan.
+
+    A hidden QMediaPlayer (private QVideoSink, no audio output) is paused and
+    sought to one position per tile; each decoded frame is scaled into its
+    cell of the sheet. Seeks are chained one at a time, one per event-loop
+    turn, and a tile whose frame never arrives stays black. The finished
+    sheet is written to the disk cache, geometry sidecar last.
+    """
+
+    TILE_WIDTH = 160
+    TILE_HEIGHT = 90
+    COLUMNS = 10
+    MAX_TILES = 100
+    MIN_INTERVAL_MS = 2000
+    FRAME_TIMEOUT_MS = 2000
+    JPEG_QUALITY = 80
+
+    finished = QtCore.Signal(str)  # clé de cache de la planche écrite
+
+    def __init__(self, cache: SpriteSheetCache, parent=None):
+        super().__init__(parent)
+        self._cache = cache
+        self._sink = QtMultimedia.QVideoSink(self)
+        self._sink.videoFrameChanged.connect(self._on_frame)
+        self._player: Optional[QtMultimedia.QMediaPlayer] = None
+        self._timeout = QtCore.QTimer(self)
+        self._timeout.setSingleShot(True)
+        self._timeout.setInterval(self.FRAME_TIMEOUT_MS)
+        self._timeout.timeout.connect(self._on_frame_timeout)
+        self._key: Optional[str] = None
+        self._info: Optional[SpriteSheetInfo] = None
+        self._sheet: Optional[QtGui.QImage] = None
+        self._index = 0
+        self._waiting = False
+        self._started_at = 0.0
+        # Durée de génération de la dernière planche
+        self.last_duration_ms: Optional[float] = None
+
+    @property
+    def busy(self) -> bool:
+        return self._key is not None
+
+    def generate(self, key: str, file_path: Path) -> bool:
+        """Lance la génération pour ``file_path`` ; abandonne la génération en cours."""
+        if key == self._key:
+            return False
+        self.cancel()
+        if self._player is None:
+            self._player = QtMultimedia.QMediaPlayer(self)
+            self._player.setVideoOutput(self._sink)
+            self._player.mediaStatusChanged.connect(self._on_media_status_changed)
+        self._key = key
+        self._started_at = time.perf_counter()
+        self._player.setSource(QtCore.QUrl.fromLocalFile(str(file_path)))
+        return True
+
+    def cancel(self):
+        self._timeout.stop()
+        self._key = None
+        self._info = None
+        self._sheet = None
+        self._waiting = False
+        if self._player is not None:
+            self._player.stop()
+            self._player.setSource(QtCore.QUrl())
+
+    def _on_media_status_changed(self, status):
+        if self._key is None or self._info is not None:
+            return
+        if status == QtMultimedia.QMediaPlayer.MediaStatus.LoadedMedia:
+            duration = self._player.duration()
+            if not self._player.hasVideo() or duration <= 0:
+                self.cancel()
+                return
+            interval = max(self.MIN_INTERVAL_MS, -(-duration // self.MAX_TILES))
+            self._info = SpriteSheetInfo(
+                interval_ms=interval,
+                count=duration // interval + 1,
+                columns=self.COLUMNS,
+                tile_width=self.TILE_WIDTH,
+                tile_height=self.TILE_HEIGHT,
+            )
+            width, height = self._info.sheet_size
+            self._sheet = QtGui.QImage(width, height, QtGui.QImage.Format.Format_RGB32)
+            self._sheet.fill(QtGui.QColor("#050607"))
+            self._index = 0
+            self._player.pause()
+            self._request_tile()
+        elif status == QtMultimedia.QMediaPlayer.MediaStatus.InvalidMedia:
+            self.cancel()
+
+    def _request_tile(self):
+        if self._info is None:
+            return
+        self._waiting = True
+        self._timeout.start()
+        self._player.setPosition(self._index * self._info.interval_ms)
+
+    def _on_frame(self, frame: QtMultimedia.QVideoFrame):
+        if not self._waiting or not frame.isValid():
+            return
+        # Ignore une image décodée avant que la recherche n'aboutisse
+        target_us = self._index * self._info.interval_ms * 1000
+        if frame.startTime() >= 0 and abs(frame.startTime() - target_us) > self._info.interval_ms * 1000:
+            return
+        self._waiting = False
+        self._timeout.stop()
+        image = frame.toImage()
+        if not image.isNull():
+            self._paint_tile(image)
+        self._advance()
+
+    def _on_frame_timeout(self):
+        self._waiting = False
+        self._advance()
+
+    def _paint_tile(self, image: QtGui.QImage):
+        x, y, width, height = self._info.tile_rect(self._index)
+        scaled = image.scaled(
+            width,
+            height,
+            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation,
+        )
+        painter = QtGui.QPainter(self._sheet)
+        painter.drawImage(x + (width - scaled.width()) // 2, y + (height - scaled.height()) // 2, scaled)
+        painter.end()
+
+    def _advance(self):
+        self._index += 1
+        if self._index >= self._info.count:
+            self._save()
+        else:
+            # Une recherche par tour de boucle : l'interface garde la main
+            QtCore.QTimer.singleShot(0, self._request_tile)
+
+    def _save(self):
+        key, info, sheet = self._key, self._info, self._sheet
+        self.cancel()
+        sheet_path = self._cache.sheet_path(key)
+        sheet_path.parent.mkdir(parents=True, exist_ok=True)
+        if not sheet.save(str(sheet_path), "JPG", self.JPEG_QUALITY) or not self._cache.store_info(key, info):
+            self._cache.discard(key)
+            return
+        self.last_duration_ms = (time.perf_counter() - self._started_at) * 1000
+        self.finished.emit(key)
+
+
+class ScrubPreview(QtCore.QObject):
+    """Aperçu au survol de la barre de progression.
+
+    Sheets come from the disk cache (keyed by path, size and mtime) or, when
+    missing, from a ``TrickplayGenerator`` started a few seconds after the
+    media loads. Decoded sheets stay in a small LRU of pixmaps, so a hover
+    only copies one tile and never touches the main player.
+    """
+
+    PIXMAP_CACHE_SIZE = 8
+    GENERATION_DELAY_MS = 3000
+    POPUP_MARGIN = 12
+
+    def __init__(self, cache_dir: Path, enabled: bool = True, parent: Optional[QtWidgets.QWidget] = None):
+        super().__init__(parent)
+        self._cache = SpriteSheetCache(cache_dir)
+        self._enabled = enabled
+        self._generator: Optional[TrickplayGenerator] = None
+        self._pixmaps: "OrderedDict[str, Tuple[QtGui.QPixmap, SpriteSheetInfo]]" = OrderedDict()
+        self._key: Optional[str] = None
+        self._file_path: Optional[Path] = None
+        self._delay = QtCore.QTimer(self)
+        self._delay.setSingleShot(True)
+        self._delay.setInterval(self.GENERATION_DELAY_MS)
+        self._delay.timeout.connect(self._start_generation)
+        self._popup = QtWidgets.QLabel(parent, QtCore.Qt.WindowType.ToolTip)
+        self._popup.setStyleSheet("border: 1px solid #4CAF50; background-color: #050607;")
+        self._popup.hide()
+
+    @property
+    def has_sheet(self) -> bool:
+        return self._key is not None and self._key in self._pixmaps
+
+    def set_media(self, file_path: Optional[Path]):
+        """Associe l'aperçu au média chargé ; lance la génération si aucune planche n'existe."""
+        key = stat_media_key(file_path) if file_path else None
+        if key == self._key:
+            return
+        self.hide()
+        self._delay.stop()
+        self._key = key
+        self._file_path = Path(file_path) if key else None
+        if key is None or self._load(key):
+            return
+        if self._enabled:
+            self._delay.start()
+
+    def clear(self):
+        self.set_media(None)
+        if self._generator is not None:
+            self._generator.cancel()
+
+    def show_at(self, position_ms: int, global_pos: QtCore.QPoint) -> bool:
+        """Affiche la vignette la plus proche de ``position_ms`` au-dessus de ``global_pos``."""
+        entry = self._pixmaps.get(self._key) if self._key else None
+        if entry is None:
+            self.hide()
+            return False
+        self._pixmaps.move_to_end(self._key)
+        pixmap, info = entry
+        x, y, width, height = info.tile_rect(info.tile_index(position_ms))
+        self._popup.setPixmap(pixmap.copy(x, y, width, height))
+        self._popup.resize(width, height)
+        self._popup.move(global_pos.x() - width // 2, global_pos.y() - height - self.POPUP_MARGIN)
+        self._popup.show()
+        return True
+
+    def hide(self):
+        self._popup.hide()
+
+    def _load(self, key: str) -> bool:
+        if key in self._pixmaps:
+            self._pixmaps.move_to_end(key)
+            return True
+        found = self._cache.lookup(key)
+        if found is None:
+            return False
+        sheet_path, info = found
+        pixmap = QtGui.QPixmap(str(sheet_path))
+        if pixmap.isNull():
+            self._cache.discard(key)
+            return False
+        self._pixmaps[key] = (pixmap, info)
+        while len(self._pixmaps) > self.PIXMAP_CACHE_SIZE:
+            self._pixmaps.popitem(last=False)
+        return True
+
+    def _start_generation(self):
+        if self._key is None:
+            return
+        if self._generator is None:
+            self._generator = TrickplayGenerator(self._cache, self)
+            self._generator.finished.connect(self._on_generated)
+        self._generator.generate(self._key, self._file_path)
+
+    def _on_generated(self, key: str):
+        if key == self._key:
+            self._load(key)
+
+
+__all__ = ["ScrubPreview", "TrickplayGenerator"]
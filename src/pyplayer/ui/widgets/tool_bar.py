@@ -510,11 +510,16 @@ class TimeLabelWidget(QtWidgets.QLabel):
         )
 
     def set_times(self, current_time=None, total_time=None):
-        if current_time:
+        changed = False
+        if current_time and current_time != self.current_time:
             self.current_time = current_time
-        if total_time:
+            changed = True
+        if total_time and total_time != self.total_time:
             self.total_time = total_time
-        self.update_display()
+            changed = True
+        # Le texte riche n'est reconstruit que si l'affichage change
+        if changed:
+            self.update_display()
 
 
 class PlaylistButtonWidget(QtWidgets.QPushButton):
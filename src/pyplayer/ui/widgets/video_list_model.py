@@ -0,0 +1,582 @@
+import bisect
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from src.pyplayer.domain.media import Video
+from src.pyplayer.domain.playlist import Playlist, PlaylistChange, PlaylistChangeKind
+from src.pyplayer.shared.text import fold_text
+
+
+class VideoListModel(QtCore.QAbstractListModel):
+    """Modèle de liste des vidéos, alimenté directement par une Playlist.
+
+    The model keeps a list of references to the playlist's videos, which it
+    uses to replay each batch of playlist change events through the matching
+    begin*/end* calls. No widget is created per row: painting is left to
+    ``VideoItemDelegate``.
+
+    Rows are exposed to the view page by page (``canFetchMore``/``fetchMore``)
+    so binding a huge playlist costs one page. The rest is exposed in the
+    background, in chunks that double each timer slice.
+
+    An optional filter maps view rows onto playlist rows. Matches come from
+    a substring scan of each video's folded name, and a query that only
+    narrows the previous one rescans the previous matches only.
+    """
+
+    VideoRole = QtCore.Qt.ItemDataRole.UserRole + 1
+    VideoIdRole = QtCore.Qt.ItemDataRole.UserRole + 2
+    ProgressRole = QtCore.Qt.ItemDataRole.UserRole + 3
+    StateRole = QtCore.Qt.ItemDataRole.UserRole + 4
+    PositionRole = QtCore.Qt.ItemDataRole.UserRole + 5
+
+    PAGE_SIZE = 200
+    MATERIALIZE_INTERVAL_MS = 16
+    KEY_CHUNK_SIZE = 10_000
+
+    STATE_NORMAL = "normal"
+    STATE_CURRENT = "current"
+    STATE_READ = "read"
+
+    currentVideoChanged = QtCore.Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._playlist: Optional[Playlist] = None
+        self._videos: List[Video] = []
+        self._keys: List[Optional[str]] = []
+        self._keys_cursor = 0
+        self._row_index: Dict[str, int] = {}
+        self._row_index_valid = True
+        self._current_id: Optional[str] = None
+        self._current_row_hint = -1
+        self._read_ids: Set[str] = set()
+        self._exposed = 0
+        self._filter_terms: Tuple[str, ...] = ()
+        self._filter_rows: Optional[List[int]] = None
+
+        self._materialize_timer = QtCore.QTimer(self)
+        self._materialize_timer.setInterval(self.MATERIALIZE_INTERVAL_MS)
+        self._materialize_timer.timeout.connect(self._materialize_step)
+
+    # --- binding ---
+    @property
+    def playlist(self) -> Optional[Playlist]:
+        return self._playlist
+
+    def set_playlist(self, playlist: Optional[Playlist]):
+        if self._playlist is not None:
+            self._playlist.changes.unsubscribe(self.apply_changes)
+        if playlist is not self._playlist:
+            self._filter_terms = ()
+            self._filter_rows = None
+        self._reload(playlist)
+        if playlist is not None:
+            playlist.changes.subscribe(self.apply_changes)
+
+    def _reload(self, playlist: Optional[Playlist]):
+        self.beginResetModel()
+        self._playlist = playlist
+        self._videos = list(playlist.videos) if playlist is not None else []
+        self._keys = [None] * len(self._videos)
+        self._keys_cursor = 0
+        self._invalidate_rows()
+        self._read_ids.clear()
+        current = playlist.current_video if playlist is not None else None
+        self._current_id = current.id if current is not None else None
+        current_row = playlist.current_index if current is not None else -1
+        self._current_row_hint = current_row
+        if self._filter_terms:
+            self._filter_rows = self._match_rows(self._filter_terms)
+        # First page, plus whatever it takes to show the current video.
+        current_view_row = self._view_row(current_row)
+        self._exposed = min(self._visible_count(), max(self.PAGE_SIZE, current_view_row + self.PAGE_SIZE))
+        self.endResetModel()
+        self._schedule_materialization()
+
+    # --- Qt model interface ---
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._exposed
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()) -> bool:
+        return not parent.isValid() and self._exposed < self._visible_count()
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            self._expose(self.PAGE_SIZE)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if not index.isValid() or not 0 <= row < self._exposed:
+            return None
+        source = self._source_row(row)
+        video = self._videos[source]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return video.name
+        if role == self.PositionRole:
+            return source + 1
+        if role == self.VideoIdRole:
+            return video.id
+        if role == self.ProgressRole:
+            return video.progress
+        if role == self.StateRole:
+            return self.state_of(video.id)
+        if role == self.VideoRole:
+            return video
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return str(video.file_path)
+        return None
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
+
+    # --- paging ---
+    @property
+    def is_fully_exposed(self) -> bool:
+        return self._exposed >= self._visible_count()
+
+    @property
+    def visible_count(self) -> int:
+        """Nombre de lignes une fois tout exposé (filtre compris)."""
+        return self._visible_count()
+
+    def _visible_count(self) -> int:
+        return len(self._filter_rows) if self._filter_rows is not None else len(self._videos)
+
+    def _expose(self, count: int):
+        last = min(self._visible_count(), self._exposed + count) - 1
+        if last < self._exposed:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._exposed, last)
+        self._exposed = last + 1
+        self.endInsertRows()
+
+    def ensure_row_exposed(self, row: int):
+        if row >= self._exposed:
+            self._expose(row - self._exposed + self.PAGE_SIZE)
+
+    def _schedule_materialization(self):
+        if self.is_fully_exposed and self._keys_cursor >= len(self._keys):
+            self._materialize_timer.stop()
+        elif not self._materialize_timer.isActive():
+            self._materialize_timer.start()
+
+    def _materialize_step(self):
+        if not self.is_fully_exposed:
+            # Doubling keeps the number of view relayouts logarithmic in the playlist size.
+            self._expose(max(self.PAGE_SIZE, self._exposed))
+            return
+        # Every row is shown: use the remaining slices to precompute the filter keys.
+        end = min(len(self._keys), self._keys_cursor + self.KEY_CHUNK_SIZE)
+        self._fill_keys(self._keys_cursor, end)
+        self._keys_cursor = end
+        if end >= len(self._keys):
+            self._materialize_timer.stop()
+
+    # --- row mapping ---
+    def _source_row(self, row: int) -> int:
+        rows = self._filter_rows
+        return rows[row] if rows is not None else row
+
+    def _view_row(self, source: int) -> int:
+        rows = self._filter_rows
+        if rows is None or source < 0:
+            return source
+        position = bisect.bisect_left(rows, source)
+        return position if position < len(rows) and rows[position] == source else -1
+
+    # --- filtering ---
+    @property
+    def is_filtered(self) -> bool:
+        return self._filter_rows is not None
+
+    def set_filter(self, text: str) -> int:
+        """Ne garde que les vidéos dont le nom contient tous les termes saisis ; renvoie le nombre de lignes."""
+        terms = tuple(fold_text(text).split())
+        if terms == self._filter_terms:
+            return self._visible_count()
+        narrowing = self._filter_rows is not None and self._refines(self._filter_terms, terms)
+        candidates = self._filter_rows if narrowing else None
+
+        self.beginResetModel()
+        self._filter_terms = terms
+        self._filter_rows = self._match_rows(terms, candidates) if terms else None
+        self._exposed = min(self._visible_count(), self.PAGE_SIZE)
+        self.endResetModel()
+        self._schedule_materialization()
+        return self._visible_count()
+
+    def _refresh_filter(self):
+        self.beginResetModel()
+        self._filter_rows = self._match_rows(self._filter_terms)
+        self._exposed = min(self._visible_count(), max(self.PAGE_SIZE, self._exposed))
+        self.endResetModel()
+        self._schedule_materialization()
+
+    @staticmethod
+    def _refines(previous: Tuple[str, ...], terms: Tuple[str, ...]) -> bool:
+        # Every old term still has to match inside some new term: the new matches are a subset.
+        return bool(previous) and all(any(old in term for term in terms) for old in previous)
+
+    def _match_rows(self, terms: Tuple[str, ...], candidates: Optional[List[int]] = None) -> List[int]:
+        self._ensure_keys()
+        keys = self._keys
+        if len(terms) == 1:
+            term = terms[0]
+            if candidates is None:
+                return [row for row, key in enumerate(keys) if term in key]
+            return [row for row in candidates if term in keys[row]]
+        rows = range(len(keys)) if candidates is None else candidates
+        return [row for row in rows if all(term in keys[row] for term in terms)]
+
+    def _fill_keys(self, start: int, end: int):
+        keys, videos = self._keys, self._videos
+        for row in range(start, end):
+            if keys[row] is None:
+                keys[row] = videos[row].search_key
+
+    def _ensure_keys(self):
+        if None in self._keys:
+            self._fill_keys(0, len(self._keys))
+
+    # --- lookups ---
+    def video_at(self, row: int) -> Optional[Video]:
+        """Vidéo affichée à une ligne de la vue (filtre compris)."""
+        if 0 <= row < self._visible_count():
+            return self._videos[self._source_row(row)]
+        return None
+
+    def row_of(self, video_id: Optional[str], hint: int = -1) -> int:
+        """Ligne de la vue d'une vidéo, ``-1`` si elle est filtrée ou absente ; ``hint`` est une ligne de playlist."""
+        return self._view_row(self._playlist_row_of(video_id, hint))
+
+    def _playlist_row_of(self, video_id: Optional[str], hint: int = -1) -> int:
+        if not video_id:
+            return -1
+        if 0 <= hint < len(self._videos) and self._videos[hint].id == video_id:
+            return hint
+        if not self._row_index_valid:
+            self._row_index = {video.id: row for row, video in enumerate(self._videos)}
+            self._row_index_valid = True
+        return self._row_index.get(video_id, -1)
+
+    def state_of(self, video_id: str) -> str:
+        if video_id == self._current_id:
+            return self.STATE_CURRENT
+        if video_id in self._read_ids:
+            return self.STATE_READ
+        return self.STATE_NORMAL
+
+    def _invalidate_rows(self):
+        self._row_index_valid = False
+
+    def _emit_row_changed(self, row: int, roles: Sequence[int] = ()):
+        if 0 <= row < self._exposed:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, list(roles))
+
+    # --- current / read state ---
+    def set_current_video(self, video_id: Optional[str], row_hint: int = -1) -> bool:
+        if row_hint < 0 and self._playlist is not None:
+            row_hint = self._playlist.current_index
+        source = self._playlist_row_of(video_id, row_hint)
+        new_id = video_id if source >= 0 else None
+        if new_id == self._current_id:
+            return source >= 0
+
+        previous = self._current_id
+        if previous is not None:
+            self._read_ids.add(previous)
+            self._emit_row_changed(self.row_of(previous, self._current_row_hint), [self.StateRole])
+
+        self._current_id = new_id
+        self._current_row_hint = source
+        row = self._view_row(source)
+        if new_id is not None:
+            self._read_ids.discard(new_id)
+            if row >= 0:
+                self.ensure_row_exposed(row)
+                self._emit_row_changed(row, [self.StateRole])
+        self.currentVideoChanged.emit(row)
+        return source >= 0
+
+    def refresh_video(self, video_id: str):
+        self._emit_row_changed(self.row_of(video_id), [self.ProgressRole])
+
+    # --- playlist change events ---
+    def apply_changes(self, changes: Sequence[PlaylistChange]):
+        """Rejoue un lot de changements de la playlist sous forme de signaux de modèle."""
+        for change in changes:
+            if not self._apply_change(change):
+                # Out of sync (should not happen): fall back to a full reset.
+                self._reload(self._playlist)
+                return
+
+    def _apply_change(self, change: PlaylistChange) -> bool:
+        kind = change.kind
+        size = len(self._videos)
+
+        if kind is PlaylistChangeKind.RESET:
+            self._reload(self._playlist)
+            return True
+
+        if kind is PlaylistChangeKind.ROWS_INSERTED:
+            if not 0 <= change.first <= size or len(change.videos) != change.count:
+                return False
+        elif kind is PlaylistChangeKind.ROWS_REMOVED:
+            if not 0 <= change.first <= change.last < size:
+                return False
+        elif kind is PlaylistChangeKind.ROW_MOVED:
+            if not (0 <= change.first < size and 0 <= change.destination < size):
+                return False
+
+        if kind.is_structural and self._filter_rows is not None:
+            # Filtered rows cannot be shifted in place: update the mirror, then match again.
+            self._mirror_change(change)
+            self._refresh_filter()
+        elif kind is PlaylistChangeKind.ROWS_INSERTED:
+            self._insert_rows(change.first, change.videos)
+        elif kind is PlaylistChangeKind.ROWS_REMOVED:
+            self._remove_rows(change.first, change.last)
+        elif kind is PlaylistChangeKind.ROW_MOVED:
+            if change.first != change.destination:
+                self._move_row(change.first, change.destination)
+        elif kind in (PlaylistChangeKind.PROGRESS_CHANGED, PlaylistChangeKind.METADATA_CHANGED):
+            if change.first >= 0:
+                self._emit_rows_changed(change.first, change.last)
+        elif kind is PlaylistChangeKind.CURRENT_CHANGED:
+            video = self._videos[change.first] if 0 <= change.first < size else None
+            self.set_current_video(video.id if video is not None else None, change.first)
+        return True
+
+    def _emit_rows_changed(self, first: int, last: int):
+        if self._filter_rows is None:
+            last = min(last, self._exposed - 1)
+            if first <= last:
+                self.dataChanged.emit(self.index(first, 0), self.index(last, 0), [])
+            return
+        for source in range(first, last + 1):
+            self._emit_row_changed(self._view_row(source))
+
+    # Rows past ``_exposed`` are only mirrored: the view learns about them when they are fetched.
+    def _mirror_change(self, change: PlaylistChange):
+        if change.kind is PlaylistChangeKind.ROWS_INSERTED:
+            self._mirror_insert(change.first, change.videos)
+        elif change.kind is PlaylistChangeKind.ROWS_REMOVED:
+            self._mirror_remove(change.first, change.last)
+        elif change.kind is PlaylistChangeKind.ROW_MOVED:
+            self._mirror_move(change.first, change.destination)
+
+    def _mirror_insert(self, first: int, videos: Sequence[Video]):
+        self._videos[first:first] = videos
+        self._keys[first:first] = [None] * len(videos)
+        self._invalidate_rows()
+
+    def _mirror_remove(self, first: int, last: int):
+        for video in self._videos[first:last + 1]:
+            self._read_ids.discard(video.id)
+            if video.id == self._current_id:
+                self._current_id = None
+        del self._videos[first:last + 1]
+        del self._keys[first:last + 1]
+        self._invalidate_rows()
+
+    def _mirror_move(self, source: int, destination: int):
+        self._videos.insert(destination, self._videos.pop(source))
+        self._keys.insert(destination, self._keys.pop(source))
+        self._invalidate_rows()
+
+    def _insert_rows(self, first: int, videos: Sequence[Video]):
+        visible = first < self._exposed or self.is_fully_exposed
+        if not visible:
+            self._mirror_insert(first, videos)
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(videos) - 1)
+        self._mirror_insert(first, videos)
+        self._exposed += len(videos)
+        self.endInsertRows()
+
+    def _remove_rows(self, first: int, last: int):
+        visible_last = min(last, self._exposed - 1)
+        if first > visible_last:
+            self._mirror_remove(first, last)
+            return
+        self.beginRemoveRows(QtCore.QModelIndex(), first, visible_last)
+        self._mirror_remove(first, last)
+        self._exposed -= visible_last - first + 1
+        self.endRemoveRows()
+
+    def _move_row(self, source: int, destination: int):
+        root = QtCore.QModelIndex()
+        source_visible = source < self._exposed
+        destination_visible = destination < self._exposed
+        if source_visible and destination_visible:
+            # Qt expects the row *before which* the moved row lands, in pre-move numbering.
+            target = destination + 1 if destination > source else destination
+            self.beginMoveRows(root, source, source, root, target)
+        elif source_visible:
+            self.beginRemoveRows(root, source, source)
+        elif destination_visible:
+            self.beginInsertRows(root, destination, destination)
+
+        self._mirror_move(source, destination)
+
+        if source_visible and destination_visible:
+            self.endMoveRows()
+        elif source_visible:
+            self._exposed -= 1
+            self.endRemoveRows()
+        elif destination_visible:
+            self._exposed += 1
+            self.endInsertRows()
+
+
+class VideoItemDelegate(QtWidgets.QStyledItemDelegate):
+    """Peint une ligne vidéo : affiche, index, nom et barre de progression, selon l'état."""
+
+    SEPARATOR_ICON = "➤"
+    ROW_HEIGHT = 50
+    NORMAL_MARGIN = 6
+    SELECTED_MARGIN = 9
+    POSTER_WIDTH = 64
+    POSTER_SPACING = 8
+    POSTER_PLACEHOLDER = "#1c2024"
+
+    # state -> (text pixel size, text weight, text color, progress pixel size, progress weight, progress color)
+    STATE_STYLES = {
+        VideoListModel.STATE_NORMAL: (12, QtGui.QFont.Weight.Normal, "#e8ecef", 12, QtGui.QFont.Weight.Medium, "#4CAF50"),
+        VideoListModel.STATE_CURRENT: (13, QtGui.QFont.Weight.DemiBold, "#ffffff", 16, QtGui.QFont.Weight.DemiBold, "#4CAF50"),
+        VideoListModel.STATE_READ: (12, QtGui.QFont.Weight.Normal, "#a5d6a7", 14, QtGui.QFont.Weight.Medium, "#81C784"),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Fournisseur d'affiches (PosterProvider) ; sans lui, la ligne n'a pas de colonne d'affiche.
+        self.poster_provider = None
+        self._styles = {}
+        for state, (text_px, text_weight, text_color, bar_px, bar_weight, bar_color) in self.STATE_STYLES.items():
+            text_font = self._make_font(text_px, text_weight)
+            bar_font = self._make_font(bar_px, bar_weight)
+            self._styles[state] = (
+                text_font,
+                QtGui.QFontMetrics(text_font),
+                QtGui.QColor(text_color),
+                bar_font,
+                QtGui.QColor(bar_color),
+                # The bar is always ten glyphs wide: measure it once per state.
+                QtGui.QFontMetrics(bar_font).horizontalAdvance("▰" * 10),
+            )
+
+    @staticmethod
+    def _make_font(pixel_size: int, weight: QtGui.QFont.Weight) -> QtGui.QFont:
+        font = QtGui.QFont()
+        font.setFamilies(["Segoe UI", "Arial", "sans-serif"])
+        font.setPixelSize(pixel_size)
+        font.setWeight(weight)
+        return font
+
+    def sizeHint(self, option, index) -> QtCore.QSize:
+        return QtCore.QSize(0, self.ROW_HEIGHT)
+
+    def paint(self, painter: QtGui.QPainter, option, index: QtCore.QModelIndex):
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        widget = opt.widget
+        style = widget.style() if widget is not None else QtWidgets.QApplication.style()
+        # Background, hover and selection come from the view's style sheet.
+        style.drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, widget)
+
+        state = index.data(VideoListModel.StateRole) or VideoListModel.STATE_NORMAL
+        text_font, text_metrics, text_color, bar_font, bar_color, bar_width = self._styles[state]
+        selected = bool(option.state & QtWidgets.QStyle.StateFlag.State_Selected)
+        left = self.SELECTED_MARGIN if selected else self.NORMAL_MARGIN
+        rect = option.rect.adjusted(left, 4, -4, -4)
+
+        painter.save()
+        painter.setFont(bar_font)
+        painter.setPen(bar_color)
+        painter.drawText(
+            rect,
+            QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter,
+            index.data(VideoListModel.ProgressRole) or "",
+        )
+
+        text_rect = rect.adjusted(0, 0, -(bar_width + 8), 0)
+        if self.poster_provider is not None:
+            self._paint_poster(painter, rect, index.data(VideoListModel.VideoIdRole))
+            text_rect.setLeft(rect.left() + self.POSTER_WIDTH + self.POSTER_SPACING)
+        position = index.data(VideoListModel.PositionRole)
+        text = f"{position} {self.SEPARATOR_ICON}  {index.data(QtCore.Qt.ItemDataRole.DisplayRole)}"
+        painter.setFont(text_font)
+        painter.setPen(text_color)
+        painter.drawText(
+            text_rect,
+            QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter,
+            text_metrics.elidedText(text, QtCore.Qt.TextElideMode.ElideRight, text_rect.width()),
+        )
+        painter.restore()
+
+    def _paint_poster(self, painter: QtGui.QPainter, rect: QtCore.QRect, video_id: Optional[str]):
+        # Mémoire uniquement : le chargement et l'extraction sont faits hors de paint()
+        pixmap = self.poster_provider.pixmap(video_id) if video_id else None
+        poster_rect = QtCore.QRect(rect.left(), rect.top(), self.POSTER_WIDTH, rect.height())
+        if pixmap is None:
+            painter.fillRect(poster_rect, QtGui.QColor(self.POSTER_PLACEHOLDER))
+            return
+        size = pixmap.size().scaled(poster_rect.size(), QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        target = QtCore.QRect(QtCore.QPoint(0, 0), size)
+        target.moveCenter(poster_rect.center())
+        painter.drawPixmap(target, pixmap)
+
+
+class VideoListView(QtWidgets.QListView):
+    """Vue de la liste des vidéos : lignes de hauteur fixe, sans re-layout sur dataChanged."""
+
+    LAYOUT_BATCH_SIZE = 1000
+    LAYOUT_POLL_MS = 16
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        # Lay rows out a batch per event-loop pass instead of all at once after each insertion.
+        self.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self.setBatchSize(self.LAYOUT_BATCH_SIZE)
+        self._pending_scroll_row = -1
+        self._scroll_retry_scheduled = False
+
+    def scroll_to_row(self, row: int):
+        """Fait défiler jusqu'à la ligne, une fois qu'elle a été mise en page."""
+        self._pending_scroll_row = row
+        self._scroll_to_pending_row()
+
+    def _scroll_to_pending_row(self):
+        self._scroll_retry_scheduled = False
+        model = self.model()
+        if model is None or self._pending_scroll_row < 0:
+            return
+        index = model.index(self._pending_scroll_row, 0)
+        if not index.isValid():
+            self._pending_scroll_row = -1
+            return
+        if self.visualRect(index).isValid():
+            self._pending_scroll_row = -1
+            self.scrollTo(index)
+        elif not self._scroll_retry_scheduled:
+            # Batched layout has not reached that row yet.
+            self._scroll_retry_scheduled = True
+            QtCore.QTimer.singleShot(self.LAYOUT_POLL_MS, self._scroll_to_pending_row)
+
+    def dataChanged(self, topLeft, bottomRight, roles=()):
+        # QListView (list mode) lays out every row again on any dataChanged, which costs
+        # O(rows) per progress tick. Row geometry never depends on the data here, so
+        # only the repaint of the changed rows is kept.
+        QtWidgets.QAbstractItemView.dataChanged(self, topLeft, bottomRight, roles)
+
+
+__all__ = ["VideoItemDelegate", "VideoListModel", "VideoListView"]
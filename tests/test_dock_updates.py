@@ -0,0 +1,385 @@
+"""Offscreen tests for incremental dock updates driven by playlist events."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+
+class TestDockIncrementalUpdates(unittest.TestCase):
+    """Count model operations performed per playlist mutation."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication once for all tests."""
+        from PySide6 import QtWidgets
+
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication(sys.argv)
+
+    def setUp(self):
+        """Bind a dock to a ten-video playlist and count its model signals."""
+        from src.pyplayer.domain.playlist import Playlist
+        from src.pyplayer.ui.widgets.dock_widget import DockWidget
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.playlist = Playlist()
+        for i in range(12):
+            path = self.temp_path / f"video_{i:02d}.mp4"
+            path.touch()
+            if i < 10:
+                self.playlist.add_video(path)
+        self.playlist.changes.scheduler = lambda callback: self.pending.append(callback)
+        self.pending = []
+
+        self.dock = DockWidget()
+        self.dock.bind_playlist(self.playlist)
+        self.model = self.dock.video_model
+        self.ops = {"insert": 0, "remove": 0, "move": 0, "changed": 0, "reset": 0}
+
+        def counter(name):
+            def count(*args):
+                self.ops[name] += 1
+            return count
+
+        self.model.rowsInserted.connect(counter("insert"))
+        self.model.rowsRemoved.connect(counter("remove"))
+        self.model.rowsMoved.connect(counter("move"))
+        self.model.dataChanged.connect(counter("changed"))
+        self.model.modelReset.connect(counter("reset"))
+
+    def tearDown(self):
+        """Close the dock and clean up."""
+        self.dock.close()
+        self.temp_dir.cleanup()
+
+    def _tick(self):
+        callbacks, self.pending = self.pending, []
+        for callback in callbacks:
+            callback()
+
+    def _dock_ids(self):
+        from src.pyplayer.ui.widgets.video_list_model import VideoListModel
+
+        return [
+            self.model.index(row, 0).data(VideoListModel.VideoIdRole)
+            for row in range(self.model.rowCount())
+        ]
+
+    def test_append_inserts_one_range(self):
+        """Test appending two videos in a tick is one row-range insertion."""
+        self.playlist.add_video(self.temp_path / "video_10.mp4")
+        self.playlist.add_video(self.temp_path / "video_11.mp4")
+        self._tick()
+
+        self.assertEqual(self.ops, {"insert": 1, "remove": 0, "move": 0, "changed": 0, "reset": 0})
+        self.assertEqual(self._dock_ids(), [video.id for video in self.playlist.videos])
+
+    def test_remove_takes_one_row(self):
+        """Test removing a video is a single removal and keeps the order."""
+        self.playlist.remove_video(3)
+        self._tick()
+
+        self.assertEqual(self.ops["remove"], 1)
+        self.assertEqual(self.ops["insert"], 0)
+        self.assertEqual(self._dock_ids(), [video.id for video in self.playlist.videos])
+
+    def test_bulk_removal_takes_contiguous_ranges(self):
+        """Test removing a multi-selection is one row removal per contiguous run."""
+        ids = [video.id for video in self.playlist.videos]
+        self.playlist.remove_videos([ids[1], ids[2], ids[3], ids[7]])
+        self._tick()
+
+        self.assertEqual(self.ops, {"insert": 0, "remove": 2, "move": 0, "changed": 0, "reset": 0})
+        self.assertEqual(self._dock_ids(), [video.id for video in self.playlist.videos])
+
+    def test_progress_refreshes_one_row(self):
+        """Test a burst of progress updates refreshes only the current row once."""
+        self.playlist.current_index = 2
+        self._tick()
+        self.ops["changed"] = 0
+
+        for position in range(0, 3000, 250):
+            self.playlist.update_current_video_state(position=position, duration=10000)
+        self._tick()
+
+        self.assertEqual(self.ops, {"insert": 0, "remove": 0, "move": 0, "changed": 1, "reset": 0})
+
+    def test_move_is_a_single_row_move(self):
+        """Test a move is reported as one row move, not remove plus insert."""
+        self.playlist.move_video(8, 1)
+        self._tick()
+
+        self.assertEqual(self.ops["move"], 1)
+        self.assertEqual(self.ops["insert"] + self.ops["remove"] + self.ops["reset"], 0)
+        self.assertEqual(self._dock_ids(), [video.id for video in self.playlist.videos])
+
+    def test_leaving_a_video_marks_it_read(self):
+        """Test the previous current video is painted as read and the new one as current."""
+        from src.pyplayer.ui.widgets.video_list_model import VideoListModel
+
+        self.playlist.current_index = 1
+        self._tick()
+        self.playlist.current_index = 4
+        self._tick()
+
+        self.assertEqual(self.model.index(1, 0).data(VideoListModel.StateRole), VideoListModel.STATE_READ)
+        self.assertEqual(self.model.index(4, 0).data(VideoListModel.StateRole), VideoListModel.STATE_CURRENT)
+        self.assertEqual(self.dock.get_selected_video_ids(), [self.playlist.videos[4].id])
+
+
+class TestVideoListPaging(unittest.TestCase):
+    """Tests for page-by-page row exposure in the video list model."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication once for all tests."""
+        from PySide6 import QtWidgets
+
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication(sys.argv)
+
+    def setUp(self):
+        """Bind a model to a playlist several pages long."""
+        from src.pyplayer.domain.playlist import Playlist
+        from src.pyplayer.ui.widgets.video_list_model import VideoListModel
+
+        data = {"videos": [{"file_path": f"/media/video_{i:04d}.mp4"} for i in range(1000)]}
+        self.playlist = Playlist.from_dict(data, validate_files=False)
+        self.model = VideoListModel()
+        self.model._materialize_timer.setInterval(60_000)
+        self.model.set_playlist(self.playlist)
+        self.page = VideoListModel.PAGE_SIZE
+
+    def tearDown(self):
+        """Detach the model from the playlist."""
+        self.model.set_playlist(None)
+
+    def _exposed_ids(self):
+        from src.pyplayer.ui.widgets.video_list_model import VideoListModel
+
+        return [self.model.index(row, 0).data(VideoListModel.VideoIdRole) for row in range(self.model.rowCount())]
+
+    def test_binding_exposes_one_page(self):
+        """Test binding exposes a single page and fetchMore adds the next one."""
+        self.assertEqual(self.model.rowCount(), self.page)
+        self.assertTrue(self.model.canFetchMore())
+
+        self.model.fetchMore()
+        self.assertEqual(self.model.rowCount(), 2 * self.page)
+
+    def test_background_materialization_exposes_everything(self):
+        """Test the materialization steps eventually expose every row."""
+        steps = 0
+        while not self.model.is_fully_exposed:
+            self.model._materialize_step()
+            steps += 1
+
+        self.assertEqual(self.model.rowCount(), len(self.playlist))
+        self.assertLessEqual(steps, 4)
+        self.assertFalse(self.model.canFetchMore())
+
+    def test_changes_past_the_exposed_rows_are_silent(self):
+        """Test removing and moving unexposed rows emits no row signal but stays in sync."""
+        signals = []
+        self.model.rowsRemoved.connect(lambda *args: signals.append("remove"))
+        self.model.rowsInserted.connect(lambda *args: signals.append("insert"))
+
+        self.playlist.remove_video(900)
+        self.playlist.move_video(800, 10)
+        self.assertEqual(signals, ["insert"])
+
+        while not self.model.is_fully_exposed:
+            self.model._materialize_step()
+        self.assertEqual(self._exposed_ids(), [video.id for video in self.playlist.videos])
+
+    def test_current_video_is_exposed(self):
+        """Test making a far row current exposes it."""
+        from src.pyplayer.ui.widgets.video_list_model import VideoListModel
+
+        self.playlist.current_index = 700
+        self.assertGreater(self.model.rowCount(), 700)
+        self.assertEqual(self.model.index(700, 0).data(VideoListModel.StateRole), VideoListModel.STATE_CURRENT)
+
+
+class TestVideoListFilter(unittest.TestCase):
+    """Tests for type-to-filter in the video list model and the dock."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication once for all tests."""
+        from PySide6 import QtWidgets
+
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication(sys.argv)
+
+    def setUp(self):
+        """Bind a model to a playlist with accented and mixed-case names."""
+        from src.pyplayer.domain.playlist import Playlist
+        from src.pyplayer.ui.widgets.video_list_model import VideoListModel
+
+        names = ["Été à Paris.mp4", "ete indien.mkv", "Winter.mp4", "SUMMER été.avi", "Notes.mp4"]
+        data = {"videos": [{"file_path": f"/media/{name}"} for name in names]}
+        self.playlist = Playlist.from_dict(data, validate_files=False)
+        self.model = VideoListModel()
+        self.model.set_playlist(self.playlist)
+
+    def tearDown(self):
+        """Detach the model from the playlist."""
+        self.model.set_playlist(None)
+
+    def _names(self):
+        return [self.model.index(row, 0).data() for row in range(self.model.rowCount())]
+
+    def test_filter_ignores_case_and_accents(self):
+        """Test a plain query matches accented and upper-case names."""
+        from src.pyplayer.ui.widgets.video_list_model import VideoListModel
+
+        self.assertEqual(self.model.set_filter("ETE"), 3)
+        self.assertEqual(self._names(), ["Été à Paris.mp4", "ete indien.mkv", "SUMMER été.avi"])
+        self.assertEqual(self.model.index(2, 0).data(VideoListModel.PositionRole), 4)
+
+    def test_extended_query_only_rescans_previous_matches(self):
+        """Test extending the query narrows the previous result set."""
+        self.model.set_filter("e")
+        previous = list(self.model._filter_rows)
+        scanned = []
+        match_rows = self.model._match_rows
+
+        def spy(terms, candidates=None):
+            scanned.append(candidates)
+            return match_rows(terms, candidates)
+
+        self.model._match_rows = spy
+        self.model.set_filter("ete")
+        self.assertEqual(scanned, [previous])
+
+        self.model.set_filter("win")
+        self.assertEqual(scanned[-1], None)
+        self.assertEqual(self._names(), ["Winter.mp4"])
+
+    def test_structural_change_while_filtered(self):
+        """Test removals under an active filter keep the mapping in sync."""
+        self.model.set_filter("mp4")
+        self.playlist.remove_video(0)
+
+        self.assertEqual(self._names(), ["Winter.mp4", "Notes.mp4"])
+        self.model.set_filter("")
+        self.assertEqual(self.model.rowCount(), len(self.playlist))
+
+    def test_dock_filter_is_debounced(self):
+        """Test typing only filters once the debounce timer fires."""
+        from src.pyplayer.ui.widgets.dock_widget import DockWidget
+
+        dock = DockWidget()
+        dock.bind_playlist(self.playlist)
+        dock.le_filter.setText("w")
+        dock.le_filter.setText("wi")
+        self.assertTrue(dock.filter_timer.isActive())
+        self.assertEqual(dock.video_model.rowCount(), len(self.playlist))
+
+        dock.filter_timer.timeout.emit()
+        self.assertEqual(dock.video_model.rowCount(), 1)
+        self.assertEqual(dock.get_selected_video_ids(), [])
+        dock.close()
+
+
+class TestPlaylistArchiveModel(unittest.TestCase):
+    """Tests for the archive playlist list model."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication once for all tests."""
+        from PySide6 import QtWidgets
+
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication(sys.argv)
+
+    def setUp(self):
+        """Fill a dock's archive list from three playlist headers."""
+        from src.pyplayer.app.services.playlist_registry import PlaylistHeader
+        from src.pyplayer.domain.playlist import Playlist
+        from src.pyplayer.ui.widgets.dock_widget import DockWidget
+
+        self.playlists = []
+        for index in range(3):
+            data = {
+                "name": f"Playlist {index}",
+                "videos": [{"file_path": f"/media/{index}/video_{i}.mp4"} for i in range(index + 1)],
+            }
+            self.playlists.append(Playlist.from_dict(data, validate_files=False))
+        self.headers = [PlaylistHeader(playlist) for playlist in self.playlists]
+        self.dock = DockWidget()
+        self.model = self.dock.playlist_model
+        self.resets = []
+        self.model.modelReset.connect(lambda: self.resets.append(True))
+        self.dock.set_playlist_headers(self.headers)
+
+    def tearDown(self):
+        """Close the dock."""
+        self.dock.close()
+
+    def test_headers_fill_once_without_stats(self):
+        """Test headers fill the list in one reset and summaries are only computed on demand."""
+        from src.pyplayer.ui.widgets.playlist_list_model import PlaylistListModel
+
+        self.assertEqual(len(self.resets), 1)
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.index(2, 0).data(), "Playlist 2")
+        self.assertTrue(all(header._stats is None for header in self.headers))
+
+        summary = self.model.index(2, 0).data(PlaylistListModel.SummaryRole)
+        self.assertTrue(summary.startswith("3 vidéos"))
+        self.assertIsNotNone(self.headers[2]._stats)
+        self.assertIsNone(self.headers[1]._stats)
+
+    def test_active_playlist_changes_refresh_its_row(self):
+        """Test a change batch on the active playlist invalidates only its header."""
+        from src.pyplayer.ui.widgets.playlist_list_model import PlaylistListModel
+
+        self.dock.set_active_playlist(self.playlists[1])
+        self.assertTrue(self.model.index(1, 0).data(PlaylistListModel.ActiveRole))
+        self.headers[1].progress
+        self.headers[0].progress
+        changed = []
+        self.model.dataChanged.connect(lambda first, last, roles: changed.append(first.row()))
+
+        self.playlists[1].current_index = 0
+        self.playlists[1].update_current_video_state(position=1000, duration=4000)
+        self.assertEqual(changed, [1, 1])
+        self.assertIsNone(self.headers[1]._stats)
+        self.assertIsNotNone(self.headers[0]._stats)
+
+    def test_programmatic_activation_is_not_a_user_selection(self):
+        """Test only user selections emit playlist_selected."""
+        selected = []
+        self.dock.playlist_selected.connect(selected.append)
+
+        self.dock.set_active_playlist(self.playlists[0])
+        self.assertEqual(selected, [])
+        self.assertEqual(self.dock.get_selected_playlist_id(), self.playlists[0].id)
+
+        self.dock.lstw_archive.setCurrentIndex(self.model.index(2, 0))
+        self.assertEqual(selected, [self.playlists[2].id])
+
+    def test_removing_the_active_playlist(self):
+        """Test removing the active playlist leaves no active row behind."""
+        from src.pyplayer.ui.widgets.playlist_list_model import PlaylistListModel
+
+        self.dock.set_active_playlist(self.playlists[0])
+        self.assertTrue(self.dock.remove_playlist_state(self.playlists[0]))
+        self.dock.set_active_playlist(None)
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertFalse(any(self.model.index(row, 0).data(PlaylistListModel.ActiveRole) for row in range(2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
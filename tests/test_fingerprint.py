@@ -0,0 +1,200 @@
+"""Tests for partial-content fingerprints, relinking moved files and duplicate detection."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.pyplayer.app.services.fingerprint_service import FingerprintService
+from src.pyplayer.domain.media import Video, compute_fingerprint
+from src.pyplayer.domain.media.fingerprint import EDGE_BYTES
+from src.pyplayer.domain.playlist import Playlist, PlaylistChangeKind
+from src.pyplayer.infrastructure.cache import MediaMetadataCache
+from src.pyplayer.infrastructure.filesystem import scan_files
+
+
+def pattern(size, seed):
+    """Return ``size`` bytes that differ from one seed to the next."""
+    block = bytes((i * 7 + seed) % 251 for i in range(4096))
+    return (block * (size // len(block) + 1))[:size]
+
+
+class TestComputeFingerprint(unittest.TestCase):
+    """Tests for the sampled blake2b fingerprint."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_same_content_same_fingerprint(self):
+        """Test a copy under another name hashes the same and a missing file gives None."""
+        data = pattern(1024 * 1024, 1)
+        (self.root / "a.mp4").write_bytes(data)
+        (self.root / "b.mp4").write_bytes(data)
+        self.assertEqual(compute_fingerprint(self.root / "a.mp4"), compute_fingerprint(self.root / "b.mp4"))
+        self.assertIsNone(compute_fingerprint(self.root / "missing.mp4"))
+
+    def test_sampled_regions_and_size_change_the_fingerprint(self):
+        """Test edits to the head, the middle sample or the size are detected."""
+        data = bytearray(pattern(1024 * 1024, 2))
+        path = self.root / "video.mp4"
+        path.write_bytes(data)
+        original = compute_fingerprint(path)
+
+        edited = bytearray(data)
+        edited[len(data) // 2] ^= 0xFF
+        path.write_bytes(edited)
+        self.assertNotEqual(compute_fingerprint(path), original)
+
+        edited = bytearray(data)
+        edited[10] ^= 0xFF
+        path.write_bytes(edited)
+        self.assertNotEqual(compute_fingerprint(path), original)
+
+        path.write_bytes(data + b"\0")
+        self.assertNotEqual(compute_fingerprint(path), original)
+
+    def test_reads_are_bounded(self):
+        """Test a large file is sampled, not read in full."""
+        path = self.root / "large.mp4"
+        with open(path, "wb") as handle:
+            handle.truncate(64 * 1024 * 1024)
+        real_open = open
+        read_sizes = []
+
+        class CountingFile:
+            def __init__(self, handle):
+                self._handle = handle
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._handle.close()
+
+            def __getattr__(self, name):
+                return getattr(self._handle, name)
+
+            def read(self, size=-1):
+                data = self._handle.read(size)
+                read_sizes.append(len(data))
+                return data
+
+        with mock.patch("builtins.open", lambda *args, **kwargs: CountingFile(real_open(*args, **kwargs))):
+            self.assertIsNotNone(compute_fingerprint(path))
+        self.assertLessEqual(sum(read_sizes), 3 * EDGE_BYTES)
+
+
+class TestFingerprintService(unittest.TestCase):
+    """Tests for relinking by fingerprint and the size-bucketed duplicate search."""
+
+    def setUp(self):
+        """Create a library folder and a search root."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.library_dir = self.root / "library"
+        self.search_root = self.root / "search"
+        (self.search_root / "nested" / "deeper").mkdir(parents=True)
+        self.library_dir.mkdir()
+        self.cache = MediaMetadataCache(self.root / "cache" / "media_metadata.json")
+        self.service = FingerprintService(self.cache, max_workers=2)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _fingerprinted_video(self, name, data):
+        path = self.library_dir / name
+        path.write_bytes(data)
+        video = Video(path)
+        self.cache.put_fingerprint(video.content_key, compute_fingerprint(path))
+        return video
+
+    def test_scan_walks_nested_folders(self):
+        """Test the parallel scan finds files at every depth and filters extensions."""
+        (self.search_root / "top.mp4").write_bytes(b"1")
+        (self.search_root / "nested" / "deeper" / "deep.MKV").write_bytes(b"22")
+        (self.search_root / "nested" / "notes.txt").write_bytes(b"333")
+        found = scan_files([self.search_root], {".mp4", ".mkv"})
+        self.assertEqual(sorted((entry.name, entry.size) for entry in found), [("deep.MKV", 2), ("top.mp4", 1)])
+
+    def test_moved_and_renamed_files_are_relinked(self):
+        """Test missing videos are found by content, renamed or not, and the playlist keeps its rows."""
+        moved = self._fingerprinted_video("moved.mp4", pattern(300_000, 3))
+        renamed = self._fingerprinted_video("renamed.mp4", pattern(300_000, 4))
+        stays = self._fingerprinted_video("stays.mp4", pattern(1000, 5))
+        moved.state.position = 1234
+        playlist = Playlist()
+        playlist.videos = [moved, stays, renamed]
+
+        os.replace(moved.file_path, self.search_root / "nested" / "moved.mp4")
+        os.replace(renamed.file_path, self.search_root / "nested" / "deeper" / "other name.mp4")
+        # Same size as the moved file, different content: must not match
+        (self.search_root / "decoy.mp4").write_bytes(pattern(300_000, 9))
+
+        relinks = self.service.find_relinks(playlist.videos, [self.search_root])
+        self.assertEqual(
+            relinks,
+            {
+                moved.id: self.search_root / "nested" / "moved.mp4",
+                renamed.id: self.search_root / "nested" / "deeper" / "other name.mp4",
+            },
+        )
+
+        changes = []
+        playlist.changes.subscribe(changes.extend)
+        self.assertEqual(playlist.relink_videos(relinks), 2)
+        self.assertEqual(playlist.videos[0].file_path, self.search_root / "nested" / "moved.mp4")
+        self.assertEqual(playlist.videos[0].state.position, 1234)
+        self.assertIs(playlist.videos[1], stays)
+        self.assertEqual(
+            [(change.kind, change.first, change.last) for change in changes],
+            [
+                (PlaylistChangeKind.ROWS_REMOVED, 0, 0),
+                (PlaylistChangeKind.ROWS_INSERTED, 0, 0),
+                (PlaylistChangeKind.ROWS_REMOVED, 2, 2),
+                (PlaylistChangeKind.ROWS_INSERTED, 2, 2),
+            ],
+        )
+        self.assertEqual(playlist.index_of_id(playlist.videos[2].id), 2)
+
+    def test_duplicates_only_read_files_sharing_a_size(self):
+        """Test duplicates are grouped and files with a unique size are never fingerprinted."""
+        data = pattern(200_000, 6)
+        for name in ("a.mp4", "b.mp4"):
+            (self.search_root / name).write_bytes(data)
+        (self.search_root / "same_size.mp4").write_bytes(pattern(200_000, 7))
+        (self.search_root / "unique.mp4").write_bytes(pattern(5000, 8))
+        files = scan_files([self.search_root])
+
+        with mock.patch(
+            "src.pyplayer.app.services.fingerprint_service.compute_fingerprint", side_effect=compute_fingerprint
+        ) as computed:
+            groups = self.service.find_duplicates(files)
+        self.assertEqual(groups, [[str(self.search_root / "a.mp4"), str(self.search_root / "b.mp4")]])
+        self.assertEqual(computed.call_count, 3)
+
+        # Cached now: a second pass reads nothing
+        with mock.patch("src.pyplayer.app.services.fingerprint_service.compute_fingerprint") as computed:
+            self.assertEqual(self.service.find_duplicates(files), groups)
+        computed.assert_not_called()
+
+    def test_fingerprints_persist_with_the_metadata_cache(self):
+        """Test fingerprints are saved in the metadata cache file and discarded with their entry."""
+        self.cache.put_fingerprint("key", "f" * 32)
+        self.assertTrue(self.cache.save())
+        reloaded = MediaMetadataCache(self.cache.cache_file)
+        self.assertTrue(reloaded.load())
+        self.assertEqual(reloaded.get_fingerprint("key"), "f" * 32)
+        self.assertTrue(reloaded.discard("key"))
+        self.assertIsNone(reloaded.get_fingerprint("key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
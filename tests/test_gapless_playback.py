@@ -0,0 +1,168 @@
+"""Tests for next-item prediction and gapless hand-over between two players."""
+
+import math
+import os
+import struct
+import sys
+import tempfile
+import time
+import unittest
+import wave
+from pathlib import Path
+
+from src.pyplayer.domain.playlist import Playlist, PlayMode
+
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+
+def write_tone(path: Path, seconds: float = 0.6, rate: int = 8000):
+    """Write a short mono 16-bit WAV tone (no external encoder needed)."""
+    frames = b"".join(
+        struct.pack("<h", int(8000 * math.sin(2 * math.pi * 440 * i / rate)))
+        for i in range(int(seconds * rate))
+    )
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(rate)
+        handle.writeframes(frames)
+
+
+class TestPeekNextVideo(unittest.TestCase):
+    """Tests for predicting the next item without advancing the playlist."""
+
+    def setUp(self):
+        """Build a five-video playlist without touching the disk."""
+        data = {"videos": [{"file_path": f"/media/video_{i}.mp4"} for i in range(5)]}
+        self.playlist = Playlist.from_dict(data, validate_files=False)
+        self.playlist.current_index = 4
+
+    def _assert_peek_matches_next(self):
+        peeked = self.playlist.peek_next_video()
+        self.assertEqual(self.playlist.get_next_video(), peeked)
+        return peeked
+
+    def test_normal_and_loop_all(self):
+        """Test peek agrees with get_next_video at the end of the list."""
+        self.assertEqual(self._assert_peek_matches_next(), (None, -1))
+        self.playlist.set_play_mode(PlayMode.LOOP_ALL)
+        self.assertEqual(self._assert_peek_matches_next()[1], 0)
+
+    def test_loop_one_peeks_the_current_video(self):
+        """Test LOOP_ONE predicts the same item, which the player rewinds instead of preloading."""
+        self.playlist.set_play_mode(PlayMode.LOOP_ONE)
+        self.assertEqual(self._assert_peek_matches_next()[1], 4)
+
+    def test_shuffle_peek_has_no_side_effects(self):
+        """Test peeking in shuffle mode neither advances nor redraws the order."""
+        self.playlist.set_play_mode(PlayMode.SHUFFLE)
+        for _ in range(len(self.playlist) - 1):
+            order = list(self.playlist._shuffle_order)
+            position = self.playlist._shuffle_position
+            peeked = self.playlist.peek_next_video()
+            self.assertEqual(self.playlist._shuffle_order, order)
+            self.assertEqual(self.playlist._shuffle_position, position)
+            if peeked[0] is not None:
+                self.assertEqual(self.playlist.get_next_video(), peeked)
+            else:
+                self.playlist.get_next_video()
+
+    def test_shuffle_end_of_order_is_not_predicted(self):
+        """Test nothing is predicted once the shuffle order is exhausted."""
+        self.playlist.set_play_mode(PlayMode.SHUFFLE)
+        self.playlist._shuffle_position = len(self.playlist._shuffle_order) - 1
+        self.assertEqual(self.playlist.peek_next_video(), (None, -1))
+
+
+class TestGaplessHandOver(unittest.TestCase):
+    """Offscreen fixture measuring the gap between two items with and without preloading."""
+
+    TIMEOUT = 10.0
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication once for all tests."""
+        from PySide6 import QtWidgets
+
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication(sys.argv)
+
+    def setUp(self):
+        """Write two short clips and initialize a player widget."""
+        from src.pyplayer.ui.widgets.player import PlayerWidget
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.clips = [Path(self.temp_dir.name) / f"clip_{i}.wav" for i in range(2)]
+        for clip in self.clips:
+            write_tone(clip)
+        self.widget = PlayerWidget()
+        self.widget.set_muted(True)
+        self.widget.ensure_player_ready()
+        if not self._wait(lambda: self.widget.player_ready):
+            self.skipTest("QtMultimedia backend unavailable")
+
+    def tearDown(self):
+        """Close the widget and clean up."""
+        self.widget.close()
+        self.temp_dir.cleanup()
+
+    def _wait(self, predicate, timeout=None):
+        deadline = time.perf_counter() + (timeout or self.TIMEOUT)
+        while not predicate():
+            if time.perf_counter() > deadline:
+                return False
+            self.app.processEvents()
+            time.sleep(0.001)
+        return True
+
+    def _measure_gap(self, gapless: bool) -> float:
+        """Play clip 0, move to clip 1 at EndOfMedia, return ms until clip 1 advances."""
+        from PySide6 import QtCore, QtMultimedia
+
+        ended = {}
+
+        def on_status(status):
+            if status != QtMultimedia.QMediaPlayer.MediaStatus.EndOfMedia or ended:
+                return
+            ended["at"] = time.perf_counter()
+            if not (gapless and self.widget.swap_to_preloaded("clip_1")):
+                self.widget.video_player.setSource(QtCore.QUrl.fromLocalFile(str(self.clips[1])))
+                self.widget.video_player.play()
+
+        first = self.widget.video_player
+        first.mediaStatusChanged.connect(on_status)
+        first.setSource(QtCore.QUrl.fromLocalFile(str(self.clips[0])))
+        first.play()
+        if gapless:
+            self.widget.preload_next("clip_1", self.clips[1])
+            self.assertTrue(self._wait(lambda: self.widget.preloader.is_primed_for("clip_1")))
+        if not self._wait(lambda: "at" in ended):
+            self.skipTest("no playback in this environment")
+        first.mediaStatusChanged.disconnect(on_status)
+        self.assertTrue(self._wait(lambda: self.widget.video_player.position() > 0))
+        return (time.perf_counter() - ended["at"]) * 1000
+
+    def test_preloaded_item_starts_without_reopening(self):
+        """Test the preloaded player is swapped in and starts faster than a cold setSource."""
+        cold_gap = self._measure_gap(gapless=False)
+        first = self.widget.video_player
+        gapless_gap = self._measure_gap(gapless=True)
+
+        self.assertIsNot(self.widget.video_player, first)
+        self.assertIs(self.widget.clock._player, self.widget.video_player)
+        self.assertLessEqual(gapless_gap, cold_gap + 20)
+        self.assertLess(gapless_gap, 250)
+
+    def test_cancel_preload_releases_the_file(self):
+        """Test cancelling the preload clears the reserve player's source, so the file is no longer held open."""
+        self.widget.preload_next("clip_1", self.clips[1])
+        self.assertEqual(self.widget.preloaded_video_id, "clip_1")
+        self.widget.cancel_preload()
+        self.assertIsNone(self.widget.preloaded_video_id)
+        self.assertTrue(self.widget.preloader._player.source().isEmpty())
+        self.assertFalse(self.widget.swap_to_preloaded("clip_1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Tests for the library-wide search index."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.pyplayer.app.services.library_index import LibraryIndex
+from src.pyplayer.app.services.playlist_registry import PlaylistRegistry
+from src.pyplayer.domain.playlist import Playlist
+from src.pyplayer.shared.text import fold_text, tokenize
+
+
+class TestTextHelpers(unittest.TestCase):
+    """Tests for accent folding and tokenization."""
+
+    def test_fold_text_strips_accents_and_case(self):
+        """Test accents and case are folded away."""
+        self.assertEqual(fold_text("Éléphant À Noël"), "elephant a noel")
+
+    def test_tokenize_splits_on_separators(self):
+        """Test tokens are split on punctuation and underscores."""
+        self.assertEqual(tokenize("Le_Fabuleux-Destin.d'Amélie.mkv"), ["le", "fabuleux", "destin", "d", "amelie", "mkv"])
+
+
+class TestLibraryIndex(unittest.TestCase):
+    """Tests for LibraryIndex incremental maintenance and ranking."""
+
+    def setUp(self):
+        """Create two playlists sharing a registry."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.registry = PlaylistRegistry()
+
+        self.films = Playlist()
+        self.films.name = "Films"
+        self.series = Playlist()
+        self.series.name = "Series"
+        for name in ["Amélie Poulain.mkv", "Le Grand Bleu.mp4", "Bleu Profond.avi"]:
+            self.films.add_video(self._touch("films", name))
+        for name in ["Breaking Bad S01E01.mkv", "Grand Hotel E02.mp4"]:
+            self.series.add_video(self._touch("series", name))
+        self.registry.add(self.films)
+        self.registry.add(self.series)
+        self.index = LibraryIndex(self.registry)
+
+    def tearDown(self):
+        """Clean up temp directory."""
+        self.temp_dir.cleanup()
+
+    def _touch(self, folder: str, name: str) -> Path:
+        path = self.temp_path / folder / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        return path
+
+    def test_search_is_accent_and_case_insensitive(self):
+        """Test that a folded query finds an accented name."""
+        hits = self.index.search("AMELIE")
+        self.assertEqual(len(hits), 1)
+        self.assertIs(hits[0].playlist, self.films)
+        self.assertEqual(hits[0].video.name, "Amélie Poulain.mkv")
+
+    def test_search_spans_playlists_and_ranks_exact_tokens_first(self):
+        """Test hits come from every playlist, exact token matches first."""
+        hits = self.index.search("grand")
+        self.assertEqual({hit.playlist.name for hit in hits}, {"Films", "Series"})
+
+        hits = self.index.search("ble")
+        names = [hit.video.name for hit in hits]
+        self.assertEqual(set(names), {"Le Grand Bleu.mp4", "Bleu Profond.avi"})
+
+    def test_substring_query_uses_trigrams(self):
+        """Test that a mid-word substring matches."""
+        hits = self.index.search("reakin")
+        self.assertEqual([hit.video.name for hit in hits], ["Breaking Bad S01E01.mkv"])
+
+    def test_path_components_are_searchable(self):
+        """Test folder names contribute to matching."""
+        hits = self.index.search("series grand")
+        self.assertEqual([hit.video.name for hit in hits], ["Grand Hotel E02.mp4"])
+
+    def test_index_follows_playlist_mutations(self):
+        """Test additions and removals are picked up incrementally."""
+        self.assertEqual(self.index.search("matrix"), [])
+
+        self.films.add_video(self._touch("films", "Matrix.mkv"))
+        self.assertEqual(len(self.index.search("matrix")), 1)
+
+        self.films.remove_video(self.films.get_index_by_name("Matrix.mkv"))
+        self.assertEqual(self.index.search("matrix"), [])
+
+    def test_refresh_only_rescans_changed_playlists(self):
+        """Test that unchanged playlists are skipped on refresh."""
+        self.index.refresh()
+        self.assertEqual(self.index.refresh(), 0)
+
+        self.series.add_video(self._touch("series", "Lost.mkv"))
+        self.assertEqual(self.index.refresh(), 1)
+
+    def test_removed_playlist_is_dropped(self):
+        """Test that entries of a removed playlist disappear."""
+        self.index.refresh()
+        self.registry.remove(self.series.id)
+        self.assertEqual(self.index.search("breaking"), [])
+        self.assertEqual(len(self.index), 3)
+
+    def test_save_and_load_roundtrip(self):
+        """Test a persisted index answers queries without rebuilding."""
+        index_file = self.temp_path / "cache" / "library_index.json"
+        self.index.refresh()
+        self.assertTrue(self.index.save(index_file))
+
+        restored = LibraryIndex(self.registry, index_file)
+        self.assertTrue(restored.load())
+        self.assertEqual(len(restored), 5)
+
+        hits = restored.search("amelie")
+        self.assertEqual(len(hits), 1)
+        self.assertEqual(hits[0].video.name, "Amélie Poulain.mkv")
+
+
+if __name__ == "__main__":
+    unittest.main()
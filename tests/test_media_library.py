@@ -0,0 +1,148 @@
+"""Tests for the shared media library."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.pyplayer.app.services.playlist_manager import PlaylistManager
+from src.pyplayer.domain.media import MediaLibrary
+from src.pyplayer.domain.playlist import Playlist
+
+
+class TestMediaLibrary(unittest.TestCase):
+    """Tests for flyweight videos shared between playlists."""
+
+    def setUp(self):
+        """Create a library and a couple of media files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.library_file = self.temp_path / "media_library.json"
+        self.library = MediaLibrary(self.library_file)
+        self.first = self.temp_path / "first.mp4"
+        self.second = self.temp_path / "second.mkv"
+        self.first.write_bytes(b"0" * 64)
+        self.second.write_bytes(b"1" * 32)
+
+    def tearDown(self):
+        """Clean up temp directory."""
+        self.temp_dir.cleanup()
+
+    def test_same_file_is_one_video_across_playlists(self):
+        """Test that two playlists share the same Video instance and state."""
+        left = Playlist(library=self.library)
+        right = Playlist(library=self.library)
+        video = left.add_video(self.first)
+        self.assertIs(right.add_video(self.first), video)
+        self.assertEqual(len(self.library), 1)
+
+        video.update_metadata(width=1920, height=1080, duration=60000)
+        video.update_state(position=30000)
+        self.assertEqual(right.videos[0].resolution, "1920x1080")
+        self.assertEqual(right.videos[0].state.position, 30000)
+
+    def test_playlist_file_stores_only_references(self):
+        """Test serialized playlists hold media keys instead of full records."""
+        playlist = Playlist(library=self.library)
+        video = playlist.add_video(self.first)
+
+        data = playlist.to_dict()
+        self.assertEqual(data["videos"], [{"media_key": video.media_key, "file_path": str(self.first)}])
+
+    def test_roundtrip_restores_shared_records(self):
+        """Test playlists reloaded against a saved library share restored videos."""
+        left = Playlist(library=self.library)
+        right = Playlist(library=self.library)
+        left.add_video(self.first).update_state(duration=90000, position=45000)
+        right.add_video(self.first)
+        right.add_video(self.second)
+        self.assertTrue(left.save_to_file(self.temp_path / "left.json", create_backup=False))
+        self.assertTrue(right.save_to_file(self.temp_path / "right.json", create_backup=False))
+
+        library = MediaLibrary(self.library_file)
+        self.assertTrue(library.load())
+        restored_left = Playlist.load_from_file(self.temp_path / "left.json", library=library)
+        restored_right = Playlist.load_from_file(self.temp_path / "right.json", library=library)
+
+        self.assertIs(restored_left.videos[0], restored_right.videos[0])
+        self.assertEqual(restored_left.videos[0].state.position, 45000)
+        self.assertEqual(len(library), 2)
+
+    def test_legacy_full_records_are_migrated(self):
+        """Test that a pre-library playlist file is adopted into the library."""
+        legacy = Playlist()
+        legacy.add_video(self.first).update_state(duration=10000, position=2500)
+        data = legacy.to_dict()
+        self.assertIn("state", data["videos"][0])
+
+        restored = Playlist.from_dict(data, validate_files=False, library=self.library)
+        self.assertIs(self.library.get_by_path(self.first), restored.videos[0])
+        self.assertEqual(restored.videos[0].state.position, 2500)
+
+    def test_prune_drops_unreferenced_records(self):
+        """Test orphaned records are removed."""
+        playlist = Playlist(library=self.library)
+        playlist.add_video(self.first)
+        self.library.acquire(self.second)
+
+        self.assertEqual(self.library.prune(playlist.videos), 1)
+        self.assertIsNone(self.library.get_by_path(self.second))
+
+    def test_library_is_written_only_when_dirty(self):
+        """Test clean saves skip the library and auto-saves respect the cooldown."""
+        playlist = Playlist(library=self.library)
+        playlist.add_video(self.first)
+        target = self.temp_path / "playlist.json"
+        self.assertTrue(playlist.save_to_file(target, create_backup=False))
+        self.library_file.unlink()
+
+        self.assertTrue(playlist.save_to_file(target, create_backup=False))
+        self.assertFalse(self.library_file.exists())
+
+        playlist.current_index = 0
+        playlist.update_current_video_state(position=1000)
+        self.assertTrue(self.library.is_dirty)
+        self.assertTrue(playlist.save_to_file(target, create_backup=False, flush_library=False))
+        self.assertFalse(self.library_file.exists())
+        self.assertTrue(playlist.save_to_file(target, create_backup=False))
+        self.assertTrue(self.library_file.exists())
+        self.assertFalse(self.library.is_dirty)
+
+
+class TestPlaylistManagerMediaLibrary(unittest.TestCase):
+    """Tests for the library owned by PlaylistManager."""
+
+    def setUp(self):
+        """Set up temp directory for file operations."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.media = self.temp_path / "media"
+        self.media.mkdir()
+        (self.media / "clip.mp4").write_bytes(b"0" * 16)
+
+    def tearDown(self):
+        """Clean up temp directory."""
+        self.temp_dir.cleanup()
+
+    def test_manager_playlists_share_library_across_restarts(self):
+        """Test the library file is not mistaken for a playlist and sharing survives reload."""
+        data_dir = self.temp_path / "data"
+        manager = PlaylistManager(data_dir=data_dir, synchronous=True)
+        first = manager.create_playlist(source_path=self.media, name="A")
+        second = manager.create_playlist(name="B")
+        second.add_video(self.media / "clip.mp4")
+        self.assertIs(first.videos[0], second.videos[0])
+        first.save_to_file(first.save_file_path, create_backup=False)
+        second.save_to_file(second.save_file_path, create_backup=False)
+
+        with open(data_dir / "media_library.json", "r", encoding="utf-8") as handle:
+            self.assertEqual(len(json.load(handle)["videos"]), 1)
+
+        reloaded = PlaylistManager(data_dir=data_dir, synchronous=True)
+        playlists = {playlist.name: playlist for playlist in reloaded.all_playlist.values()}
+        self.assertEqual(set(playlists), {"PLAYLIST", "A", "B"})
+        self.assertIs(playlists["A"].videos[0], playlists["B"].videos[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,338 @@
+"""Tests for the container header parsers."""
+
+import struct
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.pyplayer.app.services.metadata_prober import MetadataProber
+from src.pyplayer.domain.media import MediaMetadata, Video, read_media_metadata
+from src.pyplayer.infrastructure.cache.metadata_cache import MediaMetadataCache
+
+
+def mp4_box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def build_mp4(duration_ms: int, width: int, height: int, moov_last: bool = True) -> bytes:
+    """ftyp + mdat + moov(mvhd v0, audio trak, video trak v1)."""
+    mvhd = struct.pack(">B3xIIII", 0, 0, 0, 600, duration_ms * 600 // 1000) + b"\x00" * 80
+    tkhd_audio = struct.pack(">B3x", 0) + b"\x00" * 72 + struct.pack(">II", 0, 0)
+    tkhd_video = struct.pack(">B3x", 1) + b"\x00" * 84 + struct.pack(">II", width << 16, height << 16)
+    moov = mp4_box(
+        b"moov",
+        mp4_box(b"mvhd", mvhd)
+        + mp4_box(b"trak", mp4_box(b"tkhd", tkhd_audio) + mp4_box(b"mdia", b"\x00" * 16))
+        + mp4_box(b"trak", mp4_box(b"tkhd", tkhd_video)),
+    )
+    ftyp = mp4_box(b"ftyp", b"isom\x00\x00\x02\x00isomiso2")
+    mdat = mp4_box(b"mdat", b"\xAA" * 50_000)
+    return ftyp + (mdat + moov if moov_last else moov + mdat)
+
+
+def ebml_id(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+
+def ebml_size(size: int) -> bytes:
+    return (0x10000000 | size).to_bytes(4, "big")
+
+
+def ebml(element_id: int, payload: bytes) -> bytes:
+    return ebml_id(element_id) + ebml_size(len(payload)) + payload
+
+
+def ebml_uint(element_id: int, value: int) -> bytes:
+    return ebml(element_id, value.to_bytes(4, "big"))
+
+
+def build_matroska(duration_ms: int, width: int, height: int, doc_type: bytes = b"matroska", tracks_last=False) -> bytes:
+    header = ebml(0x1A45DFA3, ebml(0x4282, doc_type))
+    info = ebml(0x1549A966, ebml_uint(0x2AD7B1, 1_000_000) + ebml(0x4489, struct.pack(">d", float(duration_ms))))
+    audio = ebml(0xAE, ebml_uint(0x83, 2))
+    video = ebml(0xAE, ebml_uint(0x83, 1) + ebml(0xE0, ebml_uint(0xB0, width) + ebml_uint(0xBA, height)))
+    tracks = ebml(0x1654AE6B, audio + video)
+    cluster = ebml(0x1F43B675, b"\x00" * 20_000)
+    if not tracks_last:
+        return header + ebml(0x18538067, info + tracks + cluster)
+    # Tracks after the clusters, reachable only through the SeekHead
+    seek_head_size = len(ebml(0x114D9B74, ebml(0x4DBB, ebml(0x53AB, ebml_id(0x1654AE6B)) + ebml_uint(0x53AC, 0))))
+    tracks_position = seek_head_size + len(info) + len(cluster)
+    seek_head = ebml(
+        0x114D9B74, ebml(0x4DBB, ebml(0x53AB, ebml_id(0x1654AE6B)) + ebml_uint(0x53AC, tracks_position))
+    )
+    return header + ebml(0x18538067, seek_head + info + cluster + tracks)
+
+
+def build_avi(frames: int, us_per_frame: int, width: int, height: int, odml_frames: int = 0) -> bytes:
+    avih = struct.pack("<10I", us_per_frame, 0, 0, 0, frames, 0, 1, 0, width, height) + b"\x00" * 16
+    hdrl = b"hdrl" + b"avih" + struct.pack("<I", len(avih)) + avih
+    if odml_frames:
+        dmlh = b"dmlh" + struct.pack("<I", 248) + struct.pack("<I", odml_frames) + b"\x00" * 244
+        hdrl += b"LIST" + struct.pack("<I", 4 + len(dmlh)) + b"odml" + dmlh
+    body = b"AVI " + b"LIST" + struct.pack("<I", len(hdrl)) + hdrl
+    movi = b"LIST" + struct.pack("<I", 10_004) + b"movi" + b"\x00" * 10_000
+    body += movi
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def amf_string(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return struct.pack(">H", len(data)) + data
+
+
+def build_flv(duration_s: float, width: int, height: int) -> bytes:
+    properties = [
+        ("duration", b"\x00" + struct.pack(">d", duration_s)),
+        ("encoder", b"\x02" + amf_string("Lavf")),
+        ("keyframes", b"\x03" + amf_string("times") + b"\x0a" + struct.pack(">I", 1) + b"\x00" + struct.pack(">d", 0.0) + b"\x00\x00\x09"),
+        ("width", b"\x00" + struct.pack(">d", float(width))),
+        ("height", b"\x00" + struct.pack(">d", float(height))),
+        ("stereo", b"\x01\x01"),
+    ]
+    body = b"\x02" + amf_string("onMetaData") + b"\x08" + struct.pack(">I", len(properties))
+    body += b"".join(amf_string(key) + value for key, value in properties) + b"\x00\x00\x09"
+    tag = bytes([18]) + len(body).to_bytes(3, "big") + b"\x00" * 7 + body
+    return b"FLV\x01\x05" + struct.pack(">I", 9) + b"\x00" * 4 + tag + struct.pack(">I", len(tag))
+
+
+MP3_FRAME = 417  # MPEG-1 layer III, 128 kbit/s, 44.1 kHz
+
+
+def synchsafe(value: int) -> bytes:
+    return bytes((value >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+
+def build_mp3(frames: int, title: str = "", xing_frames: int = 0) -> bytes:
+    """Optional ID3v2.3 tag, then ``frames`` CBR frames (the first one a Xing header when asked)."""
+    tag = b""
+    if title:
+        text = b"\x03" + title.encode("utf-8")
+        body = b"TIT2" + struct.pack(">I", len(text)) + b"\x00\x00" + text + b"\x00" * 32
+        tag = b"ID3\x03\x00\x00" + synchsafe(len(body)) + body
+    header = b"\xff\xfb\x90\x00"
+    first = header + b"\x00" * 32
+    if xing_frames:
+        first += b"Xing" + struct.pack(">II", 1, xing_frames)
+    first = first.ljust(MP3_FRAME, b"\x00")
+    return tag + first + (header.ljust(MP3_FRAME, b"\x00")) * (frames - 1)
+
+
+def vorbis_comment(tags: dict) -> bytes:
+    entries = [f"{key}={value}".encode("utf-8") for key, value in tags.items()]
+    data = struct.pack("<I", 6) + b"pytest" + struct.pack("<I", len(entries))
+    return data + b"".join(struct.pack("<I", len(entry)) + entry for entry in entries)
+
+
+def build_flac(sample_rate: int, total_samples: int, tags: dict) -> bytes:
+    info = b"\x10\x00\x10\x00" + b"\x00" * 6
+    info += ((sample_rate << 44) | (1 << 41) | (15 << 36) | total_samples).to_bytes(8, "big") + b"\x00" * 16
+    picture = b"\x00" * 5000
+    comment = vorbis_comment(tags)
+    return (
+        b"fLaC"
+        + b"\x00" + len(info).to_bytes(3, "big") + info
+        + b"\x06" + len(picture).to_bytes(3, "big") + picture
+        + b"\x84" + len(comment).to_bytes(3, "big") + comment
+        + b"\xff\xf8" + b"\x00" * 1000
+    )
+
+
+def build_wav(seconds: int, title: str) -> bytes:
+    fmt = struct.pack("<HHIIHH", 1, 2, 44100, 176400, 4, 16)
+    name = title.encode("latin-1") + b"\x00"
+    info = b"INFO" + b"INAM" + struct.pack("<I", len(name)) + name + (b"\x00" if len(name) & 1 else b"")
+    data = b"\x00" * (176400 * seconds)
+    body = (
+        b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"LIST" + struct.pack("<I", len(info)) + info
+        + b"data" + struct.pack("<I", len(data)) + data
+    )
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def ogg_page(serial: int, sequence: int, granule: int, packet: bytes) -> bytes:
+    lacing = [255] * (len(packet) // 255) + [len(packet) % 255]
+    header = b"OggS\x00\x00" + struct.pack("<qIII", granule, serial, sequence, 0)
+    return header + bytes([len(lacing)]) + bytes(lacing) + packet
+
+
+def build_opus(duration_ms: int, pre_skip: int, tags: dict) -> bytes:
+    head = b"OpusHead\x01\x02" + struct.pack("<HIhB", pre_skip, 48000, 0, 0)
+    comments = b"OpusTags" + vorbis_comment(tags)
+    granule = pre_skip + duration_ms * 48
+    return (
+        ogg_page(7, 0, 0, head)
+        + ogg_page(7, 1, 0, comments)
+        + ogg_page(7, 2, granule // 2, b"\x00" * 600)
+        + ogg_page(7, 3, granule, b"\x00" * 600)
+    )
+
+
+def build_adts(frames: int, frame_length: int = 200) -> bytes:
+    """AAC-LC, 44.1 kHz stereo frames of ``frame_length`` bytes."""
+    header = bytes(
+        [
+            0xFF,
+            0xF1,
+            (1 << 6) | (4 << 2),
+            (2 << 6) | ((frame_length >> 11) & 0x03),
+            (frame_length >> 3) & 0xFF,
+            ((frame_length & 0x07) << 5) | 0x1F,
+            0xFC,
+        ]
+    )
+    return (header + b"\x00" * (frame_length - 7)) * frames
+
+
+def build_m4a(duration_ms: int, title: str, artist: str) -> bytes:
+    """Audio-only MP4 with iTunes-style ilst tags."""
+
+    def tag(box_type: bytes, value: str) -> bytes:
+        return mp4_box(box_type, mp4_box(b"data", struct.pack(">II", 1, 0) + value.encode("utf-8")))
+
+    mvhd = struct.pack(">B3xIIII", 0, 0, 0, 1000, duration_ms) + b"\x00" * 80
+    tkhd = struct.pack(">B3x", 0) + b"\x00" * 72 + struct.pack(">II", 0, 0)
+    ilst = mp4_box(b"ilst", tag(b"\xa9nam", title) + tag(b"\xa9ART", artist))
+    udta = mp4_box(b"udta", mp4_box(b"meta", b"\x00" * 4 + mp4_box(b"hdlr", b"\x00" * 25) + ilst))
+    moov = mp4_box(b"moov", mp4_box(b"mvhd", mvhd) + mp4_box(b"trak", mp4_box(b"tkhd", tkhd)) + udta)
+    return mp4_box(b"ftyp", b"M4A \x00\x00\x00\x00") + moov + mp4_box(b"mdat", b"\x00" * 1000)
+
+
+class TestMediaMetadata(unittest.TestCase):
+    """Tests for duration and dimension extraction per container."""
+
+    def setUp(self):
+        """Create a temporary directory for the synthetic files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, data: bytes) -> Path:
+        path = Path(self.temp_dir.name) / name
+        path.write_bytes(data)
+        return path
+
+    def test_mp4_moov_before_and_after_mdat(self):
+        """Test mvhd duration and the largest tkhd size, wherever the moov box sits."""
+        for moov_last in (True, False):
+            metadata = read_media_metadata(self._write("clip.mp4", build_mp4(83_000, 1920, 1080, moov_last)))
+            self.assertEqual((metadata.container, metadata.duration_ms), ("mp4", 83_000))
+            self.assertEqual((metadata.width, metadata.height), (1920, 1080))
+
+    def test_matroska_and_webm(self):
+        """Test Info/Duration scaled by TimecodeScale and the video track size."""
+        metadata = read_media_metadata(self._write("clip.mkv", build_matroska(5_432_100, 1280, 720)))
+        self.assertEqual(metadata, type(metadata)("mkv", 5_432_100, 1280, 720))
+        webm = read_media_metadata(self._write("clip.webm", build_matroska(1_000, 640, 360, doc_type=b"webm")))
+        self.assertEqual(webm.container, "webm")
+
+    def test_matroska_tracks_through_seek_head(self):
+        """Test Tracks stored after the clusters are found through the SeekHead."""
+        metadata = read_media_metadata(self._write("late.mkv", build_matroska(2_000, 854, 480, tracks_last=True)))
+        self.assertEqual((metadata.duration_ms, metadata.width, metadata.height), (2_000, 854, 480))
+
+    def test_avi_and_opendml(self):
+        """Test avih frame count x frame time, preferring the OpenDML total."""
+        metadata = read_media_metadata(self._write("clip.avi", build_avi(750, 40_000, 640, 480)))
+        self.assertEqual(metadata, type(metadata)("avi", 30_000, 640, 480))
+        large = read_media_metadata(self._write("large.avi", build_avi(750, 40_000, 640, 480, odml_frames=90_000)))
+        self.assertEqual(large.duration_ms, 3_600_000)
+
+    def test_flv_on_metadata(self):
+        """Test the AMF0 onMetaData duration, width and height."""
+        metadata = read_media_metadata(self._write("clip.flv", build_flv(12.5, 426, 240)))
+        self.assertEqual(metadata, type(metadata)("flv", 12_500, 426, 240))
+
+    def test_unknown_or_truncated_files(self):
+        """Test unsupported, truncated or missing files yield None without raising."""
+        self.assertIsNone(read_media_metadata(self._write("notes.mp4", b"plain text, not a video")))
+        self.assertIsNone(read_media_metadata(self._write("cut.mkv", build_matroska(1_000, 64, 64)[:30])))
+        self.assertIsNone(read_media_metadata(Path(self.temp_dir.name) / "missing.mp4"))
+
+    def test_video_reads_its_header(self):
+        """Test an unplayed Video gets its duration and resolution from the header."""
+        video = Video(self._write("movie.mp4", build_mp4(60_000, 3840, 2160)))
+        self.assertTrue(video.load_header_metadata())
+        self.assertEqual((video.duration, video.resolution), (60_000, "3840x2160"))
+
+    def test_reading_is_fast(self):
+        """Test a header read stays around a millisecond (payload is skipped, never read)."""
+        paths = [
+            self._write("a.mp4", build_mp4(1_000, 16, 16)),
+            self._write("b.mkv", build_matroska(1_000, 16, 16)),
+            self._write("c.avi", build_avi(25, 40_000, 16, 16)),
+            self._write("d.flv", build_flv(1.0, 16, 16)),
+        ]
+        start = time.perf_counter()
+        for _ in range(50):
+            for path in paths:
+                read_media_metadata(path)
+        per_file_ms = (time.perf_counter() - start) * 1000 / (50 * len(paths))
+        self.assertLess(per_file_ms, 2.0)
+
+
+class TestAudioMetadata(unittest.TestCase):
+    """Tests for audio durations and tags read from the headers."""
+
+    def setUp(self):
+        """Create a temporary directory for the synthetic files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, data: bytes) -> Path:
+        path = Path(self.temp_dir.name) / name
+        path.write_bytes(data)
+        return path
+
+    def test_mp3_xing_and_constant_bitrate(self):
+        """Test the Xing frame count wins, and CBR files are sized by their bitrate."""
+        vbr = read_media_metadata(self._write("vbr.mp3", build_mp3(10, title="Intro", xing_frames=1000)))
+        self.assertEqual(vbr, MediaMetadata("mp3", 1000 * 1152 * 1000 // 44100, title="Intro"))
+        cbr = read_media_metadata(self._write("cbr.mp3", build_mp3(100)))
+        self.assertEqual(cbr.duration_ms, 100 * MP3_FRAME * 8 // 128)
+
+    def test_flac_wav_and_opus(self):
+        """Test STREAMINFO, RIFF data size and the last Ogg granule, with their tags."""
+        flac = read_media_metadata(self._write("a.flac", build_flac(44100, 441_000, {"TITLE": "Song", "ARTIST": "Band"})))
+        self.assertEqual(flac, MediaMetadata("flac", 10_000, title="Song", artist="Band"))
+        wav = read_media_metadata(self._write("b.wav", build_wav(2, "Take 1")))
+        self.assertEqual(wav, MediaMetadata("wav", 2_000, title="Take 1"))
+        opus = read_media_metadata(self._write("c.ogg", build_opus(95_000, 312, {"album": "Live"})))
+        self.assertEqual(opus, MediaMetadata("opus", 95_000, album="Live"))
+
+    def test_adts_and_m4a(self):
+        """Test ADTS is estimated from its first frames and M4A tags come from ilst."""
+        aac = read_media_metadata(self._write("d.aac", build_adts(100)))
+        self.assertEqual((aac.container, aac.duration_ms), ("aac", 100 * 1024 * 1000 // 44100))
+        m4a = read_media_metadata(self._write("e.m4a", build_m4a(42_000, "Song", "Band")))
+        self.assertEqual(m4a, MediaMetadata("mp4", 42_000, title="Song", artist="Band"))
+        self.assertFalse(m4a.has_video)
+
+    def test_audio_video_tags_survive_cache_and_playlist_file(self):
+        """Test an audio item is probed for its duration only and keeps its tags once saved."""
+        video = Video(self._write("track.flac", build_flac(48000, 480_000, {"TITLE": "Song", "ARTIST": "Band"})))
+        self.assertTrue(video.is_audio)
+        self.assertTrue(video.load_header_metadata())
+        self.assertEqual((video.display_title, video.resolution), ("Band - Song", "Audio"))
+        self.assertFalse(MetadataProber.needs_probe(video))
+
+        restored = Video.from_dict(video.to_dict())
+        self.assertEqual((restored.title, restored.artist, restored.duration), ("Song", "Band", 10_000))
+
+        cache = MediaMetadataCache()
+        cache.put("audio", read_media_metadata(video.file_path))
+        cache.put("video", MediaMetadata("mp4", 1_000, 640, 360))
+        self.assertEqual(cache.get("audio").artist, "Band")
+        self.assertEqual(cache.get("video"), MediaMetadata("mp4", 1_000, 640, 360))
+
+
+if __name__ == "__main__":
+    unittest.main()
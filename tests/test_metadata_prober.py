@@ -0,0 +1,175 @@
+"""Tests for the background metadata prober and its persistent cache."""
+
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from PySide6 import QtCore
+
+from src.pyplayer.app.services.metadata_prober import MetadataProber
+from src.pyplayer.domain.media import MediaMetadata, Video, compute_fingerprint
+from src.pyplayer.domain.playlist import Playlist, PlaylistChangeKind
+from src.pyplayer.infrastructure.cache import MediaMetadataCache
+from tests.test_media_metadata import build_mp4
+
+
+class HeldPool:
+    """Collects submitted workers instead of running them, so the test drives the queue."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn):
+        self.submitted.append(fn)
+
+
+class TestMetadataProber(unittest.TestCase):
+    """Tests for cache hits, priorities, batching and persistence."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a QCoreApplication once for the timers."""
+        cls.app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv)
+
+    def setUp(self):
+        """Write a few MP4 headers with distinct durations."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.videos = []
+        for i in range(6):
+            path = root / f"video_{i}.mp4"
+            path.write_bytes(build_mp4((i + 1) * 1000, 640, 360))
+            self.videos.append(Video(path))
+        self.cache_file = root / "cache" / "media_metadata.json"
+        self.cache = MediaMetadataCache(self.cache_file)
+        self.batches = []
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _prober(self, held=False):
+        prober = MetadataProber(self.cache, max_workers=2)
+        if held:
+            pool = HeldPool()
+            prober._pool = lambda: pool
+            prober.held_pool = pool
+        prober.probed.connect(self.batches.append)
+        self.addCleanup(prober.shutdown)
+        return prober
+
+    def _spin(self, predicate, timeout=5.0):
+        deadline = time.perf_counter() + timeout
+        while not predicate() and time.perf_counter() < deadline:
+            self.app.processEvents()
+            time.sleep(0.001)
+        self.assertTrue(predicate(), "condition not reached before the timeout")
+
+    def test_probes_in_background_and_persists(self):
+        """Test every video is filled, batches reach the UI thread, and the cache is saved."""
+        prober = self._prober()
+        self.assertEqual(prober.enqueue(self.videos), 6)
+        self._spin(lambda: prober.is_idle and not prober._flush_timer.isActive())
+        self.assertEqual([video.duration for video in self.videos], [1000, 2000, 3000, 4000, 5000, 6000])
+        self.assertEqual(self.videos[0].resolution, "640x360")
+        self.assertEqual(sum(len(batch) for batch in self.batches), 6)
+
+        reloaded = MediaMetadataCache(self.cache_file)
+        self.assertTrue(reloaded.load())
+        self.assertEqual(reloaded.get(self.videos[2].content_key), MediaMetadata("mp4", 3000, 640, 360))
+        self.assertEqual(
+            reloaded.get_fingerprint(self.videos[2].content_key), compute_fingerprint(self.videos[2].file_path)
+        )
+
+    def test_known_metadata_still_gets_a_fingerprint(self):
+        """Test a video whose metadata is already known is queued once for its fingerprint only."""
+        for video in self.videos:
+            video.update_metadata(width=640, height=360, duration=1000)
+        prober = self._prober(held=True)
+        self.assertEqual(prober.enqueue(self.videos), 6)
+        self.assertEqual(len(prober.held_pool.submitted), 2)
+        for worker in prober.held_pool.submitted:
+            worker()
+        self._spin(lambda: prober.is_idle and not prober._flush_timer.isActive())
+        self.assertTrue(all(self.cache.get_fingerprint(video.content_key) for video in self.videos))
+        self.assertEqual(prober.enqueue(self.videos), 0)
+
+    def test_cache_hits_apply_immediately(self):
+        """Test cached entries fill videos during enqueue, without any probe."""
+        for video in self.videos:
+            self.cache.put(video.content_key, MediaMetadata("mp4", 42_000, 1280, 720))
+            self.cache.put_fingerprint(video.content_key, "0" * 32)
+        prober = self._prober(held=True)
+        fresh = [Video(video.file_path) for video in self.videos]
+        self.assertEqual(prober.enqueue(fresh), 0)
+        self.assertEqual({video.duration for video in fresh}, {42_000})
+        self.assertEqual(prober.held_pool.submitted, [])
+        self._spin(lambda: self.batches)
+        self.assertEqual(len(self.batches), 1)
+
+    def test_visible_rows_first_then_playlist_then_background(self):
+        """Test queue order follows priority, and re-enqueueing promotes a video."""
+        prober = self._prober(held=True)
+        a, b, c, d = self.videos[:4]
+        prober.enqueue([a, b], MetadataProber.PRIORITY_BACKGROUND)
+        prober.enqueue([c], MetadataProber.PRIORITY_PLAYLIST)
+        prober.enqueue([d], MetadataProber.PRIORITY_VISIBLE)
+        prober.enqueue([b], MetadataProber.PRIORITY_VISIBLE)
+        self.assertEqual(prober.pending_count, 4)
+
+        prober.held_pool.submitted[0]()
+        order = []
+        while not prober._results.empty():
+            order.append(prober._results.get_nowait()[0])
+        self.assertEqual(order, [d.content_key, b.content_key, c.content_key, a.content_key])
+
+    def test_file_rewritten_in_place_misses_the_cache(self):
+        """Test a reloaded video whose file changed keeps its id but is probed again under a new key."""
+        video = self.videos[0]
+        prober = self._prober()
+        prober.enqueue([video])
+        self._spin(lambda: prober.is_idle and not prober._flush_timer.isActive())
+        record = video.to_dict()
+        video.file_path.write_bytes(build_mp4(9000, 1280, 720) + b"\0" * 16)
+
+        reloaded = Video.from_dict(record)
+        self.assertEqual(reloaded.id, video.id)
+        self.assertEqual(reloaded.size, video.file_path.stat().st_size)
+        self.assertNotEqual(reloaded.content_key, video.content_key)
+        self.assertEqual((reloaded.duration, reloaded.width), (0, 0))
+        self.assertIsNone(self.cache.get(reloaded.content_key))
+        self.assertEqual(prober.enqueue([reloaded]), 1)
+        self._spin(lambda: prober.is_idle and not prober._flush_timer.isActive())
+        self.assertEqual((reloaded.duration, reloaded.resolution), (9000, "1280x720"))
+
+    def test_unreadable_files_are_cached_too(self):
+        """Test a file without a readable header is remembered and not probed again."""
+        broken = Path(self.temp_dir.name) / "broken.mp4"
+        broken.write_bytes(b"not a container")
+        video = Video(broken)
+        prober = self._prober()
+        prober.enqueue([video])
+        self._spin(lambda: prober.is_idle and not prober._flush_timer.isActive())
+        self.assertEqual(self.cache.get(video.content_key), MediaMetadata(""))
+        self.assertEqual(prober.enqueue([video]), 0)
+
+    def test_playlist_announces_probed_rows_in_runs(self):
+        """Test the playlist reports probed rows as contiguous METADATA_CHANGED ranges."""
+        playlist = Playlist.from_dict({"videos": [{"file_path": str(v.file_path)} for v in self.videos]}, validate_files=False)
+        changes = []
+        playlist.changes.subscribe(changes.extend)
+        rows = [0, 1, 2, 4]
+        for row in rows:
+            playlist.videos[row].update_metadata(duration=1000)
+        self.assertEqual(playlist.notify_metadata_changed([playlist.videos[row] for row in rows]), 4)
+        self.assertEqual(
+            [(change.kind, change.first, change.last) for change in changes],
+            [(PlaylistChangeKind.METADATA_CHANGED, 0, 2), (PlaylistChangeKind.METADATA_CHANGED, 4, 4)],
+        )
+        self.assertEqual(playlist.p_state.total_duration, 4000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Tests for the idle-time multimedia warm-up policy."""
+
+import os
+import sys
+import time
+import unittest
+
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+
+class StepTarget:
+    """Exposes the same step API as PlayerWidget, recording what ran."""
+
+    INIT_STEPS = ("backend", "audio_output", "media_player", "video_output", "finish")
+
+    def __init__(self):
+        self.ran = []
+        self.log = []
+
+    @property
+    def player_ready(self):
+        return len(self.ran) == len(self.INIT_STEPS)
+
+    def run_initialization_step(self):
+        if self.player_ready:
+            return None
+        from PySide6 import QtCore
+
+        name = self.INIT_STEPS[len(self.ran)]
+        self.ran.append(name)
+        self.log.append(name)
+        # Marks the end of the event-loop turn that ran this step
+        QtCore.QTimer.singleShot(0, lambda: self.log.append("turn"))
+        return name
+
+    def run_all(self):
+        while self.run_initialization_step() is not None:
+            pass
+
+
+class TestMultimediaWarmup(unittest.TestCase):
+    """Tests for idle detection, slicing, cancellation and the low power preference."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication once for all tests."""
+        from PySide6 import QtWidgets
+
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication(sys.argv)
+
+    def setUp(self):
+        """Create a step target and a warm-up with a short idle period."""
+        from src.pyplayer.ui.startup.multimedia_warmup import MultimediaWarmup
+
+        self.target = StepTarget()
+        self.warmup = MultimediaWarmup(self.target, idle_ms=20)
+        self.reports = []
+        self.warmup.finished.connect(self.reports.append)
+
+    def tearDown(self):
+        """Stop the warm-up."""
+        self.warmup.cancel()
+
+    def _spin(self, ms, until=None):
+        deadline = time.perf_counter() + ms / 1000
+        while time.perf_counter() < deadline and not (until and until()):
+            self.app.processEvents()
+            time.sleep(0.001)
+
+    def test_runs_one_step_per_event_loop_turn_after_idle(self):
+        """Test nothing runs before the idle period, then every step runs and is timed."""
+        self.assertTrue(self.warmup.schedule())
+        self.app.processEvents()
+        self.assertEqual(self.target.ran, [])
+
+        self._spin(300, until=lambda: self.reports)
+        self.assertEqual(self.warmup.state, self.warmup.STATE_DONE)
+        self.assertEqual(list(self.reports[0]), list(StepTarget.INIT_STEPS))
+        self._spin(10)
+        expected = []
+        for name in StepTarget.INIT_STEPS:
+            expected += [name, "turn"]
+        self.assertEqual(self.target.log, expected)
+
+    def test_input_postpones_the_next_step(self):
+        """Test a key press restarts the idle period."""
+        from PySide6 import QtCore, QtGui
+
+        self.warmup.schedule()
+        self._spin(12)
+        key = QtGui.QKeyEvent(QtCore.QEvent.Type.KeyPress, QtCore.Qt.Key.Key_A, QtCore.Qt.KeyboardModifier.NoModifier)
+        self.warmup.eventFilter(self.app, key)
+        self._spin(12)
+        self.assertEqual(self.target.ran, [])
+
+    def test_cancel_stops_the_warmup(self):
+        """Test a cancelled warm-up never runs a step."""
+        self.warmup.schedule()
+        self.warmup.cancel()
+        self._spin(60)
+        self.assertEqual(self.target.ran, [])
+        self.assertEqual(self.warmup.state, self.warmup.STATE_CANCELLED)
+
+    def test_low_power_skips_the_warmup(self):
+        """Test the low power preference disables the warm-up."""
+        from src.pyplayer.ui.startup.multimedia_warmup import MultimediaWarmup
+
+        warmup = MultimediaWarmup(self.target, idle_ms=0, low_power=True)
+        self.assertFalse(warmup.schedule())
+        self._spin(20)
+        self.assertEqual(self.target.ran, [])
+        self.assertEqual(warmup.state, MultimediaWarmup.STATE_SKIPPED)
+
+    def test_first_play_during_warmup_finishes_it(self):
+        """Test a first play that completes initialization ends the warm-up early."""
+        self.warmup.schedule()
+        self._spin(30)
+        self.target.run_all()
+        self._spin(20)
+        self.assertEqual(self.warmup.state, self.warmup.STATE_DONE)
+        self.assertEqual(len(self.reports), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
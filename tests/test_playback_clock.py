@@ -0,0 +1,97 @@
+"""Tests for the playback clock service."""
+
+import sys
+import unittest
+
+from PySide6 import QtCore
+
+from src.pyplayer.app.services.playback_clock import PlaybackClock, format_hms
+
+
+class FakePlayer:
+    """Stands in for QMediaPlayer: only the two getters the clock reads."""
+
+    def __init__(self, position=0, duration=0):
+        self.position_ms = position
+        self.duration_ms = duration
+
+    def position(self):
+        return self.position_ms
+
+    def duration(self):
+        return self.duration_ms
+
+
+class TestPlaybackClock(unittest.TestCase):
+    """Tests for sampling, coalescing and rate switching."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a QCoreApplication once for the timers."""
+        cls.app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv)
+
+    def setUp(self):
+        """Attach a clock to a fake player and record its ticks."""
+        self.player = FakePlayer(position=0, duration=3_723_000)
+        self.clock = PlaybackClock()
+        self.clock.set_player(self.player)
+        self.ticks = []
+        self.clock.subscribe(self.ticks.append)
+
+    def test_format_hms(self):
+        """Test positions are formatted as HH:MM:SS."""
+        self.assertEqual(format_hms(3_723_999), "01:02:03")
+        self.assertEqual(format_hms(-5), "00:00:00")
+
+    def test_text_is_reformatted_only_when_the_second_changes(self):
+        """Test sub-second updates reuse the formatted strings."""
+        self.clock.sample()
+        self.player.position_ms = 400
+        self.clock.sample()
+        self.player.position_ms = 1_010
+        self.clock.sample()
+
+        self.assertEqual([tick.second_changed for tick in self.ticks], [True, False, True])
+        self.assertIs(self.ticks[0].position_text, self.ticks[1].position_text)
+        self.assertEqual(self.ticks[2].position_text, "00:00:01")
+        self.assertEqual(self.ticks[2].duration_text, "01:02:03")
+
+    def test_unchanged_position_publishes_nothing(self):
+        """Test a sample that reads the same values does not notify consumers."""
+        self.clock.sample()
+        self.clock.sample()
+        self.assertEqual(len(self.ticks), 1)
+
+    def test_requests_are_coalesced_per_event_loop_turn(self):
+        """Test many position notifications while paused give a single sample."""
+        for position in range(0, 1000, 100):
+            self.player.position_ms = position
+            self.clock.request_sample(position)
+        self.assertEqual(self.ticks, [])
+
+        self.app.processEvents()
+        self.assertEqual(len(self.ticks), 1)
+        self.assertEqual(self.ticks[0].position, 900)
+
+    def test_background_rate(self):
+        """Test hiding the window lowers the sampling rate and showing restores it."""
+        active = self.clock.interval
+        self.clock.set_background(True)
+        self.assertEqual(self.clock.interval, round(1000 / PlaybackClock.BACKGROUND_HZ))
+        self.clock.set_background(False)
+        self.assertEqual(self.clock.interval, active)
+        self.assertEqual(active, round(1000 / PlaybackClock.ACTIVE_HZ))
+
+    def test_stop_publishes_the_final_position(self):
+        """Test stopping the clock reports where playback stopped."""
+        self.clock.start()
+        self.assertTrue(self.clock.is_running)
+        self.player.position_ms = 5_000
+        self.clock.stop()
+
+        self.assertFalse(self.clock.is_running)
+        self.assertEqual(self.ticks[-1].position, 5_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
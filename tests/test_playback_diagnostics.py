@@ -0,0 +1,142 @@
+"""Tests for the playback diagnostics statistics and session log."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from PySide6 import QtCore
+
+from src.pyplayer.app.services.playback_diagnostics import FrameStatistics, PlaybackDiagnostics, jitter_bucket
+
+FRAME_US = 40_000  # 25 fps
+
+
+class FakeFrame:
+    """Stands in for QVideoFrame: a presentation timestamp in microseconds."""
+
+    def __init__(self, start_time):
+        self._start_time = start_time
+
+    def isValid(self):
+        return True
+
+    def startTime(self):
+        return self._start_time
+
+
+class FakeSink(QtCore.QObject):
+    """Stands in for QVideoSink."""
+
+    videoFrameChanged = QtCore.Signal(object)
+
+
+class TestFrameStatistics(unittest.TestCase):
+    """Tests for drops, late frames, jitter buckets and stall correlation."""
+
+    def setUp(self):
+        """Create empty statistics."""
+        self.stats = FrameStatistics()
+
+    def _deliver(self, frames, display=False, delays=None):
+        """Record ``frames`` (pts indexes) at their nominal time plus an optional delay per index."""
+        delays = delays or {}
+        for index in frames:
+            at = 10.0 + index * FRAME_US / 1e6 + delays.get(index, 0.0)
+            self.stats.record_delivery(index * FRAME_US, at)
+            if display:
+                self.stats.record_display(index * FRAME_US, at)
+
+    def test_steady_playback_and_gaps(self):
+        """Test a steady stream has no drops, and missing timestamps count as dropped frames."""
+        self._deliver(range(50))
+        window = self.stats.take_window(10.0 + 50 * FRAME_US / 1e6)
+        self.assertEqual((window["frames"], window["dropped"], window["late_delivery"]), (50, 0, 0))
+        self.assertAlmostEqual(window["fps"], 25.0, delta=0.6)
+        self.assertEqual(window["interval_ms"], 40.0)
+        self.assertEqual(window["jitter_delivery"][0], 49)
+
+        self._deliver([50, 51, 54, 55])
+        self.assertEqual(self.stats.take_window(13.0)["dropped"], 2)
+        self.assertEqual(self.stats.summary()["dropped"], 2)
+
+    def test_seek_is_not_counted_as_drops(self):
+        """Test a jump past the discontinuity threshold, or backwards, resets the comparison."""
+        self._deliver(range(10))
+        self._deliver([500, 501, 3, 4])
+        self.assertEqual(self.stats.take_window(30.0)["dropped"], 0)
+
+    def test_late_display_inside_a_stall(self):
+        """Test frames delivered on time but handled late during a UI stall are attributed to it."""
+        self._deliver(range(10))
+        start = 10.0 + 5 * FRAME_US / 1e6
+        for index in range(10):
+            at = 10.0 + index * FRAME_US / 1e6 + (0.15 if index == 6 else 0.0)
+            self.stats.record_display(index * FRAME_US, at)
+        self.stats.record_stall(start, 140.0)
+        window = self.stats.take_window(12.0)
+        self.assertEqual(window["late_delivery"], 0)
+        self.assertEqual(window["late_display"], 1)
+        self.assertEqual(window["late_in_stall"], 1)
+        self.assertEqual((window["stalls"], window["stall_max_ms"]), (1, 140.0))
+        self.assertEqual(sum(window["jitter_display"]), 9)
+
+    def test_jitter_buckets(self):
+        """Test bucket bounds: under 2 ms first, over 66 ms last."""
+        self.assertEqual([jitter_bucket(ms) for ms in (0.5, 3, 20, 500)], [0, 1, 4, 6])
+
+
+class TestPlaybackDiagnostics(unittest.TestCase):
+    """Tests for the sink tap, the per-second report and the JSONL session log."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a QCoreApplication once for the timers and queued signals."""
+        cls.app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv)
+
+    def setUp(self):
+        """Create a diagnostics session logging to a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.diagnostics = PlaybackDiagnostics(Path(self.temp_dir.name))
+        self.sink = FakeSink()
+
+    def tearDown(self):
+        """Stop the session and clean up."""
+        self.diagnostics.stop()
+        self.temp_dir.cleanup()
+
+    def test_session_log(self):
+        """Test frames reach both taps and the log holds the header, windows and summary."""
+        reports = []
+        self.diagnostics.report.connect(reports.append)
+        self.diagnostics.set_position_source(lambda: 1234)
+        self.diagnostics.tap(self.sink)
+        self.diagnostics.start()
+        self.diagnostics.set_source("/media/movie.mkv")
+        for index in range(5):
+            self.sink.videoFrameChanged.emit(FakeFrame(index * FRAME_US))
+        self.app.processEvents()
+        self.diagnostics._on_report()
+        self.diagnostics.stop()
+
+        self.assertEqual(reports[0]["frames"], 5)
+        self.assertEqual(reports[0]["position_ms"], 1234)
+        self.assertEqual(sum(reports[0]["jitter_display"]), 4)
+        lines = [json.loads(line) for line in self.diagnostics.log_path.read_text().splitlines()]
+        self.assertEqual([line["event"] for line in lines], ["session", "source", "window", "summary"])
+        self.assertEqual(lines[-1]["frames"], 5)
+
+    def test_idle_windows_are_not_logged(self):
+        """Test nothing is written while no frame arrives, and untap stops listening."""
+        self.diagnostics.tap(self.sink)
+        self.diagnostics.untap()
+        self.diagnostics.start()
+        self.sink.videoFrameChanged.emit(FakeFrame(0))
+        self.diagnostics._on_report()
+        self.diagnostics.stop()
+        self.assertIsNone(self.diagnostics.log_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
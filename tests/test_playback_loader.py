@@ -0,0 +1,95 @@
+"""Tests for the seek-before-play loading sequence."""
+
+import sys
+import time
+import unittest
+
+from PySide6 import QtCore
+
+from src.pyplayer.app.services.playback_loader import LoadState, PlaybackLoader
+
+
+class FakePlayer:
+    """Stands in for QMediaPlayer: records the calls in order."""
+
+    def __init__(self):
+        self.calls = []
+
+    def setSource(self, source):
+        self.calls.append(("source", source))
+
+    def setPosition(self, position):
+        self.calls.append(("seek", position))
+
+    def play(self):
+        self.calls.append(("play",))
+
+
+class TestPlaybackLoader(unittest.TestCase):
+    """Tests for the state sequence, the resume seek and first-frame timing."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a QCoreApplication once for the timers."""
+        cls.app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv)
+
+    def setUp(self):
+        """Attach a loader to a fake player and record its states."""
+        self.player = FakePlayer()
+        self.loader = PlaybackLoader()
+        self.loader.set_player(self.player)
+        self.states = []
+        self.loader.state_changed.connect(self.states.append)
+
+    def test_resume_seek_happens_before_play(self):
+        """Test play waits for the loaded media and comes after the resume seek."""
+        self.loader.load("file.mp4", resume_ms=90_000)
+        self.assertEqual(self.player.calls, [("source", "file.mp4")])
+        self.loader.notify_frame()  # stale frame of the previous item
+        self.assertEqual(self.loader.state, LoadState.LOADING)
+
+        self.loader.media_loaded()
+        self.assertEqual(self.player.calls[1:], [("seek", 90_000), ("play",)])
+        self.loader.notify_frame()
+        self.assertEqual(self.states, [LoadState.LOADING, LoadState.SEEKING, LoadState.PLAYING])
+        self.assertEqual(self.loader.latencies[-1][1], 90_000)
+
+    def test_start_without_resume_point(self):
+        """Test an item without resume point plays from the start without any seek."""
+        self.loader.load("file.mp4")
+        self.loader.media_loaded()
+        self.assertEqual(self.player.calls, [("source", "file.mp4"), ("play",)])
+        self.assertEqual(self.loader.state, LoadState.STARTING)
+
+    def test_audio_only_completes_on_position(self):
+        """Test media without video reports its first output through position updates."""
+        self.loader.load("song.mp3", resume_ms=5_000)
+        self.loader.media_loaded(has_video=False)
+        self.loader.notify_frame()
+        self.assertTrue(self.loader.busy)
+        self.loader.notify_position(5_000)
+        self.assertEqual(self.loader.state, LoadState.PLAYING)
+
+    def test_already_loaded_source_and_failure(self):
+        """Test an already open source is started at once, and an invalid one resets the loader."""
+        self.loader.load("file.mp4", resume_ms=3_000, loaded=True)
+        self.assertEqual(self.player.calls, [("seek", 3_000), ("play",)])
+
+        self.loader.load("broken.mp4")
+        self.loader.media_failed()
+        self.assertEqual(self.loader.state, LoadState.IDLE)
+        self.loader.media_loaded()
+        self.assertEqual(self.player.calls[-1], ("source", "broken.mp4"))
+
+    def test_latency_is_measured_from_the_request(self):
+        """Test the first-frame latency starts at the given request time."""
+        self.loader.load("file.mp4", requested_at=time.perf_counter() - 0.25)
+        self.loader.media_loaded()
+        self.loader.notify_frame()
+        summary = self.loader.latency_summary()
+        self.assertEqual(summary["count"], 1)
+        self.assertGreaterEqual(summary["mean"], 250.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
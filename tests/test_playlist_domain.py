@@ -177,6 +177,18 @@ class TestPlaylist(unittest.TestCase):
         finally:
             Path(video_file.name).unlink()
 
+    def test_playlist_accepts_audio_files(self):
+        """Test audio files are added and an all-audio playlist is flagged as such."""
+        playlist = Playlist()
+        for name in ("a.mp3", "b.flac"):
+            (self.temp_path / name).write_bytes(b"")
+            self.assertIsNotNone(playlist.add_video(self.temp_path / name))
+        self.assertTrue(playlist.is_audio_only)
+        (self.temp_path / "c.mkv").write_bytes(b"")
+        playlist.add_video(self.temp_path / "c.mkv")
+        self.assertFalse(playlist.is_audio_only)
+        self.assertFalse(Playlist().is_audio_only)
+
     def test_playlist_duplicate_video_rejected(self):
         """Test that duplicate videos are rejected."""
         playlist = Playlist()
@@ -506,5 +518,175 @@ class TestPlaylist(unittest.TestCase):
         self.assertIn("videos", result)
 
 
+
+class TestPlaylistVideoIds(unittest.TestCase):
+    """Tests for stable video ids and id-based lookups."""
+
+    def setUp(self):
+        """Create two files sharing a display name in different folders."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.paths = []
+        for folder in ["season1", "season2", "season3"]:
+            path = self.temp_path / folder / "episode.mp4"
+            path.parent.mkdir()
+            path.touch()
+            self.paths.append(path)
+        self.playlist = Playlist()
+        self.videos = [self.playlist.add_video(path) for path in self.paths]
+
+    def tearDown(self):
+        """Clean up temp directory."""
+        self.temp_dir.cleanup()
+
+    def test_same_name_videos_have_distinct_ids(self):
+        """Test that identical names in different folders do not collide."""
+        ids = {video.id for video in self.videos}
+        self.assertEqual(len(ids), 3)
+        self.assertIs(self.playlist.get_video_by_id(self.videos[1].id), self.videos[1])
+
+    def test_id_lookup_follows_mutations(self):
+        """Test id -> row lookups stay correct after remove and move."""
+        self.playlist.remove_video(self.videos[0])
+        self.assertEqual(self.playlist.index_of_id(self.videos[0].id), -1)
+        self.assertEqual(self.playlist.index_of_id(self.videos[2].id), 1)
+
+        self.playlist.move_video(1, 0)
+        self.assertEqual(self.playlist.index_of_id(self.videos[2].id), 0)
+
+    def test_jump_to_video_by_id(self):
+        """Test selecting the current video by id."""
+        self.assertTrue(self.playlist.jump_to_video_by_id(self.videos[2].id))
+        self.assertIs(self.playlist.current_video, self.videos[2])
+        self.assertFalse(self.playlist.jump_to_video_by_id("missing"))
+
+    def test_id_survives_serialization(self):
+        """Test that ids are persisted rather than recomputed."""
+        restored = Playlist.from_dict(self.playlist.to_dict(), validate_files=False)
+        self.assertEqual([video.id for video in restored.videos], [video.id for video in self.videos])
+
+
+class TestPlaylistBulkRemoval(unittest.TestCase):
+    """Tests for removing many videos in one pass."""
+
+    def setUp(self):
+        """Build a ten-video playlist without touching the disk."""
+        data = {"videos": [{"file_path": f"/media/video_{i}.mp4"} for i in range(10)]}
+        self.playlist = Playlist.from_dict(data, validate_files=False)
+        self.ids = [video.id for video in self.playlist.videos]
+
+    def test_remove_videos_keeps_order_and_current(self):
+        """Test the survivors keep their order and the current video follows its new row."""
+        self.playlist.current_index = 6
+        saves = []
+        self.playlist._auto_save_if_needed = lambda: saves.append(True)
+
+        removed = self.playlist.remove_videos([self.ids[1], self.ids[2], self.ids[8], "missing"])
+        self.assertEqual(removed, 3)
+        self.assertEqual([video.id for video in self.playlist.videos], [self.ids[i] for i in (0, 3, 4, 5, 6, 7, 9)])
+        self.assertEqual(self.playlist.current_video.id, self.ids[6])
+        self.assertEqual(self.playlist.index_of_id(self.ids[9]), 6)
+        self.assertEqual(len(saves), 1)
+
+    def test_remove_videos_drops_current(self):
+        """Test removing the current video leaves no current video."""
+        self.playlist.current_index = 3
+        self.playlist.remove_videos([self.ids[3]])
+        self.assertEqual(self.playlist.current_index, -1)
+        self.assertEqual(self.playlist.remove_videos([]), 0)
+
+    def test_remove_videos_remaps_shuffle_order(self):
+        """Test the shuffle order keeps the surviving rows, remapped once."""
+        self.playlist.set_play_mode(PlayMode.SHUFFLE)
+        survivors_before = [self.ids[row] for row in self.playlist._shuffle_order if row % 2 == 0]
+
+        self.playlist.remove_videos(self.ids[1::2])
+        order = self.playlist._shuffle_order
+        self.assertEqual(sorted(order), list(range(5)))
+        self.assertEqual([self.playlist.videos[row].id for row in order], survivors_before)
+
+    def test_remove_missing_files_compacts_once(self):
+        """Test missing entries are removed in one pass with one save, using the given existence check."""
+        self.playlist.current_index = 5
+        saves = []
+        self.playlist._auto_save_if_needed = lambda: saves.append(True)
+        present = {f"/media/video_{i}.mp4" for i in (0, 4, 5, 9)}
+
+        removed = self.playlist.remove_missing_files(exists=lambda path: str(path) in present)
+        self.assertEqual([item["index"] for item in removed], [1, 2, 3, 6, 7, 8])
+        self.assertEqual([video.id for video in self.playlist.videos], [self.ids[i] for i in (0, 4, 5, 9)])
+        self.assertEqual(self.playlist.current_video.id, self.ids[5])
+        self.assertEqual(len(saves), 1)
+        self.assertEqual(self.playlist.get_validation_report()["total_videos"], 4)
+
+
+
+class TestPlaylistSnapshot(unittest.TestCase):
+    """Tests for copy-on-write playlist snapshots."""
+
+    def setUp(self):
+        """Create a playlist with a few videos."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.playlist = Playlist()
+        self.playlist.name = "Snap"
+        for i in range(6):
+            path = self.temp_path / f"video_{i}.mp4"
+            path.touch()
+            self.playlist.add_video(path)
+
+    def tearDown(self):
+        """Clean up temp directory."""
+        self.temp_dir.cleanup()
+
+    def test_snapshot_shares_structure_until_mutation(self):
+        """Test the snapshot reuses the live list and the playlist copies on write."""
+        live_list = self.playlist.videos
+        snapshot = self.playlist.snapshot()
+        self.assertIs(snapshot._videos, live_list)
+
+        self.playlist.remove_video(0)
+        self.assertIsNot(self.playlist.videos, live_list)
+        self.assertEqual(len(snapshot), 6)
+        self.assertEqual(len(self.playlist), 5)
+
+    def test_mutations_without_snapshot_do_not_copy(self):
+        """Test that no copy happens when nobody holds a snapshot."""
+        live_list = self.playlist.videos
+        self.playlist.move_video(0, 3)
+        self.playlist.remove_video(1)
+        self.assertIs(self.playlist.videos, live_list)
+
+    def test_snapshot_is_stable_across_structural_changes(self):
+        """Test move, swap, clear and shuffle navigation leave the snapshot intact."""
+        self.playlist.set_play_mode(PlayMode.SHUFFLE)
+        snapshot = self.playlist.snapshot()
+        names = [video.name for video in snapshot]
+        shuffle_order = list(snapshot._shuffle_order)
+
+        self.playlist.move_video(0, 5)
+        self.playlist.swap_videos(1, 2)
+        for _ in range(8):
+            self.playlist.get_next_video()
+        self.playlist.clear()
+
+        self.assertEqual([video.name for video in snapshot], names)
+        self.assertEqual(snapshot._shuffle_order, shuffle_order)
+        self.assertLess(snapshot.revision, self.playlist.revision)
+
+    def test_snapshot_serializes_like_the_playlist(self):
+        """Test to_dict on a snapshot matches the playlist at snapshot time."""
+        self.playlist.current_index = 2
+        expected = self.playlist.to_dict()
+        snapshot = self.playlist.snapshot()
+        self.playlist.remove_video(2)
+        self.playlist.name = "Renamed"
+
+        data = snapshot.to_dict()
+        for key in ("name", "current_index", "videos", "playlist_state", "unique_id"):
+            self.assertEqual(data[key], expected[key])
+        self.assertEqual(snapshot.current_video.name, expected["videos"][2]["name"])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
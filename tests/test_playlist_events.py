@@ -0,0 +1,195 @@
+"""Tests for granular Playlist change notifications."""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.pyplayer.domain.playlist import Playlist, PlaylistChangeKind
+
+
+class ManualScheduler:
+    """Collects flush callbacks and runs them on demand, like one event-loop tick."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def __call__(self, callback):
+        self.callbacks.append(callback)
+
+    def tick(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+class RecordingView:
+    """Mirrors a playlist the way the dock does and counts view operations."""
+
+    def __init__(self, playlist):
+        self.rows = [video.id for video in playlist.videos]
+        self.current = -1
+        self.batches = 0
+        self.operations = {kind: 0 for kind in PlaylistChangeKind}
+        self.playlist = playlist
+        playlist.changes.subscribe(self.apply)
+
+    @property
+    def total_operations(self):
+        return sum(self.operations.values())
+
+    def apply(self, changes):
+        self.batches += 1
+        for change in changes:
+            self.operations[change.kind] += 1
+            if change.kind is PlaylistChangeKind.ROWS_INSERTED:
+                self.rows[change.first:change.first] = [video.id for video in change.videos]
+            elif change.kind is PlaylistChangeKind.ROWS_REMOVED:
+                del self.rows[change.first:change.last + 1]
+            elif change.kind is PlaylistChangeKind.ROW_MOVED:
+                self.rows.insert(change.destination, self.rows.pop(change.first))
+            elif change.kind is PlaylistChangeKind.CURRENT_CHANGED:
+                self.current = change.first
+            elif change.kind is PlaylistChangeKind.RESET:
+                self.rows = [video.id for video in self.playlist.videos]
+
+
+class TestPlaylistChangeEvents(unittest.TestCase):
+    """Tests for the changes emitted by Playlist mutations."""
+
+    def setUp(self):
+        """Create media files and a playlist with a manual scheduler."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.paths = []
+        for i in range(30):
+            path = self.temp_path / f"video_{i:02d}.mp4"
+            path.touch()
+            self.paths.append(path)
+        self.playlist = Playlist()
+        self.scheduler = ManualScheduler()
+        self.playlist.changes.scheduler = self.scheduler
+
+    def tearDown(self):
+        """Clean up temp directory."""
+        self.temp_dir.cleanup()
+
+    def _fill(self, count):
+        for path in self.paths[:count]:
+            self.playlist.add_video(path)
+        self.scheduler.tick()
+
+    def test_immediate_delivery_without_scheduler(self):
+        """Test a playlist without scheduler delivers each change at once."""
+        self.playlist.changes.scheduler = None
+        view = RecordingView(self.playlist)
+
+        video = self.playlist.add_video(self.paths[0])
+        self.assertEqual(view.batches, 1)
+        self.assertEqual(view.rows, [video.id])
+
+    def test_bulk_append_is_one_insert_operation(self):
+        """Test twenty appends in one tick reach the view as one insertion."""
+        view = RecordingView(self.playlist)
+        self._fill(20)
+
+        self.assertEqual(view.batches, 1)
+        self.assertEqual(view.total_operations, 1)
+        self.assertEqual(view.operations[PlaylistChangeKind.ROWS_INSERTED], 1)
+        self.assertEqual(view.rows, [video.id for video in self.playlist.videos])
+
+    def test_adjacent_removals_are_one_remove_operation(self):
+        """Test removing consecutive rows coalesces into a single range."""
+        self._fill(10)
+        view = RecordingView(self.playlist)
+
+        for _ in range(3):
+            self.playlist.remove_video(5)
+        self.scheduler.tick()
+
+        self.assertEqual(view.total_operations, 1)
+        self.assertEqual(view.rows, [video.id for video in self.playlist.videos])
+
+    def test_bulk_removal_is_one_range_per_run(self):
+        """Test remove_videos reports each contiguous run of rows as one removal."""
+        self._fill(20)
+        view = RecordingView(self.playlist)
+        ids = [video.id for video in self.playlist.videos]
+
+        self.playlist.remove_videos(ids[2:6] + ids[9:10] + ids[14:20])
+        self.scheduler.tick()
+
+        self.assertEqual(view.operations[PlaylistChangeKind.ROWS_REMOVED], 3)
+        self.assertEqual(view.total_operations, 3)
+        self.assertEqual(view.rows, [video.id for video in self.playlist.videos])
+
+    def test_progress_updates_touch_only_the_current_row(self):
+        """Test repeated progress updates in a tick cost one row refresh."""
+        self._fill(10)
+        self.playlist.current_index = 4
+        self.scheduler.tick()
+        view = RecordingView(self.playlist)
+
+        for position in range(0, 5000, 500):
+            self.playlist.update_current_video_state(position=position, duration=10000)
+        self.scheduler.tick()
+
+        self.assertEqual(view.total_operations, 1)
+        self.assertEqual(view.operations[PlaylistChangeKind.PROGRESS_CHANGED], 1)
+
+    def test_navigation_reports_current_row(self):
+        """Test next/previous report the new current row."""
+        self._fill(5)
+        view = RecordingView(self.playlist)
+
+        self.playlist.get_next_video()
+        self.playlist.get_next_video()
+        self.scheduler.tick()
+
+        self.assertEqual(view.current, self.playlist.current_index)
+        self.assertEqual(view.operations[PlaylistChangeKind.CURRENT_CHANGED], 1)
+
+    def test_mixed_mutations_replay_to_final_order(self):
+        """Test a batch of random mutations replays to the playlist order."""
+        self._fill(15)
+        view = RecordingView(self.playlist)
+        rng = random.Random(7)
+
+        for path in self.paths[15:]:
+            self.playlist.add_video(path)
+            action = rng.choice(["move", "swap", "remove"])
+            size = len(self.playlist)
+            if action == "move":
+                self.playlist.move_video(rng.randrange(size), rng.randrange(size))
+            elif action == "swap":
+                self.playlist.swap_videos(rng.randrange(size), rng.randrange(size))
+            else:
+                self.playlist.remove_video(rng.randrange(size))
+        self.scheduler.tick()
+
+        self.assertEqual(view.batches, 1)
+        self.assertEqual(view.rows, [video.id for video in self.playlist.videos])
+
+    def test_clear_supersedes_pending_changes(self):
+        """Test a reset drops the changes queued before it."""
+        view = RecordingView(self.playlist)
+        for path in self.paths[:5]:
+            self.playlist.add_video(path)
+        self.playlist.clear()
+        self.scheduler.tick()
+
+        self.assertEqual(view.total_operations, 1)
+        self.assertEqual(view.operations[PlaylistChangeKind.RESET], 1)
+        self.assertEqual(view.rows, [])
+
+    def test_no_listener_means_no_queue(self):
+        """Test mutations without listeners only bump the revision."""
+        revision = self.playlist.revision
+        self.playlist.add_video(self.paths[0])
+
+        self.assertEqual(self.scheduler.callbacks, [])
+        self.assertGreater(self.playlist.revision, revision)
+
+
+if __name__ == "__main__":
+    unittest.main()
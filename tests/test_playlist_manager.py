@@ -1,15 +1,19 @@
 """Tests for PlaylistManager service."""
 
+import os
 import tempfile
 import unittest
+from unittest import mock
 from pathlib import Path
 
 from src.pyplayer.app.services.playlist_manager import PlaylistManager
-from src.pyplayer.app.services.playlist_registry import PlaylistRegistry
+from src.pyplayer.app.services.playlist_registry import PlaylistHeader, PlaylistRegistry
+from src.pyplayer.domain.playlist import Playlist
 from src.pyplayer.infrastructure.persistence.playlist_repository import PlaylistRepository
 from src.pyplayer.infrastructure.persistence.manager_config_store import ManagerConfigStore
 from src.pyplayer.infrastructure.persistence.last_played_store import LastPlayedStore
 from src.pyplayer.infrastructure.backup.backup_cleaner import BackupCleaner
+from src.pyplayer.infrastructure.filesystem import DirectoryListingCache
 
 
 class TestPlaylistManagerCreation(unittest.TestCase):
@@ -238,6 +242,106 @@ class TestPlaylistManagerBackupStats(unittest.TestCase):
         self.assertIn("playlists_cleaned", result)
         self.assertIn("videos_removed", result)
 
+    def test_cleanup_removes_missing_files_and_saves(self):
+        """Test cleanup drops missing entries from every playlist and persists only those playlists."""
+        media = self.temp_path / "media"
+        media.mkdir()
+        paths = [media / f"video_{i}.mp4" for i in range(4)]
+        for path in paths:
+            path.touch()
+        first = self.manager.create_playlist(name="First")
+        second = self.manager.create_playlist(name="Second")
+        untouched = self.manager.create_playlist(name="Untouched")
+        for path in paths:
+            first.add_video(path)
+        second.add_video(paths[1])
+        untouched.add_video(paths[0])
+        paths[1].unlink()
+        paths[3].unlink()
+        untouched_mtime = untouched.save_file_path.stat().st_mtime_ns if untouched.save_file_path.exists() else None
+
+        result = self.manager.cleanup()
+        self.assertEqual(result, {"playlists_cleaned": 2, "videos_removed": 3})
+        self.assertEqual([video.file_path for video in first.videos], [paths[0], paths[2]])
+        self.assertEqual(second.videos, [])
+        reloaded = Playlist.load_from_file(first.save_file_path)
+        self.assertEqual([video.file_path for video in reloaded.videos], [paths[0], paths[2]])
+        if untouched_mtime is not None:
+            self.assertEqual(untouched.save_file_path.stat().st_mtime_ns, untouched_mtime)
+
+    def test_cleanup_saves_each_cleaned_playlist_once(self):
+        """Test the compaction does not auto-save on top of the explicit cleanup save."""
+        media = self.temp_path / "media"
+        media.mkdir()
+        kept, gone = media / "kept.mp4", media / "gone.mp4"
+        kept.touch()
+        gone.touch()
+        playlist = self.manager.create_playlist(name="Cleaned")
+        playlist.add_video(kept)
+        playlist.add_video(gone)
+        gone.unlink()
+        saves = []
+        save_to_file = playlist.save_to_file
+        playlist.save_to_file = lambda *args, **kwargs: saves.append(kwargs) or save_to_file(*args, **kwargs)
+
+        with mock.patch.object(Playlist, "AUTO_SAVE_COOLDOWN", 0.0):
+            self.assertEqual(self.manager.cleanup()["videos_removed"], 1)
+        self.assertEqual(saves, [{}])
+
+    def test_listing_cache_lists_each_folder_once(self):
+        """Test existence checks are answered from one listing per folder."""
+        media = self.temp_path / "listed"
+        media.mkdir()
+        (media / "a.mp4").touch()
+        listings = DirectoryListingCache()
+        self.assertEqual(listings.prefetch([media / "a.mp4", media / "b.mp4", self.temp_path / "gone" / "c.mp4"]), 2)
+        (media / "b.mp4").touch()
+        self.assertTrue(listings.exists(media / "a.mp4"))
+        self.assertFalse(listings.exists(media / "b.mp4"))  # snapshot taken before the file appeared
+        self.assertFalse(listings.exists(self.temp_path / "gone" / "c.mp4"))
+        self.assertEqual(len(listings), 2)
+
+    def test_cleanup_keeps_entries_of_unlistable_folders(self):
+        """Test a folder that fails to list is checked file by file instead of being taken as empty."""
+        media = self.temp_path / "flaky"
+        media.mkdir()
+        present, gone = media / "present.mp4", media / "gone.mp4"
+        present.touch()
+        gone.touch()
+        playlist = self.manager.create_playlist(name="Flaky")
+        playlist.add_video(present)
+        playlist.add_video(gone)
+        gone.unlink()
+        listdir = os.listdir
+
+        def failing_listdir(path):
+            if os.fspath(path) == os.fspath(media):
+                raise PermissionError(13, "Permission denied", os.fspath(path))
+            return listdir(path)
+
+        with mock.patch("os.listdir", side_effect=failing_listdir):
+            self.assertIsNone(DirectoryListingCache().listing(media))
+            result = self.manager.cleanup()
+        self.assertEqual(result["videos_removed"], 1)
+        self.assertEqual([video.file_path for video in playlist.videos], [present])
+
+    def test_listing_cache_matches_case_insensitively_when_asked(self):
+        """Test a stored path differing only in case counts as present on case-insensitive systems."""
+        media = self.temp_path / "cased"
+        media.mkdir()
+        (media / "Movie.MP4").touch()
+        self.assertTrue(DirectoryListingCache(case_insensitive=True).exists(media / "movie.mp4"))
+        self.assertFalse(DirectoryListingCache(case_insensitive=True).exists(media / "other.mp4"))
+        self.assertFalse(DirectoryListingCache(case_insensitive=False).exists(media / "movie.mp4"))
+
+    def test_save_all_playlists_writes_every_playlist(self):
+        """Test every registered playlist with a save path is written."""
+        playlist = self.manager.create_playlist(name="Saved")
+        if playlist.save_file_path.exists():
+            playlist.save_file_path.unlink()
+        self.assertTrue(self.manager.save_all_playlists())
+        self.assertTrue(playlist.save_file_path.exists())
+
 
 class TestPlaylistManagerActivePlaylist(unittest.TestCase):
     """Tests for active playlist management."""
@@ -306,5 +410,65 @@ class TestPlaylistManagerActivePlaylist(unittest.TestCase):
         self.assertEqual(len(self.manager), initial + 1)
 
 
+class TestPlaylistHeaders(unittest.TestCase):
+    """Tests for the lightweight playlist headers used by the archive list."""
+
+    def setUp(self):
+        """Set up a manager and a playlist with two videos."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.manager = PlaylistManager(data_dir=self.temp_path, synchronous=True)
+        data = {"videos": [{"file_path": "/media/a.mp4"}, {"file_path": "/media/b.mp4"}]}
+        self.playlist = Playlist.from_dict(data, validate_files=False)
+
+    def tearDown(self):
+        """Clean up temp directory."""
+        self.temp_dir.cleanup()
+
+    def test_headers_follow_registry_order(self):
+        """Test playlist_headers lists every playlist in registry order."""
+        self.manager.create_playlist(name="Headers Test")
+        headers = self.manager.playlist_headers()
+        self.assertEqual([header.playlist_id for header in headers], self.manager.playlist_ids)
+        self.assertIn("Headers Test", [header.name for header in headers])
+
+    def test_stats_are_lazy_and_cached(self):
+        """Test duration and progress are computed on first access and kept until invalidated."""
+        header = PlaylistHeader(self.playlist)
+        self.assertIsNone(header._stats)
+        self.assertEqual(header.video_count, 2)
+        self.assertIsNone(header._stats)
+
+        self.playlist.current_index = 0
+        self.playlist.update_current_video_state(position=30_000, duration=60_000)
+        self.assertEqual(header.total_duration, 60_000)
+        self.assertAlmostEqual(header.progress, 0.5)
+
+        self.playlist.update_current_video_state(position=60_000, duration=60_000)
+        self.assertAlmostEqual(header.progress, 0.5)
+        header.invalidate()
+        self.assertAlmostEqual(header.progress, 1.0)
+
+    def test_probed_metadata_reaches_every_playlist(self):
+        """Test a probed shared video refreshes the totals of each playlist holding it, active or not."""
+        media = self.temp_path / "media"
+        media.mkdir()
+        shared, other = media / "shared.mp4", media / "other.mp4"
+        shared.touch()
+        other.touch()
+        first = self.manager.create_playlist(name="First")
+        second = self.manager.create_playlist(name="Second")
+        third = self.manager.create_playlist(name="Third")
+        video = first.add_video(shared)
+        self.assertIs(second.add_video(shared), video)
+        third.add_video(other)
+
+        video.update_metadata(duration=90_000)
+        changed = self.manager.notify_metadata_changed([video])
+        self.assertEqual({playlist.id for playlist in changed}, {first.id, second.id})
+        self.assertEqual(second.p_state.total_duration, 90_000)
+        self.assertEqual(third.p_state.total_duration, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""Tests for the poster thumbnail caches and the lazy provider."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.pyplayer.domain.media import Video
+from src.pyplayer.infrastructure.cache import ThumbnailCache
+
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+
+class TestThumbnailCache(unittest.TestCase):
+    """Tests for the sharded disk layout."""
+
+    def test_sharded_by_key_prefix(self):
+        """Test thumbnails land in a sub-directory named after the first two hex digits."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ThumbnailCache(Path(temp_dir))
+            key = "ab12cd34ef567890"
+            self.assertEqual(cache.path_for(key), Path(temp_dir) / "ab" / f"{key}.jpg")
+            self.assertIsNone(cache.lookup(key))
+            cache.prepare(key).write_bytes(b"jpeg")
+            self.assertEqual(cache.lookup(key), cache.path_for(key))
+            cache.discard(key)
+            self.assertIsNone(cache.lookup(key))
+
+
+class TestPosterProvider(unittest.TestCase):
+    """Tests for memory/disk lookups and cancellation of rows scrolled away."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication once for all tests."""
+        from PySide6 import QtWidgets
+
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication(sys.argv)
+
+    def setUp(self):
+        """Create videos and a provider over an empty cache."""
+        from src.pyplayer.ui.widgets.poster_thumbnails import PosterProvider
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.videos = []
+        for i in range(4):
+            path = root / f"video_{i}.mp4"
+            path.write_bytes(bytes([i]))
+            self.videos.append(Video(path))
+        self.cache = ThumbnailCache(root / "posters")
+        self.provider = PosterProvider(root / "posters")
+        self.ready = []
+        self.provider.poster_ready.connect(self.ready.append)
+
+    def tearDown(self):
+        """Stop extraction and clean up."""
+        self.provider.clear()
+        self.temp_dir.cleanup()
+
+    def _write_poster(self, video):
+        from PySide6 import QtGui
+
+        image = QtGui.QImage(64, 36, QtGui.QImage.Format.Format_RGB32)
+        image.fill(QtGui.QColor("#336699"))
+        image.save(str(self.cache.prepare(video.content_key)), "JPG")
+
+    def test_disk_hits_are_loaded_and_announced(self):
+        """Test a cached poster is loaded on request and then served from memory."""
+        self._write_poster(self.videos[0])
+        self.assertIsNone(self.provider.pixmap(self.videos[0].id))
+        self.provider.request_visible(self.videos[:1])
+        self.assertEqual(self.ready, [self.videos[0].id])
+        self.assertEqual(self.provider.pixmap(self.videos[0].id).width(), 64)
+
+    def test_rows_scrolled_away_are_cancelled(self):
+        """Test misses are queued for extraction and dropped once no longer visible."""
+        self.provider.request_visible(self.videos[:3])
+        extractor = self.provider._extractor
+        self.assertTrue(all(extractor.is_pending(video.content_key) for video in self.videos[:3]))
+        self.provider.request_visible(self.videos[2:])
+        self.assertFalse(extractor.is_pending(self.videos[0].content_key))
+        self.assertFalse(extractor.is_pending(self.videos[1].content_key))
+        self.assertTrue(extractor.is_pending(self.videos[2].content_key))
+        self.assertTrue(extractor.is_pending(self.videos[3].content_key))
+
+    def test_memory_cache_is_bounded(self):
+        """Test the pixmap LRU evicts the least recently used posters."""
+        self.provider.PIXMAP_CACHE_SIZE = 2
+        for video in self.videos[:3]:
+            self._write_poster(video)
+        self.provider.request_visible(self.videos[:3])
+        self.assertIsNone(self.provider.pixmap(self.videos[0].id))
+        self.assertIsNotNone(self.provider.pixmap(self.videos[2].id))
+
+    def test_file_rewritten_in_place_gets_a_new_poster(self):
+        """Test a reloaded video keeps its id but no longer gets the poster of the old content."""
+        video = self.videos[0]
+        self._write_poster(video)
+        record = video.to_dict()
+        video.file_path.write_bytes(b"re-encoded")
+        reloaded = Video.from_dict(record)
+        self.assertEqual(reloaded.id, video.id)
+
+        self.provider.request_visible([reloaded])
+        self.assertIsNone(self.provider.pixmap(reloaded.id))
+        self.assertTrue(self.provider._extractor.is_pending(reloaded.content_key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Tests for the page-cache read-ahead of upcoming playlist items."""
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.pyplayer.app.services import read_ahead
+from src.pyplayer.app.services.read_ahead import ReadAheadPrefetcher, read_ahead_ranges
+from src.pyplayer.domain.playlist import Playlist, PlayMode
+from tests.test_media_metadata import build_mp4
+
+MB = 1024 * 1024
+
+
+class TestReadAheadRanges(unittest.TestCase):
+    """Tests for the byte ranges warmed per file."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_mp4_index_past_the_head_is_included(self):
+        """Test a trailing moov box is warmed along with the head."""
+        path = self.root / "late.mp4"
+        data = build_mp4(1000, 640, 360, moov_last=True)
+        path.write_bytes(data)
+        moov = data.index(b"moov") + 4
+        with mock.patch.object(read_ahead, "HEAD_BYTES", 4096):
+            ranges = read_ahead_ranges(path, len(data))
+        self.assertEqual(ranges, [(0, 4096), (moov, len(data) - moov)])
+
+    def test_other_containers_get_the_tail(self):
+        """Test files without a known index get their head and tail, and small files one range."""
+        path = self.root / "clip.mkv"
+        with open(path, "wb") as handle:
+            handle.truncate(20 * MB)
+        self.assertEqual(read_ahead_ranges(path, 20 * MB), [(0, 8 * MB), (18 * MB, 2 * MB)])
+        self.assertEqual(read_ahead_ranges(path, 1000), [(0, 1000)])
+
+
+class TestReadAheadPrefetcher(unittest.TestCase):
+    """Tests for throttling, cancellation and skipping files warmed recently."""
+
+    def setUp(self):
+        """Create a few sparse files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.paths = []
+        for i in range(3):
+            path = self.root / f"video_{i}.avi"
+            with open(path, "wb") as handle:
+                handle.truncate(4 * MB)
+            self.paths.append(path)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _wait_idle(self, prefetcher, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not prefetcher.is_idle and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def test_bandwidth_cap_is_respected(self):
+        """Test 4 MB at 20 MB/s take about 200 ms, and a second request for the same file is skipped."""
+        prefetcher = ReadAheadPrefetcher(bandwidth=20 * MB, use_fadvise=False)
+        started = time.monotonic()
+        prefetcher.prefetch(self.paths[:1])
+        time.sleep(0.01)
+        self._wait_idle(prefetcher)
+        self.assertGreaterEqual(time.monotonic() - started, 0.15)
+        self.assertEqual(prefetcher.bytes_prefetched, 4 * MB)
+
+        prefetcher.cancel()
+        prefetcher.prefetch(self.paths[:1])
+        time.sleep(0.01)
+        self._wait_idle(prefetcher)
+        self.assertEqual(prefetcher.bytes_prefetched, 4 * MB)
+        prefetcher.shutdown()
+
+    def test_new_targets_cancel_the_old_ones(self):
+        """Test changing the upcoming items stops work on the previous ones at the next chunk."""
+        prefetcher = ReadAheadPrefetcher(bandwidth=2 * MB, use_fadvise=False)
+        prefetcher.prefetch(self.paths[:2])
+        time.sleep(0.05)
+        prefetcher.prefetch(self.paths[2:])
+        time.sleep(0.05)
+        self._wait_idle(prefetcher, timeout=3.0)
+        # The first file stopped after a chunk or two, the second was never started
+        self.assertLessEqual(prefetcher.bytes_prefetched, 2 * MB + 4 * MB)
+        self.assertEqual(prefetcher.bytes_prefetched % MB, 0)
+        prefetcher.shutdown()
+
+    def test_fadvise_is_used_when_available(self):
+        """Test the kernel is asked to read ahead instead of reading in Python."""
+        if not hasattr(read_ahead.os, "posix_fadvise"):
+            self.skipTest("posix_fadvise unavailable")
+        with mock.patch.object(read_ahead.os, "posix_fadvise") as advise:
+            prefetcher = ReadAheadPrefetcher(bandwidth=1024 * MB)
+            prefetcher.prefetch(self.paths[:1])
+            time.sleep(0.01)
+            self._wait_idle(prefetcher)
+            prefetcher.shutdown()
+        self.assertEqual(advise.call_count, 4)
+        self.assertEqual(advise.call_args_list[0].args[1:], (0, MB, read_ahead.os.POSIX_FADV_WILLNEED))
+
+
+class TestUpcomingVideos(unittest.TestCase):
+    """Tests for predicting the next items per play mode."""
+
+    def setUp(self):
+        """Build a five-video playlist without touching the disk."""
+        data = {"videos": [{"file_path": f"/media/video_{i}.mp4"} for i in range(5)]}
+        self.playlist = Playlist.from_dict(data, validate_files=False)
+        self.names = [video.name for video in self.playlist.videos]
+
+    def _upcoming(self):
+        return [video.name for video in self.playlist.peek_upcoming_videos(2)]
+
+    def test_normal_and_loop_all(self):
+        """Test NORMAL stops at the end and LOOP_ALL wraps around."""
+        self.playlist.current_index = 3
+        self.assertEqual(self._upcoming(), [self.names[4]])
+        self.playlist.set_play_mode(PlayMode.LOOP_ALL)
+        self.playlist.current_index = 3
+        self.assertEqual(self._upcoming(), [self.names[4], self.names[0]])
+
+    def test_loop_one_and_shuffle(self):
+        """Test LOOP_ONE predicts nothing and SHUFFLE follows the drawn order."""
+        self.playlist.set_play_mode(PlayMode.LOOP_ONE)
+        self.playlist.current_index = 1
+        self.assertEqual(self._upcoming(), [])
+
+        self.playlist.set_play_mode(PlayMode.SHUFFLE)
+        self.playlist.get_next_video()
+        order = self.playlist._shuffle_order
+        position = self.playlist._shuffle_position
+        expected = [self.names[row] for row in order[position + 1 : position + 3]]
+        self.assertEqual(self._upcoming(), expected)
+        self.assertEqual(self.playlist._shuffle_position, position)
+
+
+if __name__ == "__main__":
+    unittest.main()
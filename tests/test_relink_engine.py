@@ -0,0 +1,126 @@
+"""Tests for the indexed relink engine."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.pyplayer.app.services.fingerprint_service import FingerprintService
+from src.pyplayer.app.services.relink_engine import RelinkEngine, RelinkIndex, score_candidate
+from src.pyplayer.domain.media import Video, compute_fingerprint
+from src.pyplayer.domain.playlist import Playlist
+from src.pyplayer.infrastructure.cache import MediaMetadataCache
+from src.pyplayer.infrastructure.filesystem import ScannedFile
+
+
+class TestRelinkEngine(unittest.TestCase):
+    """Tests for one-pass resolution, scoring, ambiguity and bulk apply."""
+
+    def setUp(self):
+        """Create a library of videos and a search root to move them into."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.old_root = self.root / "old" / "Movies"
+        self.search_root = self.root / "search"
+        self.old_root.mkdir(parents=True)
+        self.search_root.mkdir()
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _video(self, relative, size):
+        path = self.old_root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(os.urandom(size))
+        return Video(path)
+
+    def _move(self, video, relative):
+        target = self.search_root / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(video.file_path, target)
+        return target
+
+    def _move_bytes(self, relative, size, mtime):
+        target = self.search_root / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(b"x" * size)
+        os.utime(target, (mtime, mtime))
+
+    def test_index_stats_only_the_names_looked_up(self):
+        """Test the scan records no sizes and a lookup stats just its candidates."""
+        (self.search_root / "a").mkdir()
+        (self.search_root / "a" / "Clip.MP4").write_bytes(b"12345")
+        (self.search_root / "other.mp4").write_bytes(b"1")
+        index = RelinkIndex.scan([self.search_root])
+        self.assertEqual(len(index), 2)
+        self.assertEqual([entry.size for entry in index.candidates("clip.mp4")], [5])
+        self.assertFalse(index._by_name["other.mp4"][0].has_stat)
+        self.assertEqual(sorted(entry.size for entry in index.sized_files()), [1, 5])
+
+    def test_every_playlist_is_resolved_in_one_pass(self):
+        """Test missing videos shared by several playlists are resolved once and applied to each."""
+        first = self._video("Series/S01/ep1.mp4", 100)
+        second = self._video("Series/S01/ep2.mp4", 200)
+        present = self._video("present.mp4", 10)
+        playlist_a = Playlist()
+        playlist_a.videos = [first, present, second]
+        playlist_b = Playlist()
+        playlist_b.videos = [second]
+        new_first = self._move(first, "disk/Series/S01/ep1.mp4")
+        new_second = self._move(second, "ep2.mp4")
+
+        engine = RelinkEngine()
+        report = engine.resolve([playlist_a, playlist_b], [self.search_root])
+        self.assertEqual(report.missing_count, 2)
+        self.assertEqual(report.relinks, {first.id: new_first, second.id: new_second})
+
+        self.assertEqual(
+            engine.apply([playlist_a, playlist_b], report), {"playlists_relinked": 2, "videos_relinked": 3}
+        )
+        self.assertEqual([video.file_path for video in playlist_a.videos], [new_first, present.file_path, new_second])
+        self.assertEqual(playlist_b.videos[0].file_path, new_second)
+
+    def test_scoring_prefers_same_size_mtime_and_parents(self):
+        """Test the candidate with the same size, mtime and parent folders wins, and a size mismatch is rejected."""
+        video = self._video("Series/S01/ep1.mp4", 100)
+        good = ScannedFile(str(self.search_root / "Series" / "S01" / "ep1.mp4"), 100, video.mtime)
+        other_folder = ScannedFile(str(self.search_root / "Backup" / "ep1.mp4"), 100, video.mtime)
+        self.assertGreater(score_candidate(video, good), score_candidate(video, other_folder))
+
+        os.remove(video.file_path)
+        self._move_bytes("Backup/ep1.mp4", 100, video.mtime)
+        self._move_bytes("Series/S01/ep1.mp4", 100, video.mtime)
+        self._move_bytes("Series/S02/ep1.mp4", 999, video.mtime)
+        playlist = Playlist()
+        playlist.videos = [video]
+        report = RelinkEngine().resolve([playlist], [self.search_root])
+        self.assertEqual(report.relinks, {video.id: self.search_root / "Series" / "S01" / "ep1.mp4"})
+
+    def test_ties_are_reported_as_ambiguous(self):
+        """Test two equally good candidates are not guessed between."""
+        video = self._video("clip.mp4", 50)
+        os.remove(video.file_path)
+        self._move_bytes("a/clip.mp4", 50, video.mtime)
+        self._move_bytes("b/clip.mp4", 50, video.mtime)
+        playlist = Playlist()
+        playlist.videos = [video]
+        report = RelinkEngine().resolve([playlist], [self.search_root])
+        self.assertEqual(report.relinks, {})
+        self.assertEqual(report.ambiguous, [video.id])
+
+    def test_renamed_files_fall_back_to_fingerprints(self):
+        """Test a file renamed and moved is found by content over the same scan."""
+        cache = MediaMetadataCache()
+        video = self._video("clip.mp4", 300_000)
+        cache.put_fingerprint(video.media_key, compute_fingerprint(video.file_path))
+        target = self._move(video, "nested/renamed.mp4")
+        playlist = Playlist()
+        playlist.videos = [video]
+        report = RelinkEngine(FingerprintService(cache)).resolve([playlist], [self.search_root])
+        self.assertEqual(report.relinks, {video.id: target})
+        self.assertTrue(report.matches[0].by_fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Tests for the trickplay sprite sheet cache and the hover preview."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.pyplayer.domain.media.video import stat_media_key
+from src.pyplayer.infrastructure.cache import SpriteSheetCache, SpriteSheetInfo
+
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+
+class TestSpriteSheetCache(unittest.TestCase):
+    """Tests for cache keys, sheet geometry and the disk layout."""
+
+    def setUp(self):
+        """Create a temporary media file and cache directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.media = Path(self.temp_dir.name) / "movie.mp4"
+        self.media.write_bytes(b"\x00" * 64)
+        self.cache = SpriteSheetCache(Path(self.temp_dir.name) / "cache")
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_key_follows_size_and_mtime(self):
+        """Test the key is stable for an unchanged file and changes when it is rewritten."""
+        key = stat_media_key(self.media)
+        self.assertEqual(stat_media_key(self.media), key)
+        self.media.write_bytes(b"\x00" * 65)
+        self.assertNotEqual(stat_media_key(self.media), key)
+        stat = self.media.stat()
+        changed = stat_media_key(self.media)
+        os.utime(self.media, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertNotEqual(stat_media_key(self.media), changed)
+        self.assertIsNone(stat_media_key(Path(self.temp_dir.name) / "missing.mp4"))
+
+    def test_tile_geometry(self):
+        """Test the nearest tile is picked and laid out row by row."""
+        info = SpriteSheetInfo(interval_ms=2000, count=25, columns=10, tile_width=160, tile_height=90)
+        self.assertEqual(info.rows, 3)
+        self.assertEqual(info.sheet_size, (1600, 270))
+        self.assertEqual(info.tile_index(0), 0)
+        self.assertEqual(info.tile_index(2999), 1)
+        self.assertEqual(info.tile_index(3001), 2)
+        self.assertEqual(info.tile_index(10_000_000), 24)
+        self.assertEqual(info.tile_rect(12), (320, 90, 160, 90))
+
+    def test_sheet_is_visible_only_once_published(self):
+        """Test lookup ignores a sheet image without its geometry sidecar."""
+        key = stat_media_key(self.media)
+        info = SpriteSheetInfo(interval_ms=2000, count=3, columns=10, tile_width=16, tile_height=9)
+        self.cache.cache_dir.mkdir(parents=True)
+        self.cache.sheet_path(key).write_bytes(b"jpeg")
+        self.assertIsNone(self.cache.lookup(key))
+        self.assertTrue(self.cache.store_info(key, info))
+        self.assertEqual(self.cache.lookup(key), (self.cache.sheet_path(key), info))
+        self.cache.discard(key)
+        self.assertIsNone(self.cache.lookup(key))
+
+
+class TestScrubPreview(unittest.TestCase):
+    """Tests for showing cached tiles on hover."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication once for all tests."""
+        from PySide6 import QtWidgets
+
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication(sys.argv)
+
+    def setUp(self):
+        """Write a cached sheet whose tiles have distinct colours."""
+        from PySide6 import QtGui
+
+        from src.pyplayer.ui.widgets.scrub_preview import ScrubPreview
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.media = Path(self.temp_dir.name) / "movie.mp4"
+        self.media.write_bytes(b"\x00" * 64)
+        cache_dir = Path(self.temp_dir.name) / "cache"
+        self.colors = ["#ff0000", "#00ff00", "#0000ff"]
+        info = SpriteSheetInfo(interval_ms=2000, count=3, columns=2, tile_width=16, tile_height=9)
+        sheet = QtGui.QImage(*info.sheet_size, QtGui.QImage.Format.Format_RGB32)
+        for index, color in enumerate(self.colors):
+            x, y, width, height = info.tile_rect(index)
+            for dx in range(width):
+                for dy in range(height):
+                    sheet.setPixelColor(x + dx, y + dy, QtGui.QColor(color))
+        cache = SpriteSheetCache(cache_dir)
+        key = stat_media_key(self.media)
+        cache_dir.mkdir()
+        sheet.save(str(cache.sheet_path(key)), "PNG")
+        cache.store_info(key, info)
+        self.preview = ScrubPreview(cache_dir, enabled=False)
+
+    def tearDown(self):
+        """Hide the popup and clean up."""
+        self.preview.hide()
+        self.temp_dir.cleanup()
+
+    def test_hover_shows_the_nearest_tile(self):
+        """Test a hover copies the nearest tile from the cached sheet."""
+        from PySide6 import QtCore
+
+        self.preview.set_media(self.media)
+        self.assertTrue(self.preview.has_sheet)
+        start = time.perf_counter()
+        self.assertTrue(self.preview.show_at(4100, QtCore.QPoint(200, 200)))
+        self.assertLess((time.perf_counter() - start) * 1000, 50)
+        tile = self.preview._popup.pixmap().toImage()
+        self.assertEqual(tile.size(), QtCore.QSize(16, 9))
+        self.assertEqual(tile.pixelColor(8, 4).name(), self.colors[2])
+
+    def test_no_sheet_shows_nothing(self):
+        """Test a media without a cached sheet hides the popup."""
+        from PySide6 import QtCore
+
+        other = Path(self.temp_dir.name) / "other.mp4"
+        other.write_bytes(b"\x01")
+        self.preview.set_media(other)
+        self.assertFalse(self.preview.show_at(0, QtCore.QPoint(0, 0)))
+        self.assertFalse(self.preview._popup.isVisible())
+
+    def test_pixmap_cache_is_bounded(self):
+        """Test the in-memory LRU keeps at most PIXMAP_CACHE_SIZE sheets."""
+        self.preview.PIXMAP_CACHE_SIZE = 1
+        self.preview.set_media(self.media)
+        self.preview._pixmaps["older"] = self.preview._pixmaps.pop(stat_media_key(self.media))
+        self.preview._key = None
+        self.preview.set_media(self.media)
+        self.assertEqual(list(self.preview._pixmaps), [stat_media_key(self.media)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Tests for the seek scheduler service."""
+
+import sys
+import time
+import unittest
+
+from PySide6 import QtCore
+
+from src.pyplayer.app.services.seek_scheduler import SeekScheduler
+
+
+class FakePlayer:
+    """Stands in for QMediaPlayer: records every setPosition call."""
+
+    def __init__(self):
+        self.seeks = []
+
+    def setPosition(self, position):
+        self.seeks.append(position)
+
+
+class TestSeekScheduler(unittest.TestCase):
+    """Tests for coalescing, approximate/precise targets and latency instrumentation."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a QCoreApplication once for the timers."""
+        cls.app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv)
+
+    def setUp(self):
+        """Attach a scheduler to a fake player."""
+        self.player = FakePlayer()
+        self.seeker = SeekScheduler()
+        self.seeker.set_player(self.player)
+
+    def test_one_seek_in_flight_latest_target_wins(self):
+        """Test a drag burst sends one seek, then only the latest target once a frame arrives."""
+        for value in range(10_000, 20_000, 37):
+            self.seeker.request(value, precise=False)
+        self.assertEqual(self.player.seeks, [10_000])
+        self.assertTrue(self.seeker.in_flight)
+
+        self.seeker.notify_frame()
+        self.assertEqual(self.player.seeks, [10_000, 20_000])
+        self.seeker.notify_frame()
+        self.assertFalse(self.seeker.in_flight)
+        self.assertEqual(self.seeker.latency_summary()["count"], 2)
+
+    def test_approximate_targets_snap_and_repeat_is_skipped(self):
+        """Test drag targets snap to the grid and a repeated snapped target is not re-sent."""
+        self.seeker.request(12_345, precise=False)
+        self.seeker.notify_frame()
+        self.seeker.request(12_400, precise=False)
+        self.assertEqual(self.player.seeks, [12_500])
+        self.assertFalse(self.seeker.in_flight)
+
+    def test_precise_release_replaces_queued_drag(self):
+        """Test the release target is exact and replaces a queued approximate one."""
+        self.seeker.request(5_000, precise=False)
+        self.seeker.request(7_900, precise=False)
+        self.seeker.request(7_913, precise=True)
+        self.assertEqual(self.seeker.pending_target, 7_913)
+        self.seeker.notify_frame()
+        self.assertEqual(self.player.seeks, [5_000, 7_913])
+
+    def test_audio_only_completes_on_position(self):
+        """Test media without video completes seeks on position reports, not frames."""
+        self.seeker.set_frame_driven(False)
+        self.seeker.request(1_000)
+        self.seeker.request(2_000)
+        self.seeker.notify_frame()
+        self.assertEqual(self.player.seeks, [1_000])
+        self.seeker.notify_position(1_000)
+        self.assertEqual(self.player.seeks, [1_000, 2_000])
+
+    def test_timeout_releases_a_stuck_seek(self):
+        """Test a seek that never produces a frame does not block the queue."""
+        self.seeker._timeout.setInterval(5)
+        self.seeker.request(1_000)
+        self.seeker.request(3_000)
+        deadline = time.perf_counter() + 1.0
+        while len(self.player.seeks) < 2 and time.perf_counter() < deadline:
+            self.app.processEvents()
+            time.sleep(0.001)
+        self.assertEqual(self.player.seeks, [1_000, 3_000])
+        self.assertEqual(self.seeker.timeouts, 1)
+        self.assertEqual(self.seeker.latency_summary()["count"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ from PySide6 import QtCore, QtGui, QtWidgets
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.pyplayer.ui.startup.multimedia_warmup import MultimediaWarmup
 from src.pyplayer.ui.widgets.player import PlayerWidget
 
 
@@ -90,5 +91,39 @@ def benchmark_first_play():
     }
 
 
+def benchmark_idle_warmup():
+    """Measure the idle-time warm-up slices, then the first play once it is done."""
+    print("\n" + "=" * 60)
+    print("BENCHMARK: Idle-time Multimedia Warm-up")
+    print("=" * 60)
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    player_widget = PlayerWidget()
+    player_widget.show()
+    app.processEvents()
+
+    warmup = MultimediaWarmup(player_widget, idle_ms=0)
+    reports = []
+    warmup.finished.connect(reports.append)
+    start = time.perf_counter()
+    warmup.schedule()
+    while not reports and time.perf_counter() - start < 30:
+        app.processEvents()
+    wall = (time.perf_counter() - start) * 1000
+
+    for name, elapsed in warmup.timings.items():
+        print(f"  step {name:<14} {elapsed:8.1f} ms")
+    print(f"Warm-up work: {warmup.total_ms:.1f} ms over {wall:.1f} ms wall clock")
+    print(f"Longest slice (UI blocked): {max(warmup.timings.values(), default=0):.1f} ms")
+
+    start = time.perf_counter()
+    ready = player_widget.ensure_player_ready()
+    first_play = (time.perf_counter() - start) * 1000
+    print(f"First play after warm-up: {first_play:.1f} ms (ready={ready})")
+
+    return {"timings": dict(warmup.timings), "wall": wall, "first_play": first_play}
+
+
 if __name__ == "__main__":
     benchmark_first_play()
+    benchmark_idle_warmup()
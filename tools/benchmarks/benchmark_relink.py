@@ -0,0 +1,83 @@
+"""Benchmark: relinking missing playlist entries against a large search root."""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.pyplayer.app.services.relink_engine import RelinkEngine, RelinkIndex
+from src.pyplayer.domain.media import Video
+from src.pyplayer.domain.playlist import Playlist
+
+FILES_PER_DIR = 1000
+
+
+def build_tree(root: Path, file_count: int, moved_count: int) -> list:
+    """Create ``file_count`` empty videos under ``root``; the first ``moved_count`` get a distinct size."""
+    moved = []
+    for i in range(file_count):
+        directory = root / f"disk_{i // (FILES_PER_DIR * 100):02d}" / f"folder_{i // FILES_PER_DIR:04d}"
+        if i % FILES_PER_DIR == 0:
+            directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"video_{i:07d}.mp4"
+        with open(path, "wb") as handle:
+            if i < moved_count:
+                handle.truncate(1000 + i)
+        if i < moved_count:
+            moved.append(path)
+    return moved
+
+
+def build_playlists(old_root: Path, moved: list, playlist_count: int = 10) -> list:
+    """Point playlists at the moved files' former location (same folders, another root)."""
+    playlists = [Playlist() for _ in range(playlist_count)]
+    for i, new_path in enumerate(moved):
+        stat = new_path.stat()
+        old_path = old_root / new_path.relative_to(new_path.parents[2])
+        video = Video.from_dict({"file_path": str(old_path), "size": stat.st_size, "mtime": stat.st_mtime})
+        playlists[i % playlist_count].videos.append(video)
+    return playlists
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=1_000_000, help="files in the search root")
+    parser.add_argument("--missing", type=int, default=10_000, help="missing playlist entries")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir) / "search"
+        start = time.perf_counter()
+        moved = build_tree(root, args.files, args.missing)
+        print(f"Tree creation ({args.files} files): {(time.perf_counter() - start):.1f} s")
+        playlists = build_playlists(Path(temp_dir) / "old", moved)
+
+        os.system("sync")
+        engine = RelinkEngine()
+        start = time.perf_counter()
+        index = RelinkIndex.scan([root])
+        scan_ms = (time.perf_counter() - start) * 1000
+        report = engine.resolve(playlists, [root], index=index)
+        start = time.perf_counter()
+        result = engine.apply(playlists, report)
+        apply_ms = (time.perf_counter() - start) * 1000
+
+        print("\n" + "=" * 60)
+        print("RELINK BENCHMARK SUMMARY")
+        print("=" * 60)
+        print(f"{'Files scanned':40} {report.scanned_count:10d}")
+        print(f"{'Missing entries':40} {report.missing_count:10d}")
+        print(f"{'Relinked':40} {result['videos_relinked']:10d}")
+        print(f"{'Ambiguous':40} {len(report.ambiguous):10d}")
+        print(f"{'Scan + name index':40} {scan_ms:10.1f} ms")
+        for phase in ("missing", "match", "total"):
+            print(f"{'Resolve: ' + phase:40} {report.timings.get(phase, 0.0):10.1f} ms")
+        print(f"{'Bulk apply':40} {apply_ms:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
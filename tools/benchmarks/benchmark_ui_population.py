@@ -1,150 +1,144 @@
-"""Benchmark for UI list population — playlist and video lists."""
+"""Benchmark for UI list population — video list model/view at 1k, 10k and 100k rows."""
 
+import os
 import sys
-import tempfile
 import time
 from pathlib import Path
 
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
 from PySide6 import QtCore, QtWidgets
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.pyplayer.app.services.playlist_manager import PlaylistManager
+from src.pyplayer.domain.playlist import Playlist
 from src.pyplayer.ui.widgets.dock_widget import DockWidget
 
+ROW_COUNTS = (1_000, 10_000, 100_000)
+FRAME_MS = 16.7
 
-def create_test_video_files(temp_dir: Path, count: int = 50) -> list[Path]:
-    """Create dummy video files for testing."""
-    files = []
-    for i in range(count):
-        video_file = temp_dir / f"video_{i:04d}.mp4"
-        video_file.write_text(f"dummy video content {i}")
-        files.append(video_file)
-    return files
-
-
-def benchmark_playlist_list_population():
-    """Measure playlist list widget population."""
-    print("=" * 60)
-    print("BENCHMARK: Playlist List Population")
-    print("=" * 60)
 
-    # Create QApplication
-    app = QtWidgets.QApplication.instance()
-    if app is None:
-        app = QtWidgets.QApplication([])
-
-    # Create temp directory
-    temp_dir = Path(tempfile.mkdtemp())
+def build_playlist(count: int, current_index: int = 0) -> Playlist:
+    """Build a playlist of ``count`` videos the way a saved playlist is reloaded."""
+    data = {
+        "version": "1.0",
+        "name": f"Bench {count}",
+        "videos": [{"file_path": f"/bench/media/video_{i:06d}.mp4"} for i in range(count)],
+        "current_index": current_index,
+    }
+    return Playlist.from_dict(data, validate_files=False)
+
+
+def wait_until_materialized(app, dock, timeout: float = 30.0) -> tuple:
+    """Spin the event loop until every row is exposed; return (elapsed ms, worst stall ms)."""
+    worst_gap = 0.0
+    start = last = time.perf_counter()
+    while not dock.video_model.is_fully_exposed and time.perf_counter() - start < timeout:
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 5)
+        now = time.perf_counter()
+        worst_gap = max(worst_gap, now - last)
+        last = now
+    # Let the batched layout finish too.
+    for _ in range(200):
+        app.processEvents()
+        now = time.perf_counter()
+        worst_gap = max(worst_gap, now - last)
+        last = now
+    return (time.perf_counter() - start) * 1000, worst_gap * 1000
+
+
+def benchmark_video_list_population(count: int, current_index: int = 0) -> dict:
+    """Measure binding, first paint, background materialization and scrolling on ``count`` rows."""
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
 
-    # Create PlaylistManager with some playlists
     start = time.perf_counter()
-    manager = PlaylistManager(data_dir=temp_dir, synchronous=True)
+    playlist = build_playlist(count, current_index)
+    build_time = (time.perf_counter() - start) * 1000
 
-    # Create multiple playlists
-    for i in range(10):
-        manager.create_playlist(name=f"Playlist {i+1}")
-    manager_creation = (time.perf_counter() - start) * 1000
-    print(f"PlaylistManager creation (10 playlists): {manager_creation:.1f} ms")
+    dock = DockWidget()
+    dock.resize(320, 720)
+    dock.show()
+    app.processEvents()
 
-    # Create DockWidget
     start = time.perf_counter()
-    dock = DockWidget(manager)
-    dock_creation = (time.perf_counter() - start) * 1000
-    print(f"DockWidget creation: {dock_creation:.1f} ms")
+    dock.bind_playlist(playlist)
+    bind_time = (time.perf_counter() - start) * 1000
 
-    # Show widget
     start = time.perf_counter()
-    dock.show()
-    dock_show = (time.perf_counter() - start) * 1000
-    print(f"DockWidget show: {dock_show:.1f} ms")
+    dock.lstw.viewport().repaint()
+    first_paint = (time.perf_counter() - start) * 1000
 
-    # Process events
-    QtWidgets.QApplication.processEvents()
+    materialize_time, worst_stall = wait_until_materialized(app, dock)
 
-    # Measure refresh time
     start = time.perf_counter()
-    dock.refresh_playlist_list()
-    refresh_time = (time.perf_counter() - start) * 1000
-    print(f"Playlist list refresh: {refresh_time:.1f} ms")
+    scrollbar = dock.lstw.verticalScrollBar()
+    for step in range(20):
+        scrollbar.setValue(scrollbar.maximum() * step // 19)
+        dock.lstw.viewport().repaint()
+    scroll_time = (time.perf_counter() - start) * 1000 / 20
 
-    # Measure switching active playlist
     start = time.perf_counter()
-    manager.set_active_playlist_by_name("Playlist 5")
-    QtWidgets.QApplication.processEvents()
-    switch_time = (time.perf_counter() - start) * 1000
-    print(f"Switch active playlist: {switch_time:.1f} ms")
-
-    print("\n" + "=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    total = manager_creation + dock_creation + dock_show + refresh_time
-    print(f"Total population cost: {total:.1f} ms")
-
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    playlist.current_index = current_index + 1
+    playlist.changes.flush()
+    dock.lstw.viewport().repaint()
+    current_time = (time.perf_counter() - start) * 1000
 
+    dock.close()
     return {
-        "manager_creation": manager_creation,
-        "dock_creation": dock_creation,
-        "dock_show": dock_show,
-        "refresh_time": refresh_time,
-        "switch_time": switch_time,
-        "total": total,
+        "rows": count,
+        "build_playlist": build_time,
+        "bind": bind_time,
+        "first_paint": first_paint,
+        "materialize": materialize_time,
+        "worst_stall": worst_stall,
+        "scroll_repaint": scroll_time,
+        "current_change": current_time,
     }
 
 
-def benchmark_video_list_population():
-    """Measure video list widget population."""
-    print("\n" + "=" * 60)
-    print("BENCHMARK: Video List Population")
-    print("=" * 60)
-
-    # Create QApplication
-    app = QtWidgets.QApplication.instance()
-    if app is None:
-        app = QtWidgets.QApplication([])
-
-    # Create temp directory with video files
-    temp_dir = Path(tempfile.mkdtemp())
-    video_files = create_test_video_files(temp_dir, count=100)
-
-    # Create PlaylistManager
-    manager = PlaylistManager(data_dir=temp_dir, synchronous=True)
-    playlist = manager.create_playlist(name="Test Playlist", source_path=temp_dir)
-
-    # Create DockWidget
-    dock = DockWidget(manager)
+def benchmark_filter_keystrokes(count: int) -> list:
+    """Time each keystroke of a query typed into the filter (debounce excluded)."""
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    playlist = build_playlist(count)
+    dock = DockWidget()
+    dock.resize(320, 720)
     dock.show()
-    QtWidgets.QApplication.processEvents()
-
-    # Measure video list refresh
-    start = time.perf_counter()
-    dock.refresh_video_list()
-    QtWidgets.QApplication.processEvents()
-    video_refresh = (time.perf_counter() - start) * 1000
-    print(f"Video list refresh (100 videos): {video_refresh:.1f} ms")
+    dock.bind_playlist(playlist)
+    wait_until_materialized(app, dock)
 
-    # Measure refresh again (should be cached/faster)
-    start = time.perf_counter()
-    dock.refresh_video_list()
-    QtWidgets.QApplication.processEvents()
-    video_refresh_cached = (time.perf_counter() - start) * 1000
-    print(f"Video list refresh (cached): {video_refresh_cached:.1f} ms")
-
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_dir, ignore_errors=True)
-
-    return {
-        "video_refresh": video_refresh,
-        "video_refresh_cached": video_refresh_cached,
-    }
+    timings = []
+    for query in ("7", "77", "777", "7777", "777", "", "mp4"):
+        start = time.perf_counter()
+        dock.le_filter.setText(query)
+        dock.apply_filter()
+        dock.lstw.viewport().repaint()
+        timings.append((query, dock.video_model.visible_count, (time.perf_counter() - start) * 1000))
+    dock.close()
+    return timings
 
 
 if __name__ == "__main__":
-    benchmark_playlist_list_population()
-    benchmark_video_list_population()
+    print("=" * 88)
+    print("BENCHMARK: Video List Population (paged VideoListModel + batched VideoListView)")
+    print("=" * 88)
+    header = f"{'rows':>8} {'playlist':>9} {'bind':>7} {'1st paint':>10} {'all rows':>9} {'stall':>7} {'scroll':>7} {'current':>8}"
+    print(header + "  (ms)")
+    for rows in ROW_COUNTS:
+        for current in (0, rows // 2):
+            result = benchmark_video_list_population(rows, current)
+            print(
+                f"{result['rows']:>8} {result['build_playlist']:>9.1f} {result['bind']:>7.1f} "
+                f"{result['first_paint']:>10.1f} {result['materialize']:>9.1f} {result['worst_stall']:>7.1f} "
+                f"{result['scroll_repaint']:>7.1f} {result['current_change']:>8.1f}"
+                + ("  (current mid-list)" if current else "")
+            )
+    print(f"\nbind + first paint must fit one frame ({FRAME_MS} ms); 'stall' is the worst event-loop gap")
+    print("while the remaining rows are exposed and laid out in the background.")
+
+    print("\n" + "=" * 88)
+    print("BENCHMARK: Type-to-filter, 100k rows (per keystroke, filter + repaint)")
+    print("=" * 88)
+    for query, matches, elapsed in benchmark_filter_keystrokes(100_000):
+        print(f"  {query!r:>8}  matches={matches:>7}  {elapsed:6.1f} ms")